@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark CompanyIndex n-gram blocking: recall and latency vs. full scan.
+
+Uses the ground truth dataset and candidates of the matching evaluation,
+padded with synthetic company names to realistic Companies database sizes.
+
+Usage:
+    python scripts/analysis/benchmark_company_blocking.py
+    python scripts/analysis/benchmark_company_blocking.py --sizes 1000 50000
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root))
+
+from tests.evaluation.test_company_blocking import (  # noqa: E402
+    evaluate_blocking,
+    load_blocking_dataset,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[200, 1_000, 5_000, 20_000],
+        help="Candidate set sizes to benchmark",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.85, help="Similarity threshold"
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON results")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        candidates, queries = load_blocking_dataset(size)
+        results.append(
+            evaluate_blocking(
+                candidates, queries, similarity_threshold=args.threshold
+            )
+        )
+
+    if args.json:
+        print(json.dumps([m.to_dict() for m in results], indent=2))
+        return 0
+
+    print("=" * 80)
+    print("COMPANY INDEX BLOCKING: recall and latency vs. full scan")
+    print("=" * 80)
+    print()
+    print(
+        f"{'Candidates':>10} {'Queries':>8} {'Recall':>8} {'Block':>8} "
+        f"{'Full avg':>9} {'Full p95':>9} {'Blk avg':>9} {'Blk p95':>9} {'Speedup':>8}"
+    )
+    for m in results:
+        print(
+            f"{m.candidates:>10} {m.queries:>8} {m.recall:>8.1%} {m.avg_block_size:>8.1f} "
+            f"{m.full_avg_latency_ms:>7.3f}ms {m.full_p95_latency_ms:>7.3f}ms "
+            f"{m.blocked_avg_latency_ms:>7.3f}ms {m.blocked_p95_latency_ms:>7.3f}ms "
+            f"{m.speedup:>7.1f}x"
+        )
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
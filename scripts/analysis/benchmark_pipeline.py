@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark the daemon pipeline offline: throughput and per-stage latency.
+
+Runs DaemonController.process_cycle() against a fake Gmail service,
+latency-injecting LLM provider stubs and a local Notion stub server that
+enforces the API's request rate, then checks the results against the
+performance thresholds.
+
+Latency distributions are "kind:params", e.g. "fixed:0.05",
+"uniform:0.2,1.5", "normal:1.0,0.3", "lognormal:1.0,0.4", "exponential:0.8".
+
+Usage:
+    python scripts/analysis/benchmark_pipeline.py
+    python scripts/analysis/benchmark_pipeline.py --emails 50 --llm-latency lognormal:2.0,0.5
+    python scripts/analysis/benchmark_pipeline.py --llm-failure-rate 0.1 --json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from collabiq.test_utils.pipeline_benchmark import (  # noqa: E402
+    DAEMON_FETCH_LIMIT,
+    BenchmarkConfig,
+    LatencyDistribution,
+    PipelineBenchmark,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--emails", type=int, default=20, help="Emails to process")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DAEMON_FETCH_LIMIT,
+        help="Emails arriving per cycle",
+    )
+    parser.add_argument(
+        "--gmail-latency",
+        type=LatencyDistribution.parse,
+        default=LatencyDistribution(),
+        help="Latency per Gmail API call (default: fixed:0)",
+    )
+    parser.add_argument(
+        "--llm-latency",
+        type=LatencyDistribution.parse,
+        default=LatencyDistribution("lognormal", (1.0, 0.4)),
+        help="Latency per LLM call (default: lognormal:1,0.4)",
+    )
+    parser.add_argument(
+        "--llm-failure-rate",
+        type=float,
+        default=0.0,
+        help="Share of LLM calls that fail, per provider",
+    )
+    parser.add_argument(
+        "--notion-rate",
+        type=float,
+        default=3.0,
+        help="Requests per second the Notion stub admits",
+    )
+    parser.add_argument(
+        "--notion-latency",
+        type=LatencyDistribution.parse,
+        default=LatencyDistribution("fixed", (0.05,)),
+        help="Service time per admitted Notion request (default: fixed:0.05)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--json", action="store_true", help="Print JSON results")
+    parser.add_argument(
+        "--verbose", action="store_true", help="Show pipeline log output"
+    )
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+
+    config = BenchmarkConfig(
+        email_count=args.emails,
+        batch_size=args.batch_size,
+        gmail_latency=args.gmail_latency,
+        llm_latency=args.llm_latency,
+        llm_failure_rate=args.llm_failure_rate,
+        notion_rate_per_second=args.notion_rate,
+        notion_latency=args.notion_latency,
+        seed=args.seed,
+    )
+    report = asyncio.run(PipelineBenchmark(config).run())
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2, ensure_ascii=False))
+    else:
+        print("=" * 80)
+        print("DAEMON PIPELINE BENCHMARK (offline)")
+        print("=" * 80)
+        print()
+        print(report.format_text())
+
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ Email pipeline management commands.
 Commands:
 - fetch: Download emails from Gmail
 - clean: Normalize email content
+- bulk-clean: Re-clean archived raw emails in parallel
 - list: Display recent emails
 - verify: Check Gmail connectivity
 - process: Run complete pipeline
@@ -28,11 +29,13 @@ from ..utils.logging import log_cli_operation, log_cli_error
 try:
     from email_receiver.gmail_receiver import GmailReceiver
     from content_normalizer.normalizer import ContentNormalizer
+    from content_normalizer.bulk import bulk_clean as run_bulk_clean
     from models.raw_email import RawEmail
 except ImportError:
     # Services may not be available in all environments
     GmailReceiver = None
     ContentNormalizer = None
+    run_bulk_clean = None
     RawEmail = None
 
 email_app = typer.Typer(
@@ -321,6 +324,104 @@ def clean(
         raise typer.Exit(code=1)
 
 
+@email_app.command("bulk-clean")
+def bulk_clean(
+    input_dir: Path = typer.Option(
+        RAW_EMAIL_DIR, "--input-dir", "-i", help="Directory with raw emails (recursive)"
+    ),
+    output_dir: Path = typer.Option(
+        CLEANED_EMAIL_DIR, "--output-dir", "-o", help="Directory for cleaned emails"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", help="Worker processes (default: CPU count)"
+    ),
+    batch_size: int = typer.Option(200, help="Emails per worker batch"),
+    force: bool = typer.Option(False, help="Re-clean emails already up to date"),
+    debug: bool = typer.Option(False, help="Enable debug logging"),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    quiet: bool = typer.Option(False, help="Suppress non-error output"),
+):
+    """
+    Re-clean archived raw emails in parallel.
+
+    Cleans every raw email under data/raw in a process pool and writes
+    data/cleaned/YYYY/MM/ files mirroring the raw layout. Emails whose
+    content and pattern set are unchanged since the last run are skipped.
+
+    Examples:
+        collabiq email bulk-clean
+        collabiq email bulk-clean --workers 8 --force
+        collabiq email bulk-clean -i data/raw/2025 --json
+    """
+    start_time = time.time()
+    console = Console()
+
+    try:
+        if run_bulk_clean is None:
+            raise RuntimeError(
+                "Content normalizer service not available. "
+                "Ensure content_normalizer module is installed."
+            )
+        if not input_dir.exists():
+            raise FileNotFoundError(f"Raw email directory not found: {input_dir}")
+
+        if not quiet and not json_output:
+            with create_spinner(f"Cleaning raw emails in {input_dir}...") as progress:
+                task = progress.add_task(f"Cleaning raw emails in {input_dir}...", total=None)
+                stats = run_bulk_clean(
+                    input_dir,
+                    output_dir,
+                    workers=workers,
+                    batch_size=batch_size,
+                    force=force,
+                )
+                progress.update(task, description=f"[green]✓ Cleaned {stats.cleaned} emails")
+        else:
+            stats = run_bulk_clean(
+                input_dir, output_dir, workers=workers, batch_size=batch_size, force=force
+            )
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        log_cli_operation(
+            command="email bulk-clean",
+            success=stats.failed == 0,
+            duration_ms=duration_ms,
+            cleaned=stats.cleaned,
+            skipped=stats.skipped,
+            failed=stats.failed,
+        )
+
+        if json_output:
+            output_json(
+                data=stats.to_dict(),
+                status="success",
+                errors=[f"{path}: {error}" for path, error in sorted(stats.errors.items())],
+            )
+        elif not quiet:
+            table = create_table(title="Bulk Clean", columns=["Metric", "Value"])
+            table.add_row("Scanned", str(stats.scanned))
+            table.add_row("Cleaned", str(stats.cleaned))
+            table.add_row("Skipped (up to date)", str(stats.skipped))
+            table.add_row("Empty after cleaning", str(stats.empty))
+            table.add_row("Failed", str(stats.failed))
+            table.add_row("Duration", f"{stats.elapsed_seconds:.1f}s")
+            table.add_row("Throughput", f"{stats.emails_per_second:,.0f} emails/s")
+            table.add_row("Input rate", f"{stats.megabytes_per_second:.2f} MB/s")
+            console.print(table)
+            for rel_path, error in sorted(stats.errors.items())[:10]:
+                console.print(f"[red]✗ {rel_path}: {error}[/red]")
+
+    except Exception as e:
+        log_cli_error("email bulk-clean", e)
+
+        if json_output:
+            output_json(data={}, status="failure", errors=[str(e)])
+        else:
+            console.print(f"[red]✗ Failed to bulk-clean emails: {e}[/red]")
+
+        raise typer.Exit(code=1)
+
+
 @email_app.command()
 def list(
     limit: int = typer.Option(20, help="Maximum number of emails to display"),
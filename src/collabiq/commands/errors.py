@@ -24,11 +24,14 @@ from ..utils.logging import log_cli_operation, log_cli_error
 
 # Import DLQ manager
 try:
-    from notion_integrator.dlq_manager import DLQManager
+    from notion_integrator.dlq_manager import DEFAULT_REPLAY_WORKERS, DLQManager
+    from notion_integrator.dlq_index import classify_severity
     from llm_provider.types import DLQEntry
 except ImportError:
     DLQManager = None
     DLQEntry = None
+    DEFAULT_REPLAY_WORKERS = 4
+    classify_severity = None
 
 errors_app = typer.Typer(
     name="errors",
@@ -41,23 +44,45 @@ DLQ_DIR = Path("data/dlq")
 
 def _get_severity_from_error(error_details: dict) -> str:
     """Determine severity level from error details."""
-    error_type = error_details.get("error_type", "")
-    status_code = error_details.get("status_code")
+    return classify_severity(
+        error_details.get("error_type", ""), error_details.get("status_code")
+    )
 
-    # Network/connection errors are warnings (retryable)
-    if "Connection" in error_type or "Timeout" in error_type:
-        return "warning"
 
-    # 4xx errors are errors (client-side issues)
-    if status_code and 400 <= status_code < 500:
-        return "error"
+def _create_notion_writer():
+    """
+    Build the NotionWriter used to replay DLQ entries.
+
+    Configured from settings like the daemon's writer.
+
+    Raises:
+        RuntimeError: If the Notion modules are not available
+        ValueError: If the Notion API key or CollabIQ database ID is not set
+    """
+    # Import here to avoid circular dependency
+    try:
+        from config.settings import get_settings
+        from notion_integrator.integrator import NotionIntegrator
+        from notion_integrator.writer import NotionWriter
+    except ImportError:
+        raise RuntimeError(
+            "NotionWriter not available. Ensure notion_integrator module is installed."
+        )
 
-    # 5xx errors are warnings (server-side, retryable)
-    if status_code and status_code >= 500:
-        return "warning"
+    settings = get_settings()
+    api_key = settings.get_notion_api_key()
+    collabiq_db_id = settings.get_notion_collabiq_db_id()
+    if not api_key or not collabiq_db_id:
+        raise ValueError(
+            "NOTION_API_KEY and NOTION_DATABASE_ID_COLLABIQ must be set to retry errors"
+        )
 
-    # Default to error
-    return "error"
+    return NotionWriter(
+        notion_integrator=NotionIntegrator(api_key=api_key),
+        collabiq_db_id=collabiq_db_id,
+        companies_db_id=settings.get_notion_companies_db_id(),
+        duplicate_behavior=settings.duplicate_behavior,
+    )
 
 
 def _get_remediation_suggestion(error_details: dict) -> str:
@@ -102,7 +127,14 @@ def list(
     since: Optional[str] = typer.Option(
         None, help="Show errors since date (YYYY-MM-DD)"
     ),
+    error_type: Optional[str] = typer.Option(
+        None, "--error-type", help="Filter by error type (e.g. APIResponseError)"
+    ),
+    email_id: Optional[str] = typer.Option(
+        None, "--email-id", help="Filter by email ID"
+    ),
     limit: int = typer.Option(20, help="Maximum number of errors to show"),
+    offset: int = typer.Option(0, min=0, help="Number of errors to skip (paging)"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
     quiet: bool = typer.Option(False, help="Suppress non-error output"),
 ):
@@ -110,11 +142,14 @@ def list(
     List failed operations in the DLQ with filtering options.
 
     Shows error ID, email ID, error type, timestamp, retry count, and severity.
-    Use --severity to filter by error level, --since for date filtering.
+    Use --severity to filter by error level, --since for date filtering,
+    --limit/--offset to page through large backlogs.
 
     Examples:
         collabiq errors list --limit 10
+        collabiq errors list --limit 10 --offset 10
         collabiq errors list --severity error
+        collabiq errors list --error-type APIResponseError
         collabiq errors list --since 2024-01-01
         collabiq errors list --json
     """
@@ -130,18 +165,15 @@ def list(
         # Initialize DLQ manager
         dlq_manager = DLQManager(dlq_dir=str(DLQ_DIR))
 
-        # Load all DLQ entries
-        dlq_files = dlq_manager.list_dlq_entries()
+        total = dlq_manager.count_entries()
 
-        if not dlq_files:
+        if total == 0:
             if json_output:
                 output_json(data={"errors": [], "count": 0}, status="success")
             elif not quiet:
                 console.print("[green]✓ No errors found in DLQ[/green]")
             return
 
-        # Parse entries with filtering
-        errors = []
         since_date = None
         if since:
             try:
@@ -149,51 +181,52 @@ def list(
             except ValueError:
                 raise ValueError(f"Invalid date format: {since}. Use YYYY-MM-DD")
 
-        for file_path in dlq_files:
-            try:
-                entry = dlq_manager.load_dlq_entry(file_path)
-
-                # Apply filters
-                entry_severity = _get_severity_from_error(entry.error)
-                if severity and entry_severity != severity:
-                    continue
-
-                if since_date and entry.failed_at < since_date:
-                    continue
-
-                # Extract error ID from filename
-                error_id = Path(file_path).stem
-
-                errors.append(
-                    {
-                        "error_id": error_id,
-                        "email_id": entry.email_id,
-                        "error_type": entry.error.get("error_type", "Unknown"),
-                        "error_message": entry.error.get("error_message", ""),
-                        "failed_at": entry.failed_at.isoformat(),
-                        "retry_count": entry.retry_count,
-                        "severity": entry_severity,
-                        "file_path": file_path,
-                    }
-                )
-            except Exception as e:
-                log_cli_error(f"Failed to load DLQ entry {file_path}: {e}")
-                continue
+        # Filter and paginate in the DLQ index (newest first)
+        filters = dict(
+            severity=severity,
+            since=since_date,
+            error_type=error_type,
+            email_id=email_id,
+        )
+        matching = dlq_manager.count_entries(**filters)
+        records = dlq_manager.query_entries(
+            **filters, newest_first=True, limit=limit, offset=offset
+        )
 
-        # Sort by timestamp (newest first) and limit
-        errors.sort(key=lambda x: x["failed_at"], reverse=True)
-        errors = errors[:limit]
+        errors = [
+            {
+                "error_id": record.error_id,
+                "email_id": record.email_id,
+                "error_type": record.error_type,
+                "error_message": record.error_message,
+                "failed_at": record.failed_at.isoformat(),
+                "retry_count": record.retry_count,
+                "severity": record.severity,
+                "file_path": record.file_path,
+            }
+            for record in records
+        ]
 
         # Output
         if json_output:
             output_json(
-                data={"errors": errors, "count": len(errors), "total": len(dlq_files)},
+                data={
+                    "errors": errors,
+                    "count": len(errors),
+                    "matching": matching,
+                    "offset": offset,
+                    "total": total,
+                },
                 status="success",
             )
         else:
             # Create table
             table = create_table(
-                title=f"Failed Operations (DLQ) - Showing {len(errors)} of {len(dlq_files)}",
+                title=(
+                    f"Failed Operations (DLQ) - Showing {offset + 1 if errors else 0}-"
+                    f"{offset + len(errors)} of {matching}"
+                    + (f" (total {total})" if matching != total else "")
+                ),
                 columns=[
                     {
                         "name": "Error ID",
@@ -254,7 +287,7 @@ def list(
 
         log_cli_operation(
             "errors_list",
-            {"count": len(errors), "filtered": len(errors) < len(dlq_files)},
+            {"count": len(errors), "filtered": matching < total},
         )
 
     except Exception as e:
@@ -293,14 +326,15 @@ def show(
         # Initialize DLQ manager
         dlq_manager = DLQManager(dlq_dir=str(DLQ_DIR))
 
-        # Find matching file
-        file_path = DLQ_DIR / f"{error_id}.json"
+        # Look up entry in the DLQ index
+        record = dlq_manager.get_entry(error_id)
 
-        if not file_path.exists():
+        if record is None:
             raise FileNotFoundError(f"Error ID not found: {error_id}")
 
         # Load entry
-        entry = dlq_manager.load_dlq_entry(str(file_path))
+        file_path = record.file_path
+        entry = dlq_manager.load_dlq_entry(file_path)
 
         # Get severity and remediation
         severity = _get_severity_from_error(entry.error)
@@ -409,6 +443,12 @@ def retry(
     since: Optional[str] = typer.Option(
         None, "--since", help="Retry errors since date (YYYY-MM-DD)"
     ),
+    workers: int = typer.Option(
+        DEFAULT_REPLAY_WORKERS,
+        "--workers",
+        min=1,
+        help="Number of entries retried concurrently",
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
     quiet: bool = typer.Option(False, help="Suppress non-error output"),
 ):
@@ -416,12 +456,15 @@ def retry(
     Retry failed operations from the DLQ.
 
     Can retry all errors, specific error by ID, or errors since a date.
-    Shows progress indicator for bulk retries. Successful retries are removed
-    from DLQ, failed retries have their retry count incremented.
+    Entries are replayed oldest failure first by concurrent workers that
+    share the Notion rate limit. Shows progress and throughput for bulk
+    retries. Successful retries are removed from DLQ, failed retries have
+    their retry count incremented.
 
     Examples:
         collabiq errors retry --id email001_20240101_120000
         collabiq errors retry --all
+        collabiq errors retry --all --workers 8
         collabiq errors retry --since 2024-01-01
     """
     console = Console()  # Initialize Console locally
@@ -443,105 +486,87 @@ def retry(
         # Initialize DLQ manager
         dlq_manager = DLQManager(dlq_dir=str(DLQ_DIR))
 
-        # Get NotionWriter for retry (import here to avoid circular dependency)
-        try:
-            from notion_integrator.writer import NotionWriter
-
-            notion_writer = NotionWriter()
-        except ImportError:
-            raise RuntimeError(
-                "NotionWriter not available. Ensure notion_integrator module is installed."
-            )
-
         # Determine which entries to retry
-        entries_to_retry = []
+        file_paths = None
+        failed_since = None
 
         if id:
             # Single entry
-            file_path = DLQ_DIR / f"{id}.json"
-            if not file_path.exists():
+            record = dlq_manager.get_entry(id)
+            if record is None:
                 raise FileNotFoundError(f"Error ID not found: {id}")
-            entries_to_retry = [str(file_path)]
-        else:
-            # Multiple entries
-            all_files = dlq_manager.list_dlq_entries()
-
-            if since:
-                # Filter by date
-                since_date = datetime.fromisoformat(since)
-                for file_path in all_files:
-                    try:
-                        entry = dlq_manager.load_dlq_entry(file_path)
-                        if entry.failed_at >= since_date:
-                            entries_to_retry.append(file_path)
-                    except Exception as e:
-                        log_cli_error(f"Failed to load {file_path}: {e}")
-            else:
-                # All entries
-                entries_to_retry = all_files
-
-        if not entries_to_retry:
-            if json_output:
-                output_json(
-                    data={"succeeded": 0, "failed": 0, "total": 0}, status="success"
-                )
-            elif not quiet:
-                console.print("[yellow]No errors to retry[/yellow]")
-            return
-
-        # Run async retry
-        async def run_retries():
-            results = {"succeeded": 0, "failed": 0}
+            file_paths = [record.file_path]
+        elif since:
+            failed_since = datetime.fromisoformat(since)
+
+        # Get NotionWriter for retry
+        notion_writer = _create_notion_writer()
+
+        # Run concurrent replay (oldest failures first)
+        async def replay():
+            replay_args = dict(
+                notion_writer=notion_writer,
+                max_count=None,
+                workers=workers,
+                file_paths=file_paths,
+                failed_since=failed_since,
+            )
 
             if json_output or quiet:
                 # No progress bar
-                for file_path in entries_to_retry:
-                    try:
-                        success = await dlq_manager.retry_failed_write(
-                            file_path, notion_writer
-                        )
-                        if success:
-                            results["succeeded"] += 1
-                        else:
-                            results["failed"] += 1
-                    except Exception as e:
-                        log_cli_error(f"Error retrying {file_path}: {e}")
-                        results["failed"] += 1
-            else:
-                # With progress bar
-                with create_progress() as progress:
-                    task = progress.add_task(
-                        f"[cyan]Retrying {len(entries_to_retry)} failed operations...",
-                        total=len(entries_to_retry),
-                    )
+                return await dlq_manager.replay_batch(**replay_args)
+
+            # With progress bar showing live throughput
+            with create_progress() as progress:
+                task = progress.add_task(
+                    "[cyan]Retrying failed operations...", total=None
+                )
 
-                    for file_path in entries_to_retry:
-                        try:
-                            success = await dlq_manager.retry_failed_write(
-                                file_path, notion_writer
-                            )
-                            if success:
-                                results["succeeded"] += 1
-                            else:
-                                results["failed"] += 1
-                        except Exception as e:
-                            log_cli_error(f"Error retrying {file_path}: {e}")
-                            results["failed"] += 1
+                def on_progress(stats):
+                    progress.update(
+                        task,
+                        total=stats["total"],
+                        completed=stats["completed"],
+                        description=(
+                            f"[cyan]Retrying failed operations "
+                            f"({stats['throughput_per_second']:.1f}/s)..."
+                        ),
+                    )
 
-                        progress.update(task, advance=1)
+                return await dlq_manager.replay_batch(
+                    **replay_args, progress_callback=on_progress
+                )
 
-            return results
+        async def run_retries():
+            # Close the writer's Notion client on the same event loop
+            try:
+                return await replay()
+            finally:
+                await notion_writer.notion_integrator.close()
 
         # Execute retries
         results = asyncio.run(run_retries())
 
+        if results["total"] == 0:
+            if json_output:
+                output_json(
+                    data={"succeeded": 0, "failed": 0, "total": 0}, status="success"
+                )
+            elif not quiet:
+                console.print("[yellow]No errors to retry[/yellow]")
+            return
+
         # Output results
         if json_output:
             output_json(
                 data={
                     "succeeded": results["succeeded"],
                     "failed": results["failed"],
-                    "total": len(entries_to_retry),
+                    "total": results["total"],
+                    "elapsed_seconds": round(results["elapsed_seconds"], 2),
+                    "throughput_per_second": round(
+                        results["throughput_per_second"], 2
+                    ),
                 },
                 status="success",
             )
@@ -549,7 +574,11 @@ def retry(
             console.print("\n[bold]Retry Results:[/bold]")
             console.print(f"  [green]✓ Succeeded: {results['succeeded']}[/green]")
             console.print(f"  [red]✗ Failed: {results['failed']}[/red]")
-            console.print(f"  Total: {len(entries_to_retry)}")
+            console.print(f"  Total: {results['total']}")
+            console.print(
+                f"  Throughput: {results['throughput_per_second']:.2f} entries/s "
+                f"({results['elapsed_seconds']:.1f}s)"
+            )
 
         log_cli_operation("errors_retry", results)
 
@@ -603,10 +632,9 @@ def clear(
         # Initialize DLQ manager
         dlq_manager = DLQManager(dlq_dir=str(DLQ_DIR))
 
-        # Get all DLQ entries
-        all_files = dlq_manager.list_dlq_entries()
+        total = dlq_manager.count_entries()
 
-        if not all_files:
+        if total == 0:
             if json_output:
                 output_json(data={"cleared": 0, "total": 0}, status="success")
             elif not quiet:
@@ -614,7 +642,6 @@ def clear(
             return
 
         # Determine which entries to clear
-        entries_to_clear = []
         before_date = None
 
         if before:
@@ -623,27 +650,18 @@ def clear(
             except ValueError:
                 raise ValueError(f"Invalid date format: {before}. Use YYYY-MM-DD")
 
-        for file_path in all_files:
-            try:
-                entry = dlq_manager.load_dlq_entry(file_path)
-
-                # Filter by resolved status
-                if resolved and not dlq_manager.is_processed(entry.email_id):
-                    continue
+        records = dlq_manager.query_entries(before=before_date)
 
-                # Filter by date
-                if before_date and entry.failed_at >= before_date:
-                    continue
+        # Filter by resolved status
+        if resolved:
+            processed_ids = dlq_manager.get_processed_ids()
+            records = [r for r in records if r.email_id in processed_ids]
 
-                entries_to_clear.append(file_path)
-            except Exception as e:
-                log_cli_error(f"Failed to load {file_path}: {e}")
+        entries_to_clear = [record.file_path for record in records]
 
         if not entries_to_clear:
             if json_output:
-                output_json(
-                    data={"cleared": 0, "total": len(all_files)}, status="success"
-                )
+                output_json(data={"cleared": 0, "total": total}, status="success")
             elif not quiet:
                 console.print("[yellow]No errors match the criteria[/yellow]")
             return
@@ -662,7 +680,7 @@ def clear(
         cleared_count = 0
         for file_path in entries_to_clear:
             try:
-                Path(file_path).unlink()
+                dlq_manager.remove_entry(file_path)
                 cleared_count += 1
             except Exception as e:
                 log_cli_error(f"Failed to delete {file_path}: {e}")
@@ -672,19 +690,19 @@ def clear(
             output_json(
                 data={
                     "cleared": cleared_count,
-                    "total": len(all_files),
-                    "remaining": len(all_files) - cleared_count,
+                    "total": total,
+                    "remaining": total - cleared_count,
                 },
                 status="success",
             )
         else:
             console.print(f"[green]✓ Cleared {cleared_count} error(s) from DLQ[/green]")
-            remaining = len(all_files) - cleared_count
+            remaining = total - cleared_count
             if remaining > 0:
                 console.print(f"[dim]{remaining} error(s) remaining[/dim]")
 
         log_cli_operation(
-            "errors_clear", {"cleared": cleared_count, "total": len(all_files)}
+            "errors_clear", {"cleared": cleared_count, "total": total}
         )
 
     except ValueError as e:
@@ -52,6 +52,18 @@ from .fuzz_generator import (
     generate_fuzz_date_strings,
 )
 
+# Local API stand-ins
+from .notion_stub import NotionStubServer
+
+# Offline pipeline benchmark
+from .pipeline_benchmark import (
+    BenchmarkConfig,
+    BenchmarkReport,
+    LatencyDistribution,
+    PipelineBenchmark,
+    run_pipeline_benchmark,
+)
+
 __all__ = [
     "cleanup_notion",
     "NotionTestCleanup",
@@ -79,4 +91,10 @@ __all__ = [
     "generate_fuzz_emails",
     "generate_fuzz_extraction_results",
     "generate_fuzz_date_strings",
+    "NotionStubServer",
+    "BenchmarkConfig",
+    "BenchmarkReport",
+    "LatencyDistribution",
+    "PipelineBenchmark",
+    "run_pipeline_benchmark",
 ]
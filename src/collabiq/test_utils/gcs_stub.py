@@ -0,0 +1,149 @@
+"""
+In-memory stand-in for the google-cloud-storage client.
+
+Implements the subset of Client/Bucket/Blob the daemon uses, including
+object generations and if_generation_match preconditions, so optimistic
+concurrency between several writers can be tested without GCS:
+
+    >>> client = FakeGCSClient()
+    >>> manager = GCSStateManager("state-bucket", client=client)
+    >>> other = GCSStateManager("state-bucket", client=client)  # second instance
+
+A failed precondition raises google.api_core.exceptions.PreconditionFailed
+(HTTP 412), like the real client.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+try:
+    from google.api_core.exceptions import NotFound, PreconditionFailed
+except ImportError:  # pragma: no cover - installed with google-cloud-storage
+
+    class PreconditionFailed(Exception):  # type: ignore[no-redef]
+        code = 412
+
+    class NotFound(Exception):  # type: ignore[no-redef]
+        code = 404
+
+
+class FakeGCSClient:
+    """
+    Client holding every bucket in memory (thread-safe).
+
+    Attributes:
+        uploads: Number of successful uploads
+        downloads: Number of downloads
+        precondition_failures: Number of uploads rejected by if_generation_match
+    """
+
+    def __init__(self):
+        self._objects: Dict[Tuple[str, str], Tuple[bytes, int, Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._next_generation = 1
+        self.uploads = 0
+        self.downloads = 0
+        self.precondition_failures = 0
+
+    def bucket(self, bucket_name: str) -> "FakeBucket":
+        return FakeBucket(self, bucket_name)
+
+    def get_bucket(self, bucket_name: str) -> "FakeBucket":
+        return self.bucket(bucket_name)
+
+    def object_data(self, bucket_name: str, blob_name: str) -> Optional[bytes]:
+        """Stored bytes of an object (None if absent), for assertions."""
+        stored = self._objects.get((bucket_name, blob_name))
+        return stored[0] if stored else None
+
+
+class FakeBucket:
+    """Bucket view onto a FakeGCSClient."""
+
+    def __init__(self, client: FakeGCSClient, name: str):
+        self.client = client
+        self.name = name
+
+    def blob(self, blob_name: str) -> "FakeBlob":
+        return FakeBlob(self, blob_name)
+
+    def get_blob(self, blob_name: str) -> Optional["FakeBlob"]:
+        """Blob with its current generation, or None if it does not exist."""
+        with self.client._lock:
+            stored = self.client._objects.get((self.name, blob_name))
+        if stored is None:
+            return None
+        blob = FakeBlob(self, blob_name)
+        blob.generation = stored[1]
+        blob.content_type = stored[2]
+        return blob
+
+
+class FakeBlob:
+    """Object handle; generation is set by get_blob() and uploads."""
+
+    def __init__(self, bucket: FakeBucket, name: str):
+        self.bucket = bucket
+        self.name = name
+        self.generation: Optional[int] = None
+        self.content_type: Optional[str] = None
+
+    @property
+    def _key(self) -> Tuple[str, str]:
+        return (self.bucket.name, self.name)
+
+    def exists(self) -> bool:
+        return self._key in self.bucket.client._objects
+
+    def _check(self, current: Optional[int], if_generation_match: Optional[int]) -> None:
+        """Raise PreconditionFailed if the generation does not match."""
+        if if_generation_match is None:
+            return
+        if (current or 0) != if_generation_match:
+            self.bucket.client.precondition_failures += 1
+            raise PreconditionFailed(
+                f"gs://{self.bucket.name}/{self.name}: generation "
+                f"{current or 0} != {if_generation_match}"
+            )
+
+    def upload_from_string(
+        self,
+        data,
+        content_type: Optional[str] = None,
+        if_generation_match: Optional[int] = None,
+    ) -> None:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        client = self.bucket.client
+        with client._lock:
+            stored = client._objects.get(self._key)
+            self._check(stored[1] if stored else None, if_generation_match)
+            generation = client._next_generation
+            client._next_generation += 1
+            client._objects[self._key] = (bytes(data), generation, content_type)
+            client.uploads += 1
+        self.generation = generation
+        self.content_type = content_type
+
+    def download_as_bytes(self, if_generation_match: Optional[int] = None) -> bytes:
+        client = self.bucket.client
+        with client._lock:
+            stored = client._objects.get(self._key)
+            if stored is None:
+                raise NotFound(f"gs://{self.bucket.name}/{self.name}")
+            self._check(stored[1], if_generation_match)
+            client.downloads += 1
+        self.generation = stored[1]
+        return stored[0]
+
+    def download_as_string(self, if_generation_match: Optional[int] = None) -> bytes:
+        return self.download_as_bytes(if_generation_match=if_generation_match)
+
+    def delete(self, if_generation_match: Optional[int] = None) -> None:
+        client = self.bucket.client
+        with client._lock:
+            stored = client._objects.get(self._key)
+            if stored is None:
+                raise NotFound(f"gs://{self.bucket.name}/{self.name}")
+            self._check(stored[1], if_generation_match)
+            del client._objects[self._key]
@@ -0,0 +1,409 @@
+"""Local Notion API stub server for rate limit and throughput testing.
+
+Serves the subset of the Notion REST API that CollabIQ uses from a
+background thread, enforcing a token-bucket request rate the way the real
+API does: requests over budget get ``429 rate_limited`` with a
+``Retry-After`` header. Point a NotionClient at it with ``base_url``.
+
+Further databases (each with its own properties) can be added with
+``add_database`` and seeded with ``add_page``; queries honour the simple
+filters CollabIQ sends (property equals, last_edited_time on_or_after,
+and/or), so duplicate checks and delta refreshes behave as against Notion.
+
+Usage:
+    from collabiq.test_utils.notion_stub import NotionStubServer
+
+    with NotionStubServer(rate_per_second=3.0) as stub:
+        client = NotionClient(api_key="secret_stub", base_url=stub.base_url)
+        await client.query_database(stub.database_id)
+
+    print(stub.request_count, stub.rate_limited_count)
+"""
+
+import json
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, UTC
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+
+DEFAULT_DATABASE_ID = "stub-database"
+
+_ROUTES = [
+    ("GET", re.compile(r"^/v1/databases/([^/]+)$"), "_get_database"),
+    ("GET", re.compile(r"^/v1/data_sources/([^/]+)$"), "_get_data_source"),
+    ("POST", re.compile(r"^/v1/data_sources/([^/]+)/query$"), "_query_data_source"),
+    ("POST", re.compile(r"^/v1/pages$"), "_create_page"),
+    ("GET", re.compile(r"^/v1/pages/([^/]+)$"), "_get_page"),
+    ("PATCH", re.compile(r"^/v1/pages/([^/]+)$"), "_update_page"),
+    ("GET", re.compile(r"^/v1/users$"), "_list_users"),
+]
+
+
+def _error(status: int, code: str, message: str) -> Tuple[int, Dict[str, Any]]:
+    return status, {"object": "error", "status": status, "code": code, "message": message}
+
+
+class NotionStubServer:
+    """In-process HTTP stand-in for the Notion API.
+
+    Attributes:
+        rate_per_second: Sustained request rate before 429s are returned
+        capacity: Burst size of the token bucket
+        retry_after: Seconds advertised in the Retry-After header
+        fail_first: Number of initial requests forced to 429 regardless of rate
+        latency: Artificial per-request service time in seconds, or a
+            zero-argument callable returning one per request
+        database_id: ID of the pre-created database
+        databases: Database titles and properties keyed by database ID
+        pages: Created pages keyed by page ID
+        users: Workspace users returned by GET /v1/users
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = 3.0,
+        capacity: Optional[int] = None,
+        retry_after: float = 1.0,
+        fail_first: int = 0,
+        latency: Union[float, Callable[[], float]] = 0.0,
+        properties: Optional[Dict[str, Any]] = None,
+        users: Optional[List[Dict[str, Any]]] = None,
+    ):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity if capacity is not None else max(1, int(rate_per_second))
+        self.retry_after = retry_after
+        self.fail_first = fail_first
+        self.latency = latency
+        self.database_id = DEFAULT_DATABASE_ID
+        self.properties = properties or {
+            "Name": {"id": "title", "name": "Name", "type": "title", "title": {}}
+        }
+        self.databases: Dict[str, Dict[str, Any]] = {}
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.users = users or []
+
+        self.request_count = 0
+        self.rate_limited_count = 0
+        self.request_log: List[Tuple[float, str, str, int]] = []
+
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.add_database(self.database_id, self.properties)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def base_url(self) -> str:
+        """Root URL to pass as NotionClient(base_url=...)."""
+        if self._server is None:
+            raise RuntimeError("NotionStubServer is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "NotionStubServer":
+        """Start serving on an ephemeral localhost port."""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub._handle(self, "GET")
+
+            def do_POST(self):
+                stub._handle(self, "POST")
+
+            def do_PATCH(self):
+                stub._handle(self, "PATCH")
+
+            def log_message(self, format, *args):  # noqa: A002 - silence stderr
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down and join its thread."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "NotionStubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Seeding
+    # ------------------------------------------------------------------
+
+    def add_database(
+        self,
+        database_id: str,
+        properties: Dict[str, Any],
+        title: Optional[str] = None,
+    ) -> str:
+        """Register a database with its own properties; returns its ID."""
+        now = datetime.now(UTC).isoformat()
+        with self._lock:
+            self.databases[database_id] = {
+                "title": title or database_id,
+                "properties": properties,
+                "created_time": now,
+                "last_edited_time": now,
+            }
+        return database_id
+
+    def add_page(self, database_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a page directly (without a request or rate limiting)."""
+        return self._create_page(
+            {"parent": {"database_id": database_id}, "properties": properties}
+        )[1]
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Request counters and the peak number of accepted requests in any 1s window."""
+        with self._lock:
+            accepted = [t for t, _, _, status in self.request_log if status != 429]
+        peak = 0
+        start = 0
+        for end, ts in enumerate(accepted):
+            while ts - accepted[start] >= 1.0:
+                start += 1
+            peak = max(peak, end - start + 1)
+        return {
+            "requests": self.request_count,
+            "rate_limited": self.rate_limited_count,
+            "accepted": len(accepted),
+            "peak_requests_per_second": peak,
+        }
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    def _admit(self) -> bool:
+        """Take a token from the bucket; False means respond 429."""
+        with self._lock:
+            self.request_count += 1
+            if self.request_count <= self.fail_first:
+                self.rate_limited_count += 1
+                return False
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._last_refill) * self.rate_per_second,
+            )
+            self._last_refill = now
+            if self._tokens < 1:
+                self.rate_limited_count += 1
+                return False
+            self._tokens -= 1
+            return True
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        path = handler.path.split("?", 1)[0]
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = json.loads(handler.rfile.read(length) or b"{}") if length else {}
+
+        headers: Dict[str, str] = {}
+        if not self._admit():
+            status, payload = _error(429, "rate_limited", "Rate limited")
+            headers["Retry-After"] = f"{self.retry_after:g}"
+        else:
+            latency = self.latency() if callable(self.latency) else self.latency
+            if latency > 0:
+                time.sleep(latency)
+            status, payload = self._dispatch(method, path, body)
+
+        with self._lock:
+            self.request_log.append((time.monotonic(), method, path, status))
+
+        data = json.dumps(payload).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _dispatch(
+        self, method: str, path: str, body: Dict[str, Any]
+    ) -> Tuple[int, Dict[str, Any]]:
+        for route_method, pattern, name in _ROUTES:
+            match = pattern.match(path)
+            if route_method == method and match:
+                return getattr(self, name)(body, *match.groups())
+        return _error(404, "object_not_found", f"No route for {method} {path}")
+
+    # ------------------------------------------------------------------
+    # Endpoints
+    # ------------------------------------------------------------------
+
+    def _data_source_id(self, database_id: str) -> str:
+        return f"{database_id}-ds"
+
+    def _database(self, database_id: str) -> Dict[str, Any]:
+        """Registered database, or the default schema for unknown IDs."""
+        with self._lock:
+            database = self.databases.get(database_id)
+        return database or {**self.databases[self.database_id], "title": database_id}
+
+    def _get_database(self, body, database_id):
+        database = self._database(database_id)
+        title = database["title"]
+        return 200, {
+            "object": "database",
+            "id": database_id,
+            "created_time": database["created_time"],
+            "last_edited_time": database["last_edited_time"],
+            "url": f"https://www.notion.so/{database_id}",
+            "title": [{"type": "text", "text": {"content": title}, "plain_text": title}],
+            "data_sources": [
+                {"id": self._data_source_id(database_id), "name": title}
+            ],
+        }
+
+    def _get_data_source(self, body, data_source_id):
+        database = self._database(data_source_id.removesuffix("-ds"))
+        return 200, {
+            "object": "data_source",
+            "id": data_source_id,
+            "title": [{"plain_text": database["title"]}],
+            "properties": database["properties"],
+        }
+
+    def _query_data_source(self, body, data_source_id):
+        query_filter = body.get("filter")
+        with self._lock:
+            results = [
+                page
+                for page in self.pages.values()
+                if self._data_source_id(page["parent"].get("database_id", ""))
+                == data_source_id
+                and (not query_filter or _matches(page, query_filter))
+            ]
+        start = int(body.get("start_cursor") or 0)
+        page_size = int(body.get("page_size") or 100)
+        chunk = results[start : start + page_size]
+        has_more = start + page_size < len(results)
+        return 200, {
+            "object": "list",
+            "results": chunk,
+            "has_more": has_more,
+            "next_cursor": str(start + page_size) if has_more else None,
+        }
+
+    def _create_page(self, body, *_):
+        now = datetime.now(UTC).isoformat()
+        page = {
+            "object": "page",
+            "id": str(uuid.uuid4()),
+            "created_time": now,
+            "last_edited_time": now,
+            "parent": body.get("parent", {}),
+            "properties": _normalize_properties(body.get("properties", {})),
+        }
+        with self._lock:
+            self.pages[page["id"]] = page
+        return 200, page
+
+    def _get_page(self, body, page_id):
+        with self._lock:
+            page = self.pages.get(page_id)
+        if page is None:
+            return _error(404, "object_not_found", f"Page {page_id} not found")
+        return 200, page
+
+    def _update_page(self, body, page_id):
+        with self._lock:
+            page = self.pages.get(page_id)
+            if page is None:
+                return _error(404, "object_not_found", f"Page {page_id} not found")
+            page["properties"].update(
+                _normalize_properties(body.get("properties", {}))
+            )
+            page["last_edited_time"] = datetime.now(UTC).isoformat()
+        return 200, page
+
+    def _list_users(self, body, *_):
+        return 200, {"object": "list", "results": self.users, "has_more": False}
+
+
+# ----------------------------------------------------------------------
+# Page properties and query filters
+# ----------------------------------------------------------------------
+
+
+def _normalize_properties(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Give written property values the shape Notion returns on read.
+
+    Adds the ``type`` key and ``plain_text`` of title/rich text items,
+    which callers parsing pages (e.g. CompaniesCache) rely on.
+    """
+    normalized = {}
+    for name, value in properties.items():
+        value = dict(value)
+        prop_type = value.get("type") or next(iter(value), None)
+        if prop_type:
+            value["type"] = prop_type
+        if prop_type in ("title", "rich_text"):
+            value[prop_type] = [
+                {**item, "plain_text": item.get("text", {}).get("content", "")}
+                for item in value.get(prop_type) or []
+            ]
+        normalized[name] = value
+    return normalized
+
+
+def _plain_text(value: Dict[str, Any]) -> str:
+    prop_type = value.get("type", "")
+    items = value.get(prop_type) if prop_type in ("title", "rich_text") else None
+    return "".join(item.get("plain_text", "") for item in items or [])
+
+
+def _matches(page: Dict[str, Any], query_filter: Dict[str, Any]) -> bool:
+    """Evaluate the subset of Notion query filters CollabIQ sends.
+
+    Supports ``or``/``and`` compounds, title/rich_text ``equals`` and
+    ``last_edited_time`` ``on_or_after``; other conditions match every page.
+    """
+    if "or" in query_filter:
+        return any(_matches(page, f) for f in query_filter["or"])
+    if "and" in query_filter:
+        return all(_matches(page, f) for f in query_filter["and"])
+
+    if query_filter.get("timestamp") == "last_edited_time":
+        bound = query_filter.get("last_edited_time", {}).get("on_or_after")
+        if bound:
+            return datetime.fromisoformat(
+                page["last_edited_time"].replace("Z", "+00:00")
+            ) >= datetime.fromisoformat(bound.replace("Z", "+00:00"))
+        return True
+
+    value = page.get("properties", {}).get(query_filter.get("property"), {})
+    for prop_type in ("title", "rich_text"):
+        condition = query_filter.get(prop_type)
+        if condition and "equals" in condition:
+            return _plain_text(value) == condition["equals"]
+    return True
@@ -0,0 +1,1142 @@
+"""Offline end-to-end benchmark of the daemon pipeline.
+
+Runs the real ``DaemonController.process_cycle()`` (receiver, normalizer,
+LLM orchestrator, summary enhancer, Notion integrator and writer) against
+local stand-ins, so every performance change can be measured without
+touching Gmail, an LLM API or Notion:
+
+- FakeGmailService: in-memory Gmail API (messages.list/get) with injected
+  latency; emails "arrive" in batches before each cycle
+- StubLLMProvider: LLMProvider returning the generated emails' ground truth
+  after a sampled latency, optionally failing a share of calls
+- NotionStubServer: local HTTP Notion API enforcing a request rate with
+  429 + Retry-After (3 req/s by default, like Notion)
+
+Each pipeline stage is timed by wrapping the controller's components; the
+report gives throughput, per-stage percentiles and pass/fail against the
+thresholds in performance_thresholds.py.
+
+Usage:
+    from collabiq.test_utils.pipeline_benchmark import (
+        BenchmarkConfig,
+        LatencyDistribution,
+        PipelineBenchmark,
+    )
+
+    config = BenchmarkConfig(
+        email_count=20,
+        llm_latency=LatencyDistribution.parse("lognormal:1.0,0.4"),
+    )
+    report = await PipelineBenchmark(config).run()
+    print(report.format_text())
+
+    # or from the command line
+    python scripts/analysis/benchmark_pipeline.py --emails 20
+"""
+
+import asyncio
+import base64
+import functools
+import inspect
+import logging
+import math
+import random
+import re
+import tempfile
+import time
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from collabiq.test_utils.notion_stub import NotionStubServer
+from collabiq.test_utils.performance_monitor import PerformanceThresholds
+from collabiq.test_utils.performance_thresholds import (
+    EMAIL_PROCESSING_THRESHOLDS,
+    EMAIL_TEXT_EXTRACTION_THRESHOLDS,
+    LLM_EXTRACTION_THRESHOLDS,
+    NOTION_READ_THRESHOLDS,
+    NOTION_WRITE_THRESHOLDS,
+    PIPELINE_THRESHOLDS,
+)
+from email_receiver.gmail_receiver import GmailReceiver
+from llm_provider.base import LLMProvider
+from llm_provider.exceptions import LLMAPIError
+from llm_provider.types import ConfidenceScores, ExtractedEntities
+
+logger = logging.getLogger(__name__)
+
+
+# DaemonController.process_cycle() fetches at most this many emails per cycle
+DAEMON_FETCH_LIMIT = 10
+
+# Stage name -> thresholds its per-call latency and error rate are held to
+STAGE_THRESHOLDS: Dict[str, PerformanceThresholds] = {
+    "company_context": NOTION_READ_THRESHOLDS,
+    "gmail_fetch": EMAIL_PROCESSING_THRESHOLDS,
+    "duplicate_check": NOTION_READ_THRESHOLDS,
+    "normalize": EMAIL_TEXT_EXTRACTION_THRESHOLDS,
+    "llm_extraction": LLM_EXTRACTION_THRESHOLDS,
+    "llm_summary": LLM_EXTRACTION_THRESHOLDS,
+    "notion_write": NOTION_WRITE_THRESHOLDS,
+    "email": EMAIL_PROCESSING_THRESHOLDS,
+}
+
+
+# ============================================================================
+# Latency distributions
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """Distribution injected latencies are drawn from (seconds).
+
+    Kinds and their parameters:
+        fixed: value
+        uniform: low, high
+        normal: mean, stddev (clipped at 0)
+        lognormal: median, sigma
+        exponential: mean
+
+    Attributes:
+        kind: Distribution kind
+        params: Distribution parameters
+    """
+
+    kind: str = "fixed"
+    params: Tuple[float, ...] = (0.0,)
+
+    ARITY = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}
+
+    def __post_init__(self):
+        if self.kind not in self.ARITY:
+            raise ValueError(
+                f"Unknown latency distribution '{self.kind}' "
+                f"(expected one of {sorted(self.ARITY)})"
+            )
+        if len(self.params) != self.ARITY[self.kind]:
+            raise ValueError(
+                f"'{self.kind}' takes {self.ARITY[self.kind]} parameter(s), "
+                f"got {len(self.params)}"
+            )
+        if any(p < 0 for p in self.params):
+            raise ValueError(f"Latency parameters must not be negative: {self.params}")
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """Parse "kind:p1,p2" (e.g. "lognormal:1.0,0.4"); a bare number is fixed."""
+        kind, _, params = spec.partition(":")
+        if not params:
+            try:
+                return cls("fixed", (float(kind),))
+            except ValueError:
+                pass
+        try:
+            values = tuple(float(p) for p in params.split(",") if p.strip())
+        except ValueError as e:
+            raise ValueError(f"Invalid latency distribution '{spec}': {e}") from e
+        return cls(kind.strip(), values)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "normal":
+            return max(0.0, rng.gauss(*self.params))
+        if self.kind == "lognormal":
+            median, sigma = self.params
+            return rng.lognormvariate(math.log(median), sigma) if median else 0.0
+        return rng.expovariate(1 / self.params[0]) if self.params[0] else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{','.join(f'{p:g}' for p in self.params)}"
+
+
+# ============================================================================
+# Generated emails
+# ============================================================================
+
+STARTUPS = [
+    "웨이크",
+    "브레이크앤컴퍼니",
+    "본봄",
+    "테이블매니저",
+    "스마트레이더시스템",
+    "파인더스에이아이",
+    "플라즈맵",
+    "어반베이스",
+]
+PARTNERS = ["신세계인터내셔날", "이마트", "SSG닷컴", "신세계푸드", "스타벅스코리아"]
+PEOPLE = ["김철수", "이영희", "박지민", "최수진", "정민호"]
+TOPICS = ["파일럿 킥오프", "PoC 결과 공유", "입점 논의", "공동 프로모션 기획", "계약 검토"]
+
+# Startups the Companies database does not know yet; their first email
+# creates a company page
+UNSEEDED_STARTUPS = STARTUPS[-2:]
+
+
+@dataclass
+class BenchmarkEmail:
+    """One generated email and the entities an LLM should extract from it."""
+
+    message_id: str
+    gmail_id: str
+    subject: str
+    body: str
+    person: str
+    startup: str
+    partner: str
+    details: str
+    date: datetime
+
+
+def generate_benchmark_emails(count: int, seed: int = 0) -> List[BenchmarkEmail]:
+    """Generate Korean collaboration emails with signatures, disclaimers and quotes.
+
+    Args:
+        count: Number of emails
+        seed: Random seed (same seed, same emails)
+
+    Returns:
+        Generated emails with their ground truth
+    """
+    rng = random.Random(seed)
+    emails = []
+    for i in range(count):
+        person = rng.choice(PEOPLE)
+        startup = rng.choice(STARTUPS)
+        partner = rng.choice(PARTNERS)
+        topic = rng.choice(TOPICS)
+        date = datetime(2025, 11, 1, tzinfo=UTC) + timedelta(days=rng.randrange(60))
+        details = (
+            f"{startup}와 {partner} 간 {topic} 건으로 "
+            f"{date.month}월 {date.day}일 미팅을 진행했습니다."
+        )
+        body = "\n".join(
+            [
+                "안녕하세요,",
+                "",
+                f"{partner} 협업 관련하여 공유드립니다.",
+                details,
+                "다음 단계는 세부 일정 확정 후 다시 말씀드리겠습니다.",
+                "",
+                "감사합니다.",
+                "",
+                "--",
+                f"{person} | 시그나이트파트너스",
+                "Tel. 02-0000-0000",
+                "",
+                "본 메일은 발신자의 허가 없이 배포할 수 없습니다. "
+                "This email is confidential and intended solely for the recipient.",
+                "",
+                f"On Mon, {date:%d %b %Y} at 10:00 {partner} wrote:",
+                f"> {startup} 측 자료 확인 부탁드립니다.",
+                "> 감사합니다.",
+            ]
+        )
+        emails.append(
+            BenchmarkEmail(
+                message_id=f"<bench-{seed}-{i}@collabiq.local>",
+                gmail_id=f"bench{seed:x}{i:06x}",
+                subject=f"[{startup}] {partner} {topic}",
+                body=body,
+                person=person,
+                startup=startup,
+                partner=partner,
+                details=details,
+                date=date,
+            )
+        )
+    return emails
+
+
+# ============================================================================
+# Gmail stand-in
+# ============================================================================
+
+
+class _GmailCall:
+    """Pending Gmail API call; execute() waits out the injected latency."""
+
+    def __init__(self, service: "FakeGmailService", result: Callable[[], Dict[str, Any]]):
+        self._service = service
+        self._result = result
+
+    def execute(self) -> Dict[str, Any]:
+        delay = self._service.next_latency()
+        if delay > 0:
+            time.sleep(delay)
+        return self._result()
+
+
+class FakeGmailService:
+    """In-memory stand-in for the Gmail API client built by GmailReceiver.
+
+    Supports ``users().messages().list(q=...)`` (honouring ``after:``),
+    ``users().messages().get(id=...)``, and for push notifications
+    ``users().watch()`` and ``users().history().list()``. Emails become
+    visible once delivered, with their arrival time as internalDate; each
+    delivered email advances the mailbox historyId.
+
+    Attributes:
+        latency: Latency of every API call
+        list_calls: Number of messages.list calls
+        get_calls: Number of messages.get calls
+        history_id: Current mailbox historyId
+        watch_requests: Bodies of users.watch calls
+    """
+
+    def __init__(self, latency: Optional[LatencyDistribution] = None, seed: int = 0):
+        self.latency = latency or LatencyDistribution()
+        self.list_calls = 0
+        self.get_calls = 0
+        self.history_id = 1000
+        self.watch_requests: List[Dict[str, Any]] = []
+        self._messages: Dict[str, Dict[str, Any]] = {}
+        self._history: List[Tuple[int, str]] = []
+        self._rng = random.Random(seed)
+
+    def deliver(self, emails: List[BenchmarkEmail]) -> int:
+        """Make emails visible to list/get, arriving now.
+
+        Returns:
+            The mailbox historyId after delivery (what Gmail would publish)
+        """
+        arrived = datetime.now(UTC)
+        for email in emails:
+            self.history_id += 1
+            self._history.append((self.history_id, email.gmail_id))
+            self._messages[email.gmail_id] = {
+                "id": email.gmail_id,
+                "threadId": email.gmail_id,
+                "internalDate": str(int(arrived.timestamp() * 1000)),
+                "payload": {
+                    "mimeType": "text/plain",
+                    "headers": [
+                        {"name": "Message-ID", "value": email.message_id},
+                        {"name": "From", "value": "partner@example.com"},
+                        {"name": "To", "value": "collab@signite.co"},
+                        {"name": "Subject", "value": email.subject},
+                        {"name": "Date", "value": format_datetime(arrived)},
+                    ],
+                    "body": {
+                        "data": base64.urlsafe_b64encode(
+                            email.body.encode("utf-8")
+                        ).decode("ascii")
+                    },
+                },
+                "labelIds": ["INBOX"],
+            }
+        return self.history_id
+
+    def next_latency(self) -> float:
+        return self.latency.sample(self._rng)
+
+    def users(self) -> "FakeGmailService":
+        return self
+
+    def messages(self) -> "FakeGmailService":
+        return self
+
+    def history(self) -> "_FakeGmailHistory":
+        return _FakeGmailHistory(self)
+
+    def watch(self, userId: str, body: Dict[str, Any]) -> _GmailCall:
+        self.watch_requests.append(body)
+        expiration = datetime.now(UTC) + timedelta(days=7)
+        return _GmailCall(
+            self,
+            lambda: {
+                "historyId": str(self.history_id),
+                "expiration": str(int(expiration.timestamp() * 1000)),
+            },
+        )
+
+    def list(self, userId: str, q: str = "", maxResults: int = 100, **kwargs) -> _GmailCall:
+        self.list_calls += 1
+        match = re.search(r"after:(\d+)", q)
+        after_ms = int(match.group(1)) * 1000 if match else 0
+
+        def result():
+            visible = [
+                m for m in self._messages.values() if int(m["internalDate"]) >= after_ms
+            ]
+            # Newest first, like Gmail
+            visible.sort(key=lambda m: int(m["internalDate"]), reverse=True)
+            return {
+                "messages": [
+                    {"id": m["id"], "threadId": m["threadId"]}
+                    for m in visible[:maxResults]
+                ]
+            }
+
+        return _GmailCall(self, result)
+
+    def get(self, userId: str, id: str, format: str = "full") -> _GmailCall:  # noqa: A002
+        self.get_calls += 1
+        return _GmailCall(self, lambda: self._messages[id])
+
+
+class _FakeGmailHistory:
+    """``users().history()`` of a FakeGmailService (messageAdded only)."""
+
+    def __init__(self, service: FakeGmailService):
+        self._service = service
+
+    def list(
+        self,
+        userId: str,
+        startHistoryId: str,
+        pageToken: Optional[str] = None,
+        maxResults: int = 100,
+        **kwargs,
+    ) -> _GmailCall:
+        service = self._service
+
+        def result():
+            start = int(startHistoryId)
+            offset = int(pageToken or 0)
+            records = [
+                {
+                    "id": str(history_id),
+                    "messagesAdded": [
+                        {"message": {"id": gmail_id, "labelIds": ["INBOX"]}}
+                    ],
+                }
+                for history_id, gmail_id in service._history
+                if history_id > start
+            ]
+            page = {
+                "history": records[offset : offset + maxResults],
+                "historyId": str(service.history_id),
+            }
+            if offset + maxResults < len(records):
+                page["nextPageToken"] = str(offset + maxResults)
+            return page
+
+        return _GmailCall(service, result)
+
+
+class OfflineGmailReceiver(GmailReceiver):
+    """GmailReceiver whose connect() uses a FakeGmailService instead of OAuth."""
+
+    def __init__(self, service: FakeGmailService, work_dir: Path):
+        super().__init__(
+            credentials_path=work_dir / "credentials.json",
+            token_path=work_dir / "token.json",
+            raw_email_dir=work_dir / "raw",
+            metadata_dir=work_dir / "metadata",
+        )
+        self._offline_service = service
+
+    def connect(self) -> None:
+        self.service = self._offline_service
+
+
+# ============================================================================
+# LLM stand-in
+# ============================================================================
+
+
+class StubLLMProvider(LLMProvider):
+    """LLM provider answering from the generated emails' ground truth.
+
+    Attributes:
+        name: Provider name (as used in the orchestrator's priority list)
+        latency: Latency of every call
+        failure_rate: Share of calls failing with LLMAPIError
+        calls: Number of calls made
+    """
+
+    def __init__(
+        self,
+        name: str,
+        emails: List[BenchmarkEmail],
+        latency: Optional[LatencyDistribution] = None,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError(f"failure_rate must be between 0 and 1, got {failure_rate}")
+        self.name = name
+        self.latency = latency or LatencyDistribution()
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self._emails = {email.message_id: email for email in emails}
+        self._rng = random.Random(f"{name}:{seed}")
+
+    async def _call(self) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.latency.sample(self._rng))
+        if self.failure_rate and self._rng.random() < self.failure_rate:
+            raise LLMAPIError(f"{self.name} stub: injected failure", status_code=503)
+
+    async def extract_entities(
+        self,
+        email_text: str,
+        company_context: Optional[str] = None,
+        email_id: Optional[str] = None,
+    ) -> ExtractedEntities:
+        await self._call()
+        email = self._emails.get(email_id or "")
+        return ExtractedEntities(
+            person_in_charge=email.person if email else None,
+            startup_name=email.startup if email else None,
+            partner_org=email.partner if email else None,
+            details=email.details if email else email_text[:200],
+            date=email.date if email else None,
+            confidence=ConfidenceScores(
+                person=0.9, startup=0.9, partner=0.9, details=0.9, date=0.9
+            ),
+            email_id=email_id or "unknown",
+        )
+
+    async def generate_summary(self, email_text: str) -> str:
+        await self._call()
+        first_line = next((line for line in email_text.splitlines() if line.strip()), "")
+        return f"{self.name} 요약: {first_line[:120]} (협업 진행 상황 공유 및 후속 일정 논의)"
+
+
+# ============================================================================
+# Stage timing
+# ============================================================================
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Linearly interpolated percentile (q in 0-100) of sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+@dataclass
+class StageStats:
+    """Latency statistics of one pipeline stage (seconds)."""
+
+    name: str
+    count: int
+    errors: int
+    total: float
+    p50: float
+    p90: float
+    p95: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_samples(cls, name: str, samples: List[float], errors: int = 0) -> "StageStats":
+        values = sorted(samples)
+        return cls(
+            name=name,
+            count=len(values),
+            errors=errors,
+            total=sum(values),
+            p50=percentile(values, 50),
+            p90=percentile(values, 90),
+            p95=percentile(values, 95),
+            p99=percentile(values, 99),
+            max=values[-1] if values else 0.0,
+        )
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "total": self.total,
+            "p50": self.p50,
+            "p90": self.p90,
+            "p95": self.p95,
+            "p99": self.p99,
+            "max": self.max,
+        }
+
+
+class StageRecorder:
+    """Times component methods by wrapping them on their instances.
+
+    A call counts as failed if it raises or its result fails the wrap's
+    ``succeeded`` check. The "email" stage spans from the first call keyed
+    by an email ID to the end of the call completing that email.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+        self._clock = clock
+        self._email_started: Dict[str, float] = {}
+
+    def wrap(
+        self,
+        obj: Any,
+        method_name: str,
+        stage: str,
+        email_key: Optional[Callable[..., Optional[str]]] = None,
+        completes_email: bool = False,
+        succeeded: Callable[[Any], bool] = lambda result: True,
+    ) -> None:
+        """Replace obj.method_name with a timed version.
+
+        Args:
+            obj: Component instance
+            method_name: Method to time (sync or async)
+            stage: Stage name to record under
+            email_key: Maps the call's (args, kwargs) to its email ID
+            completes_email: The call ends the email's end-to-end time
+            succeeded: Whether a returned result counts as success
+        """
+        method = getattr(obj, method_name)
+
+        def begin(args, kwargs) -> Tuple[float, Optional[str]]:
+            started = self._clock()
+            key = email_key(*args, **kwargs) if email_key else None
+            if key is not None:
+                self._email_started.setdefault(key, started)
+            return started, key
+
+        def end(started: float, key: Optional[str], ok: bool) -> None:
+            finished = self._clock()
+            self.samples[stage].append(finished - started)
+            if not ok:
+                self.errors[stage] += 1
+            if completes_email and key is not None and key in self._email_started:
+                self.samples["email"].append(finished - self._email_started.pop(key))
+                if not ok:
+                    self.errors["email"] += 1
+
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def timed(*args, **kwargs):
+                started, key = begin(args, kwargs)
+                try:
+                    result = await method(*args, **kwargs)
+                except BaseException:
+                    end(started, key, ok=False)
+                    raise
+                end(started, key, ok=succeeded(result))
+                return result
+
+        else:
+
+            @functools.wraps(method)
+            def timed(*args, **kwargs):
+                started, key = begin(args, kwargs)
+                try:
+                    result = method(*args, **kwargs)
+                except BaseException:
+                    end(started, key, ok=False)
+                    raise
+                end(started, key, ok=succeeded(result))
+                return result
+
+        setattr(obj, method_name, timed)
+
+    def stats(self) -> Dict[str, StageStats]:
+        """Statistics per stage, in the order stages were first seen."""
+        return {
+            stage: StageStats.from_samples(stage, samples, self.errors[stage])
+            for stage, samples in self.samples.items()
+        }
+
+
+# ============================================================================
+# Thresholds
+# ============================================================================
+
+
+@dataclass
+class ThresholdResult:
+    """Outcome of checking one stage (or the pipeline) against its thresholds."""
+
+    name: str
+    passed: bool
+    failures: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "passed": self.passed, "failures": self.failures}
+
+
+def check_stage(stats: StageStats, thresholds: PerformanceThresholds) -> ThresholdResult:
+    """Hold a stage's p95 latency and error rate to its thresholds.
+
+    The latency limit is max_response_time (per call), falling back to
+    max_processing_time. Stages run sequentially within a cycle, so
+    min_throughput is only checked for the pipeline as a whole.
+    """
+    failures = []
+    limit = thresholds.max_response_time or thresholds.max_processing_time
+    if limit is not None and stats.p95 > limit:
+        failures.append(f"p95 {stats.p95:.3f}s exceeds {limit:.3f}s")
+    if thresholds.max_error_rate is not None and stats.error_rate > thresholds.max_error_rate:
+        failures.append(
+            f"error rate {stats.error_rate:.2%} exceeds {thresholds.max_error_rate:.2%}"
+        )
+    return ThresholdResult(stats.name, not failures, failures)
+
+
+def check_pipeline(
+    throughput: float,
+    error_rate: float,
+    email_stats: Optional[StageStats],
+    thresholds: PerformanceThresholds = PIPELINE_THRESHOLDS,
+) -> ThresholdResult:
+    """Hold overall throughput, error rate and per-email time to PIPELINE_THRESHOLDS."""
+    failures = []
+    if thresholds.min_throughput is not None and throughput < thresholds.min_throughput:
+        failures.append(
+            f"throughput {throughput:.3f} emails/s below {thresholds.min_throughput:.3f}"
+        )
+    if thresholds.max_error_rate is not None and error_rate > thresholds.max_error_rate:
+        failures.append(
+            f"error rate {error_rate:.2%} exceeds {thresholds.max_error_rate:.2%}"
+        )
+    if (
+        thresholds.max_processing_time is not None
+        and email_stats is not None
+        and email_stats.p95 > thresholds.max_processing_time
+    ):
+        failures.append(
+            f"email p95 {email_stats.p95:.3f}s exceeds "
+            f"{thresholds.max_processing_time:.3f}s"
+        )
+    return ThresholdResult("pipeline", not failures, failures)
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+
+@dataclass
+class BenchmarkConfig:
+    """Benchmark workload and stand-in behaviour.
+
+    Attributes:
+        email_count: Emails delivered over the run
+        batch_size: Emails arriving before each cycle (at most the daemon's
+            per-cycle fetch limit)
+        gmail_latency: Latency of each Gmail API call
+        llm_latency: Latency of each LLM call (extraction and summary)
+        llm_failure_rate: Share of LLM calls failing (per provider)
+        llm_providers: Stub provider names, in failover priority
+        notion_rate_per_second: Request rate the Notion stub admits
+        notion_latency: Service time of each admitted Notion request
+        seed: Random seed for emails and latencies
+        work_dir: Directory for state and caches (default: a temporary one)
+    """
+
+    email_count: int = 20
+    batch_size: int = DAEMON_FETCH_LIMIT
+    gmail_latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    llm_latency: LatencyDistribution = field(
+        default_factory=lambda: LatencyDistribution("lognormal", (1.0, 0.4))
+    )
+    llm_failure_rate: float = 0.0
+    llm_providers: Tuple[str, ...] = ("gemini", "claude")
+    notion_rate_per_second: float = 3.0
+    notion_latency: LatencyDistribution = field(
+        default_factory=lambda: LatencyDistribution("fixed", (0.05,))
+    )
+    seed: int = 0
+    work_dir: Optional[Path] = None
+
+    def __post_init__(self):
+        if self.email_count < 1:
+            raise ValueError(f"email_count must be positive, got {self.email_count}")
+        if not 1 <= self.batch_size <= DAEMON_FETCH_LIMIT:
+            raise ValueError(
+                f"batch_size must be between 1 and {DAEMON_FETCH_LIMIT}, "
+                f"got {self.batch_size}"
+            )
+        if not self.llm_providers:
+            raise ValueError("llm_providers must not be empty")
+
+    @property
+    def cycles(self) -> int:
+        return math.ceil(self.email_count / self.batch_size)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "email_count": self.email_count,
+            "batch_size": self.batch_size,
+            "gmail_latency": str(self.gmail_latency),
+            "llm_latency": str(self.llm_latency),
+            "llm_failure_rate": self.llm_failure_rate,
+            "llm_providers": list(self.llm_providers),
+            "notion_rate_per_second": self.notion_rate_per_second,
+            "notion_latency": str(self.notion_latency),
+            "seed": self.seed,
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    """Results of one benchmark run."""
+
+    config: BenchmarkConfig
+    duration: float
+    cycles: int
+    emails_delivered: int
+    emails_processed: int
+    emails_skipped: int
+    errors: int
+    stages: Dict[str, StageStats]
+    notion: Dict[str, Any]
+    gmail: Dict[str, int]
+    llm_calls: Dict[str, int]
+    thresholds: List[ThresholdResult]
+
+    @property
+    def throughput(self) -> float:
+        """Processed emails per second of wall time."""
+        return self.emails_processed / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.emails_delivered if self.emails_delivered else 0.0
+
+    @property
+    def passed(self) -> bool:
+        return all(result.passed for result in self.thresholds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "config": self.config.to_dict(),
+            "duration": self.duration,
+            "cycles": self.cycles,
+            "emails_delivered": self.emails_delivered,
+            "emails_processed": self.emails_processed,
+            "emails_skipped": self.emails_skipped,
+            "errors": self.errors,
+            "throughput": self.throughput,
+            "error_rate": self.error_rate,
+            "stages": {name: stats.to_dict() for name, stats in self.stages.items()},
+            "notion": self.notion,
+            "gmail": self.gmail,
+            "llm_calls": self.llm_calls,
+            "thresholds": [result.to_dict() for result in self.thresholds],
+            "passed": self.passed,
+        }
+
+    def format_text(self) -> str:
+        """Human-readable report."""
+        lines = [
+            f"Pipeline benchmark: {self.emails_delivered} emails in "
+            f"{self.cycles} cycles, {self.duration:.2f}s",
+            f"Throughput: {self.throughput:.3f} emails/s "
+            f"(processed {self.emails_processed}, skipped {self.emails_skipped}, "
+            f"errors {self.errors})",
+            f"Notion stub: {self.notion.get('requests', 0)} requests, "
+            f"{self.notion.get('rate_limited', 0)} rate limited, "
+            f"peak {self.notion.get('peak_requests_per_second', 0)} req/s",
+            "LLM calls: "
+            + ", ".join(f"{name} {calls}" for name, calls in self.llm_calls.items()),
+            "",
+            f"{'stage':<16}{'count':>6}{'errors':>7}"
+            + "".join(f"{col:>9}" for col in ("p50", "p90", "p95", "p99", "max")),
+        ]
+        for stats in self.stages.values():
+            lines.append(
+                f"{stats.name:<16}{stats.count:>6}{stats.errors:>7}"
+                + "".join(
+                    f"{value:>8.3f}s"
+                    for value in (stats.p50, stats.p90, stats.p95, stats.p99, stats.max)
+                )
+            )
+        lines.append("")
+        lines.append("Thresholds:")
+        for result in self.thresholds:
+            status = "PASS" if result.passed else "FAIL"
+            detail = f": {'; '.join(result.failures)}" if result.failures else ""
+            lines.append(f"  {status} {result.name}{detail}")
+        lines.append(f"Result: {'PASS' if self.passed else 'FAIL'}")
+        return "\n".join(lines)
+
+
+class _OfflineReportGenerator:
+    """Report generator stand-in; the benchmark seeds state so it never runs."""
+
+    def generate_and_send(self, state):
+        raise RuntimeError("Daily reports are not sent during benchmarks")
+
+
+class _OfflineAlertManager:
+    """Alert manager stand-in; benchmarks never send alert mail."""
+
+    def __init__(self):
+        self.sent_alerts_history: List[datetime] = []
+
+    def process_alerts(self, state) -> list:
+        return []
+
+
+COMPANIES_PROPERTIES = {
+    "Name": {"id": "title", "name": "Name", "type": "title", "title": {}},
+    "Shinsegae affiliates?": {
+        "id": "ssg",
+        "name": "Shinsegae affiliates?",
+        "type": "checkbox",
+        "checkbox": {},
+    },
+    "Is Portfolio?": {
+        "id": "pf",
+        "name": "Is Portfolio?",
+        "type": "checkbox",
+        "checkbox": {},
+    },
+}
+
+
+def _collabiq_properties(companies_db_id: str) -> Dict[str, Any]:
+    """CollabIQ database schema as FieldMapper writes it."""
+    relation = {"database_id": companies_db_id, "type": "single_property"}
+    types = {
+        "제목": ("title", {}),
+        "담당자": ("people", {}),
+        "협업내용": ("rich_text", {}),
+        "스타트업명": ("relation", relation),
+        "협업기관": ("relation", relation),
+        "협업형태": ("select", {"options": []}),
+        "협업강도": ("select", {"options": []}),
+        "날짜": ("date", {}),
+        "Email ID": ("rich_text", {}),
+        "classification_timestamp": ("date", {}),
+    }
+    return {
+        name: {"id": f"p{i}", "name": name, "type": prop_type, prop_type: config}
+        for i, (name, (prop_type, config)) in enumerate(types.items())
+    }
+
+
+class PipelineBenchmark:
+    """Runs DaemonController.process_cycle() against offline stand-ins."""
+
+    COMPANIES_DB_ID = "bench-companies"
+    COLLABIQ_DB_ID = "bench-collabiq"
+
+    def __init__(self, config: Optional[BenchmarkConfig] = None):
+        self.config = config or BenchmarkConfig()
+
+    async def run(self) -> BenchmarkReport:
+        """Run the benchmark and return its report."""
+        if self.config.work_dir is not None:
+            self.config.work_dir.mkdir(parents=True, exist_ok=True)
+            return await self._run(self.config.work_dir)
+        with tempfile.TemporaryDirectory(prefix="collabiq-bench-") as work_dir:
+            return await self._run(Path(work_dir))
+
+    async def _run(self, work_dir: Path) -> BenchmarkReport:
+        config = self.config
+        emails = generate_benchmark_emails(config.email_count, config.seed)
+        notion_rng = random.Random(f"notion:{config.seed}")
+
+        stub = NotionStubServer(
+            rate_per_second=config.notion_rate_per_second,
+            latency=lambda: config.notion_latency.sample(notion_rng),
+            users=[
+                {
+                    "object": "user",
+                    "id": f"user-{i}",
+                    "type": "person",
+                    "name": name,
+                    "person": {"email": f"user{i}@signite.co"},
+                }
+                for i, name in enumerate(PEOPLE)
+            ],
+        )
+        self._seed_notion(stub)
+
+        with stub:
+            gmail = FakeGmailService(config.gmail_latency, seed=config.seed)
+            providers = {
+                name: StubLLMProvider(
+                    name,
+                    emails,
+                    latency=config.llm_latency,
+                    failure_rate=config.llm_failure_rate,
+                    seed=config.seed,
+                )
+                for name in config.llm_providers
+            }
+            controller = self._build_controller(stub, gmail, providers, work_dir)
+            recorder = self._instrument(controller)
+
+            start = time.perf_counter()
+            for cycle in range(config.cycles):
+                batch = emails[cycle * config.batch_size : (cycle + 1) * config.batch_size]
+                gmail.deliver(batch)
+                await controller.process_cycle()
+            duration = time.perf_counter() - start
+
+            await controller.notion_integrator.cache_manager.wait_for_refreshes()
+            field_mapper = controller.writer.field_mapper
+            if field_mapper is not None and field_mapper.companies_cache is not None:
+                await field_mapper.companies_cache.wait_for_refresh()
+            notion_stats = stub.get_stats()
+
+        state = controller.state_manager.load_state()
+        stages = recorder.stats()
+        errors = state.error_count
+        report = BenchmarkReport(
+            config=config,
+            duration=duration,
+            cycles=config.cycles,
+            emails_delivered=len(emails),
+            emails_processed=state.emails_processed_count,
+            emails_skipped=state.emails_skipped_count,
+            errors=errors,
+            stages=stages,
+            notion=notion_stats,
+            gmail={"list_calls": gmail.list_calls, "get_calls": gmail.get_calls},
+            llm_calls={name: provider.calls for name, provider in providers.items()},
+            thresholds=[],
+        )
+        report.thresholds = [
+            check_stage(stats, STAGE_THRESHOLDS[name])
+            for name, stats in stages.items()
+            if name in STAGE_THRESHOLDS
+        ]
+        report.thresholds.append(
+            check_pipeline(report.throughput, report.error_rate, stages.get("email"))
+        )
+        return report
+
+    def _seed_notion(self, stub: NotionStubServer) -> None:
+        """Create the Companies and CollabIQ databases and known companies."""
+        stub.add_database(
+            self.COMPANIES_DB_ID, COMPANIES_PROPERTIES, title="Benchmark Companies"
+        )
+        stub.add_database(
+            self.COLLABIQ_DB_ID,
+            _collabiq_properties(self.COMPANIES_DB_ID),
+            title="Benchmark CollabIQ",
+        )
+        known = [s for s in STARTUPS if s not in UNSEEDED_STARTUPS]
+        for name, portfolio, ssg in [(s, True, False) for s in known] + [
+            (p, False, True) for p in PARTNERS
+        ]:
+            stub.add_page(
+                self.COMPANIES_DB_ID,
+                {
+                    "Name": {"title": [{"text": {"content": name}}]},
+                    "Shinsegae affiliates?": {"checkbox": ssg},
+                    "Is Portfolio?": {"checkbox": portfolio},
+                },
+            )
+
+    def _build_controller(
+        self,
+        stub: NotionStubServer,
+        gmail: FakeGmailService,
+        providers: Dict[str, StubLLMProvider],
+        work_dir: Path,
+    ):
+        # Imported here: the daemon pulls in every pipeline component
+        from config.settings import Settings
+        from daemon.controller import DaemonController
+        from daemon.state_manager import StateManager
+        from llm_adapters.health_tracker import HealthTracker
+        from llm_orchestrator.orchestrator import LLMOrchestrator
+        from llm_orchestrator.types import OrchestrationConfig
+        from notion_integrator.integrator import NotionIntegrator
+        from notion_integrator.writer import NotionWriter
+
+        # A fresh token per run: rate limiters are shared per token
+        api_key = f"secret_benchmark_{uuid.uuid4().hex}"
+        cache_dir = str(work_dir / "notion_cache")
+        settings = Settings(
+            notion_api_key=api_key,
+            notion_database_id_collabiq=self.COLLABIQ_DB_ID,
+            notion_database_id_companies=self.COMPANIES_DB_ID,
+            duplicate_behavior="skip",
+        )
+
+        notion_integrator = NotionIntegrator(
+            api_key=api_key,
+            cache_dir=cache_dir,
+            base_url=stub.base_url,
+            stale_while_revalidate=True,
+        )
+        writer = NotionWriter(
+            notion_integrator=notion_integrator,
+            collabiq_db_id=self.COLLABIQ_DB_ID,
+            companies_db_id=self.COMPANIES_DB_ID,
+            duplicate_behavior="skip",
+            stale_while_revalidate=True,
+            cache_dir=cache_dir,
+        )
+        orchestrator = LLMOrchestrator(
+            providers=dict(providers),
+            config=OrchestrationConfig(
+                default_strategy="failover",
+                provider_priority=list(self.config.llm_providers),
+            ),
+            health_tracker=HealthTracker(data_dir=work_dir / "llm_health"),
+        )
+
+        state_manager = StateManager(work_dir / "state.json")
+        state = state_manager.load_state()
+        # Daily reports are out of scope; mark today's as sent
+        state.last_report_generated = datetime.now(UTC)
+        state_manager.save_state(state)
+
+        return DaemonController(
+            settings=settings,
+            state_manager=state_manager,
+            receiver=OfflineGmailReceiver(gmail, work_dir),
+            orchestrator=orchestrator,
+            notion_integrator=notion_integrator,
+            writer=writer,
+            report_generator=_OfflineReportGenerator(),
+            alert_manager=_OfflineAlertManager(),
+        )
+
+    def _instrument(self, controller) -> StageRecorder:
+        recorder = StageRecorder()
+        recorder.wrap(controller.notion_integrator, "format_for_llm", "company_context")
+        recorder.wrap(controller.receiver, "fetch_emails", "gmail_fetch")
+        recorder.wrap(
+            controller.writer,
+            "check_duplicate",
+            "duplicate_check",
+            email_key=lambda email_id, *args, **kwargs: email_id,
+        )
+        recorder.wrap(controller.normalizer, "process_raw_email", "normalize")
+        recorder.wrap(
+            controller.orchestrator,
+            "extract_entities",
+            "llm_extraction",
+            succeeded=lambda extracted: extracted is not None,
+        )
+        recorder.wrap(controller.summary_enhancer, "generate_summary", "llm_summary")
+        recorder.wrap(
+            controller.writer,
+            "create_collabiq_entry",
+            "notion_write",
+            email_key=lambda extracted, *args, **kwargs: extracted.email_id,
+            completes_email=True,
+            succeeded=lambda result: result.success,
+        )
+        return recorder
+
+
+async def run_pipeline_benchmark(
+    config: Optional[BenchmarkConfig] = None,
+) -> BenchmarkReport:
+    """Run PipelineBenchmark with config (default workload if None)."""
+    return await PipelineBenchmark(config).run()
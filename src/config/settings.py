@@ -13,7 +13,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, List
 
-from pydantic import Field, field_validator
+from pydantic import AliasChoices, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 if TYPE_CHECKING:
@@ -29,6 +29,8 @@ class Settings(BaseSettings):
         gmail_batch_size: Number of emails to fetch per batch
         pubsub_topic: Google Cloud Pub/Sub topic name
         pubsub_project_id: Google Cloud project ID
+        pubsub_subscription: Pub/Sub subscription the daemon pulls Gmail push
+            notifications from
         data_dir: Base directory for storing raw/cleaned emails
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_dir: Directory for log files
@@ -67,15 +69,24 @@ class Settings(BaseSettings):
         description="Fernet key for encrypting Gmail tokens at rest",
     )
 
-    # Google Cloud Pub/Sub Configuration (Future use)
+    # Google Cloud Pub/Sub Configuration (Gmail push notifications)
+    # Push is enabled when project, topic and subscription are all set
     pubsub_topic: Optional[str] = Field(
         default=None,
         description="Pub/Sub topic name for email notifications",
+        validation_alias=AliasChoices("PUBSUB_TOPIC", "PUBSUB_TOPIC_NAME"),
     )
     pubsub_project_id: Optional[str] = Field(
         default=None,
         description="Google Cloud project ID",
     )
+    pubsub_subscription: Optional[str] = Field(
+        default=None,
+        description="Pub/Sub subscription for Gmail push notifications",
+        validation_alias=AliasChoices(
+            "PUBSUB_SUBSCRIPTION", "PUBSUB_SUBSCRIPTION_NAME"
+        ),
+    )
 
     # Data Storage Configuration
     data_dir: Path = Field(
@@ -244,6 +255,53 @@ class Settings(BaseSettings):
         description="Days to retain archived reports",
     )
 
+    # Daemon Scheduling Configuration
+    daemon_max_interval_minutes: int = Field(
+        default=60,
+        ge=1,
+        description="Longest delay between polling cycles while the inbox is idle",
+    )
+    daemon_backoff_factor: float = Field(
+        default=2.0,
+        ge=1.0,
+        description="Idle polling delay multiplier per consecutive idle cycle",
+    )
+    daemon_cycle_budget_seconds: Optional[float] = Field(
+        default=600.0,
+        gt=0,
+        description="Time a cycle may spend before leaving remaining emails to the next one",
+    )
+
+    # Multi-instance work distribution
+    daemon_lease_store: Optional[str] = Field(
+        default=None,
+        description=(
+            "Shared lease store letting several daemons split the work "
+            "(sqlite:///path or gs://bucket/prefix); unset for a single daemon"
+        ),
+    )
+    daemon_lease_seconds: float = Field(
+        default=600.0,
+        gt=0,
+        description="How long a daemon holds an email before others may take it over",
+    )
+
+    # Near-duplicate detection (forwarded / CC'd copies of one email)
+    daemon_near_duplicate_window_hours: float = Field(
+        default=72.0,
+        ge=0,
+        description=(
+            "How far back a written email with a nearly identical cleaned body "
+            "makes a new one a duplicate; 0 disables detection"
+        ),
+    )
+    daemon_near_duplicate_max_distance: int = Field(
+        default=6,
+        ge=0,
+        le=32,
+        description="Largest SimHash bit difference between near-duplicate emails",
+    )
+
     @field_validator("duplicate_behavior")
     @classmethod
     def validate_duplicate_behavior(cls, v: str) -> str:
@@ -0,0 +1,261 @@
+"""
+Bulk re-cleaning of archived raw emails.
+
+After a change to patterns.py, every archived email in data/raw has to be
+cleaned again. bulk_clean() does this in parallel:
+
+- raw files are streamed from the input directory (recursively) and
+  grouped into batches
+- batches are cleaned in a process pool, since regex work is CPU-bound
+  and holds the GIL; at most two batches per worker are in flight, so
+  memory stays bounded however large the archive is
+- each finished batch is written out, and the manifest saved with it
+- inputs whose content hash and cleaning version (pattern set plus
+  normalizer options) match the manifest are skipped
+
+Cleaned files mirror the raw layout: data/raw/YYYY/MM/name.json becomes
+data/cleaned/YYYY/MM/name.json, so re-cleaning replaces earlier output.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from ..models.raw_email import RawEmail
+    from . import patterns
+    from .normalizer import DEFAULT_TOKEN_BUDGET, MAX_BODY_CHARS, ContentNormalizer
+except ImportError:
+    from models.raw_email import RawEmail
+    from content_normalizer import patterns
+    from content_normalizer.normalizer import (
+        DEFAULT_TOKEN_BUDGET,
+        MAX_BODY_CHARS,
+        ContentNormalizer,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Manifest file in the output directory
+MANIFEST_NAME = ".bulk_clean_manifest.json"
+
+# Emails per batch sent to a worker (and per manifest save)
+DEFAULT_BATCH_SIZE = 200
+
+# (relative path, raw file bytes)
+_Item = Tuple[str, bytes]
+
+
+@dataclass
+class BulkCleanStats:
+    """Counts and throughput of one bulk_clean() run."""
+
+    scanned: int = 0
+    cleaned: int = 0
+    skipped: int = 0
+    empty: int = 0
+    failed: int = 0
+    bytes_cleaned: int = 0
+    elapsed_seconds: float = 0.0
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def emails_per_second(self) -> float:
+        """Cleaned emails per second of wall time."""
+        return self.cleaned / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Raw input cleaned per second of wall time, in MB."""
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.bytes_cleaned / 1_000_000 / self.elapsed_seconds
+
+    def to_dict(self) -> dict:
+        """Counts and rates (without errors) for JSON output."""
+        return {
+            "scanned": self.scanned,
+            "cleaned": self.cleaned,
+            "skipped": self.skipped,
+            "empty": self.empty,
+            "failed": self.failed,
+            "duration_ms": int(self.elapsed_seconds * 1000),
+            "emails_per_second": round(self.emails_per_second, 1),
+            "megabytes_per_second": round(self.megabytes_per_second, 2),
+        }
+
+
+def cleaning_version(
+    token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+    max_chars: Optional[int] = MAX_BODY_CHARS,
+) -> str:
+    """Version of cleaning output: the pattern set and normalizer options."""
+    return f"{patterns.pattern_set_version()}:{token_budget}:{max_chars}"
+
+
+def _load_manifest(path: Path) -> Dict[str, dict]:
+    """Manifest entries by relative path ({} if missing or unreadable)."""
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("files", {})
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable bulk clean manifest {path}: {e}")
+        return {}
+
+
+def _save_manifest(path: Path, entries: Dict[str, dict]) -> None:
+    """Write the manifest atomically."""
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps({"files": entries}, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+# Per-process normalizer, created by _init_worker()
+_worker_normalizer: Optional[ContentNormalizer] = None
+
+
+def _init_worker(token_budget: Optional[int], max_chars: Optional[int]) -> None:
+    global _worker_normalizer
+    _worker_normalizer = ContentNormalizer(token_budget=token_budget, max_chars=max_chars)
+
+
+def _clean_batch(batch: List[_Item]) -> List[Tuple[str, Optional[str], bool, Optional[str]]]:
+    """
+    Clean a batch of raw emails (runs in a worker process).
+
+    Returns:
+        (relative path, CleanedEmail JSON or None, is_empty, error or None)
+        per email
+    """
+    results = []
+    for rel_path, raw_bytes in batch:
+        try:
+            raw_email = RawEmail.model_validate_json(raw_bytes)
+            cleaned = _worker_normalizer.process_raw_email(raw_email)
+            results.append(
+                (rel_path, cleaned.model_dump_json(indent=2), cleaned.is_empty, None)
+            )
+        except Exception as e:
+            results.append((rel_path, None, False, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def _batches(items: Iterable[_Item], size: int) -> Iterator[List[_Item]]:
+    batch: List[_Item] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def bulk_clean(
+    input_dir: Path = Path("data/raw"),
+    output_dir: Path = Path("data/cleaned"),
+    *,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    force: bool = False,
+    token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+    max_chars: Optional[int] = MAX_BODY_CHARS,
+) -> BulkCleanStats:
+    """
+    Clean all raw emails under input_dir into output_dir.
+
+    Args:
+        input_dir: Directory of raw email JSON files (searched recursively)
+        output_dir: Directory for cleaned emails and the manifest
+        workers: Worker processes (default: CPU count; 1 cleans in-process)
+        batch_size: Emails per worker task and per manifest save
+        force: Re-clean even inputs the manifest marks as up to date
+        token_budget: ContentNormalizer token budget
+        max_chars: ContentNormalizer character limit
+
+    Returns:
+        BulkCleanStats with counts, throughput and per-file errors
+    """
+    input_dir = Path(input_dir)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, workers or os.cpu_count() or 1)
+    version = cleaning_version(token_budget, max_chars)
+    manifest_path = output_dir / MANIFEST_NAME
+    manifest = _load_manifest(manifest_path)
+    stats = BulkCleanStats()
+    # Content hash and size of each file sent for cleaning
+    pending: Dict[str, Tuple[str, int]] = {}
+    start = time.perf_counter()
+
+    def changed_inputs() -> Iterator[_Item]:
+        for path in sorted(input_dir.rglob("*.json")):
+            rel_path = path.relative_to(input_dir).as_posix()
+            raw_bytes = path.read_bytes()
+            digest = hashlib.sha256(raw_bytes).hexdigest()
+            stats.scanned += 1
+            entry = manifest.get(rel_path)
+            if (
+                not force
+                and entry
+                and entry.get("sha256") == digest
+                and entry.get("version") == version
+                and (output_dir / rel_path).exists()
+            ):
+                stats.skipped += 1
+                continue
+            pending[rel_path] = (digest, len(raw_bytes))
+            yield rel_path, raw_bytes
+
+    def write_batch(results) -> None:
+        for rel_path, cleaned_json, is_empty, error in results:
+            digest, size = pending.pop(rel_path)
+            if error is not None:
+                stats.failed += 1
+                stats.errors[rel_path] = error
+                logger.warning(f"Bulk clean failed for {rel_path}: {error}")
+                continue
+            out_path = output_dir / rel_path
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            out_path.write_text(cleaned_json, encoding="utf-8")
+            manifest[rel_path] = {"sha256": digest, "version": version}
+            stats.cleaned += 1
+            stats.bytes_cleaned += size
+            stats.empty += is_empty
+        _save_manifest(manifest_path, manifest)
+
+    batches = _batches(changed_inputs(), batch_size)
+    if workers == 1:
+        _init_worker(token_budget, max_chars)
+        for batch in batches:
+            write_batch(_clean_batch(batch))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(token_budget, max_chars),
+        ) as executor:
+            in_flight = set()
+            for batch in batches:
+                in_flight.add(executor.submit(_clean_batch, batch))
+                if len(in_flight) >= 2 * workers:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        write_batch(future.result())
+            for future in in_flight:
+                write_batch(future.result())
+
+    stats.elapsed_seconds = time.perf_counter() - start
+    logger.info(
+        f"Bulk clean: {stats.cleaned} cleaned, {stats.skipped} skipped, "
+        f"{stats.failed} failed in {stats.elapsed_seconds:.1f}s "
+        f"({stats.emails_per_second:.0f} emails/s)"
+    )
+    return stats
@@ -0,0 +1,208 @@
+"""
+HTML-to-text conversion for ContentNormalizer.
+
+Gmail bodies without a text/plain part arrive as raw text/html. Newsletters
+and forwarded threads then carry markup, inline CSS, tracking links and
+unsubscribe footers that cost LLM tokens without adding information.
+html_to_text() turns such a body into plain text:
+
+- script/style/head content and comments are dropped
+- block elements become line breaks, list items "- " lines
+- <blockquote> content is prefixed with "> ", so the quoted-thread stage
+  removes it like a plain-text reply chain
+- links keep their text only; visible URLs lose query strings and long
+  paths (tracking parameters); images are dropped
+- short boilerplate lines ("Unsubscribe", "View in browser", "수신거부") are
+  dropped
+- whitespace (including &nbsp; and zero-width padding) is normalized
+
+Uses only the standard library HTMLParser.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import List
+from urllib.parse import urlsplit
+
+# Elements whose content is never visible text
+_SKIP_TAGS = frozenset(
+    {"script", "style", "head", "title", "noscript", "template", "svg", "iframe", "object"}
+)
+
+# Elements that start a new line
+_BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "center", "dd", "div", "dl", "dt",
+        "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4",
+        "h5", "h6", "header", "hr", "main", "nav", "ol", "p", "pre",
+        "section", "table", "tbody", "tfoot", "thead", "tr", "ul",
+    }
+)
+
+# Elements followed by a blank line (a paragraph break)
+_PARAGRAPH_TAGS = frozenset(
+    {"article", "h1", "h2", "h3", "h4", "h5", "h6", "hr", "ol", "p", "pre", "section", "table", "ul"}
+)
+
+# Cheap check for markup: a document-level tag, or several common tags
+_HTML_DOCUMENT = re.compile(r"<(?:!doctype\s+html|html|body|head)\b", re.IGNORECASE)
+_HTML_TAG = re.compile(
+    r"</?(?:a|b|br|div|font|i|img|li|p|span|strong|table|td|tr|ul)\b[^>]*>", re.IGNORECASE
+)
+
+# Whitespace as it appears in HTML mail, including &nbsp; and zero-width
+# characters used to pad preheaders
+_SPACES = re.compile(r"[\s\u00a0\u034f\u200b\u200c\u200d\u2060\ufeff]+")
+
+_URL = re.compile(r"https?://[^\s<>\"'()\[\]]+", re.IGNORECASE)
+
+# Longest URL path kept as is; longer ones are cut to the host
+_MAX_URL_PATH = 40
+
+# Footer lines carrying no content (matched on lines up to 200 characters)
+_BOILERPLATE = re.compile(
+    r"unsubscribe|view (?:this (?:email|message) )?(?:in|on) (?:your |a |the )?(?:web ?)?browser"
+    r"|manage (?:your )?(?:email |subscription )?preferences|update your preferences"
+    r"|you (?:are )?receiv(?:ed|ing) this (?:email|message) because"
+    r"|수신\s*거부|구독\s*(?:취소|해지)|(?:웹|브라우저)\s*(?:에서|로)?\s*보기|발신\s*전용",
+    re.IGNORECASE,
+)
+
+# Lines made only of separators/bullets left over from layout tables
+_EMPTY_LINE = re.compile(r"^[\s|•·\-–—_=*>]*$")
+
+
+def looks_like_html(text: str) -> bool:
+    """True if the text is HTML markup rather than plain text."""
+    head = text[:5000]
+    if _HTML_DOCUMENT.search(head):
+        return True
+    return len(_HTML_TAG.findall(head)) >= 2
+
+
+def collapse_url(url: str) -> str:
+    """Drop query string and fragment, and long (tracking) paths, from a URL."""
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return url
+    path = parts.path.rstrip("/")
+    if len(path) > _MAX_URL_PATH:
+        return parts.netloc
+    return f"{parts.netloc}{path}"
+
+
+class _TextExtractor(HTMLParser):
+    """Collects visible text, one list entry per output line."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines: List[str] = []
+        self._line: List[str] = []
+        self._skip_depth = 0
+        self._quote_depth = 0
+        self._pre_depth = 0
+        self._line_quote_depth = 0
+
+    def _newline(self) -> None:
+        """End the current line, if any."""
+        if self._line:
+            prefix = "> " * self._line_quote_depth
+            self.lines.append(prefix + "".join(self._line).strip())
+            self._line = []
+
+    def _paragraph(self) -> None:
+        """End the current line and leave a blank one."""
+        self._newline()
+        if self.lines and self.lines[-1] != "":
+            self.lines.append("")
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "br":
+            if self._line:
+                self._newline()
+            else:
+                self._paragraph()
+        elif tag == "li":
+            self._newline()
+            self._write("- ")
+        elif tag == "blockquote":
+            self._newline()
+            self._quote_depth += 1
+        elif tag in ("td", "th"):
+            self._write(" ")
+        elif tag in _BLOCK_TAGS:
+            if tag == "pre":
+                self._pre_depth += 1
+            self._newline()
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "blockquote":
+            self._paragraph()
+            self._quote_depth = max(0, self._quote_depth - 1)
+        elif tag in _BLOCK_TAGS or tag == "li":
+            if tag == "pre":
+                self._pre_depth = max(0, self._pre_depth - 1)
+            if tag in _PARAGRAPH_TAGS:
+                self._paragraph()
+            else:
+                self._newline()
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if self._pre_depth:
+            for i, line in enumerate(data.split("\n")):
+                if i:
+                    self._newline()
+                self._write(line)
+            return
+        self._write(_SPACES.sub(" ", data))
+
+    def _write(self, text: str) -> None:
+        if not self._line:
+            text = text.lstrip()
+            if not text:
+                return
+            self._line_quote_depth = self._quote_depth
+        self._line.append(text)
+
+    def close(self):
+        super().close()
+        self._newline()
+
+
+def html_to_text(html: str) -> str:
+    """
+    Convert an HTML email body to compact plain text.
+
+    Args:
+        html: HTML markup
+
+    Returns:
+        Visible text with links collapsed, boilerplate lines dropped and
+        whitespace normalized
+    """
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+
+    lines: List[str] = []
+    for line in parser.lines:
+        line = _URL.sub(lambda m: collapse_url(m.group(0)), line)
+        line = _SPACES.sub(" ", line).strip()
+        if line and (
+            _EMPTY_LINE.match(line) or (len(line) <= 200 and _BOILERPLATE.search(line))
+        ):
+            continue
+        if not line:
+            # At most one blank line in a row, none at the start
+            if lines and lines[-1]:
+                lines.append("")
+            continue
+        lines.append(line)
+
+    return "\n".join(lines).strip()
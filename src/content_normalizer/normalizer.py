@@ -2,27 +2,38 @@
 Content normalizer for email text cleaning.
 
 This module defines the ContentNormalizer class that removes signatures,
-quoted threads, and disclaimers from email body text.
+quoted threads, and disclaimers from email body text, converts HTML bodies
+to text and trims over-long bodies to a token budget.
 """
 
 import json
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Optional
+from typing import AbstractSet, Optional
 
 try:
     from ..models.cleaned_email import CleanedEmail, CleaningStatus, RemovedContent
     from ..models.raw_email import RawEmail
     from . import patterns
+    from .html_text import html_to_text, looks_like_html
+    from .token_budget import trim_to_budget
 except ImportError:
     from models.cleaned_email import CleanedEmail, CleaningStatus, RemovedContent
     from models.raw_email import RawEmail
     from content_normalizer import patterns
+    from content_normalizer.html_text import html_to_text, looks_like_html
+    from content_normalizer.token_budget import trim_to_budget
 
 # Configure logging (FR-009)
 logger = logging.getLogger(__name__)
 
+# Default token budget for a cleaned body (see token_budget.estimate_tokens)
+DEFAULT_TOKEN_BUDGET = 4000
+
+# Longest cleaned body; LLMOrchestrator truncates extraction input beyond it
+MAX_BODY_CHARS = 10000
+
 
 class CleaningResult:
     """
@@ -55,12 +66,27 @@ class ContentNormalizer:
     - SC-003: Remove quoted threads from 95%+ of test emails
     """
 
+    def __init__(
+        self,
+        token_budget: Optional[int] = DEFAULT_TOKEN_BUDGET,
+        max_chars: Optional[int] = MAX_BODY_CHARS,
+    ):
+        """
+        Args:
+            token_budget: Estimated tokens a cleaned body may use; longer
+                bodies keep their most informative paragraphs (None: no limit)
+            max_chars: Character limit applied with the token budget
+        """
+        self.token_budget = token_budget
+        self.max_chars = max_chars
+
     def clean(
         self,
         body: str,
         remove_signatures: bool = True,
         remove_quotes: bool = True,
         remove_disclaimers: bool = True,
+        convert_html: bool = True,
     ) -> CleaningResult:
         """
         Remove signatures, quoted threads, and disclaimers from email body text.
@@ -70,12 +96,18 @@ class ContentNormalizer:
         Stage 2: Remove quoted threads
         Stage 3: Remove signatures
 
+        HTML bodies are converted to text first (html_text.html_to_text), and
+        the result is trimmed to the token budget last. The literal anchors
+        of all patterns are scanned once (patterns.scan_anchors), so each
+        stage only runs the patterns that can match.
+
         Args:
             body: Raw email body text containing collaboration content mixed with
                   signatures, quoted threads, and disclaimers.
             remove_signatures: Enable signature removal (FR-004)
             remove_quotes: Enable quoted thread removal (FR-005)
             remove_disclaimers: Enable disclaimer removal (FR-006)
+            convert_html: Convert HTML bodies to text
 
         Returns:
             CleaningResult object containing cleaned body text and removal metadata.
@@ -105,36 +137,56 @@ class ContentNormalizer:
         signature_removed = False
         quoted_thread_removed = False
         disclaimer_removed = False
+        html_converted = False
+        trimmed = False
+
+        # Stage 0: HTML to text (markup, styles, tracking links, footers)
+        if convert_html and looks_like_html(cleaned):
+            cleaned = html_to_text(cleaned)
+            html_converted = True
+
+        # One pass finds every pattern anchor; stages only cut the text
+        # shorter, so the set stays valid for all of them
+        anchors = patterns.scan_anchors(cleaned)
 
         # Stage 1: Remove disclaimers (FR-006)
         if remove_disclaimers:
-            disclaimer_result = self.remove_disclaimer(cleaned)
+            disclaimer_result = self.remove_disclaimer(cleaned, anchors=anchors)
             if len(disclaimer_result) < len(cleaned):
                 disclaimer_removed = True
                 cleaned = disclaimer_result
 
         # Stage 2: Remove quoted threads (FR-005)
         if remove_quotes:
-            quote_result = self.remove_quoted_thread(cleaned)
+            quote_result = self.remove_quoted_thread(cleaned, anchors=anchors)
             if len(quote_result) < len(cleaned):
                 quoted_thread_removed = True
                 cleaned = quote_result
 
         # Stage 3: Remove signatures (FR-004)
         if remove_signatures:
-            signature_result = self.remove_signature(cleaned)
+            signature_result = self.remove_signature(cleaned, anchors=anchors)
             if len(signature_result) < len(cleaned):
                 signature_removed = True
                 cleaned = signature_result
 
         cleaned = cleaned.strip()
+
+        # Stage 4: Fit the token budget, keeping the informative paragraphs
+        if self.token_budget is not None:
+            trimmed_text = trim_to_budget(cleaned, self.token_budget, self.max_chars)
+            if trimmed_text != cleaned:
+                trimmed = True
+                cleaned = trimmed_text
+
         cleaned_length = len(cleaned)
 
         # Log final result
         logger.info(
             f"Email cleaned: {original_length} → {cleaned_length} chars "
             f"(signature={signature_removed}, quotes={quoted_thread_removed}, "
-            f"disclaimer={disclaimer_removed})"
+            f"disclaimer={disclaimer_removed}, html={html_converted}, "
+            f"trimmed={trimmed})"
         )
 
         return CleaningResult(
@@ -145,25 +197,33 @@ class ContentNormalizer:
                 signature_removed=signature_removed,
                 quoted_thread_removed=quoted_thread_removed,
                 disclaimer_removed=disclaimer_removed,
+                html_converted=html_converted,
+                trimmed=trimmed,
             ),
         )
 
-    def detect_signature(self, body: str) -> Optional[int]:
+    def detect_signature(
+        self, body: str, anchors: Optional[AbstractSet[str]] = None
+    ) -> Optional[int]:
         """
         Detect signature location in email body text.
 
         Args:
             body: Email body text
+            anchors: patterns.scan_anchors() result for body (or a text it
+                was cut from), to skip patterns that cannot match
 
         Returns:
             Starting position of signature, or None if no signature detected
         """
-        result = patterns.detect_signature(body)
+        result = patterns.detect_signature(body, anchors)
         if result is None:
             return None
         return result[0]  # Return only position
 
-    def remove_signature(self, body: str) -> str:
+    def remove_signature(
+        self, body: str, anchors: Optional[AbstractSet[str]] = None
+    ) -> str:
         """
         Remove email signature from body text using Korean and English patterns.
 
@@ -171,6 +231,8 @@ class ContentNormalizer:
 
         Args:
             body: Email body text
+            anchors: patterns.scan_anchors() result for body (or a text it
+                was cut from), to skip patterns that cannot match
 
         Returns:
             Text with signature removed (or original if no signature detected)
@@ -184,7 +246,7 @@ class ContentNormalizer:
             logger.debug("Empty body provided to remove_signature")
             return body
 
-        result = patterns.detect_signature(body)
+        result = patterns.detect_signature(body, anchors)
         if result is None:
             logger.debug("No signature detected in email body")
             return body
@@ -201,22 +263,28 @@ class ContentNormalizer:
 
         return cleaned_body
 
-    def detect_quoted_thread(self, body: str) -> Optional[int]:
+    def detect_quoted_thread(
+        self, body: str, anchors: Optional[AbstractSet[str]] = None
+    ) -> Optional[int]:
         """
         Detect quoted thread location in email body text.
 
         Args:
             body: Email body text
+            anchors: patterns.scan_anchors() result for body (or a text it
+                was cut from), to skip patterns that cannot match
 
         Returns:
             Starting position of quoted thread, or None if no quotes detected
         """
-        result = patterns.detect_quoted_thread(body)
+        result = patterns.detect_quoted_thread(body, anchors)
         if result is None:
             return None
         return result[0]  # Return only position
 
-    def remove_quoted_thread(self, body: str) -> str:
+    def remove_quoted_thread(
+        self, body: str, anchors: Optional[AbstractSet[str]] = None
+    ) -> str:
         """
         Remove quoted email thread content (reply chains).
 
@@ -227,6 +295,8 @@ class ContentNormalizer:
 
         Args:
             body: Email body text
+            anchors: patterns.scan_anchors() result for body (or a text it
+                was cut from), to skip patterns that cannot match
 
         Returns:
             Text with quoted content removed (or original if no quotes detected)
@@ -240,7 +310,7 @@ class ContentNormalizer:
             logger.debug("Empty body provided to remove_quoted_thread")
             return body
 
-        result = patterns.detect_quoted_thread(body)
+        result = patterns.detect_quoted_thread(body, anchors)
         if result is None:
             logger.debug("No quoted thread detected in email body")
             return body
@@ -257,22 +327,28 @@ class ContentNormalizer:
 
         return cleaned_body
 
-    def detect_disclaimer(self, body: str) -> Optional[int]:
+    def detect_disclaimer(
+        self, body: str, anchors: Optional[AbstractSet[str]] = None
+    ) -> Optional[int]:
         """
         Detect disclaimer location in email body text.
 
         Args:
             body: Email body text
+            anchors: patterns.scan_anchors() result for body (or a text it
+                was cut from), to skip patterns that cannot match
 
         Returns:
             Starting position of disclaimer, or None if no disclaimer detected
         """
-        result = patterns.detect_disclaimer(body)
+        result = patterns.detect_disclaimer(body, anchors)
         if result is None:
             return None
         return result[0]  # Return only position
 
-    def remove_disclaimer(self, body: str) -> str:
+    def remove_disclaimer(
+        self, body: str, anchors: Optional[AbstractSet[str]] = None
+    ) -> str:
         """
         Remove legal disclaimers and confidentiality notices.
 
@@ -283,6 +359,8 @@ class ContentNormalizer:
 
         Args:
             body: Email body text
+            anchors: patterns.scan_anchors() result for body (or a text it
+                was cut from), to skip patterns that cannot match
 
         Returns:
             Text with disclaimer removed (or original if no disclaimer detected)
@@ -296,7 +374,7 @@ class ContentNormalizer:
             logger.debug("Empty body provided to remove_disclaimer")
             return body
 
-        result = patterns.detect_disclaimer(body)
+        result = patterns.detect_disclaimer(body, anchors)
         if result is None:
             logger.debug("No disclaimer detected in email body")
             return body
@@ -10,10 +10,17 @@ Tasks:
 - T053: Korean signature patterns
 - T054: English signature patterns
 - T055: Heuristic fallback patterns
+
+Every pattern with a literal anchor (e.g. "wrote:", "드림", "confidential")
+is listed in PATTERN_ANCHORS. scan_anchors() finds all anchors present in
+a text up front, and the find_*/detect_*/remove_* functions given that
+set skip patterns whose anchors are absent: such patterns cannot match, so
+results are identical, but most regexes never run.
 """
 
+import hashlib
 import re
-from typing import Optional, List, Tuple
+from typing import AbstractSet, Dict, FrozenSet, Optional, List, Tuple
 
 
 # ============================================================================
@@ -144,17 +151,115 @@ def detect_short_final_line(
 # TODO: Implement in future with pattern frequency tracking
 
 
+# ============================================================================
+# Anchor Prefilter
+# ============================================================================
+
+# Literal anchors, lowercase; every match of a pattern in PATTERN_ANCHORS
+# contains at least one of the pattern's anchors (ignoring case)
+ANCHOR_CLASSES: Dict[str, Tuple[str, ...]] = {
+    "korean_name_suffix": ("드림", "올림"),
+    "korean_thanks": ("감사합니다", "감사드립니다", "고맙습니다", "수고하세요"),
+    "korean_title": ("부장", "과장", "대리", "팀장", "이사", "대표", "매니저"),
+    "english_closing": ("regards", "sincerely", "yours"),
+    "english_thanks": ("thank", "cheers", "best"),
+    "contact_label": ("phone:", "mobile:", "tel:", "email:"),
+    "wrote": ("wrote:",),
+    "korean_wrote": ("작성:",),
+    "sent": ("sent:",),
+    "notice": ("notice",),
+    "disclaimer": ("disclaimer",),
+    "intended": ("intended",),
+    "confidential": ("confidential",),
+    "privilege": ("privilege",),
+    "unauthorized": ("unauthorized", "unauthorised"),
+}
+
+# Separator lines ("---", "=-=", "___") have no single literal
+SEPARATOR_ANCHOR = re.compile(r"[-=_]{3}")
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters; mapped
+# before lower() so the literal check never misses what a pattern matches
+_CASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+# Pattern name -> anchor classes, any of which must be present to match
+PATTERN_ANCHORS: Dict[str, Tuple[str, ...]] = {
+    # Signatures
+    "korean_thanks_name": ("korean_name_suffix",),
+    "korean_greeting_signature": ("korean_name_suffix",),
+    "korean_contact_block": ("korean_title",),
+    "korean_name_only": ("korean_name_suffix",),
+    "korean_closing_only": ("korean_thanks",),
+    "english_formal_closing": ("english_closing",),
+    "english_informal_closing": ("english_thanks",),
+    "english_contact_block": ("separator",),
+    "english_phone_email_block": ("contact_label",),
+    "english_confidentiality_notice": ("notice", "disclaimer"),
+    "separator_line_signature": ("separator",),
+    # Quoted threads
+    "gmail_reply_header": ("wrote",),
+    "outlook_reply_header": ("sent",),
+    "korean_reply_header": ("korean_wrote", "wrote"),
+    "simple_on_date_wrote": ("wrote",),
+    # Disclaimers
+    "confidentiality_notice": ("notice",),
+    "legal_disclaimer": ("disclaimer",),
+    "intended_only_notice": ("intended",),
+    "separator_disclaimer": ("separator",),
+    "confidential_disclaimer": ("confidential",),
+    "privileged_communication": ("privilege",),
+    "unauthorized_use": ("unauthorized",),
+}
+
+def scan_anchors(text: str) -> FrozenSet[str]:
+    """
+    Find which anchor classes occur in text.
+
+    The text is case-folded once and searched for the literal anchors with
+    str's substring search, which is faster than one alternation regex
+    (Python's re has no multi-literal automaton). The result stays valid
+    for any prefix of text (e.g. after an earlier stage cut the text), so
+    one scan serves all cleaning stages; pass it as anchors=.
+
+    Args:
+        text: Email body text
+
+    Returns:
+        Names of the ANCHOR_CLASSES present (plus "separator")
+    """
+    folded = text.lower() if text.isascii() else text.translate(_CASE_FOLD).lower()
+    found = {
+        name
+        for name, literals in ANCHOR_CLASSES.items()
+        if any(literal in folded for literal in literals)
+    }
+    if SEPARATOR_ANCHOR.search(text):
+        found.add("separator")
+    return frozenset(found)
+
+
+def _may_match(name: str, anchors: Optional[AbstractSet[str]]) -> bool:
+    """False if the anchors rule out pattern `name` (None: unknown, try it)."""
+    if anchors is None:
+        return True
+    required = PATTERN_ANCHORS.get(name)
+    return required is None or not anchors.isdisjoint(required)
+
+
 # ============================================================================
 # Pattern Matching Functions
 # ============================================================================
 
 
-def find_korean_signature(text: str) -> Optional[Tuple[int, str]]:
+def find_korean_signature(
+    text: str, anchors: Optional[AbstractSet[str]] = None
+) -> Optional[Tuple[int, str]]:
     """
     Search for Korean signature patterns in text.
 
     Args:
         text: Email body text
+        anchors: scan_anchors() result, to skip patterns that cannot match
 
     Returns:
         Tuple of (start_position, pattern_name) if found, else None
@@ -168,6 +273,8 @@ def find_korean_signature(text: str) -> Optional[Tuple[int, str]]:
     ]
 
     for pattern, name in patterns:
+        if not _may_match(name, anchors):
+            continue
         match = pattern.search(text)
         if match:
             return (match.start(), name)
@@ -175,12 +282,15 @@ def find_korean_signature(text: str) -> Optional[Tuple[int, str]]:
     return None
 
 
-def find_english_signature(text: str) -> Optional[Tuple[int, str]]:
+def find_english_signature(
+    text: str, anchors: Optional[AbstractSet[str]] = None
+) -> Optional[Tuple[int, str]]:
     """
     Search for English signature patterns in text.
 
     Args:
         text: Email body text
+        anchors: scan_anchors() result, to skip patterns that cannot match
 
     Returns:
         Tuple of (start_position, pattern_name) if found, else None
@@ -194,6 +304,8 @@ def find_english_signature(text: str) -> Optional[Tuple[int, str]]:
     ]
 
     for pattern, name in patterns:
+        if not _may_match(name, anchors):
+            continue
         match = pattern.search(text)
         if match:
             return (match.start(), name)
@@ -201,20 +313,24 @@ def find_english_signature(text: str) -> Optional[Tuple[int, str]]:
     return None
 
 
-def find_heuristic_signature(text: str) -> Optional[Tuple[int, str]]:
+def find_heuristic_signature(
+    text: str, anchors: Optional[AbstractSet[str]] = None
+) -> Optional[Tuple[int, str]]:
     """
     Search for signature using heuristic patterns (fallback).
 
     Args:
         text: Email body text
+        anchors: scan_anchors() result, to skip patterns that cannot match
 
     Returns:
         Tuple of (start_position, pattern_name) if found, else None
     """
     # Try separator line
-    match = SEPARATOR_LINE_SIGNATURE.search(text)
-    if match:
-        return (match.start(), "separator_line_signature")
+    if _may_match("separator_line_signature", anchors):
+        match = SEPARATOR_LINE_SIGNATURE.search(text)
+        if match:
+            return (match.start(), "separator_line_signature")
 
     # Try short final line heuristic
     start_pos = detect_short_final_line(text)
@@ -224,7 +340,9 @@ def find_heuristic_signature(text: str) -> Optional[Tuple[int, str]]:
     return None
 
 
-def detect_signature(text: str) -> Optional[Tuple[int, str]]:
+def detect_signature(
+    text: str, anchors: Optional[AbstractSet[str]] = None
+) -> Optional[Tuple[int, str]]:
     """
     Detect signature in email text using all available patterns.
 
@@ -235,6 +353,7 @@ def detect_signature(text: str) -> Optional[Tuple[int, str]]:
 
     Args:
         text: Email body text
+        anchors: scan_anchors() result, to skip patterns that cannot match
 
     Returns:
         Tuple of (start_position, pattern_name) if signature found, else None
@@ -250,29 +369,32 @@ def detect_signature(text: str) -> Optional[Tuple[int, str]]:
         return None
 
     # Try Korean patterns first
-    result = find_korean_signature(text)
+    result = find_korean_signature(text, anchors)
     if result:
         return result
 
     # Try English patterns
-    result = find_english_signature(text)
+    result = find_english_signature(text, anchors)
     if result:
         return result
 
     # Fall back to heuristics
-    result = find_heuristic_signature(text)
+    result = find_heuristic_signature(text, anchors)
     if result:
         return result
 
     return None
 
 
-def remove_signature(text: str) -> str:
+def remove_signature(
+    text: str, anchors: Optional[AbstractSet[str]] = None
+) -> str:
     """
     Remove detected signature from email text.
 
     Args:
         text: Email body text
+        anchors: scan_anchors() result, to skip patterns that cannot match
 
     Returns:
         Text with signature removed, or original text if no signature detected
@@ -282,7 +404,7 @@ def remove_signature(text: str) -> str:
         >>> remove_signature(text)
         'Hello,\\n\\nContent here.'
     """
-    result = detect_signature(text)
+    result = detect_signature(text, anchors)
     if result is None:
         return text
 
@@ -338,12 +460,15 @@ SIMPLE_ON_DATE_WROTE = re.compile(r"On\s+.+?\s+wrote:", re.MULTILINE | re.IGNORE
 # ============================================================================
 
 
-def find_quoted_thread(text: str) -> Optional[Tuple[int, str]]:
+def find_quoted_thread(
+    text: str, anchors: Optional[AbstractSet[str]] = None
+) -> Optional[Tuple[int, str]]:
     """
     Search for quoted thread patterns in text.
 
     Args:
         text: Email body text
+        anchors: scan_anchors() result, to skip patterns that cannot match
 
     Returns:
         Tuple of (start_position, pattern_name) if found, else None
@@ -360,6 +485,8 @@ def find_quoted_thread(text: str) -> Optional[Tuple[int, str]]:
     ]
 
     for pattern, name in patterns:
+        if not _may_match(name, anchors):
+            continue
         match = pattern.search(text)
         if match:
             return (match.start(), name)
@@ -395,7 +522,9 @@ def detect_nested_quotes(text: str) -> Optional[int]:
     return None
 
 
-def detect_quoted_thread(text: str) -> Optional[Tuple[int, str]]:
+def detect_quoted_thread(
+    text: str, anchors: Optional[AbstractSet[str]] = None
+) -> Optional[Tuple[int, str]]:
     """
     Detect quoted thread in email text using all available patterns.
 
@@ -406,6 +535,7 @@ def detect_quoted_thread(text: str) -> Optional[Tuple[int, str]]:
 
     Args:
         text: Email body text
+        anchors: scan_anchors() result, to skip patterns that cannot match
 
     Returns:
         Tuple of (start_position, pattern_name) if quoted thread found, else None
@@ -418,7 +548,7 @@ def detect_quoted_thread(text: str) -> Optional[Tuple[int, str]]:
         >>> result[1]  # Pattern name
         'angle_bracket_quotes'
     """
-    result = find_quoted_thread(text)
+    result = find_quoted_thread(text, anchors)
     if result:
         return result
 
@@ -430,12 +560,15 @@ def detect_quoted_thread(text: str) -> Optional[Tuple[int, str]]:
     return None
 
 
-def remove_quoted_thread(text: str) -> str:
+def remove_quoted_thread(
+    text: str, anchors: Optional[AbstractSet[str]] = None
+) -> str:
     """
     Remove detected quoted thread from email text.
 
     Args:
         text: Email body text
+        anchors: scan_anchors() result, to skip patterns that cannot match
 
     Returns:
         Text with quoted thread removed, or original text if no quotes detected
@@ -448,7 +581,7 @@ def remove_quoted_thread(text: str) -> str:
     if not text or not text.strip():
         return text
 
-    result = detect_quoted_thread(text)
+    result = detect_quoted_thread(text, anchors)
     if result is None:
         return text
 
@@ -522,12 +655,15 @@ SEPARATOR_DISCLAIMER = re.compile(
 # ============================================================================
 
 
-def find_disclaimer(text: str) -> Optional[Tuple[int, str]]:
+def find_disclaimer(
+    text: str, anchors: Optional[AbstractSet[str]] = None
+) -> Optional[Tuple[int, str]]:
     """
     Search for disclaimer patterns in text.
 
     Args:
         text: Email body text
+        anchors: scan_anchors() result, to skip patterns that cannot match
 
     Returns:
         Tuple of (start_position, pattern_name) if found, else None
@@ -547,6 +683,8 @@ def find_disclaimer(text: str) -> Optional[Tuple[int, str]]:
     ]
 
     for pattern, name in patterns:
+        if not _may_match(name, anchors):
+            continue
         match = pattern.search(text)
         if match:
             return (match.start(), name)
@@ -554,7 +692,9 @@ def find_disclaimer(text: str) -> Optional[Tuple[int, str]]:
     return None
 
 
-def detect_disclaimer(text: str) -> Optional[Tuple[int, str]]:
+def detect_disclaimer(
+    text: str, anchors: Optional[AbstractSet[str]] = None
+) -> Optional[Tuple[int, str]]:
     """
     Detect disclaimer in email text using all available patterns.
 
@@ -566,6 +706,7 @@ def detect_disclaimer(text: str) -> Optional[Tuple[int, str]]:
 
     Args:
         text: Email body text
+        anchors: scan_anchors() result, to skip patterns that cannot match
 
     Returns:
         Tuple of (start_position, pattern_name) if disclaimer found, else None
@@ -578,15 +719,18 @@ def detect_disclaimer(text: str) -> Optional[Tuple[int, str]]:
         >>> result[1]  # Pattern name
         'confidentiality_notice'
     """
-    return find_disclaimer(text)
+    return find_disclaimer(text, anchors)
 
 
-def remove_disclaimer(text: str) -> str:
+def remove_disclaimer(
+    text: str, anchors: Optional[AbstractSet[str]] = None
+) -> str:
     """
     Remove detected disclaimer from email text.
 
     Args:
         text: Email body text
+        anchors: scan_anchors() result, to skip patterns that cannot match
 
     Returns:
         Text with disclaimer removed, or original text if no disclaimer detected
@@ -599,7 +743,7 @@ def remove_disclaimer(text: str) -> str:
     if not text or not text.strip():
         return text
 
-    result = detect_disclaimer(text)
+    result = detect_disclaimer(text, anchors)
     if result is None:
         return text
 
@@ -655,3 +799,23 @@ def test_pattern_on_text(pattern_name: str, text: str) -> bool:
 
     pattern = patterns[pattern_name]
     return pattern.search(text) is not None
+
+
+def pattern_set_version() -> str:
+    """
+    Fingerprint of the pattern set, for re-cleaning archived emails only
+    when patterns change.
+
+    Hashes every compiled pattern in this module (name, regex and flags)
+    and the anchor tables. Changes to heuristic functions are not covered.
+
+    Returns:
+        First 16 hex digits of a SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for name, value in sorted(globals().items()):
+        if isinstance(value, re.Pattern):
+            digest.update(f"{name}\0{value.pattern}\0{value.flags}\n".encode())
+    digest.update(repr(sorted(ANCHOR_CLASSES.items())).encode())
+    digest.update(repr(sorted(PATTERN_ANCHORS.items())).encode())
+    return digest.hexdigest()[:16]
@@ -0,0 +1,145 @@
+"""
+Token-budget trimming for ContentNormalizer.
+
+The extraction prompt has a size limit (LLMOrchestrator cuts email text
+beyond 10,000 characters, keeping head and tail). trim_to_budget() instead
+shortens an over-long body by dropping its least informative paragraphs:
+
+- the text is split into paragraphs (blank-line separated; oversized
+  paragraphs into lines)
+- each is scored by the collaboration signals it carries per token:
+  dates, amounts, organization names, collaboration keywords; repeated
+  and link-only paragraphs are dropped
+- the first paragraph is always kept, then the best-scoring ones while
+  they fit, and the result is put back in original order with "[...]"
+  where paragraphs were dropped
+
+Text that already fits is returned unchanged.
+"""
+
+import math
+import re
+from typing import List, Optional, Tuple
+
+# Marker left where paragraphs were dropped
+OMISSION_MARKER = "[...]"
+
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n+")
+
+_SIGNALS = (
+    # Dates and times: 2025-11-05, 11/5, 11월 5일, 다음 주 화요일, 3pm
+    (re.compile(r"\d{4}\s*[-./년]\s*\d{1,2}|\d{1,2}\s*월\s*\d{1,2}\s*일|\b\d{1,2}/\d{1,2}\b"
+                r"|[월화수목금토일]요일|\b(?:mon|tues|wednes|thurs|fri|satur|sun)day\b"
+                r"|\b\d{1,2}\s*(?:am|pm)\b|\d{1,2}\s*시", re.IGNORECASE), 3.0),
+    # Amounts and figures
+    (re.compile(r"\d[\d,.]*\s*(?:억|만|천|원|%|달러|usd|krw|\$)|[$₩]\s*\d", re.IGNORECASE), 2.0),
+    # Organizations
+    (re.compile(r"주식회사|㈜|\(주\)|\b(?:inc|corp|ltd|llc|co)\b\.?", re.IGNORECASE), 2.0),
+    # Collaboration vocabulary
+    (re.compile(r"협업|협력|제휴|미팅|회의|투자|계약|제안|파트너|도입|파일럿|검토|논의|일정|킥오프"
+                r"|\b(?:poc|mou|nda|pilot|partner(?:ship)?|meeting|invest(?:ment)?|contract"
+                r"|proposal|collaborat\w*|kick-?off|deal|launch)\b", re.IGNORECASE), 1.5),
+    # Capitalized names and Korean words (general content)
+    (re.compile(r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+|[가-힣]{2,}"), 0.2),
+)
+
+_URL_ONLY = re.compile(r"^(?:\S*(?:https?://|www\.)\S*\s*)+$", re.IGNORECASE)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough LLM token count: about 4 ASCII characters per token, and
+    1.5 characters per token for other scripts (e.g. Hangul).
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    other_chars = len(text) - ascii_chars
+    return math.ceil(ascii_chars / 4 + other_chars / 1.5)
+
+
+def _segments(text: str, max_tokens: int, max_chars: Optional[int]) -> List[str]:
+    """Paragraphs, with those exceeding the budget split into lines."""
+    segments: List[str] = []
+    for paragraph in _PARAGRAPH_BREAK.split(text.strip()):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if estimate_tokens(paragraph) <= max_tokens and (
+            max_chars is None or len(paragraph) <= max_chars
+        ):
+            segments.append(paragraph)
+        else:
+            segments.extend(line.strip() for line in paragraph.split("\n") if line.strip())
+    return segments
+
+
+def _score(segment: str, tokens: int) -> float:
+    """Collaboration signal per token (square root, to favour substance over brevity)."""
+    signal = sum(weight * len(pattern.findall(segment)) for pattern, weight in _SIGNALS)
+    return signal / math.sqrt(max(tokens, 1))
+
+
+def trim_to_budget(text: str, max_tokens: int, max_chars: Optional[int] = None) -> str:
+    """
+    Shorten text to fit a token budget (and optionally a character limit),
+    keeping its most informative paragraphs.
+
+    Args:
+        text: Cleaned email body
+        max_tokens: Token budget (estimate_tokens())
+        max_chars: Character limit, e.g. the extraction input limit
+
+    Returns:
+        The text itself if it fits, otherwise the kept paragraphs in order,
+        joined by blank lines, with OMISSION_MARKER for dropped runs
+    """
+    if estimate_tokens(text) <= max_tokens and (max_chars is None or len(text) <= max_chars):
+        return text
+
+    segments = _segments(text, max_tokens, max_chars)
+    if not segments:
+        return ""
+    costs = [estimate_tokens(segment) for segment in segments]
+    marker_cost = estimate_tokens(OMISSION_MARKER) + 1
+
+    seen = set()
+    ranked: List[Tuple[float, int]] = []
+    for index, segment in enumerate(segments):
+        key = re.sub(r"\W+", "", segment.lower())
+        if key in seen or _URL_ONLY.match(segment):
+            # Repeats and bare links add nothing
+            continue
+        seen.add(key)
+        # The opening paragraph sets the context: always first choice
+        score = math.inf if index == 0 else _score(segment, costs[index])
+        ranked.append((score, index))
+    ranked.sort(key=lambda item: (-item[0], item[1]))
+
+    kept = set()
+    tokens = 0
+    chars = 0
+    for _, index in ranked:
+        # Reserve room for an omission marker next to each kept paragraph
+        cost = costs[index] + marker_cost
+        length = len(segments[index]) + len(OMISSION_MARKER) + 4
+        if tokens + cost > max_tokens or (max_chars is not None and chars + length > max_chars):
+            continue
+        kept.add(index)
+        tokens += cost
+        chars += length
+
+    if not kept:
+        # Nothing fits whole (e.g. one unsplittable line): cut the best
+        # segment, falling back to the first if all were links or repeats
+        best = segments[ranked[0][1]] if ranked else segments[0]
+        limit = max_tokens * 4 if max_chars is None else min(max_chars, max_tokens * 4)
+        while estimate_tokens(best[:limit]) > max_tokens:
+            limit = int(limit * 0.9)
+        return best[:limit].rstrip() + "\n\n" + OMISSION_MARKER
+
+    parts: List[str] = []
+    for index, segment in enumerate(segments):
+        if index in kept:
+            parts.append(segment)
+        elif not parts or parts[-1] != OMISSION_MARKER:
+            parts.append(OMISSION_MARKER)
+    return "\n\n".join(parts)
@@ -1,15 +1,20 @@
 import logging
 import asyncio
 import os
-from datetime import datetime, UTC
+import time
+from datetime import datetime, timedelta, UTC
 from pathlib import Path
+from typing import Optional, Tuple
 
 from config.settings import get_settings
 from daemon.state_manager import StateManager
 from daemon.gcs_state_manager import GCSStateManager
-from daemon.scheduler import Scheduler
+from daemon.scheduler import CycleResult, Scheduler
+from daemon.work_queue import LEASE_DONE, LEASE_HELD, build_lease_store
 from email_receiver.gmail_receiver import GmailReceiver
+from email_receiver.webhook_receiver import WebhookReceiver
 from content_normalizer.normalizer import ContentNormalizer
+from content_normalizer.near_duplicates import NearDuplicateDetector, simhash
 from llm_orchestrator.orchestrator import LLMOrchestrator
 from llm_orchestrator.summary_enhancer import SummaryEnhancer
 from notion_integrator.writer import NotionWriter
@@ -17,17 +22,75 @@ from notion_integrator.integrator import NotionIntegrator
 from llm_orchestrator.types import OrchestrationConfig
 from admin_reporting.reporter import ReportGenerator
 from admin_reporting.alerter import AlertManager
+from models.daemon_state import WORK_DONE, WORK_DUPLICATE
+from notion_integrator.dlq_manager import DLQManager
 
 logger = logging.getLogger(__name__)
 
+# Emails fetched per polling cycle / pushed batch
+FETCH_BATCH_SIZE = 10
+# How long one Pub/Sub pull waits for a notification
+PUSH_PULL_TIMEOUT_SECONDS = 10.0
+# Pause after a failed pull before trying again
+PUSH_ERROR_BACKOFF_SECONDS = 30.0
+# Pipeline attempts on one email before it is quarantined to the DLQ
+MAX_EMAIL_ATTEMPTS = 3
+
 
 class DaemonController:
-    def __init__(self, interval_minutes: int = 15):
-        self.settings = get_settings()
+    def __init__(
+        self,
+        interval_minutes: int = 15,
+        *,
+        settings=None,
+        state_manager=None,
+        receiver=None,
+        orchestrator=None,
+        notion_integrator=None,
+        writer=None,
+        report_generator=None,
+        alert_manager=None,
+        push_receiver=None,
+        dlq_manager=None,
+        lease_store=None,
+        near_duplicates=None,
+    ):
+        """
+        Initialize the daemon and its pipeline components.
+
+        Components that are not passed in are built from settings (the
+        production setup); passing stand-ins lets the same process_cycle()
+        run offline, e.g. in collabiq.test_utils.pipeline_benchmark.
+
+        Args:
+            interval_minutes: Minutes between processing cycles
+            settings: Settings instance (default: get_settings())
+            state_manager: State persistence (default: GCS or local file)
+            receiver: Email receiver (default: GmailReceiver)
+            orchestrator: LLM orchestrator (default: from settings priority)
+            notion_integrator: Notion read access (default: NotionIntegrator)
+            writer: Notion writer (default: NotionWriter if a CollabIQ DB is set)
+            report_generator: Daily report generator (default: ReportGenerator)
+            alert_manager: Alert manager (default: AlertManager)
+            push_receiver: Gmail push receiver (default: WebhookReceiver,
+                built in run() if Pub/Sub is configured)
+            dlq_manager: DLQ for quarantined emails (default: DLQManager,
+                built when the first email is quarantined)
+            lease_store: Shared lease store (daemon.work_queue) for running
+                several daemons on one mailbox (default: built in run()
+                from settings.daemon_lease_store, if set)
+            near_duplicates: NearDuplicateDetector skipping emails whose
+                cleaned body nearly matches a recently written one
+                (default: built in run() from settings, unless the window
+                is 0)
+        """
+        self.settings = settings or get_settings()
 
         # Use GCS state manager if bucket is configured (for Cloud Run persistence)
         gcs_bucket = os.getenv("GCS_STATE_BUCKET")
-        if gcs_bucket:
+        if state_manager is not None:
+            self.state_manager = state_manager
+        elif gcs_bucket:
             self.state_manager = GCSStateManager(
                 bucket_name=gcs_bucket,
                 blob_name="daemon/state.json",
@@ -38,11 +101,21 @@ class DaemonController:
             self.state_manager = StateManager(Path("data/daemon/state.json"))
             logger.info("Using local state manager")
 
-        self.scheduler = Scheduler(interval_minutes * 60)
+        # Reruns at once while mail is backlogged, backs off while idle,
+        # and wakes for the daily report window
+        self.scheduler = Scheduler(
+            interval_minutes * 60,
+            max_interval_seconds=self.settings.daemon_max_interval_minutes * 60,
+            backoff_factor=self.settings.daemon_backoff_factor,
+            cycle_budget_seconds=self.settings.daemon_cycle_budget_seconds,
+            daily_runs=[
+                (self.settings.admin_report_time, self.settings.admin_report_timezone)
+            ],
+        )
 
         # Initialize components
         # GmailReceiver is synchronous
-        self.receiver = GmailReceiver(
+        self.receiver = receiver or GmailReceiver(
             credentials_path=self.settings.get_gmail_credentials_path(),
             token_path=self.settings.gmail_token_path,
             raw_email_dir=self.settings.raw_email_dir,
@@ -50,21 +123,28 @@ class DaemonController:
         self.normalizer = ContentNormalizer()
 
         # Initialize Orchestrator
-        orch_config = OrchestrationConfig(
-            default_strategy="failover",
-            provider_priority=self.settings.llm_provider_priority
-            or ["gemini", "claude", "openai"],
-        )
-        self.orchestrator = LLMOrchestrator.from_config(orch_config)
+        if orchestrator is None:
+            orch_config = OrchestrationConfig(
+                default_strategy="failover",
+                provider_priority=self.settings.llm_provider_priority
+                or ["gemini", "claude", "openai"],
+            )
+            orchestrator = LLMOrchestrator.from_config(orch_config)
+        self.orchestrator = orchestrator
         self.summary_enhancer = SummaryEnhancer(self.orchestrator)
 
         # Notion components (clients handle async internally, but init is sync)
-        self.notion_integrator = NotionIntegrator(
-            api_key=self.settings.get_notion_api_key()
+        # The daemon outlives background cache refreshes, so expired caches
+        # are served while they refresh instead of blocking a cycle
+        self.notion_integrator = notion_integrator or NotionIntegrator(
+            api_key=self.settings.get_notion_api_key(),
+            stale_while_revalidate=True,
         )
 
         collabiq_db = self.settings.get_notion_collabiq_db_id()
-        if not collabiq_db:
+        if writer is not None:
+            self.writer = writer
+        elif not collabiq_db:
             logger.warning("Notion CollabIQ DB ID not set, writer disabled")
             self.writer = None
         else:
@@ -73,46 +153,178 @@ class DaemonController:
                 collabiq_db_id=collabiq_db,
                 companies_db_id=self.settings.get_notion_companies_db_id(),
                 duplicate_behavior=self.settings.duplicate_behavior,
+                llm_orchestrator=self.orchestrator,
+                stale_while_revalidate=True,
             )
 
         # Initialize report generator for daily admin reports
-        self.report_generator = ReportGenerator()
+        self.report_generator = report_generator or ReportGenerator()
 
         # Initialize alert manager for critical error notifications
-        self.alert_manager = AlertManager()
+        self.alert_manager = alert_manager or AlertManager()
+
+        # Gmail push notifications (optional); polling stays the safety net
+        self.push_receiver = push_receiver
+        self._pipeline_lock = asyncio.Lock()
+        self.dlq_manager = dlq_manager
+        self.lease_store = lease_store
+        self.near_duplicates = near_duplicates
 
     def run(self):
         """Entry point for the daemon"""
+        if self.push_receiver is None:
+            self.push_receiver = self._build_push_receiver()
+        if self.lease_store is None and self.settings.daemon_lease_store:
+            self.lease_store = build_lease_store(
+                self.settings.daemon_lease_store,
+                lease_seconds=self.settings.daemon_lease_seconds,
+            )
+            logger.info(
+                f"Sharing work through lease store {self.settings.daemon_lease_store} "
+                f"as {self.lease_store.worker_id}"
+            )
+        window_hours = self.settings.daemon_near_duplicate_window_hours
+        if self.near_duplicates is None and window_hours > 0:
+            self.near_duplicates = NearDuplicateDetector(
+                timedelta(hours=window_hours),
+                max_distance=self.settings.daemon_near_duplicate_max_distance,
+            )
         try:
-            asyncio.run(self.scheduler.run_loop_async(self.process_cycle))
+            asyncio.run(self._run_async())
         except KeyboardInterrupt:
             logger.info("Daemon interrupted")
 
-    async def process_cycle(self):
-        """Async processing cycle"""
-        state = self.state_manager.load_state()
+    async def _run_async(self) -> None:
+        """
+        Poll on the schedule and process pushed emails in between.
+
+        Polling cycles and pushed batches share the pipeline lock, so they
+        never process emails (or save state) concurrently.
+        """
+
+        async def locked_cycle():
+            async with self._pipeline_lock:
+                return await self.process_cycle(deadline=self.scheduler.cycle_deadline)
+
+        loops = [self.scheduler.run_loop_async(locked_cycle)]
+        if self.push_receiver is not None:
+            loops.append(self._push_loop())
+        await asyncio.gather(*loops)
+
+    def _build_push_receiver(self):
+        """Build the Gmail push receiver if Pub/Sub is configured."""
+        settings = self.settings
+        if not (
+            settings.pubsub_project_id
+            and settings.pubsub_topic
+            and settings.pubsub_subscription
+        ):
+            logger.info("Pub/Sub not configured, relying on polling only")
+            return None
+
+        # Own GmailReceiver: the API client is not shared across threads
+        return WebhookReceiver(
+            pubsub_project_id=settings.pubsub_project_id,
+            pubsub_topic_name=settings.pubsub_topic,
+            pubsub_subscription_name=settings.pubsub_subscription,
+            credentials_path=settings.get_gmail_credentials_path(),
+            raw_email_dir=settings.raw_email_dir,
+            token_path=settings.gmail_token_path,
+        )
+
+    async def _push_loop(self) -> None:
+        """
+        Pull Gmail push notifications and process their emails right away.
+
+        Any failure here only delays emails until the next polling cycle,
+        which remains the safety net.
+        """
+        receiver = self.push_receiver
+        try:
+            await asyncio.to_thread(receiver.setup_watch)
+        except Exception as e:
+            logger.error(f"Gmail push disabled, relying on polling: {e}")
+            return
+
+        while not self.scheduler.shutdown_requested:
+            try:
+                if receiver.watch_needs_renewal():
+                    await asyncio.to_thread(receiver.renew_watch)
+
+                emails = await asyncio.to_thread(
+                    receiver.wait_for_emails,
+                    timeout=PUSH_PULL_TIMEOUT_SECONDS,
+                    max_emails=FETCH_BATCH_SIZE,
+                )
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Gmail push receive failed: {e}")
+                await asyncio.sleep(PUSH_ERROR_BACKOFF_SECONDS)
+                continue
+
+            if emails:
+                async with self._pipeline_lock:
+                    await self.process_pushed_emails(emails)
+
+            # Push lost track of the mailbox: let polling cover the gap now
+            if receiver.take_history_gap():
+                self.scheduler.wake()
+
+    async def process_pushed_emails(self, emails) -> None:
+        """
+        Run emails received by push through the pipeline.
+
+        Same per-email steps as process_cycle(). The polling watermark is
+        left alone, so the next cycle still covers anything that failed
+        here (and skips what succeeded).
+        """
+        state = await asyncio.to_thread(self.state_manager.load_state)
+        try:
+            company_context = await self._load_company_context(state)
+            state.emails_received_count += len(emails)
+
+            processed_count, skipped_count, _ = await self._process_emails(
+                emails, state, company_context
+            )
+            state.emails_processed_count += processed_count
+            state.emails_skipped_count += skipped_count
+            logger.info(
+                f"Pushed batch complete. Processed {processed_count}, "
+                f"Skipped {skipped_count} of {len(emails)}."
+            )
+        except Exception as e:
+            logger.error(f"Error processing pushed emails: {e}", exc_info=True)
+            state.error_count += 1
+            state.record_error(
+                severity="high",
+                component="daemon",
+                message=f"Unhandled exception processing pushed emails: {str(e)}",
+                context={"exception_type": type(e).__name__},
+            )
+        finally:
+            await self.state_manager.save_state_async(state)
+
+    async def process_cycle(self, deadline: Optional[float] = None) -> Optional[CycleResult]:
+        """
+        Async processing cycle
+
+        Args:
+            deadline: time.monotonic() after which no new email is started;
+                the rest stay for the next cycle
+
+        Returns:
+            CycleResult for the scheduler (None if the cycle failed)
+        """
+        state = await asyncio.to_thread(self.state_manager.load_state)
         state.current_status = "running"
         state.last_check_timestamp = datetime.now()
-        self.state_manager.save_state(state)
+        await self.state_manager.save_state_async(state, wait=False)
+        cycle_result = None
 
         try:
             # 0. Fetch Company Context (Cached)
-            company_context = None
-            companies_db = self.settings.get_notion_companies_db_id()
-            if companies_db:
-                try:
-                    # Use format_for_llm to get markdown list of existing companies
-                    formatted = await self.notion_integrator.format_for_llm(
-                        database_id=companies_db, use_cache=True
-                    )
-                    company_context = formatted.summary_markdown
-                    logger.info(
-                        f"Loaded company context ({formatted.metadata.total_companies} companies)"
-                    )
-                    # Track Notion check for health monitoring
-                    state.last_notion_check = datetime.now(UTC)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch company context: {e}")
+            company_context = await self._load_company_context(state)
 
             # 1. Fetch Emails (Sync -> Thread)
             await asyncio.to_thread(self.receiver.connect)
@@ -127,138 +339,27 @@ class DaemonController:
 
             if since_timestamp:
                 logger.info(f"Fetching emails since {since_timestamp.isoformat()}")
+                # Oldest first, so a backlog larger than one batch drains in order
+                emails = await asyncio.to_thread(
+                    self.receiver.fetch_emails,
+                    since=since_timestamp,
+                    max_emails=FETCH_BATCH_SIZE,
+                    oldest_first=True,
+                )
             else:
                 logger.info("No previous run timestamp found, fetching recent emails")
-
-            emails = await asyncio.to_thread(
-                self.receiver.fetch_emails, since=since_timestamp, max_emails=10
-            )
+                emails = await asyncio.to_thread(
+                    self.receiver.fetch_emails,
+                    since=since_timestamp,
+                    max_emails=FETCH_BATCH_SIZE,
+                )
 
             # Track emails received for metrics
             state.emails_received_count += len(emails)
 
-            processed_count = 0
-            skipped_count = 0
-            for raw_email in emails:
-                message_id = raw_email.metadata.message_id
-
-                # Check state-based duplicate tracking (persisted to GCS for Cloud Run)
-                # This is the primary deduplication mechanism for cloud deployments
-                if state.is_email_processed(message_id):
-                    logger.debug(f"Email {message_id} already processed (state check)")
-                    skipped_count += 1
-                    continue
-
-                # Also check local file-based tracker (for backward compatibility)
-                if self.receiver.is_duplicate(message_id):
-                    logger.debug(f"Email {message_id} already processed (local file)")
-                    state.mark_email_processed(message_id)  # Sync to state
-                    skipped_count += 1
-                    continue
-
-                logger.info(f"Processing email: {raw_email.metadata.subject}")
-
-                # 1.5 Early Duplicate Check in Notion
-                # Avoid expensive LLM calls if entry already exists
-                if self.writer:
-                    try:
-                        existing_id = await self.writer.check_duplicate(message_id)
-                        if existing_id:
-                            logger.info(
-                                f"Duplicate found in Notion (page_id={existing_id}). Skipping processing."
-                            )
-                            # Mark as processed in both state (for GCS) and local file
-                            state.mark_email_processed(message_id)
-                            self.receiver.mark_processed(message_id)
-                            processed_count += 1
-                            continue
-                    except Exception as e:
-                        logger.warning(f"Failed to check Notion duplicate: {e}")
-
-                # Clean (CPU bound, fast enough to run sync or thread)
-                cleaned_email = self.normalizer.process_raw_email(raw_email)
-
-                # Extract (Async)
-                extracted = await self.orchestrator.extract_entities(
-                    email_text=cleaned_email.cleaned_body,
-                    email_id=raw_email.metadata.message_id,
-                    company_context=company_context,  # Pass context for better matching
-                )
-
-                if not extracted:
-                    logger.error(
-                        f"Failed to extract entities for {raw_email.metadata.message_id}"
-                    )
-                    state.error_count += 1
-                    state.record_error(
-                        severity="high",
-                        component="llm",
-                        message="Failed to extract entities from email",
-                        context={"email_id": raw_email.metadata.message_id},
-                    )
-                    continue
-
-                # Summarize (Async)
-                try:
-                    summary = await self.summary_enhancer.generate_summary(
-                        cleaned_email.cleaned_body
-                    )
-                except Exception as e:
-                    logger.warning(f"Summary generation failed: {e}")
-                    summary = "[Summary unavailable due to error.]"
-
-                # Ensure summary meets minimum length requirements (50 chars)
-                if not summary or len(summary) < 50:
-                    summary = "[Summary unavailable due to content policy, generation error, or insufficient length for validation requirements.]"
-
-                # Inject summary into extracted entities (requires field existence)
-                from llm_provider.types import ExtractedEntitiesWithClassification
-
-                classified_data = ExtractedEntitiesWithClassification(
-                    **extracted.model_dump(),
-                    collaboration_summary=summary,
-                    # Classification fields might be missing if extract_entities didn't return them
-                    collaboration_type=getattr(
-                        extracted, "collaboration_type", "[A]PortCoXSSG"
-                    ),
-                    collaboration_intensity=getattr(
-                        extracted, "collaboration_intensity", "협력"
-                    ),
-                )
-
-                # Write (Async)
-                if self.writer:
-                    # Note: writer.create_collabiq_entry also checks duplicates,
-                    # but we did it early to save LLM costs.
-                    result = await self.writer.create_collabiq_entry(classified_data)
-
-                    # Track Notion check for health monitoring
-                    state.last_notion_check = datetime.now(UTC)
-
-                    if result.success:
-                        # Mark as processed in both state (for GCS) and local file
-                        state.mark_email_processed(message_id)
-                        self.receiver.mark_processed(message_id)
-                        processed_count += 1
-                        state.last_processed_email_id = message_id
-                        # Track Notion operation for metrics
-                        state.record_notion_operation("create", success=True)
-                    else:
-                        logger.error(
-                            f"Failed to write email {raw_email.metadata.message_id}: {result.error_message}"
-                        )
-                        state.error_count += 1
-                        # Track failed Notion operation
-                        state.record_notion_operation("create", success=False)
-                        # Record error for reporting
-                        state.record_error(
-                            severity="high",
-                            component="notion",
-                            message=f"Failed to create entry: {result.error_message}",
-                            context={"email_id": raw_email.metadata.message_id},
-                        )
-                else:
-                    logger.warning("Writer disabled, skipping Notion write")
+            processed_count, skipped_count, out_of_time = await self._process_emails(
+                emails, state, company_context, deadline
+            )
 
             state.emails_processed_count += processed_count
             state.emails_skipped_count += skipped_count
@@ -267,17 +368,33 @@ class DaemonController:
             # Update the fetch timestamp ONLY if all emails in batch were handled
             # (processed or skipped). If any failed, we don't update timestamp
             # so we can retry them in the next cycle.
-            if processed_count + skipped_count == len(emails):
-                state.last_successful_fetch_timestamp = fetch_start_time
+            batch_full = len(emails) >= FETCH_BATCH_SIZE
+            backlog = False
+            if out_of_time:
+                # Unstarted emails stay after the watermark for the next cycle
+                backlog = processed_count + skipped_count > 0
+                logger.warning(
+                    f"Cycle time budget used up after {processed_count + skipped_count} "
+                    f"of {len(emails)} emails; continuing next cycle"
+                )
+            elif processed_count + skipped_count == len(emails):
+                watermark = fetch_start_time
+                if batch_full and since_timestamp:
+                    # More mail may be waiting after this (oldest) batch: move
+                    # the watermark only past it
+                    watermark = _batch_watermark(emails, fetch_start_time)
+                    backlog = watermark.timestamp() > since_timestamp.timestamp()
+                state.last_successful_fetch_timestamp = watermark
                 logger.info(
                     f"Cycle complete. Processed {processed_count}, Skipped {skipped_count}. "
-                    f"Updated fetch timestamp to {fetch_start_time.isoformat()}"
+                    f"Updated fetch timestamp to {watermark.isoformat()}"
                 )
             else:
                 logger.warning(
                     f"Cycle had failures (processed {processed_count} + skipped {skipped_count} != total {len(emails)}). "
                     "Keeping old fetch timestamp to retry failed emails."
                 )
+            cycle_result = CycleResult(processed=processed_count, backlog=backlog)
 
             # Check if daily report should be generated
             await self._check_daily_report(state)
@@ -299,7 +416,321 @@ class DaemonController:
         finally:
             if state.current_status != "error":
                 state.current_status = "sleeping"
-            self.state_manager.save_state(state)
+            await self.state_manager.save_state_async(state)
+
+        return cycle_result
+
+    async def _load_company_context(self, state) -> Optional[str]:
+        """Get the companies summary for extraction (None if unavailable)."""
+        companies_db = self.settings.get_notion_companies_db_id()
+        if not companies_db:
+            return None
+        try:
+            # Use format_for_llm to get markdown list of existing companies
+            formatted = await self.notion_integrator.format_for_llm(
+                database_id=companies_db, use_cache=True
+            )
+            logger.info(
+                f"Loaded company context ({formatted.metadata.total_companies} companies)"
+            )
+            # Track Notion check for health monitoring
+            state.last_notion_check = datetime.now(UTC)
+            return formatted.summary_markdown
+        except Exception as e:
+            logger.warning(f"Failed to fetch company context: {e}")
+            return None
+
+    async def _process_emails(
+        self, emails, state, company_context, deadline: Optional[float] = None
+    ) -> Tuple[int, int, bool]:
+        """
+        Run a batch of emails through the pipeline.
+
+        Returns:
+            (processed_count, skipped_count, out_of_time); skipped includes
+            near-duplicate and quarantined emails. The rest failed, or were not started if the
+            deadline passed.
+        """
+        state.track_pending(email.metadata.message_id for email in emails)
+        processed_count = 0
+        skipped_count = 0
+        for raw_email in emails:
+            if deadline is not None and time.monotonic() >= deadline:
+                return processed_count, skipped_count, True
+            outcome = await self._process_email(raw_email, state, company_context)
+            if outcome in ("skipped", "leased"):
+                # Handled before, or by another daemon: not this cycle's work
+                state.drop_pending(raw_email.metadata.message_id)
+            if outcome == "processed":
+                processed_count += 1
+            elif outcome in ("skipped", "duplicate", "quarantined"):
+                skipped_count += 1
+        return processed_count, skipped_count, False
+
+    async def _process_email(self, raw_email, state, company_context) -> str:
+        """
+        Deduplicate, clean, extract, summarize and write one email.
+
+        With a lease store, the email is claimed first: one leased by
+        another daemon is left alone ("leased", so the watermark waits
+        for it), one another daemon finished is skipped.
+
+        Progress is kept in the state's work ledger, checkpointed before
+        each attempt. An email whose attempts (crashes included) reach
+        MAX_EMAIL_ATTEMPTS is quarantined to the DLQ and counts as handled,
+        so it no longer holds back the fetch watermark.
+
+        An email whose cleaned body nearly duplicates one written within
+        the near-duplicate window is linked to it instead of extracted.
+
+        Returns:
+            "processed", "skipped", "duplicate", "quarantined", "leased"
+            or "failed"
+        """
+        message_id = raw_email.metadata.message_id
+
+        # Check state-based duplicate tracking (persisted to GCS for Cloud Run)
+        # This is the primary deduplication mechanism for cloud deployments
+        if state.is_email_processed(message_id):
+            logger.debug(f"Email {message_id} already processed (state check)")
+            return "skipped"
+
+        # Also check local file-based tracker (for backward compatibility)
+        if self.receiver.is_duplicate(message_id):
+            logger.debug(f"Email {message_id} already processed (local file)")
+            state.mark_email_processed(message_id)  # Sync to state
+            return "skipped"
+
+        if self.lease_store is None:
+            return await self._process_claimed_email(raw_email, state, company_context)
+
+        lease = await asyncio.to_thread(self.lease_store.claim, message_id)
+        if lease == LEASE_DONE:
+            logger.debug(f"Email {message_id} already processed (lease store)")
+            state.mark_email_processed(message_id)
+            return "skipped"
+        if lease == LEASE_HELD:
+            logger.debug(f"Email {message_id} leased by another daemon")
+            return "leased"
+
+        outcome = "failed"
+        try:
+            outcome = await self._process_claimed_email(raw_email, state, company_context)
+        finally:
+            if outcome == "failed":
+                await asyncio.to_thread(self.lease_store.release, message_id)
+            else:
+                await asyncio.to_thread(self.lease_store.complete, message_id)
+        return outcome
+
+    async def _process_claimed_email(self, raw_email, state, company_context) -> str:
+        """_process_email() past the state and lease checks."""
+        message_id = raw_email.metadata.message_id
+
+        logger.info(f"Processing email: {raw_email.metadata.subject}")
+
+        # 1.5 Early Duplicate Check in Notion
+        # Avoid expensive LLM calls if entry already exists
+        if self.writer:
+            try:
+                existing_id = await self.writer.check_duplicate(message_id)
+                if existing_id:
+                    logger.info(
+                        f"Duplicate found in Notion (page_id={existing_id}). Skipping processing."
+                    )
+                    # Mark as processed in both state (for GCS) and local file
+                    state.finish_work(message_id)
+                    self.receiver.mark_processed(message_id)
+                    return "processed"
+            except Exception as e:
+                logger.warning(f"Failed to check Notion duplicate: {e}")
+
+        item = state.work_ledger.get(message_id)
+        if item is not None and item.status not in WORK_DONE and item.attempts >= MAX_EMAIL_ATTEMPTS:
+            # Earlier attempts never finished (e.g. the daemon crashed on it)
+            await self._quarantine_email(raw_email, state)
+            return "quarantined"
+
+        state.start_work(message_id)
+        # The attempt must be on record before the email can crash the daemon.
+        # The upload starts now, off-loop, and is done long before extraction
+        # (an LLM call) is; not waiting for it keeps checkpoints coalesced.
+        await self.state_manager.save_state_async(state, wait=False)
+
+        try:
+            error = await self._run_pipeline(raw_email, state, company_context)
+        except Exception as e:
+            logger.error(f"Pipeline failed for email {message_id}: {e}", exc_info=True)
+            error = f"{type(e).__name__}: {e}"
+            state.error_count += 1
+            state.record_error(
+                severity="high",
+                component="daemon",
+                message=f"Unhandled exception processing email: {str(e)}",
+                context={"email_id": message_id, "exception_type": type(e).__name__},
+            )
+
+        if error is None:
+            if state.work_ledger[message_id].status == WORK_DUPLICATE:
+                return "duplicate"
+            return "processed"
+
+        item = state.fail_work(message_id, error)
+        if item.attempts >= MAX_EMAIL_ATTEMPTS:
+            await self._quarantine_email(raw_email, state)
+            return "quarantined"
+        return "failed"
+
+    async def _run_pipeline(self, raw_email, state, company_context) -> Optional[str]:
+        """
+        Clean, extract, summarize and write one email.
+
+        Returns:
+            None on success, otherwise the reason it failed
+        """
+        message_id = raw_email.metadata.message_id
+
+        # Clean (CPU bound, fast enough to run sync or thread)
+        cleaned_email = self.normalizer.process_raw_email(raw_email)
+
+        # Forwarded/CC'd copies of a written email: link instead of extracting
+        fingerprint = None
+        if self.near_duplicates is not None:
+            fingerprint = simhash(cleaned_email.cleaned_body)
+        if fingerprint is not None:
+            original_id = self.near_duplicates.find(fingerprint, state.content_fingerprints)
+            if original_id is not None:
+                logger.info(
+                    f"Email {message_id} nearly duplicates {original_id}. Skipping processing."
+                )
+                state.link_duplicate(message_id, original_id)
+                self.receiver.mark_processed(message_id)
+                return None
+
+        # Extract (Async)
+        extracted = await self.orchestrator.extract_entities(
+            email_text=cleaned_email.cleaned_body,
+            email_id=raw_email.metadata.message_id,
+            company_context=company_context,  # Pass context for better matching
+        )
+
+        if not extracted:
+            logger.error(
+                f"Failed to extract entities for {raw_email.metadata.message_id}"
+            )
+            state.error_count += 1
+            state.record_error(
+                severity="high",
+                component="llm",
+                message="Failed to extract entities from email",
+                context={"email_id": raw_email.metadata.message_id},
+            )
+            return "Failed to extract entities"
+
+        # Summarize (Async)
+        try:
+            summary = await self.summary_enhancer.generate_summary(
+                cleaned_email.cleaned_body
+            )
+        except Exception as e:
+            logger.warning(f"Summary generation failed: {e}")
+            summary = "[Summary unavailable due to error.]"
+
+        # Ensure summary meets minimum length requirements (50 chars)
+        if not summary or len(summary) < 50:
+            summary = "[Summary unavailable due to content policy, generation error, or insufficient length for validation requirements.]"
+
+        # Inject summary into extracted entities (requires field existence)
+        from llm_provider.types import ExtractedEntitiesWithClassification
+
+        classified_data = ExtractedEntitiesWithClassification(
+            **extracted.model_dump(),
+            collaboration_summary=summary,
+            # Classification fields might be missing if extract_entities didn't return them
+            collaboration_type=getattr(
+                extracted, "collaboration_type", "[A]PortCoXSSG"
+            ),
+            collaboration_intensity=getattr(
+                extracted, "collaboration_intensity", "협력"
+            ),
+        )
+
+        # Write (Async)
+        if not self.writer:
+            logger.warning("Writer disabled, skipping Notion write")
+            return "Notion writer disabled"
+
+        # Extraction took a while: make sure no other daemon took over
+        if self.lease_store is not None and not await asyncio.to_thread(
+            self.lease_store.renew, message_id
+        ):
+            return "Lease expired and taken over by another daemon"
+
+        # Note: writer.create_collabiq_entry also checks duplicates,
+        # but we did it early to save LLM costs.
+        result = await self.writer.create_collabiq_entry(classified_data)
+
+        # Track Notion check for health monitoring
+        state.last_notion_check = datetime.now(UTC)
+
+        if result.success:
+            # Mark as processed in both state (for GCS) and local file
+            state.finish_work(message_id)
+            self.receiver.mark_processed(message_id)
+            state.last_processed_email_id = message_id
+            if fingerprint is not None:
+                state.record_fingerprint(message_id, fingerprint)
+            # Track Notion operation for metrics
+            state.record_notion_operation("create", success=True)
+            return None
+
+        logger.error(
+            f"Failed to write email {raw_email.metadata.message_id}: {result.error_message}"
+        )
+        state.error_count += 1
+        # Track failed Notion operation
+        state.record_notion_operation("create", success=False)
+        # Record error for reporting
+        state.record_error(
+            severity="high",
+            component="notion",
+            message=f"Failed to create entry: {result.error_message}",
+            context={"email_id": raw_email.metadata.message_id},
+        )
+        return f"Failed to create entry: {result.error_message}"
+
+    async def _quarantine_email(self, raw_email, state) -> None:
+        """Save an email that keeps failing to the DLQ and stop retrying it."""
+        message_id = raw_email.metadata.message_id
+        item = state.work_ledger[message_id]
+        error = item.last_error or "Interrupted before finishing"
+        logger.error(
+            f"Quarantining email {message_id} after {item.attempts} attempts: {error}"
+        )
+        try:
+            if self.dlq_manager is None:
+                self.dlq_manager = DLQManager()
+            await asyncio.to_thread(
+                self.dlq_manager.save_quarantined_email,
+                message_id,
+                {
+                    "error_type": "Quarantined",
+                    "error_message": error,
+                    "retry_count": item.attempts,
+                    "subject": raw_email.metadata.subject,
+                },
+                raw_email.body,
+            )
+        except Exception as e:
+            # Still quarantine: retrying forever would stall the watermark
+            logger.error(f"Failed to save quarantined email {message_id} to DLQ: {e}")
+        state.quarantine_work(message_id, error)
+        state.record_error(
+            severity="high",
+            component="daemon",
+            message=f"Email quarantined after {item.attempts} attempts: {error}",
+            context={"email_id": message_id},
+        )
 
     async def _check_daily_report(self, state) -> None:
         """
@@ -371,3 +802,18 @@ class DaemonController:
         except Exception as e:
             logger.error(f"Failed to process alerts: {e}", exc_info=True)
             # Don't record error for alert processing failure to avoid loops
+
+
+def _batch_watermark(emails, fetch_start_time: datetime) -> datetime:
+    """
+    Fetch timestamp that resumes right after a batch fetched oldest first.
+
+    Uses the server arrival time (what Gmail's after: filter compares)
+    of the newest email, less a second: Gmail filters by whole seconds,
+    and emails fetched twice are skipped as already processed.
+    """
+    arrivals = [
+        (email.metadata.internal_date or email.metadata.received_at).timestamp()
+        for email in emails
+    ]
+    return datetime.fromtimestamp(min(max(arrivals) - 1, fetch_start_time.timestamp()))
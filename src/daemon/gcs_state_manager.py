@@ -3,24 +3,48 @@ Google Cloud Storage-backed state manager for daemon.
 
 This manager persists daemon state to GCS, allowing state to survive
 across Cloud Run job executions.
+
+Writes are conflict-safe: every upload carries if_generation_match with
+the object generation this instance last read or wrote, so two
+overlapping instances cannot silently overwrite each other. On a
+conflict (HTTP 412) the remote state is read back, merged into ours
+(DaemonProcessState.merge_from) and the upload retried. The remote
+state is kept and merged into every later upload as well, because the
+caller's in-memory state never sees the merge.
+
+State is stored as compact JSON, and save_state_async() uploads from a
+worker thread so the event loop keeps running during checkpoints.
 """
 
 import json
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
+from daemon.state_manager import AsyncStateWriter
 from models.daemon_state import DaemonProcessState
 
 logger = logging.getLogger(__name__)
 
+# Uploads retried after a generation conflict before giving up
+MAX_CONFLICT_RETRIES = 3
+
+# Reads retried when the object is rewritten mid-read
+MAX_READ_RETRIES = 3
+
 
 class GCSStateManager:
     """
     Manages daemon state using Google Cloud Storage for persistence.
 
     Falls back to local file storage if GCS is not configured or unavailable.
+
+    Attributes:
+        generation: GCS generation of the state object as last read or
+            written by this instance (0 if it did not exist, None if unknown)
+        conflicts: Number of write conflicts resolved by merging
     """
 
     def __init__(
@@ -28,6 +52,7 @@ class GCSStateManager:
         bucket_name: Optional[str] = None,
         blob_name: str = "daemon/state.json",
         local_fallback_path: Optional[Path] = None,
+        client=None,
     ):
         """
         Initialize the GCS state manager.
@@ -36,6 +61,8 @@ class GCSStateManager:
             bucket_name: GCS bucket name. If None, uses GCS_STATE_BUCKET env var.
             blob_name: Path within the bucket for the state file.
             local_fallback_path: Local file path to use if GCS is unavailable.
+            client: GCS client to use (default: google.cloud.storage.Client),
+                e.g. collabiq.test_utils.gcs_stub.FakeGCSClient in tests.
         """
         self.bucket_name = bucket_name or os.getenv("GCS_STATE_BUCKET")
         self.blob_name = blob_name
@@ -43,8 +70,19 @@ class GCSStateManager:
 
         self._gcs_client = None
         self._gcs_available = False
+        self.generation: Optional[int] = None
+        self.conflicts = 0
+        # Last (generation, JSON) seen, to skip downloading an unchanged object
+        self._cached: Optional[Tuple[int, bytes]] = None
+        # State another writer stored, merged into every upload until reloaded
+        self._remote_state: Optional[DaemonProcessState] = None
+        self._lock = threading.Lock()
+        self._writer = AsyncStateWriter(self._write)
 
-        if self.bucket_name:
+        if client is not None and self.bucket_name:
+            self._gcs_client = client
+            self._gcs_available = True
+        elif self.bucket_name:
             self._init_gcs_client()
 
     def _init_gcs_client(self):
@@ -71,6 +109,9 @@ class GCSStateManager:
         Returns:
             DaemonProcessState instance (empty state if not found).
         """
+        with self._lock:
+            # The caller now holds everything stored, including merges
+            self._remote_state = None
         if self._gcs_available:
             return self._load_from_gcs()
         return self._load_from_local()
@@ -81,42 +122,158 @@ class GCSStateManager:
 
         Saves to both locations if GCS is available for redundancy.
         """
+        self._write(state.model_dump_json())
+
+    async def save_state_async(self, state: DaemonProcessState, wait: bool = True):
+        """
+        Save daemon state from a worker thread.
+
+        The state is serialized right away, on the event loop; the local
+        write and the GCS upload happen off-loop. Saves requested while an
+        upload is running are coalesced into one upload of the latest state.
+
+        Args:
+            state: State to save
+            wait: Wait for the upload; False for checkpoints
+        """
+        await self._writer.submit(state.model_dump_json(), wait=wait)
+
+    async def flush(self):
+        """Wait for pending asynchronous saves."""
+        await self._writer.flush()
+
+    def _write(self, data: str):
+        """Persist serialized state locally and (if available) to GCS."""
         # Always save locally as backup
-        self._save_to_local(state)
+        self._save_to_local(data)
 
         if self._gcs_available:
-            self._save_to_gcs(state)
+            self._save_to_gcs(data)
 
     def _load_from_gcs(self) -> DaemonProcessState:
         """Load state from GCS bucket."""
         try:
-            bucket = self._gcs_client.bucket(self.bucket_name)
-            blob = bucket.blob(self.blob_name)
-
-            if not blob.exists():
+            remote = self._read_remote()
+            if remote is None:
                 logger.info("No existing state in GCS, returning default state")
                 return DaemonProcessState()
 
-            data = json.loads(blob.download_as_string())
             logger.info(f"Loaded state from GCS: gs://{self.bucket_name}/{self.blob_name}")
-            return DaemonProcessState(**data)
+            return DaemonProcessState(**json.loads(remote))
         except Exception as e:
             logger.error(f"Failed to load state from GCS: {e}")
             # Try local fallback
             return self._load_from_local()
 
-    def _save_to_gcs(self, state: DaemonProcessState):
-        """Save state to GCS bucket."""
+    def _read_remote(self) -> Optional[bytes]:
+        """
+        Read the state object and remember its generation.
+
+        Only the object metadata is fetched when the generation matches
+        the last one seen. The read is retried when another instance
+        rewrites the object between fetching its metadata and downloading
+        it (HTTP 412).
+
+        Returns:
+            Stored JSON, or None if the object does not exist
+
+        Raises:
+            The last 412 error if the object kept changing
+        """
+        bucket = self._gcs_client.bucket(self.bucket_name)
+        for attempt in range(MAX_READ_RETRIES):
+            blob = bucket.get_blob(self.blob_name)
+            if blob is None:
+                with self._lock:
+                    self.generation = 0
+                    self._cached = None
+                return None
+
+            with self._lock:
+                cached = self._cached
+            if cached is not None and cached[0] == blob.generation:
+                data = cached[1]
+            else:
+                try:
+                    data = blob.download_as_bytes(if_generation_match=blob.generation)
+                except Exception as e:
+                    if getattr(e, "code", None) != 412 or attempt == MAX_READ_RETRIES - 1:
+                        raise
+                    continue
+
+            with self._lock:
+                self.generation = blob.generation
+                self._cached = (blob.generation, data)
+            return data
+
+    def _save_to_gcs(self, data: str):
+        """
+        Upload state to GCS unless another instance wrote it meanwhile.
+
+        On a generation conflict the remote state is merged into ours and
+        the upload retried. Remote state merged earlier is merged again, so
+        a later save of the caller's (unmerged) state cannot drop it.
+        """
         try:
-            bucket = self._gcs_client.bucket(self.bucket_name)
-            blob = bucket.blob(self.blob_name)
+            with self._lock:
+                remote_state = self._remote_state
+            if remote_state is not None:
+                data = self._merge(data, remote_state)
+
+            if self.generation is None:
+                # Never read: fold in whatever is stored instead of replacing it
+                data = self._merge_remote(data)
+
+            for _ in range(MAX_CONFLICT_RETRIES + 1):
+                blob = self._gcs_client.bucket(self.bucket_name).blob(self.blob_name)
+                try:
+                    blob.upload_from_string(
+                        data,
+                        content_type="application/json",
+                        if_generation_match=self.generation,
+                    )
+                except Exception as e:
+                    if getattr(e, "code", None) != 412:
+                        raise
+                    self.conflicts += 1
+                    data = self._merge_remote(data)
+                    continue
 
-            state_json = state.model_dump_json(indent=2)
-            blob.upload_from_string(state_json, content_type="application/json")
-            logger.info(f"Saved state to GCS: gs://{self.bucket_name}/{self.blob_name}")
+                with self._lock:
+                    self.generation = blob.generation
+                    self._cached = (blob.generation, data.encode("utf-8"))
+                logger.info(f"Saved state to GCS: gs://{self.bucket_name}/{self.blob_name}")
+                return
+
+            logger.error(
+                f"Failed to save state to GCS: gs://{self.bucket_name}/{self.blob_name} "
+                f"kept changing ({MAX_CONFLICT_RETRIES} conflicts)"
+            )
         except Exception as e:
             logger.error(f"Failed to save state to GCS: {e}")
 
+    def _merge_remote(self, data: str) -> str:
+        """Merge the stored state (e.g. another instance's) into ours."""
+        remote = self._read_remote()
+        if remote is None:
+            return data
+
+        logger.warning(
+            "Merging state stored in GCS by another writer "
+            f"(generation {self.generation})"
+        )
+        remote_state = DaemonProcessState.model_validate_json(remote)
+        with self._lock:
+            self._remote_state = remote_state
+        return self._merge(data, remote_state)
+
+    @staticmethod
+    def _merge(data: str, remote_state: DaemonProcessState) -> str:
+        """Serialized state with remote_state merged in."""
+        ours = DaemonProcessState.model_validate_json(data)
+        ours.merge_from(remote_state)
+        return ours.model_dump_json()
+
     def _load_from_local(self) -> DaemonProcessState:
         """Load state from local file."""
         if not self.local_fallback_path.exists():
@@ -131,13 +288,13 @@ class GCSStateManager:
             logger.error(f"Failed to load local state: {e}")
             return DaemonProcessState()
 
-    def _save_to_local(self, state: DaemonProcessState):
-        """Save state to local file."""
+    def _save_to_local(self, data: str):
+        """Save serialized state to local file."""
         try:
             self.local_fallback_path.parent.mkdir(parents=True, exist_ok=True)
 
             temp_path = self.local_fallback_path.with_suffix(".tmp")
-            temp_path.write_text(state.model_dump_json(indent=2))
+            temp_path.write_text(data)
             temp_path.replace(self.local_fallback_path)
             logger.debug(f"Saved state to local file: {self.local_fallback_path}")
         except Exception as e:
@@ -1,8 +1,10 @@
 import asyncio
 import logging
 import signal
+import time as time_module
+from dataclasses import dataclass
 from datetime import datetime, timedelta, time, UTC
-from typing import Callable, Any, Awaitable, Optional
+from typing import Callable, Any, Awaitable, Optional, Sequence, Tuple
 
 try:
     import zoneinfo
@@ -11,24 +13,93 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class CycleResult:
+    """
+    What a scheduled task did, returned to let the scheduler adapt.
+
+    Attributes:
+        processed: Work items handled this cycle (0 means idle)
+        backlog: More work is known to be waiting and this cycle made
+            progress on it, so the next cycle should start right away
+    """
+
+    processed: int = 0
+    backlog: bool = False
+
+
 class Scheduler:
     """
     Handles scheduling of periodic tasks and graceful shutdown (Async).
+
+    The delay before the next cycle adapts to what the task returns (a
+    CycleResult); a task returning None keeps the fixed interval:
+
+    - backlog: run again immediately
+    - work done: wait the base interval
+    - idle: back off exponentially (interval * backoff_factor ** idle
+      cycles), up to max_interval
+
+    wake() (thread-safe, also SIGUSR1) ends the current wait early, e.g.
+    when a push receiver or an HTTP trigger learns of new mail.
+
+    A wait never runs past the next of the daily_runs times, so daily
+    tasks checked inside the cycle (should_run_daily_task) are not slept
+    through during a long idle backoff.
     """
-    def __init__(self, interval_seconds: int):
+
+    def __init__(
+        self,
+        interval_seconds: int,
+        *,
+        max_interval_seconds: Optional[float] = None,
+        backoff_factor: float = 2.0,
+        cycle_budget_seconds: Optional[float] = None,
+        daily_runs: Sequence[Tuple[str, str]] = (),
+    ):
+        """
+        Args:
+            interval_seconds: Base delay between cycles
+            max_interval_seconds: Longest idle delay (default: no backoff)
+            backoff_factor: Idle delay multiplier per consecutive idle cycle
+            cycle_budget_seconds: Time a cycle may spend before it should
+                stop taking new work (see cycle_deadline)
+            daily_runs: (HH:MM, IANA timezone) times to start a cycle at
+                regardless of the delay, e.g. the daily report time
+        """
         self.interval = timedelta(seconds=interval_seconds)
+        self.max_interval = timedelta(
+            seconds=max(max_interval_seconds or interval_seconds, interval_seconds)
+        )
+        self.backoff_factor = backoff_factor
+        self.cycle_budget = (
+            timedelta(seconds=cycle_budget_seconds) if cycle_budget_seconds else None
+        )
+        self.cycle_deadline: Optional[float] = None
+        self.daily_runs = list(daily_runs)
+        self.idle_cycles = 0
         self.running = False
         self._shutdown_requested = False
         self._shutdown_event = asyncio.Event()
-        
+        self._wake_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake_pending = False
+
         # Register signal handlers (requires main thread)
         try:
             signal.signal(signal.SIGINT, self._handle_signal)
             signal.signal(signal.SIGTERM, self._handle_signal)
+            if hasattr(signal, "SIGUSR1"):
+                signal.signal(signal.SIGUSR1, self._handle_wake_signal)
         except ValueError:
             # Not in main thread, ignore signal handling
             logger.warning("Scheduler not running in main thread, signal handling disabled")
 
+    @property
+    def shutdown_requested(self) -> bool:
+        """True once a shutdown signal was received."""
+        return self._shutdown_requested
+
     def _handle_signal(self, signum, frame):
         logger.info(f"Received signal {signum}, scheduling shutdown...")
         self._shutdown_requested = True
@@ -36,40 +107,132 @@ class Scheduler:
         # We can't set async event from signal handler directly reliably in all loops, 
         # but we can set the flag. The loop checks the flag.
 
+    def _handle_wake_signal(self, signum, frame):
+        logger.info(f"Received signal {signum}, waking scheduler")
+        self.wake()
+
+    def wake(self) -> None:
+        """
+        Start the next cycle now instead of after the current delay.
+
+        Safe to call from any thread. A wake-up during a cycle makes the
+        next one start right after it.
+        """
+        self._wake_pending = True
+        loop, event = self._loop, self._wake_event
+        if loop is not None and event is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(event.set)
+
+    def cycle_time_left(self) -> Optional[float]:
+        """Seconds left in the current cycle's budget (None if unbudgeted)."""
+        if self.cycle_deadline is None:
+            return None
+        return self.cycle_deadline - time_module.monotonic()
+
+    def next_delay(self, result: Any) -> timedelta:
+        """
+        Delay before the next cycle, given what the last one returned.
+
+        Also tracks the idle streak used for backoff.
+        """
+        if not isinstance(result, CycleResult):
+            return self.interval
+        if result.backlog:
+            self.idle_cycles = 0
+            return timedelta(0)
+        if result.processed:
+            self.idle_cycles = 0
+            return self.interval
+
+        self.idle_cycles += 1
+        backoff = self.backoff_factor ** min(self.idle_cycles, 32)
+        return min(self.interval * backoff, self.max_interval)
+
+    def seconds_until_daily_run(self) -> Optional[float]:
+        """Seconds until the next of the daily_runs times (None if none)."""
+        if not self.daily_runs:
+            return None
+        now = datetime.now(UTC)
+        seconds = []
+        for target, tz in self.daily_runs:
+            try:
+                seconds.append((self.get_next_daily_run(target, tz) - now).total_seconds())
+            except (ValueError, AttributeError):
+                logger.error(f"Invalid daily run time format: {target}")
+        return min(seconds, default=None)
+
     async def run_loop_async(self, task: Callable[[], Awaitable[Any]]):
         """
-        Runs the given async task periodically until shutdown is requested.
+        Runs the given async task until shutdown is requested.
+
+        The delay between runs follows next_delay() of the task's result.
         """
         self.running = True
-        logger.info(f"Starting async scheduler with interval {self.interval}")
+        self._loop = asyncio.get_running_loop()
+        self._wake_event = asyncio.Event()
+        logger.info(
+            f"Starting async scheduler with interval {self.interval} "
+            f"(idle backoff up to {self.max_interval})"
+        )
 
         while self.running and not self._shutdown_requested:
             start_time = datetime.now()
+            self._wake_event.clear()
+            self._wake_pending = False
+            if self.cycle_budget is not None:
+                self.cycle_deadline = (
+                    time_module.monotonic() + self.cycle_budget.total_seconds()
+                )
+
+            result = None
             try:
                 logger.info("Executing scheduled task...")
-                await task()
+                result = await task()
             except asyncio.CancelledError:
                 logger.info("Task cancelled")
                 break
             except Exception as e:
                 logger.error(f"Error in scheduled task: {e}", exc_info=True)
-            
+            finally:
+                self.cycle_deadline = None
+
             if self._shutdown_requested:
                 break
 
+            if self._wake_pending:
+                logger.info("Wake-up received during cycle, running again")
+                continue
+
             # Calculate sleep time
+            delay = self.next_delay(result)
             elapsed = datetime.now() - start_time
-            sleep_seconds = (self.interval - elapsed).total_seconds()
-            
-            # Sleep in 1-second chunks to remain responsive to shutdown signals
+            sleep_seconds = (delay - elapsed).total_seconds()
+            until_daily = self.seconds_until_daily_run()
+            if until_daily is not None and until_daily < sleep_seconds:
+                # Wake for the daily run instead of sleeping past its window
+                sleep_seconds = until_daily
+                logger.info(f"Next cycle in {sleep_seconds:.0f}s (daily run)")
+            elif delay and sleep_seconds > 0:
+                logger.info(f"Next cycle in {sleep_seconds:.0f}s")
+            elif not delay:
+                logger.info("Backlog remaining, running next cycle immediately")
+
+            # Wait in 1-second chunks to remain responsive to shutdown signals
             while sleep_seconds > 0 and not self._shutdown_requested:
                 chunk = min(1.0, sleep_seconds)
                 try:
-                    await asyncio.sleep(chunk)
+                    await asyncio.wait_for(self._wake_event.wait(), timeout=chunk)
+                except asyncio.TimeoutError:
                     sleep_seconds -= chunk
+                    continue
                 except asyncio.CancelledError:
+                    self.running = False
                     break
-        
+                logger.info("Scheduler woken up")
+                self.idle_cycles = 0
+                break
+
+        self.running = False
         logger.info("Scheduler stopped")
 
     def should_run_daily_task(
@@ -1,11 +1,56 @@
+import asyncio
 import json
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 from models.daemon_state import DaemonProcessState
 
 logger = logging.getLogger(__name__)
 
+
+class AsyncStateWriter:
+    """
+    Writes serialized state from a worker thread, off the event loop.
+
+    Writes are coalesced: while one is in progress, newer requests replace
+    each other and only the latest is written next, so frequent checkpoints
+    never queue up stale copies.
+    """
+
+    def __init__(self, write: Callable[[str], None]):
+        """
+        Args:
+            write: Blocking function persisting one serialized state
+        """
+        self._write = write
+        self._pending: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, data: str, wait: bool = True) -> None:
+        """
+        Queue a serialized state for writing.
+
+        Args:
+            data: Serialized state
+            wait: Wait until it (or a newer state) has been written
+        """
+        self._pending = data
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._drain())
+        if wait:
+            await asyncio.shield(self._task)
+
+    async def flush(self) -> None:
+        """Wait for queued writes to finish."""
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+    async def _drain(self) -> None:
+        while self._pending is not None:
+            data, self._pending = self._pending, None
+            await asyncio.to_thread(self._write, data)
+
+
 class StateManager:
     """
     Manages the state of the daemon process using a JSON file.
@@ -13,6 +58,7 @@ class StateManager:
     def __init__(self, state_file_path: Path):
         self.state_file_path = state_file_path
         self.state_file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = AsyncStateWriter(self._write)
 
     def load_state(self) -> DaemonProcessState:
         """
@@ -33,10 +79,26 @@ class StateManager:
         """
         Saves the daemon state to file atomically.
         """
+        self._write(state.model_dump_json())
+
+    async def save_state_async(self, state: DaemonProcessState, wait: bool = True):
+        """
+        Save the state from a worker thread.
+
+        The state is serialized right away (on the event loop, so later
+        changes are not picked up half-way); the write happens off-loop.
+
+        Args:
+            state: State to save
+            wait: Wait for the write; False for checkpoints
+        """
+        await self._writer.submit(state.model_dump_json(), wait=wait)
+
+    def _write(self, data: str):
         try:
             temp_path = self.state_file_path.with_suffix(".tmp")
             with open(temp_path, "w", encoding="utf-8") as f:
-                f.write(state.model_dump_json(indent=2))
+                f.write(data)
             temp_path.replace(self.state_file_path)
         except Exception as e:
             logger.error(f"Failed to save daemon state: {e}")
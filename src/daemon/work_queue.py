@@ -0,0 +1,366 @@
+"""
+Lease-based work distribution across daemon instances.
+
+Several daemons (or Cloud Run job executions) may poll the same mailbox.
+Before running an email through the pipeline, an instance claims the
+email's message ID in a shared lease store. A claim succeeds when nobody
+holds an unexpired lease on it and it is not done yet. Finished (or
+quarantined) emails are marked done, so every instance skips them.
+Crashed workers simply stop renewing: their leases expire and the emails
+are claimed again.
+
+Two stores are provided:
+    - SQLiteLeaseStore: one SQLite table (plain SQL, Postgres-compatible
+      upserts); shared by processes on one machine, and the local
+      stand-in for tests
+    - GCSLeaseStore: one GCS object per message ID, claimed with
+      if_generation_match preconditions; works across Cloud Run jobs
+
+Use build_lease_store() to create one from a URL
+("sqlite:///data/daemon/leases.sqlite3" or "gs://bucket/prefix").
+"""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default lease length; an email must be finished (or renewed) within it
+DEFAULT_LEASE_SECONDS = 600.0
+
+# Reads of a GCS lease object retried when it is rewritten mid-read
+LEASE_READ_RETRIES = 3
+
+# claim() outcomes
+LEASE_CLAIMED = "claimed"
+LEASE_HELD = "held"
+LEASE_DONE = "done"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    message_id TEXT PRIMARY KEY,
+    owner      TEXT,
+    expires_at REAL NOT NULL,
+    done       INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def default_worker_id() -> str:
+    """Identifier unique to this process: host, PID and a random suffix."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+class LeaseStore(Protocol):
+    """Shared store of per-email leases."""
+
+    worker_id: str
+
+    def claim(self, message_id: str) -> str:
+        """Try to lease an email; returns LEASE_CLAIMED, LEASE_HELD or LEASE_DONE."""
+        ...
+
+    def renew(self, message_id: str) -> bool:
+        """Extend our lease; False if it was lost to another worker."""
+        ...
+
+    def complete(self, message_id: str) -> None:
+        """Mark an email done for every worker."""
+        ...
+
+    def release(self, message_id: str) -> None:
+        """Give up our lease so another worker may retry at once."""
+        ...
+
+
+class SQLiteLeaseStore:
+    """
+    Lease store in a SQLite database.
+
+    Claims are single upserts guarded by a WHERE clause, so they are
+    atomic across processes sharing the file.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            db_path: SQLite database file (created if missing)
+            worker_id: This worker's identity (default: default_worker_id())
+            lease_seconds: How long a claim stays valid without renewal
+            clock: Time source in epoch seconds (for tests)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection committing on success."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def claim(self, message_id: str) -> str:
+        now = self._clock()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO leases (message_id, owner, expires_at, done) "
+                "VALUES (?, ?, ?, 0) "
+                "ON CONFLICT (message_id) DO UPDATE SET "
+                "owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE leases.done = 0 "
+                "AND (leases.expires_at <= ? OR leases.owner = excluded.owner)",
+                (message_id, self.worker_id, now + self.lease_seconds, now),
+            )
+            owner, done = conn.execute(
+                "SELECT owner, done FROM leases WHERE message_id = ?", (message_id,)
+            ).fetchone()
+        if done:
+            return LEASE_DONE
+        return LEASE_CLAIMED if owner == self.worker_id else LEASE_HELD
+
+    def renew(self, message_id: str) -> bool:
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE leases SET expires_at = ? "
+                "WHERE message_id = ? AND owner = ? AND done = 0",
+                (self._clock() + self.lease_seconds, message_id, self.worker_id),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, message_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO leases (message_id, owner, expires_at, done) "
+                "VALUES (?, ?, 0, 1) "
+                "ON CONFLICT (message_id) DO UPDATE SET "
+                "owner = excluded.owner, expires_at = 0, done = 1",
+                (message_id, self.worker_id),
+            )
+
+    def release(self, message_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE leases SET expires_at = 0 "
+                "WHERE message_id = ? AND owner = ? AND done = 0",
+                (message_id, self.worker_id),
+            )
+
+
+class GCSLeaseStore:
+    """
+    Lease store with one GCS object per message ID.
+
+    Each object holds {"owner", "expires_at", "done"}. Creating it uses
+    if_generation_match=0 and taking over an expired lease matches the
+    generation read, so of two workers racing for an email exactly one
+    upload succeeds (the other gets HTTP 412).
+    """
+
+    def __init__(
+        self,
+        bucket_name: str,
+        prefix: str = "daemon/leases",
+        *,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        client=None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            bucket_name: GCS bucket holding the lease objects
+            prefix: Object name prefix
+            worker_id: This worker's identity (default: default_worker_id())
+            lease_seconds: How long a claim stays valid without renewal
+            client: GCS client (default: google.cloud.storage.Client),
+                e.g. collabiq.test_utils.gcs_stub.FakeGCSClient in tests
+            clock: Time source in epoch seconds (for tests)
+        """
+        if client is None:
+            from google.cloud import storage
+
+            client = storage.Client()
+        self._bucket = client.bucket(bucket_name)
+        self.prefix = prefix.strip("/")
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        # Generation of each lease object we hold, for conditional updates
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _name(self, message_id: str) -> str:
+        return f"{self.prefix}/{message_id}.json"
+
+    def _upload(self, message_id: str, record: dict, if_generation_match: Optional[int]):
+        """Write a lease object; returns its generation, or None on conflict."""
+        blob = self._bucket.blob(self._name(message_id))
+        try:
+            blob.upload_from_string(
+                json.dumps(record),
+                content_type="application/json",
+                if_generation_match=if_generation_match,
+            )
+        except Exception as e:
+            if getattr(e, "code", None) == 412:
+                return None
+            raise
+        return blob.generation
+
+    def _read(self, message_id: str) -> Tuple[Optional[dict], Optional[int]]:
+        """
+        Read a lease object and its generation.
+
+        The read is retried when another worker rewrites the object between
+        fetching its metadata and downloading it (HTTP 412).
+
+        Returns:
+            (record, generation); (None, 0) if the object does not exist,
+            (None, None) if it kept changing
+        """
+        for _ in range(LEASE_READ_RETRIES):
+            blob = self._bucket.get_blob(self._name(message_id))
+            if blob is None:
+                return None, 0
+            try:
+                data = blob.download_as_bytes(if_generation_match=blob.generation)
+            except Exception as e:
+                if getattr(e, "code", None) == 412:
+                    continue
+                raise
+            return json.loads(data), blob.generation
+        return None, None
+
+    def claim(self, message_id: str) -> str:
+        record, expected = self._read(message_id)
+        if expected is None:
+            # Other workers are busy with it
+            return LEASE_HELD
+        if record is not None:
+            if record.get("done"):
+                return LEASE_DONE
+            if record.get("owner") != self.worker_id and record["expires_at"] > self._clock():
+                return LEASE_HELD
+
+        generation = self._upload(
+            message_id,
+            {
+                "owner": self.worker_id,
+                "expires_at": self._clock() + self.lease_seconds,
+                "done": False,
+            },
+            expected,
+        )
+        if generation is None:
+            # Another worker claimed (or finished) it first
+            blob = self._bucket.get_blob(self._name(message_id))
+            if blob is not None and json.loads(blob.download_as_bytes()).get("done"):
+                return LEASE_DONE
+            return LEASE_HELD
+        with self._lock:
+            self._generations[message_id] = generation
+        return LEASE_CLAIMED
+
+    def renew(self, message_id: str) -> bool:
+        with self._lock:
+            expected = self._generations.get(message_id)
+        if expected is None:
+            return False
+        generation = self._upload(
+            message_id,
+            {
+                "owner": self.worker_id,
+                "expires_at": self._clock() + self.lease_seconds,
+                "done": False,
+            },
+            expected,
+        )
+        with self._lock:
+            if generation is None:
+                self._generations.pop(message_id, None)
+                return False
+            self._generations[message_id] = generation
+        return True
+
+    def complete(self, message_id: str) -> None:
+        # Unconditional: the work is done whoever holds the lease now
+        self._upload(
+            message_id,
+            {"owner": self.worker_id, "expires_at": 0, "done": True},
+            None,
+        )
+        with self._lock:
+            self._generations.pop(message_id, None)
+
+    def release(self, message_id: str) -> None:
+        with self._lock:
+            expected = self._generations.pop(message_id, None)
+        if expected is None:
+            return
+        # Expire rather than delete, so a late takeover is not undone
+        self._upload(
+            message_id,
+            {"owner": self.worker_id, "expires_at": 0, "done": False},
+            expected,
+        )
+
+
+def build_lease_store(
+    url: str,
+    *,
+    worker_id: Optional[str] = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    client=None,
+) -> LeaseStore:
+    """
+    Create a lease store from a URL.
+
+    Args:
+        url: "sqlite:///relative/leases.sqlite3",
+            "sqlite:////absolute/leases.sqlite3" or "gs://bucket[/prefix]"
+        worker_id: This worker's identity (default: default_worker_id())
+        lease_seconds: Lease length
+        client: GCS client for gs:// URLs
+
+    Raises:
+        ValueError: For an unsupported URL
+    """
+    if url.startswith("gs://"):
+        bucket, _, prefix = url[len("gs://"):].partition("/")
+        return GCSLeaseStore(
+            bucket,
+            prefix or "daemon/leases",
+            worker_id=worker_id,
+            lease_seconds=lease_seconds,
+            client=client,
+        )
+    if url.startswith("sqlite:///"):
+        # As in SQLAlchemy: three slashes, then the path (a fourth for absolute)
+        path = url[len("sqlite:///"):]
+        return SQLiteLeaseStore(Path(path), worker_id=worker_id, lease_seconds=lease_seconds)
+    raise ValueError(f"Unsupported lease store URL: {url!r} (use sqlite:/// or gs://)")
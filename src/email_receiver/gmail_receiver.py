@@ -5,7 +5,6 @@ This module provides the GmailReceiver class that connects to Gmail API
 using OAuth2 and retrieves emails from portfolioupdates@signite.co inbox.
 """
 
-import base64
 import json
 import logging
 from datetime import datetime, UTC
@@ -24,6 +23,7 @@ try:
     from ..models.raw_email import EmailAttachment, EmailMetadata, RawEmail
     from ..models.duplicate_tracker import DuplicateTracker
     from .base import EmailReceiver
+    from .mime_body import DEFAULT_MAX_BODY_BYTES, decode_body, scan_payload
     from ..error_handling.structured_logger import logger as error_logger
     from ..error_handling.models import ErrorRecord, ErrorSeverity, ErrorCategory
     from ..error_handling import (
@@ -35,6 +35,7 @@ except ImportError:
     from models.raw_email import EmailMetadata, RawEmail
     from models.duplicate_tracker import DuplicateTracker
     from email_receiver.base import EmailReceiver
+    from email_receiver.mime_body import DEFAULT_MAX_BODY_BYTES, decode_body, scan_payload
     from error_handling.structured_logger import logger as error_logger
     from error_handling.models import ErrorRecord, ErrorSeverity, ErrorCategory
     from error_handling import retry_with_backoff, GMAIL_RETRY_CONFIG
@@ -77,6 +78,7 @@ class GmailReceiver(EmailReceiver):
         token_path: Path,
         raw_email_dir: Optional[Path] = None,
         metadata_dir: Optional[Path] = None,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
     ):
         """
         Initialize GmailReceiver.
@@ -86,11 +88,14 @@ class GmailReceiver(EmailReceiver):
             token_path: Path to store OAuth2 access/refresh tokens
             raw_email_dir: Directory for raw email storage (default: data/raw)
             metadata_dir: Directory for metadata storage (default: data/metadata)
+            max_body_bytes: Largest body decoded per message; longer bodies
+                are cut before decoding
         """
         self.credentials_path = Path(credentials_path)
         self.token_path = Path(token_path)
         self.raw_email_dir = Path(raw_email_dir or "data/raw")
         self.metadata_dir = Path(metadata_dir or "data/metadata")
+        self.max_body_bytes = max_body_bytes
         self.service = None
         self.creds = None
         
@@ -203,6 +208,7 @@ class GmailReceiver(EmailReceiver):
         since: Optional[datetime] = None,
         max_emails: int = 100,
         query: Optional[str] = None,
+        oldest_first: bool = False,
     ) -> List[RawEmail]:
         """
         Retrieve unprocessed emails from Gmail inbox (T031).
@@ -214,6 +220,9 @@ class GmailReceiver(EmailReceiver):
             since: Only retrieve emails after this timestamp
             max_emails: Maximum number of emails to retrieve (1-500)
             query: Custom Gmail search query (T020). If None, defaults to 'to:collab@signite.co'
+            oldest_first: Take the oldest max_emails matches instead of the
+                newest (lists every matching ID, so use it with since). Lets
+                a caller drain a backlog batch by batch.
 
         Returns:
             List of RawEmail objects in chronological order (oldest first)
@@ -253,19 +262,21 @@ class GmailReceiver(EmailReceiver):
             # Fetch message list
             # includeSpamTrash=False is the default, but we set it explicitly for clarity
             logger.info(f"Fetching emails with query: {query_str}, max: {max_emails}")
-            results = (
-                self.service.users()
-                .messages()
-                .list(
-                    userId="me",
-                    q=query_str,
-                    maxResults=max_emails,
-                    includeSpamTrash=False,
+            if oldest_first:
+                messages = self._list_all_messages(query_str)[::-1][:max_emails]
+            else:
+                results = (
+                    self.service.users()
+                    .messages()
+                    .list(
+                        userId="me",
+                        q=query_str,
+                        maxResults=max_emails,
+                        includeSpamTrash=False,
+                    )
+                    .execute()
                 )
-                .execute()
-            )
-
-            messages = results.get("messages", [])
+                messages = results.get("messages", [])
             logger.info(f"Found {len(messages)} messages")
 
             if not messages:
@@ -347,6 +358,25 @@ class GmailReceiver(EmailReceiver):
                 # by re-raising the original exception
                 raise
 
+    def _list_all_messages(self, query_str: str) -> List[dict]:
+        """List every message ID matching a query, newest first (IDs only)."""
+        messages = []
+        page_token = None
+        while True:
+            params = {
+                "userId": "me",
+                "q": query_str,
+                "maxResults": 500,
+                "includeSpamTrash": False,
+            }
+            if page_token:
+                params["pageToken"] = page_token
+            results = self.service.users().messages().list(**params).execute()
+            messages.extend(results.get("messages", []))
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                return messages
+
     def _parse_message(self, msg_detail: dict) -> RawEmail:
         """
         Parse Gmail API message to RawEmail model (T032).
@@ -378,11 +408,17 @@ class GmailReceiver(EmailReceiver):
             except Exception:
                 received_at = datetime.now(UTC)
 
-            # Extract body
-            body = self._extract_body(payload)
+            # Server-side arrival time, which Gmail's after:/before: filters use
+            internal_date = None
+            if msg_detail.get("internalDate"):
+                internal_date = datetime.fromtimestamp(
+                    int(msg_detail["internalDate"]) / 1000, UTC
+                )
 
-            # Check for attachments
-            has_attachments = self._has_attachments(payload)
+            # Find body part and attachments in one pass, decode the body once
+            scan = scan_payload(payload)
+            body = self._decode_body(scan.body_part, message_id)
+            has_attachments = scan.has_attachments
             attachments = []  # TODO: Implement attachment parsing in later phase
 
             # Create RawEmail
@@ -392,6 +428,7 @@ class GmailReceiver(EmailReceiver):
                 sender=sender,
                 subject=subject,
                 received_at=received_at,
+                internal_date=internal_date,
                 has_attachments=has_attachments,
             )
 
@@ -412,7 +449,7 @@ class GmailReceiver(EmailReceiver):
         """
         Extract email body from Gmail API payload.
 
-        Handles both plain text and multipart messages.
+        Handles both plain text and multipart messages (see mime_body).
 
         Args:
             payload: Gmail API message payload
@@ -420,64 +457,24 @@ class GmailReceiver(EmailReceiver):
         Returns:
             Decoded email body text
         """
-        # Single-part message
-        if "body" in payload and payload["body"].get("data"):
-            return self._decode_base64(payload["body"]["data"])
-
-        # Multipart message - find text/plain part
-        if "parts" in payload:
-            for part in payload["parts"]:
-                mime_type = part.get("mimeType", "")
-
-                # Prefer text/plain
-                if mime_type == "text/plain" and part.get("body", {}).get("data"):
-                    return self._decode_base64(part["body"]["data"])
-
-            # Fallback to text/html
-            for part in payload["parts"]:
-                if part.get("mimeType") == "text/html" and part.get("body", {}).get(
-                    "data"
-                ):
-                    return self._decode_base64(part["body"]["data"])
-
-            # Nested parts
-            for part in payload["parts"]:
-                if "parts" in part:
-                    body = self._extract_body(part)
-                    if body:
-                        return body
-
-        return ""
-
-    def _decode_base64(self, data: str) -> str:
-        """Decode base64url-encoded string with fallback encoding."""
-        try:
-            # Gmail uses base64url encoding (RFC 4648)
-            decoded = base64.urlsafe_b64decode(data)
+        return self._decode_body(scan_payload(payload).body_part)
 
-            # Try UTF-8 first
-            try:
-                return decoded.decode("utf-8")
-            except UnicodeDecodeError:
-                # Fallback to latin-1 (never fails but may not be semantically correct)
-                logger.warning("UTF-8 decode failed, falling back to latin-1")
-                error_record = ErrorRecord(
-                    timestamp=datetime.now(UTC),
-                    severity=ErrorSeverity.WARNING,
-                    category=ErrorCategory.PERMANENT,
-                    message="Email encoding issue: UTF-8 decode failed, using fallback",
-                    error_type="UnicodeDecodeError",
-                    stack_trace=None,
-                    context={
-                        "operation": "_decode_base64",
-                        "encoding": "latin-1 fallback",
-                    },
-                    retry_count=0,
-                )
-                error_logger.log_error(error_record)
-                return decoded.decode("latin-1", errors="replace")
+    def _decode_body(self, part: Optional[dict], message_id: Optional[str] = None) -> str:
+        """
+        Decode a body part in its declared charset, up to max_body_bytes.
 
-        except Exception as e:
+        Args:
+            part: Body part chosen by scan_payload() (None: no body)
+            message_id: Message ID for log context
+
+        Returns:
+            Decoded text ("" if there is no body or it is not valid base64)
+        """
+        if part is None:
+            return ""
+        try:
+            decoded = decode_body(part, self.max_body_bytes)
+        except ValueError as e:
             logger.warning(f"Failed to decode base64 data: {e}")
             error_record = ErrorRecord(
                 timestamp=datetime.now(UTC),
@@ -486,22 +483,41 @@ class GmailReceiver(EmailReceiver):
                 message=f"Base64 decode failed: {str(e)}",
                 error_type=type(e).__name__,
                 stack_trace=str(e),
-                context={"operation": "_decode_base64"},
+                context={"operation": "_decode_body", "message_id": message_id},
                 retry_count=0,
             )
             error_logger.log_error(error_record)
             return ""
 
+        if decoded.truncated:
+            logger.warning(
+                f"Body of {message_id} exceeds {self.max_body_bytes} bytes, truncated"
+            )
+        if decoded.lossy:
+            logger.warning(f"Body of {message_id} is not valid {decoded.charset}")
+            error_record = ErrorRecord(
+                timestamp=datetime.now(UTC),
+                severity=ErrorSeverity.WARNING,
+                category=ErrorCategory.PERMANENT,
+                message=(
+                    f"Email encoding issue: body is not valid {decoded.charset}, "
+                    "undecodable bytes replaced"
+                ),
+                error_type="UnicodeDecodeError",
+                stack_trace=None,
+                context={
+                    "operation": "_decode_body",
+                    "message_id": message_id,
+                    "encoding": decoded.charset,
+                },
+                retry_count=0,
+            )
+            error_logger.log_error(error_record)
+        return decoded.text
+
     def _has_attachments(self, payload: dict) -> bool:
         """Check if message has attachments."""
-        if "parts" in payload:
-            for part in payload["parts"]:
-                if part.get("filename"):
-                    return True
-                if "parts" in part:
-                    if self._has_attachments(part):
-                        return True
-        return False
+        return scan_payload(payload).has_attachments
 
     def save_raw_email(self, email: RawEmail) -> Path:
         """
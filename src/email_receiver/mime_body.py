@@ -0,0 +1,191 @@
+"""
+Body selection and decoding for Gmail API message payloads.
+
+A format="full" message arrives as a tree of parts, each with headers, a
+mimeType and a body whose data is the part content base64url-encoded
+(Gmail has already undone the part's Content-Transfer-Encoding). The
+bytes are in the charset its Content-Type declares, e.g. EUC-KR or
+CP949 for much Korean mail.
+
+scan_payload() walks the tree once, choosing the body part (the first
+inline text/plain, else the first inline text/html) and noting
+attachments. decode_body() decodes only the chosen part:
+
+- only as much base64 as max_bytes allows is decoded, so a huge part is
+  never materialized in full; attachments are never decoded at all
+- bytes are decoded with the declared charset (legacy charsets widened
+  to their supersets, e.g. EUC-KR to CP949), then UTF-8 and CP949 if it
+  does not fit, and with replacement characters only as a last resort
+"""
+
+import base64
+import codecs
+from dataclasses import dataclass
+from email.message import Message
+from typing import Optional
+
+# Largest body decoded from a message (bytes); the rest is cut off
+DEFAULT_MAX_BODY_BYTES = 1_000_000
+
+# Declared charsets decoded with a superset codec (by Python codec name).
+# Mail clients label CP949 (UHC) text as EUC-KR/ks_c_5601-1987, and so on.
+_SUPERSET_CODECS = {
+    "ascii": "utf-8",
+    "euc_kr": "cp949",
+    "gb2312": "gb18030",
+    "gbk": "gb18030",
+    "shift_jis": "cp932",
+}
+
+# Charset names Python does not know
+_CHARSET_ALIASES = {
+    "x-windows-949": "cp949",
+    "windows-874": "cp874",
+    "x-sjis": "cp932",
+}
+
+# Tried, in order, when the declared charset does not fit the bytes
+_FALLBACK_CODECS = ("utf-8", "cp949")
+
+
+@dataclass
+class PayloadScan:
+    """Result of scan_payload()."""
+
+    body_part: Optional[dict] = None
+    has_attachments: bool = False
+
+
+@dataclass
+class DecodedBody:
+    """Result of decode_body()."""
+
+    text: str
+    charset: str
+    truncated: bool = False
+    # True when no charset decoded the bytes cleanly (text has U+FFFD)
+    lossy: bool = False
+
+
+def _header(part: dict, name: str) -> Optional[str]:
+    name = name.lower()
+    for header in part.get("headers", ()):
+        if header.get("name", "").lower() == name:
+            return header.get("value")
+    return None
+
+
+def _is_attachment(part: dict) -> bool:
+    if part.get("filename") or part.get("body", {}).get("attachmentId"):
+        return True
+    disposition = _header(part, "Content-Disposition") or ""
+    return disposition.strip().lower().startswith("attachment")
+
+
+def scan_payload(payload: dict) -> PayloadScan:
+    """
+    Find the body part and attachments of a message in one pass.
+
+    Args:
+        payload: Gmail API message payload
+
+    Returns:
+        PayloadScan with the preferred inline text part (or None) and
+        whether any part is an attachment
+    """
+    scan = PayloadScan()
+    html_part = None
+    stack = [payload]
+    while stack:
+        part = stack.pop()
+        children = part.get("parts")
+        if children:
+            # Reversed, so parts are visited in document order
+            stack.extend(reversed(children))
+            continue
+        if _is_attachment(part):
+            scan.has_attachments = True
+            continue
+        if not part.get("body", {}).get("data"):
+            continue
+        mime_type = (part.get("mimeType") or "text/plain").lower()
+        if mime_type == "text/plain" and scan.body_part is None:
+            scan.body_part = part
+        elif mime_type == "text/html" and html_part is None:
+            html_part = part
+        elif part is payload and mime_type.startswith("text/"):
+            # Single-part message of another text type
+            scan.body_part = part
+    if scan.body_part is None:
+        scan.body_part = html_part
+    return scan
+
+
+def part_charset(part: dict) -> Optional[str]:
+    """Charset declared in a part's Content-Type header, lowercased."""
+    content_type = _header(part, "Content-Type")
+    if not content_type:
+        return None
+    message = Message()
+    message["Content-Type"] = content_type
+    return message.get_content_charset()
+
+
+def _codec_for(charset: Optional[str]) -> Optional[str]:
+    """Python codec for a declared charset (None if unknown)."""
+    if not charset:
+        return None
+    charset = _CHARSET_ALIASES.get(charset, charset)
+    try:
+        name = codecs.lookup(charset).name
+    except LookupError:
+        return None
+    return _SUPERSET_CODECS.get(name, name)
+
+
+def decode_body(part: dict, max_bytes: int = DEFAULT_MAX_BODY_BYTES) -> DecodedBody:
+    """
+    Decode a part's body text, reading at most max_bytes of it.
+
+    Args:
+        part: Gmail API message part with body.data
+        max_bytes: Decoded size limit; longer bodies are cut (at a
+            character boundary) without decoding the rest
+
+    Returns:
+        DecodedBody with text, the codec used and truncation/loss flags
+
+    Raises:
+        binascii.Error: If body.data is not valid base64url (a ValueError)
+    """
+    data = part.get("body", {}).get("data", "")
+    # base64 turns every 3 bytes into 4 characters
+    max_chars = -(-max_bytes // 3) * 4
+    truncated = len(data) > max_chars
+    if truncated:
+        data = data[:max_chars]
+    raw = base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+    if truncated:
+        raw = raw[:max_bytes]
+
+    declared = _codec_for(part_charset(part))
+    candidates = [declared] if declared else []
+    candidates += [codec for codec in _FALLBACK_CODECS if codec != declared]
+    for codec in candidates:
+        # Incremental decoding tolerates a character cut at the limit
+        decoder = codecs.getincrementaldecoder(codec)("strict")
+        try:
+            text = decoder.decode(raw, final=not truncated)
+        except UnicodeDecodeError:
+            continue
+        return DecodedBody(text=text, charset=codec, truncated=truncated)
+
+    codec = declared or "utf-8"
+    decoder = codecs.getincrementaldecoder(codec)("replace")
+    return DecodedBody(
+        text=decoder.decode(raw, final=not truncated),
+        charset=codec,
+        truncated=truncated,
+        lossy=True,
+    )
+
@@ -1,35 +1,323 @@
 """
-Webhook implementation of EmailReceiver (PLACEHOLDER).
-
-This module is a placeholder for future webhook-based email reception.
-All methods are currently unimplemented and will raise NotImplementedError.
+Gmail push implementation of EmailReceiver (Cloud Pub/Sub).
+
+Polling finds a new email only at the next cycle, minutes after it
+arrived. With a Gmail watch, Gmail publishes a notification to a Pub/Sub
+topic whenever the mailbox changes; WebhookReceiver pulls those
+notifications from a subscription, turns the history IDs they carry into
+RawEmails and hands them to the daemon within seconds.
+
+Flow:
+1. setup_watch() registers users.watch() for the topic and remembers the
+   mailbox historyId as the cursor
+2. Each notification carries {"emailAddress", "historyId"}; history.list()
+   from the cursor yields the added message IDs, and messages.get()
+   fetches each one (parsed exactly like GmailReceiver does)
+3. The cursor is persisted in metadata_dir/gmail_watch.json and the
+   notifications are acknowledged only after their messages were listed
+
+Push is an accelerator, not the source of truth: if the cursor is lost or
+too old (history.list() returns 404), the receiver resets it and the
+daemon's polling cycle picks up whatever was missed.
+
+The subscription is anything with pull()/acknowledge():
+- GooglePubSubSubscriber: google-cloud-pubsub (optional dependency); honours
+  PUBSUB_EMULATOR_HOST for the Pub/Sub emulator
+- LocalPubSubQueue: in-process stand-in with ack deadlines and redelivery,
+  for tests and offline runs
+
+Usage:
+    >>> gmail = GmailReceiver(credentials_path, token_path)
+    >>> receiver = WebhookReceiver(
+    ...     "my-project", "gmail-notifications", "gmail-notifications-sub",
+    ...     credentials_path, gmail_receiver=gmail,
+    ... )
+    >>> receiver.connect()
+    >>> receiver.setup_watch()
+    >>> emails = receiver.wait_for_emails(timeout=10.0)
 """
 
-from datetime import datetime
+import base64
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Deque, Dict, List, Optional, Protocol, Sequence, Tuple
 
 try:
     from ..models.raw_email import RawEmail
     from .base import EmailReceiver
+    from .gmail_receiver import EmailReceiverError, GmailReceiver
 except ImportError:
     from models.raw_email import RawEmail
     from email_receiver.base import EmailReceiver
+    from email_receiver.gmail_receiver import EmailReceiverError, GmailReceiver
+
+logger = logging.getLogger(__name__)
+
+# Gmail expires a watch after 7 days; renew a day ahead
+WATCH_RENEWAL_MARGIN = timedelta(days=1)
+
+
+@dataclass
+class PubSubMessage:
+    """One message pulled from a subscription."""
+
+    ack_id: str
+    data: bytes
+    message_id: str = ""
+    delivery_attempt: int = 1
+
+
+@dataclass
+class GmailNotification:
+    """Decoded Gmail push notification."""
+
+    email_address: str
+    history_id: int
+    ack_id: str
+
+
+class PubSubSubscriber(Protocol):
+    """Pull access to a Pub/Sub subscription."""
+
+    def pull(self, max_messages: int, timeout: float) -> List[PubSubMessage]:
+        """Pull up to max_messages, waiting at most timeout seconds."""
+        ...
+
+    def acknowledge(self, ack_ids: Sequence[str]) -> None:
+        """Acknowledge messages so they are not redelivered."""
+        ...
+
+
+class LocalPubSubQueue:
+    """
+    In-process stand-in for a Pub/Sub topic and subscription.
+
+    Published messages are delivered to pull() and redelivered if they are
+    not acknowledged within ack_deadline seconds, as Pub/Sub does.
+    Thread-safe, so a test can publish while the daemon pulls.
+    """
+
+    def __init__(self, ack_deadline: float = 10.0):
+        """
+        Args:
+            ack_deadline: Seconds before an unacknowledged message is redelivered
+        """
+        self.ack_deadline = ack_deadline
+        self._ready: Deque[Tuple[str, bytes, int]] = deque()
+        self._leased: Dict[str, Tuple[str, bytes, int, float]] = {}
+        self._condition = threading.Condition()
+        self._next_id = 0
+        self.published_count = 0
+        self.acknowledged_count = 0
+
+    def publish(self, data: Any) -> str:
+        """
+        Publish a message.
+
+        Args:
+            data: Payload bytes, or a dict that is JSON-encoded
+
+        Returns:
+            Message ID
+        """
+        if isinstance(data, dict):
+            data = json.dumps(data).encode("utf-8")
+        with self._condition:
+            self._next_id += 1
+            message_id = str(self._next_id)
+            self._ready.append((message_id, data, 1))
+            self.published_count += 1
+            self._condition.notify_all()
+        return message_id
+
+    def publish_gmail_notification(self, email_address: str, history_id: int) -> str:
+        """Publish a notification shaped like the ones Gmail sends."""
+        return self.publish({"emailAddress": email_address, "historyId": history_id})
+
+    def pull(self, max_messages: int = 100, timeout: float = 0.0) -> List[PubSubMessage]:
+        """Pull ready messages, waiting up to timeout seconds for the first."""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                self._requeue_expired()
+                if self._ready:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                self._condition.wait(min(remaining, self.ack_deadline))
+
+            messages = []
+            now = time.monotonic()
+            while self._ready and len(messages) < max_messages:
+                message_id, data, attempt = self._ready.popleft()
+                ack_id = f"{message_id}-{attempt}"
+                self._leased[ack_id] = (message_id, data, attempt, now)
+                messages.append(PubSubMessage(ack_id, data, message_id, attempt))
+            return messages
+
+    def acknowledge(self, ack_ids: Sequence[str]) -> None:
+        """Acknowledge pulled messages."""
+        with self._condition:
+            for ack_id in ack_ids:
+                if self._leased.pop(ack_id, None) is not None:
+                    self.acknowledged_count += 1
+
+    def pending_count(self) -> int:
+        """Messages published but not yet acknowledged."""
+        with self._condition:
+            return len(self._ready) + len(self._leased)
+
+    def _requeue_expired(self) -> None:
+        """Return leased messages past their ack deadline to the queue."""
+        now = time.monotonic()
+        for ack_id, (message_id, data, attempt, leased_at) in list(self._leased.items()):
+            if now - leased_at >= self.ack_deadline:
+                del self._leased[ack_id]
+                self._ready.append((message_id, data, attempt + 1))
+
+
+class GooglePubSubSubscriber:
+    """
+    Pull subscriber backed by google-cloud-pubsub.
+
+    The package is optional and imported on first use. With
+    PUBSUB_EMULATOR_HOST set, the client talks to the Pub/Sub emulator.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        subscription_name: str,
+        credentials_path: Optional[Path] = None,
+    ):
+        """
+        Args:
+            project_id: Google Cloud project ID
+            subscription_name: Subscription name (or full path)
+            credentials_path: Service account JSON (default: application default)
+        """
+        self.project_id = project_id
+        self.subscription_name = subscription_name
+        self.credentials_path = Path(credentials_path) if credentials_path else None
+        self._client = None
+
+    @property
+    def subscription_path(self) -> str:
+        if self.subscription_name.startswith("projects/"):
+            return self.subscription_name
+        return f"projects/{self.project_id}/subscriptions/{self.subscription_name}"
+
+    def _get_client(self):
+        """Create the SubscriberClient on first use."""
+        if self._client is None:
+            try:
+                from google.cloud import pubsub_v1
+            except ImportError as e:
+                raise EmailReceiverError(
+                    code="PUBSUB_UNAVAILABLE",
+                    message=(
+                        "google-cloud-pubsub is not installed; install it to "
+                        "receive Gmail push notifications"
+                    ),
+                ) from e
+
+            kwargs = {}
+            if (
+                self.credentials_path
+                and self.credentials_path.exists()
+                and not os.getenv("PUBSUB_EMULATOR_HOST")
+            ):
+                from google.oauth2 import service_account
+
+                kwargs["credentials"] = (
+                    service_account.Credentials.from_service_account_file(
+                        str(self.credentials_path)
+                    )
+                )
+            self._client = pubsub_v1.SubscriberClient(**kwargs)
+        return self._client
+
+    def pull(self, max_messages: int = 100, timeout: float = 10.0) -> List[PubSubMessage]:
+        """Pull messages, returning an empty list if none arrive in time."""
+        from google.api_core import exceptions as gcp_exceptions
+
+        client = self._get_client()
+        try:
+            response = client.pull(
+                request={
+                    "subscription": self.subscription_path,
+                    "max_messages": max_messages,
+                },
+                timeout=max(timeout, 1.0),
+            )
+        except (gcp_exceptions.DeadlineExceeded, gcp_exceptions.RetryError):
+            return []
+
+        return [
+            PubSubMessage(
+                ack_id=received.ack_id,
+                data=received.message.data,
+                message_id=received.message.message_id,
+                delivery_attempt=received.delivery_attempt or 1,
+            )
+            for received in response.received_messages
+        ]
+
+    def acknowledge(self, ack_ids: Sequence[str]) -> None:
+        """Acknowledge pulled messages."""
+        if ack_ids:
+            self._get_client().acknowledge(
+                request={"subscription": self.subscription_path, "ack_ids": list(ack_ids)}
+            )
+
+
+def parse_notification(message: PubSubMessage) -> Optional[GmailNotification]:
+    """
+    Decode a Gmail push notification.
+
+    Pub/Sub delivers the payload as bytes; push endpoints receive it
+    base64-encoded, so both forms are accepted.
+
+    Returns:
+        GmailNotification, or None if the payload is not one
+    """
+    data = message.data
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            payload = json.loads(base64.b64decode(data))
+        return GmailNotification(
+            email_address=payload.get("emailAddress", ""),
+            history_id=int(payload["historyId"]),
+            ack_id=message.ack_id,
+        )
+    except (ValueError, KeyError, TypeError, AttributeError):
+        logger.warning(f"Ignoring malformed Pub/Sub message {message.message_id}")
+        return None
 
 
 class WebhookReceiver(EmailReceiver):
     """
-    Webhook implementation for email ingestion (PLACEHOLDER).
+    Gmail push notification receiver.
 
-    This is a placeholder class for webhook-based email reception.
-    The Gmail API implementation (GmailReceiver) is the primary focus for MVP.
+    Wraps a GmailReceiver for OAuth, message parsing, raw storage and
+    duplicate tracking, so emails arriving by push are indistinguishable
+    from polled ones.
 
-    Future implementation will support:
-    - Gmail push notifications via Cloud Pub/Sub
-    - Webhook endpoint for receiving email notifications
-    - Real-time email processing (< 5 minute latency)
-    - Message ID tracking for duplicate detection
-    - Automatic watch renewal (every 7 days for Gmail)
+    Attributes:
+        history_id: Cursor: last mailbox historyId whose messages were listed
+        watch_expiration: When the current Gmail watch expires
     """
 
     def __init__(
@@ -40,17 +328,26 @@ class WebhookReceiver(EmailReceiver):
         credentials_path: Path,
         raw_email_dir: Optional[Path] = None,
         metadata_dir: Optional[Path] = None,
+        *,
+        token_path: Optional[Path] = None,
+        gmail_receiver: Optional[GmailReceiver] = None,
+        subscriber: Optional[PubSubSubscriber] = None,
+        label_ids: Sequence[str] = ("INBOX",),
     ):
         """
-        Initialize WebhookReceiver (PLACEHOLDER).
+        Initialize WebhookReceiver.
 
         Args:
             pubsub_project_id: Google Cloud project ID
             pubsub_topic_name: Pub/Sub topic name for Gmail notifications
             pubsub_subscription_name: Pub/Sub subscription name
-            credentials_path: Path to service account credentials JSON
+            credentials_path: Path to Gmail OAuth2 credentials JSON
             raw_email_dir: Directory for raw email storage
-            metadata_dir: Directory for metadata storage
+            metadata_dir: Directory for metadata storage (watch state, processed IDs)
+            token_path: Gmail OAuth2 token cache (default: token.json)
+            gmail_receiver: GmailReceiver to share (default: one built from the paths)
+            subscriber: Subscription to pull from (default: GooglePubSubSubscriber)
+            label_ids: Labels to watch; only messages added with them are fetched
         """
         self.pubsub_project_id = pubsub_project_id
         self.pubsub_topic_name = pubsub_topic_name
@@ -58,111 +355,308 @@ class WebhookReceiver(EmailReceiver):
         self.credentials_path = Path(credentials_path)
         self.raw_email_dir = Path(raw_email_dir or "data/raw")
         self.metadata_dir = Path(metadata_dir or "data/metadata")
+        self.label_ids = list(label_ids)
 
-    def fetch_emails(
-        self, since: Optional[datetime] = None, max_emails: int = 100
-    ) -> List[RawEmail]:
-        """
-        Retrieve emails triggered by webhook (PLACEHOLDER).
+        self.gmail = gmail_receiver or GmailReceiver(
+            credentials_path=self.credentials_path,
+            token_path=Path(token_path or "token.json"),
+            raw_email_dir=self.raw_email_dir,
+            metadata_dir=self.metadata_dir,
+        )
+        self.subscriber = subscriber or GooglePubSubSubscriber(
+            pubsub_project_id, pubsub_subscription_name
+        )
 
-        TODO: Implement Pub/Sub subscription and Gmail API integration.
+        self.watch_state_path = self.metadata_dir / "gmail_watch.json"
+        self.history_id: Optional[int] = None
+        self.watch_expiration: Optional[datetime] = None
+        self._pending_ids: Deque[str] = deque()
+        self._history_gap = False
+        self._lock = threading.Lock()
+        self._load_watch_state()
+
+    @property
+    def topic_path(self) -> str:
+        if self.pubsub_topic_name.startswith("projects/"):
+            return self.pubsub_topic_name
+        return f"projects/{self.pubsub_project_id}/topics/{self.pubsub_topic_name}"
+
+    def connect(self) -> None:
+        """Connect the underlying Gmail API client."""
+        if not self.gmail.service:
+            self.gmail.connect()
 
-        Args:
-            since: Only retrieve emails after this timestamp
-            max_emails: Maximum number of emails to retrieve
+    def setup_watch(self) -> dict:
+        """
+        Start (or refresh) the Gmail watch on the Pub/Sub topic.
+
+        The returned historyId becomes the cursor only if there is none
+        yet, so re-registering never skips unlisted history.
 
         Returns:
-            List of RawEmail objects
+            dict: Watch response with historyId and expiration (epoch ms)
 
         Raises:
-            NotImplementedError: Webhook implementation not yet available
+            EmailReceiverError: With code WATCH_FAILED if Gmail rejects the watch
         """
-        raise NotImplementedError(
-            "WebhookReceiver is a placeholder. Use GmailReceiver for MVP implementation."
+        self.connect()
+        body = {"topicName": self.topic_path}
+        if self.label_ids:
+            body["labelIds"] = self.label_ids
+            body["labelFilterBehavior"] = "INCLUDE"
+
+        try:
+            response = (
+                self.gmail.service.users().watch(userId="me", body=body).execute()
+            )
+        except Exception as e:
+            logger.error(f"Gmail watch on {self.topic_path} failed: {e}")
+            raise EmailReceiverError(
+                code="WATCH_FAILED",
+                message=f"Failed to set up Gmail watch on {self.topic_path}: {e}",
+            )
+
+        with self._lock:
+            self.watch_expiration = datetime.fromtimestamp(
+                int(response["expiration"]) / 1000, UTC
+            )
+            if self.history_id is None:
+                self.history_id = int(response["historyId"])
+            self._save_watch_state()
+
+        logger.info(
+            f"Gmail watch active on {self.topic_path} until "
+            f"{self.watch_expiration.isoformat()} (history cursor {self.history_id})"
         )
+        return response
 
-    def save_raw_email(self, email: RawEmail) -> Path:
+    def renew_watch(self) -> dict:
         """
-        Save RawEmail to file storage (PLACEHOLDER).
+        Renew the Gmail watch before it expires (Gmail drops it after 7 days).
 
-        TODO: Implement file storage logic (same as GmailReceiver).
+        Returns:
+            dict: Renewed watch response
+        """
+        logger.info("Renewing Gmail watch")
+        return self.setup_watch()
 
-        Args:
-            email: RawEmail object to save
+    def watch_needs_renewal(self, now: Optional[datetime] = None) -> bool:
+        """True if there is no watch or it expires within WATCH_RENEWAL_MARGIN."""
+        if self.watch_expiration is None:
+            return True
+        now = now or datetime.now(UTC)
+        return now >= self.watch_expiration - WATCH_RENEWAL_MARGIN
 
-        Returns:
-            Path to saved JSON file
+    def take_history_gap(self) -> bool:
+        """
+        True (once) if the cursor was reset and some emails were not listed.
 
-        Raises:
-            NotImplementedError: Webhook implementation not yet available
+        Lets the daemon poll right away instead of at its next cycle.
         """
-        raise NotImplementedError(
-            "WebhookReceiver is a placeholder. Use GmailReceiver for MVP implementation."
-        )
+        gap, self._history_gap = self._history_gap, False
+        return gap
 
-    def is_duplicate(self, message_id: str) -> bool:
+    def fetch_emails(
+        self, since: Optional[datetime] = None, max_emails: int = 100
+    ) -> List[RawEmail]:
         """
-        Check if email has been processed (PLACEHOLDER).
+        Retrieve emails announced by notifications already in the subscription.
 
-        TODO: Implement DuplicateTracker integration.
+        Does not wait for new notifications; see wait_for_emails().
 
         Args:
-            message_id: Email message ID to check
+            since: Ignored; the history cursor decides what is new
+            max_emails: Maximum number of emails to retrieve (the rest are
+                kept for the next call)
 
         Returns:
-            bool: Whether email is a duplicate
-
-        Raises:
-            NotImplementedError: Webhook implementation not yet available
+            List of RawEmail objects, in the order Gmail added them
         """
-        raise NotImplementedError(
-            "WebhookReceiver is a placeholder. Use GmailReceiver for MVP implementation."
-        )
+        return self.wait_for_emails(timeout=0.0, max_emails=max_emails)
 
-    def mark_processed(self, message_id: str) -> None:
+    def wait_for_emails(
+        self, timeout: float = 10.0, max_emails: int = 100
+    ) -> List[RawEmail]:
         """
-        Mark email as processed (PLACEHOLDER).
-
-        TODO: Implement DuplicateTracker integration.
+        Wait up to timeout seconds for notifications and fetch their emails.
 
         Args:
-            message_id: Email message ID to mark as processed
-
-        Raises:
-            NotImplementedError: Webhook implementation not yet available
-        """
-        raise NotImplementedError(
-            "WebhookReceiver is a placeholder. Use GmailReceiver for MVP implementation."
-        )
+            timeout: Seconds to wait for a notification
+            max_emails: Maximum number of emails to retrieve
 
-    def setup_watch(self) -> dict:
+        Returns:
+            List of RawEmail objects (empty if nothing arrived)
         """
-        Set up Gmail watch for push notifications (PLACEHOLDER).
-
-        TODO: Implement Gmail API watch setup.
+        if not self._pending_ids:
+            messages = self.subscriber.pull(max_messages=100, timeout=timeout)
+            if messages:
+                self._consume_notifications(messages)
+        return self._fetch_pending(max_emails)
 
-        Returns:
-            dict: Watch response with expiration timestamp
+    def save_raw_email(self, email: RawEmail) -> Path:
+        """Save RawEmail to file storage (same layout as GmailReceiver)."""
+        return self.gmail.save_raw_email(email)
 
-        Raises:
-            NotImplementedError: Webhook implementation not yet available
-        """
-        raise NotImplementedError(
-            "WebhookReceiver is a placeholder. Use GmailReceiver for MVP implementation."
-        )
+    def is_duplicate(self, message_id: str) -> bool:
+        """Check the shared duplicate tracker."""
+        return self.gmail.is_duplicate(message_id)
 
-    def renew_watch(self) -> dict:
+    def mark_processed(self, message_id: str) -> None:
+        """Mark an email as processed in the shared duplicate tracker."""
+        self.gmail.mark_processed(message_id)
+
+    def _consume_notifications(self, messages: List[PubSubMessage]) -> None:
+        """List the messages added since the cursor, then ack the notifications."""
+        notifications = [n for n in map(parse_notification, messages) if n]
+        ack_ids = [message.ack_id for message in messages]
+        if not notifications:
+            self.subscriber.acknowledge(ack_ids)
+            return
+
+        latest = max(n.history_id for n in notifications)
+        self.connect()
+
+        with self._lock:
+            if self.history_id is None:
+                logger.warning(
+                    "No Gmail history cursor; starting at the notification and "
+                    "leaving earlier messages to polling"
+                )
+                self.history_id = latest
+                self._history_gap = True
+            elif latest > self.history_id:
+                try:
+                    message_ids, cursor = self._list_added_messages(self.history_id)
+                except _HistoryExpired:
+                    logger.warning(
+                        f"Gmail history {self.history_id} is no longer available; "
+                        "resetting the cursor and leaving the gap to polling"
+                    )
+                    self.history_id = latest
+                    self._history_gap = True
+                else:
+                    known = set(self._pending_ids)
+                    self._pending_ids.extend(i for i in message_ids if i not in known)
+                    self.history_id = max(cursor, latest)
+            self._save_watch_state()
+
+        self.subscriber.acknowledge(ack_ids)
+
+    def _list_added_messages(self, start_history_id: int) -> Tuple[List[str], int]:
         """
-        Renew Gmail watch (PLACEHOLDER).
-
-        TODO: Implement watch renewal logic (required every 7 days).
+        Page through history.list() from a cursor.
 
         Returns:
-            dict: Renewed watch response
+            (IDs of messages added with the watched labels, new cursor)
 
         Raises:
-            NotImplementedError: Webhook implementation not yet available
+            _HistoryExpired: If Gmail no longer has history that old
         """
-        raise NotImplementedError(
-            "WebhookReceiver is a placeholder. Use GmailReceiver for MVP implementation."
-        )
+        try:
+            from googleapiclient.errors import HttpError
+        except ImportError:  # pragma: no cover - installed with the Gmail client
+            HttpError = ()
+
+        history_api = self.gmail.service.users().history()
+        message_ids: List[str] = []
+        seen = set()
+        cursor = start_history_id
+        page_token = None
+
+        while True:
+            params = {
+                "userId": "me",
+                "startHistoryId": str(start_history_id),
+                "historyTypes": ["messageAdded"],
+            }
+            if len(self.label_ids) == 1:
+                params["labelId"] = self.label_ids[0]
+            if page_token:
+                params["pageToken"] = page_token
+
+            try:
+                response = history_api.list(**params).execute()
+            except HttpError as e:
+                if getattr(getattr(e, "resp", None), "status", None) == 404:
+                    raise _HistoryExpired() from e
+                raise
+
+            for record in response.get("history", []):
+                for added in record.get("messagesAdded", []):
+                    message = added.get("message", {})
+                    message_id = message.get("id")
+                    if not message_id or message_id in seen:
+                        continue
+                    labels = set(message.get("labelIds", []))
+                    if self.label_ids and labels and not labels.intersection(
+                        self.label_ids
+                    ):
+                        continue
+                    seen.add(message_id)
+                    message_ids.append(message_id)
+
+            cursor = max(cursor, int(response.get("historyId", cursor)))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return message_ids, cursor
+
+    def _fetch_pending(self, max_emails: int) -> List[RawEmail]:
+        """Fetch and parse up to max_emails listed messages."""
+        emails = []
+        messages_api = self.gmail.service.users().messages() if self._pending_ids else None
+
+        while self._pending_ids and len(emails) < max_emails:
+            gmail_id = self._pending_ids[0]
+            try:
+                detail = messages_api.get(userId="me", id=gmail_id, format="full").execute()
+            except Exception as e:
+                if getattr(getattr(e, "resp", None), "status", None) == 404:
+                    logger.info(f"Message {gmail_id} was deleted before it was fetched")
+                    self._pending_ids.popleft()
+                    continue
+                raise
+            self._pending_ids.popleft()
+
+            try:
+                emails.append(self.gmail._parse_message(detail))
+            except Exception as e:
+                logger.warning(f"Failed to parse pushed message {gmail_id}: {e}")
+
+        if emails:
+            logger.info(f"Received {len(emails)} emails by push")
+        return emails
+
+    def _load_watch_state(self) -> None:
+        """Restore the cursor and watch expiration from the metadata dir."""
+        try:
+            data = json.loads(self.watch_state_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable Gmail watch state: {e}")
+            return
+
+        if data.get("history_id") is not None:
+            self.history_id = int(data["history_id"])
+        if data.get("expiration"):
+            self.watch_expiration = datetime.fromisoformat(data["expiration"])
+
+    def _save_watch_state(self) -> None:
+        """Persist the cursor and watch expiration (best effort)."""
+        data = {
+            "history_id": self.history_id,
+            "expiration": (
+                self.watch_expiration.isoformat() if self.watch_expiration else None
+            ),
+        }
+        try:
+            self.watch_state_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.watch_state_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(self.watch_state_path)
+        except OSError as e:
+            logger.warning(f"Failed to save Gmail watch state: {e}")
+
+
+class _HistoryExpired(Exception):
+    """history.list() start ID is older than Gmail keeps."""
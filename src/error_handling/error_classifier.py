@@ -117,15 +117,15 @@ class ErrorClassifier:
         Returns:
             Seconds to wait before retrying, or None if not available
         """
-        # Check if exception has response attribute (HTTP errors)
-        if not hasattr(exception, "response"):
+        # Headers live on exception.response for most HTTP libraries and
+        # directly on the exception for notion-client's APIResponseError
+        headers = getattr(getattr(exception, "response", None), "headers", None)
+        if headers is None:
+            headers = getattr(exception, "headers", None)
+        if headers is None or not hasattr(headers, "get"):
             return None
 
-        response = exception.response
-        if not hasattr(response, "headers"):
-            return None
-
-        retry_after = response.headers.get("Retry-After")
+        retry_after = headers.get("Retry-After")
         if not retry_after:
             return None
 
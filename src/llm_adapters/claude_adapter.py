@@ -84,6 +84,52 @@ class ClaudeAdapter(LLMProvider):
 
         logger.info(f"Initialized ClaudeAdapter with model={model}, timeout={timeout}s")
 
+    async def generate_text(self, prompt: str, *, max_output_tokens: int = 1024) -> str:
+        """Generate a completion for a self-contained prompt.
+
+        Args:
+            prompt: Complete prompt text
+            max_output_tokens: Maximum response length in tokens
+
+        Returns:
+            str: Response text
+
+        Raises:
+            LLMAuthenticationError: Authentication failed
+            LLMRateLimitError: Rate limit exceeded
+            LLMTimeoutError: Request timeout
+            LLMAPIError: Other API errors
+        """
+        try:
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=max_output_tokens,
+                messages=[{"role": "user", "content": prompt}],
+                timeout=self.timeout,
+            )
+        except anthropic.AuthenticationError as e:
+            raise LLMAuthenticationError(
+                "Invalid Anthropic API key", original_error=e
+            ) from e
+        except anthropic.RateLimitError as e:
+            raise LLMRateLimitError(
+                "Claude API rate limit exceeded", original_error=e
+            ) from e
+        except anthropic.APITimeoutError as e:
+            raise LLMTimeoutError(
+                f"Claude API timeout after {self.timeout}s",
+                timeout_seconds=self.timeout,
+                original_error=e,
+            ) from e
+        except anthropic.APIError as e:
+            raise LLMAPIError(
+                f"Claude API error: {str(e)}", status_code=500, original_error=e
+            ) from e
+
+        self.last_input_tokens = response.usage.input_tokens
+        self.last_output_tokens = response.usage.output_tokens
+        return response.content[0].text.strip()
+
     async def extract_entities(
         self,
         email_text: str,
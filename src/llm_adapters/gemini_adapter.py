@@ -164,6 +164,38 @@ class GeminiAdapter(LLMProvider):
             logger.error(f"Failed to generate summary: {e}")
             return ""
 
+    async def generate_text(self, prompt: str, *, max_output_tokens: int = 1024) -> str:
+        """Generate a completion for a self-contained prompt.
+
+        Args:
+            prompt: Complete prompt text
+            max_output_tokens: Maximum response length in tokens
+
+        Returns:
+            str: Response text
+
+        Raises:
+            LLMAPIError: If the API call fails or returns no text
+        """
+
+        def _generate():
+            return self.client.generate_content(
+                prompt,
+                generation_config=genai.GenerationConfig(
+                    temperature=0.0,
+                    max_output_tokens=max_output_tokens,
+                ),
+            )
+
+        try:
+            response = await asyncio.to_thread(_generate)
+        except Exception as e:
+            self._handle_api_error(e)
+
+        if not (response.candidates and response.candidates[0].content.parts):
+            raise LLMAPIError("Gemini returned no text")
+        return response.text.strip()
+
     @(
         retry_with_backoff(GEMINI_RETRY_CONFIG)
         if retry_with_backoff and GEMINI_RETRY_CONFIG
@@ -84,6 +84,52 @@ class OpenAIAdapter(LLMProvider):
 
         logger.info(f"Initialized OpenAIAdapter with model={model}, timeout={timeout}s")
 
+    async def generate_text(self, prompt: str, *, max_output_tokens: int = 1024) -> str:
+        """Generate a completion for a self-contained prompt.
+
+        Args:
+            prompt: Complete prompt text
+            max_output_tokens: Maximum response length in tokens
+
+        Returns:
+            str: Response text
+
+        Raises:
+            LLMAuthenticationError: Authentication failed
+            LLMRateLimitError: Rate limit exceeded
+            LLMTimeoutError: Request timeout
+            LLMAPIError: Other API errors
+        """
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                max_completion_tokens=max_output_tokens,
+                timeout=self.timeout,
+            )
+        except openai.AuthenticationError as e:
+            raise LLMAuthenticationError(
+                "Invalid OpenAI API key", original_error=e
+            ) from e
+        except openai.RateLimitError as e:
+            raise LLMRateLimitError(
+                "OpenAI API rate limit exceeded", original_error=e
+            ) from e
+        except openai.APITimeoutError as e:
+            raise LLMTimeoutError(
+                f"OpenAI API timeout after {self.timeout}s",
+                timeout_seconds=self.timeout,
+                original_error=e,
+            ) from e
+        except openai.APIError as e:
+            raise LLMAPIError(
+                f"OpenAI API error: {str(e)}", status_code=500, original_error=e
+            ) from e
+
+        self.last_input_tokens = response.usage.prompt_tokens
+        self.last_output_tokens = response.usage.completion_tokens
+        return (response.choices[0].message.content or "").strip()
+
     async def extract_entities(
         self,
         email_text: str,
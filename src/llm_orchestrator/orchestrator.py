@@ -6,10 +6,15 @@ LLM providers using configurable strategies (failover, consensus, best-match).
 
 import asyncio
 import logging
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
-from llm_orchestrator.exceptions import InvalidProviderError, InvalidStrategyError
+from llm_orchestrator.exceptions import (
+    AllProvidersFailedError,
+    InvalidProviderError,
+    InvalidStrategyError,
+)
 from llm_orchestrator.strategies.all_providers import AllProvidersStrategy
 from llm_orchestrator.strategies.best_match import BestMatchStrategy
 from llm_orchestrator.strategies.consensus import ConsensusStrategy
@@ -432,6 +437,67 @@ class LLMOrchestrator:
 
         return entities
 
+    async def generate_text(self, prompt: str, *, max_output_tokens: int = 1024) -> str:
+        """Generate a completion for a self-contained prompt, with failover.
+
+        Tries healthy providers in priority order (whatever the active
+        extraction strategy) until one returns text. Providers without
+        generate_text support are skipped.
+
+        Args:
+            prompt: Complete prompt text
+            max_output_tokens: Maximum response length in tokens
+
+        Returns:
+            Response text of the first provider that succeeded
+
+        Raises:
+            AllProvidersFailedError: No provider produced a response
+        """
+        attempted = []
+        last_error: Optional[Exception] = None
+
+        for provider_name in self.config.provider_priority:
+            provider = self.providers.get(provider_name)
+            if provider is None or not self.health_tracker.is_healthy(provider_name):
+                continue
+
+            start_time = time.time()
+            try:
+                text = await provider.generate_text(
+                    prompt, max_output_tokens=max_output_tokens
+                )
+            except NotImplementedError:
+                continue
+            except Exception as e:
+                attempted.append(provider_name)
+                self.health_tracker.record_failure(provider_name, str(e))
+                logger.warning(
+                    f"Text generation failed with {provider_name}: "
+                    f"{type(e).__name__}: {str(e)[:100]}"
+                )
+                last_error = e
+                continue
+
+            self.health_tracker.record_success(
+                provider_name, (time.time() - start_time) * 1000
+            )
+            if self.cost_tracker and hasattr(provider, "last_input_tokens"):
+                try:
+                    self.cost_tracker.record_usage(
+                        provider_name=provider_name,
+                        input_tokens=provider.last_input_tokens,
+                        output_tokens=provider.last_output_tokens,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to record cost metrics: {e}")
+            return text
+
+        error_msg = f"No provider generated text. Attempted: {attempted}"
+        if last_error:
+            error_msg += f". Last error: {str(last_error)}"
+        raise AllProvidersFailedError(error_msg)
+
     def get_provider_status(self) -> dict[str, ProviderStatus]:
         """Get current status of all configured providers.
 
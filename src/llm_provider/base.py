@@ -80,3 +80,21 @@ class LLMProvider(ABC):
             str: Summary text (1-4 lines)
         """
         raise NotImplementedError("generate_summary not implemented by this provider")
+
+    async def generate_text(self, prompt: str, *, max_output_tokens: int = 1024) -> str:
+        """Generate a completion for a self-contained prompt.
+
+        Used for auxiliary tasks (e.g. company name disambiguation) whose
+        prompt specifies the response format itself.
+
+        Args:
+            prompt: Complete prompt text
+            max_output_tokens: Maximum response length in tokens
+
+        Returns:
+            str: Response text
+
+        Raises:
+            LLMAPIError: Base exception for all LLM API errors
+        """
+        raise NotImplementedError("generate_text not implemented by this provider")
@@ -521,7 +521,8 @@ class DLQEntry(BaseModel):
         failed_at: When the write operation failed (UTC)
         retry_count: Number of automatic retries attempted
         error: Error details (type, message, status, response)
-        extracted_data: Full extracted entity data
+        extracted_data: Full extracted entity data (None for emails
+            quarantined before extraction succeeded)
         original_email_content: Optional original email text
         dlq_file_path: Path to DLQ JSON file
     """
@@ -532,8 +533,8 @@ class DLQEntry(BaseModel):
     )
     retry_count: int = Field(0, ge=0, description="Number of retries attempted")
     error: Dict[str, Any] = Field(..., description="Error details")
-    extracted_data: "ExtractedEntitiesWithClassification" = Field(
-        ..., description="Full extracted data"
+    extracted_data: Optional["ExtractedEntitiesWithClassification"] = Field(
+        None, description="Full extracted data (None for quarantined emails)"
     )
     original_email_content: Optional[str] = Field(
         None, description="Original email text"
@@ -32,6 +32,8 @@ class RemovedContent(BaseModel):
         signature_pattern: Pattern name that matched signature (e.g., 'korean_thanks')
         quote_pattern: Pattern name that matched quote (e.g., 'angle_bracket')
         disclaimer_pattern: Pattern name that matched disclaimer (e.g., 'confidentiality')
+        html_converted: Whether the body was HTML and converted to text
+        trimmed: Whether paragraphs were dropped to fit the token budget
         original_length: Character count of original body
         cleaned_length: Character count of cleaned body
     """
@@ -57,6 +59,14 @@ class RemovedContent(BaseModel):
         description="Pattern name that matched disclaimer (e.g., 'confidentiality')",
     )
 
+    html_converted: bool = Field(
+        default=False, description="Whether the body was HTML and converted to text"
+    )
+    trimmed: bool = Field(
+        default=False,
+        description="Whether paragraphs were dropped to fit the token budget",
+    )
+
     original_length: int = Field(
         ..., description="Character count of original body", ge=0
     )
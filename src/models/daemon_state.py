@@ -1,7 +1,24 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Iterable, Optional
 from datetime import datetime, timedelta
 
+# Processed message IDs kept in the state (the rest are trimmed)
+MAX_PROCESSED_IDS = 1000
+
+# Unfinished work ledger entries (pending, extracting, failed) are dropped
+# after this long without a change, e.g. for mail deleted before it was
+# processed, and only the most recent MAX_PROCESSED_IDS are kept
+MAX_UNFINISHED_WORK_AGE = timedelta(days=7)
+
+# Work ledger statuses; written, duplicate and quarantined emails are done
+WORK_PENDING = "pending"
+WORK_EXTRACTING = "extracting"
+WORK_WRITTEN = "written"
+WORK_DUPLICATE = "duplicate"
+WORK_FAILED = "failed"
+WORK_QUARANTINED = "quarantined"
+WORK_DONE = (WORK_WRITTEN, WORK_DUPLICATE, WORK_QUARANTINED)
+
 
 class ErrorDetail(BaseModel):
     """Details of an error occurrence for reporting."""
@@ -13,6 +30,23 @@ class ErrorDetail(BaseModel):
     context: dict = Field(default_factory=dict, description="Additional context data")
 
 
+class WorkItem(BaseModel):
+    """Progress of one email through the pipeline (a work ledger entry)."""
+
+    status: str = Field(WORK_PENDING, description="pending, extracting, written, duplicate, failed or quarantined")
+    attempts: int = Field(0, description="Times the pipeline was started on the email.")
+    last_error: Optional[str] = Field(None, description="Error of the last failed attempt.")
+    updated_at: datetime = Field(default_factory=datetime.now, description="Time of the last status change.")
+    duplicate_of: Optional[str] = Field(None, description="Message ID of the earlier email this one nearly duplicates.")
+
+
+class ContentFingerprint(BaseModel):
+    """SimHash of a written email's cleaned body (content_normalizer.near_duplicates)."""
+
+    simhash: int = Field(..., description="64-bit SimHash fingerprint.")
+    seen_at: datetime = Field(default_factory=datetime.now, description="Time the email was written.")
+
+
 class DaemonProcessState(BaseModel):
     """
     Represents the state of the autonomous background operation daemon.
@@ -57,6 +91,18 @@ class DaemonProcessState(BaseModel):
         description="Set of processed email message IDs. Synced to GCS for persistence across container restarts.",
     )
 
+    # Per-email work ledger, so an interrupted cycle resumes where it stopped
+    work_ledger: dict[str, WorkItem] = Field(
+        default_factory=dict,
+        description="Pipeline progress and attempt counts by email message ID.",
+    )
+
+    # Content fingerprints of written emails, for near-duplicate detection
+    content_fingerprints: dict[str, ContentFingerprint] = Field(
+        default_factory=dict,
+        description="SimHash of recently written emails by message ID (last 1000).",
+    )
+
     def is_email_processed(self, message_id: str) -> bool:
         """Check if an email has already been processed.
 
@@ -80,10 +126,193 @@ class DaemonProcessState(BaseModel):
         """
         self.processed_message_ids.add(message_id)
         # Keep set size manageable - only store last 1000 IDs
-        if len(self.processed_message_ids) > 1000:
+        if len(self.processed_message_ids) > MAX_PROCESSED_IDS:
             # Convert to list, sort by some order (lexicographic for IDs), keep recent
             sorted_ids = sorted(self.processed_message_ids)
-            self.processed_message_ids = set(sorted_ids[-1000:])
+            self.processed_message_ids = set(sorted_ids[-MAX_PROCESSED_IDS:])
+
+    def track_pending(self, message_ids: Iterable[str]) -> None:
+        """Add fetched emails not yet in the work ledger as pending."""
+        for message_id in message_ids:
+            if message_id not in self.work_ledger:
+                self.work_ledger[message_id] = WorkItem()
+        self._prune_ledger()
+
+    def drop_pending(self, message_id: str) -> None:
+        """Remove an email's ledger entry if no attempt was made on it yet.
+
+        For fetched emails skipped before the pipeline (already processed,
+        or handled by another daemon), which would otherwise stay pending.
+        """
+        item = self.work_ledger.get(message_id)
+        if item is not None and item.status == WORK_PENDING:
+            del self.work_ledger[message_id]
+
+    def start_work(self, message_id: str) -> WorkItem:
+        """Record that the pipeline is starting on an email (one more attempt).
+
+        An email still "extracting" when the state is next loaded was
+        interrupted mid-attempt, e.g. by a crash, and that attempt counts.
+
+        Returns:
+            The email's ledger entry
+        """
+        item = self.work_ledger.setdefault(message_id, WorkItem())
+        item.status = WORK_EXTRACTING
+        item.attempts += 1
+        item.updated_at = datetime.now()
+        return item
+
+    def finish_work(self, message_id: str) -> None:
+        """Record that an email was written, and mark it processed."""
+        self._set_work_status(message_id, WORK_WRITTEN)
+        self.mark_email_processed(message_id)
+
+    def fail_work(self, message_id: str, error: str) -> WorkItem:
+        """Record a failed attempt; the email is retried next cycle.
+
+        Returns:
+            The email's ledger entry
+        """
+        item = self._set_work_status(message_id, WORK_FAILED)
+        item.last_error = error
+        return item
+
+    def quarantine_work(self, message_id: str, error: Optional[str] = None) -> None:
+        """Give up on an email: mark it quarantined and processed.
+
+        Processed, it no longer holds back the fetch watermark.
+        """
+        item = self._set_work_status(message_id, WORK_QUARANTINED)
+        if error:
+            item.last_error = error
+        self.mark_email_processed(message_id)
+
+    def link_duplicate(self, message_id: str, original_id: str) -> None:
+        """Record that an email nearly duplicates an earlier one; mark it processed."""
+        item = self._set_work_status(message_id, WORK_DUPLICATE)
+        item.duplicate_of = original_id
+        self.mark_email_processed(message_id)
+
+    def record_fingerprint(self, message_id: str, simhash: int) -> None:
+        """Keep a written email's fingerprint (the most recent MAX_PROCESSED_IDS)."""
+        self.content_fingerprints[message_id] = ContentFingerprint(simhash=simhash)
+        self._prune_fingerprints()
+
+    def _prune_fingerprints(self) -> None:
+        if len(self.content_fingerprints) > MAX_PROCESSED_IDS:
+            recent = sorted(
+                self.content_fingerprints.items(),
+                key=lambda entry: _sort_key(entry[1].seen_at),
+            )[-MAX_PROCESSED_IDS:]
+            self.content_fingerprints = dict(recent)
+
+    def _set_work_status(self, message_id: str, status: str) -> WorkItem:
+        item = self.work_ledger.setdefault(message_id, WorkItem())
+        item.status = status
+        item.updated_at = datetime.now()
+        if status in WORK_DONE:
+            self._prune_ledger()
+        return item
+
+    def _prune_ledger(self) -> None:
+        """Cap the work ledger.
+
+        Keeps the most recent MAX_PROCESSED_IDS finished entries, and the
+        most recent MAX_PROCESSED_IDS unfinished ones changed within
+        MAX_UNFINISHED_WORK_AGE.
+        """
+        done = []
+        unfinished = []
+        cutoff = _sort_key(datetime.now() - MAX_UNFINISHED_WORK_AGE)
+        for message_id, item in list(self.work_ledger.items()):
+            if item.status in WORK_DONE:
+                done.append(message_id)
+            elif _sort_key(item.updated_at) < cutoff:
+                del self.work_ledger[message_id]
+            else:
+                unfinished.append(message_id)
+
+        for message_ids in (done, unfinished):
+            if len(message_ids) > MAX_PROCESSED_IDS:
+                message_ids.sort(
+                    key=lambda message_id: _sort_key(self.work_ledger[message_id].updated_at)
+                )
+                for message_id in message_ids[:-MAX_PROCESSED_IDS]:
+                    del self.work_ledger[message_id]
+
+    def merge_from(self, other: "DaemonProcessState") -> None:
+        """Fold in state another daemon instance saved concurrently.
+
+        Keeps this state's view but never drops the other's progress:
+        processed IDs are united, counters and "last ..." timestamps take
+        the larger value, recent errors are combined, work ledger entries
+        keep the most advanced (finished, then most attempted), content
+        fingerprints are united, and the fetch watermark takes the earlier
+        value (emails fetched again are skipped as processed).
+
+        Args:
+            other: State loaded from storage after a write conflict
+        """
+        processed = self.processed_message_ids | other.processed_message_ids
+        if len(processed) > MAX_PROCESSED_IDS:
+            processed = set(sorted(processed)[-MAX_PROCESSED_IDS:])
+        self.processed_message_ids = processed
+
+        for message_id, theirs in other.work_ledger.items():
+            ours = self.work_ledger.get(message_id)
+            if ours is None or _work_rank(theirs) > _work_rank(ours):
+                self.work_ledger[message_id] = theirs
+        self._prune_ledger()
+
+        for message_id, fingerprint in other.content_fingerprints.items():
+            self.content_fingerprints.setdefault(message_id, fingerprint)
+        self._prune_fingerprints()
+
+        for name in (
+            "total_processing_cycles",
+            "emails_processed_count",
+            "error_count",
+            "emails_received_count",
+            "emails_skipped_count",
+            "notion_entries_created",
+            "notion_entries_updated",
+            "notion_validation_failures",
+        ):
+            setattr(self, name, max(getattr(self, name), getattr(other, name)))
+
+        for name in (
+            "last_check_timestamp",
+            "last_gmail_check",
+            "last_notion_check",
+            "last_report_generated",
+            "last_alert_sent",
+        ):
+            values = [v for v in (getattr(self, name), getattr(other, name)) if v]
+            if values:
+                setattr(self, name, max(values, key=_sort_key))
+
+        watermarks = [
+            v
+            for v in (self.last_successful_fetch_timestamp, other.last_successful_fetch_timestamp)
+            if v
+        ]
+        if watermarks:
+            self.last_successful_fetch_timestamp = min(watermarks, key=_sort_key)
+
+        for counts in ("llm_calls_by_provider", "llm_costs_by_provider"):
+            merged = dict(getattr(other, counts))
+            for provider, value in getattr(self, counts).items():
+                merged[provider] = max(value, merged.get(provider, value))
+            setattr(self, counts, merged)
+
+        errors = {
+            (error.get("timestamp"), error.get("message")): error
+            for error in other.recent_errors + self.recent_errors
+        }
+        self.recent_errors = sorted(
+            errors.values(), key=lambda error: str(error.get("timestamp"))
+        )[-100:]
 
     def record_error(self, severity: str, component: str, message: str, context: dict | None = None) -> None:
         """Record an error for reporting. Keeps last 100 errors."""
@@ -114,3 +343,13 @@ class DaemonProcessState(BaseModel):
                 self.notion_entries_updated += 1
         else:
             self.notion_validation_failures += 1
+
+
+def _sort_key(value: datetime) -> float:
+    """Comparable instant for naive (local) and aware datetimes alike."""
+    return value.timestamp()
+
+
+def _work_rank(item: WorkItem) -> tuple:
+    """Order ledger entries by progress: finished, attempts, recency."""
+    return (item.status in WORK_DONE, item.attempts, _sort_key(item.updated_at))
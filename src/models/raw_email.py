@@ -40,6 +40,8 @@ class EmailMetadata(BaseModel):
         sender: Sender email address
         subject: Email subject line
         received_at: Timestamp when email was received by server
+        internal_date: Timestamp the mail server recorded the email (Gmail
+            internalDate), if known
         retrieved_at: Timestamp when email was retrieved by EmailReceiver
         has_attachments: Whether email contains attachments
     """
@@ -55,6 +57,9 @@ class EmailMetadata(BaseModel):
     received_at: datetime = Field(
         ..., description="Timestamp when email was received by server"
     )
+    internal_date: Optional[datetime] = Field(
+        None, description="Timestamp the mail server recorded the email"
+    )
     retrieved_at: datetime = Field(
         default_factory=lambda: datetime.now(UTC),
         description="Timestamp when email was retrieved by EmailReceiver",
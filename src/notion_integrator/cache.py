@@ -5,38 +5,66 @@ File-based caching system with TTL for schemas and data:
 - Atomic writes using temp file + rename pattern
 - Separate TTL for schemas (24h) and data (6h)
 - JSON serialization with UTF-8 encoding
+- Compact record stores for data caches, with expiry checks that skip the
+  records and projection reads (e.g. page_id + name only)
 - Cache validation and corruption handling
+- In-process memory tier (LRU + TTL) in front of the files
+- Single-flight loading and stale-while-revalidate for data caches
+  (get_or_load_data)
 
 Cache Structure:
 - Schema cache: data/notion_cache/schema_{database_name}.json
-- Data cache: data/notion_cache/data_{database_name}.json
+- Data cache: data/notion_cache/data_{database_name}.sqlite3 (RecordStore;
+  legacy data_{database_name}.json files are still read until rewritten)
 """
 
 import json
 import os
+import sqlite3
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence
 
 from .exceptions import (
     CacheCorruptedError,
     CacheReadError,
     CacheWriteError,
 )
+from .cache_tiers import (
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_SECONDS,
+    MemoryTier,
+    SingleFlight,
+)
 from .logging_config import get_logger, log_cache_operation
 from .models import DataCache, DatabaseSchema
+from .record_store import RecordStore
 
 
 logger = get_logger(__name__)
 
+DATA_CACHE_SUFFIX = ".sqlite3"
+
+# Computed DataCache fields, not stored
+_COMPUTED_FIELDS = ("is_expired", "age_hours")
+
 
 class CacheManager:
     """
     Manages file-based caching for Notion schemas and data.
 
+    Reads are served from an in-process memory tier when possible; values
+    returned from it are shared, so callers must treat cached schemas and
+    records as read-only.
+
     Attributes:
         cache_dir: Directory for cache files
         schema_ttl_hours: TTL for schema cache (default: 24 hours)
         data_ttl_hours: TTL for data cache (default: 6 hours)
+        stale_while_revalidate: Whether get_or_load_data() serves an expired
+            data cache while refreshing it in the background
+        memory: MemoryTier in front of the cache files
+        flights: SingleFlight de-duplicating loads and background refreshes
     """
 
     def __init__(
@@ -44,6 +72,9 @@ class CacheManager:
         cache_dir: Optional[str] = None,
         schema_ttl_hours: int = 24,
         data_ttl_hours: int = 6,
+        memory_max_entries: int = DEFAULT_MAX_ENTRIES,
+        memory_ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        stale_while_revalidate: bool = False,
     ):
         """
         Initialize cache manager.
@@ -52,12 +83,24 @@ class CacheManager:
             cache_dir: Cache directory path (defaults to data/notion_cache)
             schema_ttl_hours: Schema cache TTL in hours (default: 24)
             data_ttl_hours: Data cache TTL in hours (default: 6)
+            memory_max_entries: Memory tier size (default: 128, 0 disables it)
+            memory_ttl_seconds: Longest time a value is served from memory
+                before the file is re-read (default: 300)
+            stale_while_revalidate: Serve expired data caches from
+                get_or_load_data() while refreshing in the background
+                (default: False; enable in long-running processes such as
+                the daemon, where the refresh can finish)
         """
         self.cache_dir = Path(
             cache_dir or os.getenv("NOTION_CACHE_DIR", "data/notion_cache")
         )
         self.schema_ttl_hours = schema_ttl_hours
         self.data_ttl_hours = data_ttl_hours
+        self.stale_while_revalidate = stale_while_revalidate
+        self.memory = MemoryTier(
+            max_entries=memory_max_entries, ttl_seconds=memory_ttl_seconds
+        )
+        self.flights = SingleFlight()
 
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -91,6 +134,19 @@ class CacheManager:
             DatabaseSchema if cache valid, None otherwise
         """
         cache_path = self._get_cache_path("schema", database_name)
+        memory_key = ("schema", database_name)
+
+        schema = self.memory.get(memory_key)
+        if schema is not None:
+            log_cache_operation(
+                logger,
+                operation="read",
+                cache_type="schema",
+                database_name=database_name,
+                hit=True,
+                source="memory",
+            )
+            return schema
 
         log_cache_operation(
             logger,
@@ -137,6 +193,7 @@ class CacheManager:
 
             # Deserialize schema from cache content
             schema = self._deserialize_schema(cache.content)
+            self.memory.set(memory_key, schema, cache.expires_at)
 
             log_cache_operation(
                 logger,
@@ -215,6 +272,7 @@ class CacheManager:
 
             # Write to cache
             self._write_cache_file(cache_path, cache.model_dump())
+            self.memory.set(("schema", database_name), schema, cache.expires_at)
 
             logger.info(
                 "Schema cached successfully",
@@ -239,18 +297,38 @@ class CacheManager:
         self,
         database_id: str,
         database_name: str,
+        fields: Optional[Sequence[str]] = None,
     ) -> Optional[List[Dict[str, Any]]]:
         """
         Get cached data if valid.
 
+        Expiry is checked from the cache header before any record is read.
+
         Args:
             database_id: Database ID
             database_name: Database name for cache filename
+            fields: Optional projection - top-level keys to return for each
+                record (e.g. ["page_id", "name"]); other fields are never
+                loaded. Keys missing from a record are None.
 
         Returns:
             List of records if cache valid, None otherwise
         """
         cache_path = self._get_cache_path("data", database_name)
+        memory_key = _data_key(database_name, fields)
+
+        content = self.memory.get(memory_key)
+        if content is not None:
+            log_cache_operation(
+                logger,
+                operation="read",
+                cache_type="data",
+                database_name=database_name,
+                hit=True,
+                source="memory",
+                record_count=len(content),
+            )
+            return content
 
         log_cache_operation(
             logger,
@@ -260,9 +338,9 @@ class CacheManager:
         )
 
         try:
-            # Read cache file
-            cache_data = self._read_cache_file(cache_path)
-            if not cache_data:
+            # Read cache header
+            header = self._read_data_header(database_name)
+            if not header:
                 log_cache_operation(
                     logger,
                     operation="read",
@@ -272,17 +350,26 @@ class CacheManager:
                 )
                 return None
 
-            # Validate and parse cache
-            cache = DataCache(**cache_data)
-
             # Check if expired
-            if cache.is_expired:
+            try:
+                cached_at = _parse_timestamp(header["cached_at"])
+                expires_at = _parse_timestamp(header["expires_at"])
+            except (KeyError, TypeError, ValueError) as e:
+                raise CacheCorruptedError(
+                    cache_path=str(cache_path),
+                    message="Data cache header is invalid",
+                    original_error=e,
+                )
+            now = datetime.now()
+            age_hours = (now - cached_at).total_seconds() / 3600
+
+            if now > expires_at:
                 logger.info(
                     "Data cache expired",
                     extra={
                         "database_name": database_name,
-                        "age_hours": cache.age_hours,
-                        "ttl_hours": cache.ttl_hours,
+                        "age_hours": age_hours,
+                        "ttl_hours": header.get("ttl_hours"),
                     },
                 )
                 log_cache_operation(
@@ -295,20 +382,23 @@ class CacheManager:
                 )
                 return None
 
-            # Return cached data
+            # Read (projected) records
+            content = self._read_data_records(database_name, fields)
+            if not isinstance(content, list):
+                content = []
+            self.memory.set(memory_key, content, expires_at)
+
             log_cache_operation(
                 logger,
                 operation="read",
                 cache_type="data",
                 database_name=database_name,
                 hit=True,
-                age_hours=cache.age_hours,
-                record_count=len(cache.content)
-                if isinstance(cache.content, list)
-                else 0,
+                age_hours=age_hours,
+                record_count=len(content),
             )
 
-            return cache.content if isinstance(cache.content, list) else []
+            return content
 
         except CacheReadError:
             log_cache_operation(
@@ -330,14 +420,67 @@ class CacheManager:
                 reason="corrupted",
             )
             # Delete corrupted cache
-            self._delete_cache_file(cache_path)
+            self._delete_data_cache_files(database_name)
             return None
 
+    def get_data_cache_entry(self, database_name: str) -> Optional[DataCache]:
+        """
+        Get the data cache entry with its metadata, even if expired.
+
+        Used by incremental refreshes, which update expired content in place
+        instead of discarding it.
+
+        Args:
+            database_name: Database name for cache filename
+
+        Returns:
+            DataCache entry, or None if missing, unreadable or corrupted
+        """
+        try:
+            header = self._read_data_header(database_name)
+            if not header:
+                return None
+            return DataCache(
+                **header, content=self._read_data_records(database_name)
+            )
+        except Exception as e:
+            logger.warning(
+                "Data cache entry unavailable",
+                extra={"database_name": database_name, "error": str(e)},
+            )
+            return None
+
+    def update_data_cache_entry(self, cache: DataCache) -> None:
+        """
+        Write a data cache entry as-is, keeping its cached_at/expires_at.
+
+        Use this for in-place edits (e.g. upserting one record) that should
+        not extend the cache's TTL.
+
+        Args:
+            cache: DataCache entry to write
+
+        Raises:
+            CacheWriteError: If cache write fails
+        """
+        cache_path = self._get_cache_path("data", cache.database_name)
+
+        log_cache_operation(
+            logger,
+            operation="update",
+            cache_type="data",
+            database_name=cache.database_name,
+        )
+
+        self.memory.discard(("data", cache.database_name))
+        self._write_data_cache(cache_path, cache)
+
     def set_data_cache(
         self,
         database_id: str,
         database_name: str,
         records: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Cache database records.
@@ -346,6 +489,8 @@ class CacheManager:
             database_id: Database ID
             database_name: Database name
             records: List of records to cache
+            metadata: Optional extra metadata stored with the records
+                (e.g. sync watermarks)
 
         Raises:
             CacheWriteError: If cache write fails
@@ -369,12 +514,17 @@ class CacheManager:
                 ttl_hours=self.data_ttl_hours,
                 content=records,
                 metadata={
+                    **(metadata or {}),
                     "record_count": len(records),
                 },
             )
 
             # Write to cache
-            self._write_cache_file(cache_path, cache.model_dump())
+            self.memory.discard(("data", database_name))
+            self._write_data_cache(cache_path, cache)
+            self.memory.set(
+                _data_key(database_name, None), records, cache.expires_at
+            )
 
             logger.info(
                 "Data cached successfully",
@@ -392,6 +542,89 @@ class CacheManager:
                 original_error=e,
             )
 
+    def get_data_cache_version(self, database_name: str) -> Optional[str]:
+        """
+        Get an identifier that changes whenever a data cache is rewritten.
+
+        Every write (including in-place updates) replaces the cache file,
+        so the file's identity, modification time and size identify the
+        cached content without reading it. Derived artifacts (e.g. the
+        formatted company context) can be keyed by this.
+
+        Args:
+            database_name: Database name
+
+        Returns:
+            Version string, or None if there is no data cache
+        """
+        for path in (
+            self._get_cache_path("data", database_name),
+            self._get_cache_path("data", database_name, legacy=True),
+        ):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            return f"{path.suffix}:{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}"
+        return None
+
+    async def get_or_load_data(
+        self,
+        database_id: str,
+        database_name: str,
+        load: Callable[[], Awaitable[List[Dict[str, Any]]]],
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get cached data, loading (and caching) it on a miss.
+
+        Concurrent misses for the same database share one load. With
+        stale_while_revalidate, an expired cache is returned immediately
+        and refreshed in the background instead of blocking the caller.
+
+        Args:
+            database_id: Database ID
+            database_name: Database name for cache filename
+            load: Coroutine function fetching all records (e.g. from Notion)
+            fields: Optional projection, as in get_data_cache()
+
+        Returns:
+            Cached, stale or freshly loaded records
+
+        Raises:
+            Exception: Whatever load raised, when there is nothing to serve
+        """
+        records = self.get_data_cache(database_id, database_name, fields)
+        if records is not None:
+            return records
+
+        flight_key = ("data", database_name)
+
+        async def refresh() -> List[Dict[str, Any]]:
+            return await self._load_data(database_id, database_name, load)
+
+        if self.stale_while_revalidate:
+            stale = self._read_stale_data(database_name, fields)
+            if stale:
+                started = not self.flights.in_flight(flight_key)
+                self.flights.start(flight_key, refresh)
+                if started:
+                    logger.info(
+                        "Serving stale data cache while refreshing",
+                        extra={
+                            "database_name": database_name,
+                            "record_count": len(stale),
+                        },
+                    )
+                return stale
+
+        records = await self.flights.do(flight_key, refresh)
+        return _project(records, fields) if fields is not None else records
+
+    async def wait_for_refreshes(self) -> None:
+        """Wait for running loads and background refreshes to finish."""
+        await self.flights.wait()
+
     # ==========================================================================
     # Cache Invalidation
     # ==========================================================================
@@ -415,6 +648,7 @@ class CacheManager:
             database_name=database_name,
         )
 
+        self.memory.discard(("schema", database_name))
         return self._delete_cache_file(cache_path)
 
     def invalidate_data_cache(self, database_name: str) -> bool:
@@ -427,8 +661,6 @@ class CacheManager:
         Returns:
             True if cache was deleted, False if not found
         """
-        cache_path = self._get_cache_path("data", database_name)
-
         log_cache_operation(
             logger,
             operation="invalidate",
@@ -436,7 +668,8 @@ class CacheManager:
             database_name=database_name,
         )
 
-        return self._delete_cache_file(cache_path)
+        self.memory.discard(("data", database_name))
+        return self._delete_data_cache_files(database_name)
 
     def invalidate_all_caches(self, database_name: str) -> None:
         """
@@ -457,13 +690,16 @@ class CacheManager:
     # Helper Methods
     # ==========================================================================
 
-    def _get_cache_path(self, cache_type: str, database_name: str) -> Path:
+    def _get_cache_path(
+        self, cache_type: str, database_name: str, legacy: bool = False
+    ) -> Path:
         """
         Get cache file path.
 
         Args:
             cache_type: "schema" or "data"
             database_name: Database name
+            legacy: Return the JSON path data caches used before RecordStore
 
         Returns:
             Path to cache file
@@ -472,9 +708,164 @@ class CacheManager:
         safe_name = "".join(
             c if c.isalnum() or c in ("-", "_") else "_" for c in database_name
         )
-        filename = f"{cache_type}_{safe_name}.json"
+        suffix = ".json"
+        if cache_type == "data" and not legacy:
+            suffix = DATA_CACHE_SUFFIX
+        filename = f"{cache_type}_{safe_name}{suffix}"
         return self.cache_dir / filename
 
+    def _read_data_header(self, database_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a data cache's metadata (DataCache fields except content).
+
+        Falls back to the legacy JSON file when there is no record store.
+
+        Args:
+            database_name: Database name
+
+        Returns:
+            Header dict, or None if the cache doesn't exist
+
+        Raises:
+            CacheReadError: If the cache exists but can't be read
+            CacheCorruptedError: If the cache is invalid
+        """
+        store = RecordStore(self._get_cache_path("data", database_name))
+        if not store.exists():
+            cache_data = self._read_cache_file(
+                self._get_cache_path("data", database_name, legacy=True)
+            )
+            if not cache_data:
+                return None
+            return {k: v for k, v in cache_data.items() if k != "content"}
+
+        return self._read_store(store, store.read_header)
+
+    def _read_data_records(
+        self,
+        database_name: str,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        """
+        Read a data cache's records, optionally projected to some fields.
+
+        Args:
+            database_name: Database name
+            fields: Top-level keys to return per record (None for all)
+
+        Returns:
+            Records (empty if the cache no longer exists)
+
+        Raises:
+            CacheReadError: If the cache exists but can't be read
+            CacheCorruptedError: If the cache is invalid
+        """
+        store = RecordStore(self._get_cache_path("data", database_name))
+        if store.exists():
+            return self._read_store(store, lambda: store.read_records(fields))
+
+        cache_data = self._read_cache_file(
+            self._get_cache_path("data", database_name, legacy=True)
+        )
+        content = (cache_data or {}).get("content")
+        if not isinstance(content, list):
+            return []
+        return _project(content, fields) if fields is not None else content
+
+    def _read_stale_data(
+        self,
+        database_name: str,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[List[Any]]:
+        """Read a data cache regardless of expiry (None if unavailable)."""
+        try:
+            if not self._read_data_header(database_name):
+                return None
+            return self._read_data_records(database_name, fields) or None
+        except (CacheReadError, CacheCorruptedError):
+            return None
+
+    async def _load_data(
+        self,
+        database_id: str,
+        database_name: str,
+        load: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """Run a data load and cache its result (write failures are logged)."""
+        records = await load()
+        try:
+            self.set_data_cache(database_id, database_name, records)
+        except CacheWriteError as e:
+            logger.warning(
+                "Failed to cache loaded data",
+                extra={"database_name": database_name, "error": str(e)},
+            )
+        return records
+
+    def _read_store(self, store: RecordStore, read: Any) -> Any:
+        """Run a RecordStore read, mapping failures to cache exceptions."""
+        try:
+            return read()
+        except (sqlite3.DatabaseError, ValueError) as e:
+            raise CacheCorruptedError(
+                cache_path=str(store.path),
+                message="Data cache store is invalid",
+                original_error=e,
+            )
+        except Exception as e:
+            raise CacheReadError(
+                cache_path=str(store.path),
+                message=f"Failed to read data cache store: {e}",
+                original_error=e,
+            )
+
+    def _write_data_cache(self, cache_path: Path, cache: DataCache) -> None:
+        """
+        Write a data cache entry as a record store, replacing any legacy file.
+
+        Args:
+            cache_path: Record store path
+            cache: DataCache entry (content must be a list of records)
+
+        Raises:
+            CacheWriteError: If write fails
+        """
+        if not isinstance(cache.content, list):
+            raise CacheWriteError(
+                cache_path=str(cache_path),
+                message="Data cache content must be a list of records",
+            )
+
+        header = cache.model_dump(mode="json", exclude={"content"})
+        for field in _COMPUTED_FIELDS:
+            header.pop(field, None)
+
+        try:
+            RecordStore(cache_path).write(header, cache.content)
+        except Exception as e:
+            raise CacheWriteError(
+                cache_path=str(cache_path),
+                message=f"Failed to write data cache store: {e}",
+                original_error=e,
+            )
+
+        self._delete_cache_file(
+            self._get_cache_path("data", cache.database_name, legacy=True)
+        )
+
+    def _delete_data_cache_files(self, database_name: str) -> bool:
+        """
+        Delete a data cache's record store and any legacy JSON file.
+
+        Returns:
+            True if a file was deleted, False if none was found
+        """
+        deleted = self._delete_cache_file(self._get_cache_path("data", database_name))
+        legacy_deleted = self._delete_cache_file(
+            self._get_cache_path("data", database_name, legacy=True)
+        )
+        return deleted or legacy_deleted
+
     def _read_cache_file(self, cache_path: Path) -> Optional[Dict[str, Any]]:
         """
         Read cache file.
@@ -590,3 +981,27 @@ class CacheManager:
                 message=f"Failed to deserialize schema: {e}",
                 original_error=e,
             )
+
+
+def _data_key(
+    database_name: str, fields: Optional[Sequence[str]]
+) -> Hashable:
+    """Memory tier key of a (projected) data cache read."""
+    return ("data", database_name, tuple(fields) if fields is not None else None)
+
+
+def _project(records: List[Any], fields: Sequence[str]) -> List[Dict[str, Any]]:
+    """Keep only the given top-level fields of each record (missing: None)."""
+    return [
+        {field: record.get(field) for field in fields}
+        if isinstance(record, dict)
+        else dict.fromkeys(fields)
+        for record in records
+    ]
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse a cached ISO 8601 timestamp (as written by DataCache)."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
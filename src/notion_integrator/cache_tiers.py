@@ -0,0 +1,294 @@
+"""
+In-process Cache Tiers
+
+Building blocks CacheManager puts in front of its file caches:
+
+- MemoryTier: bounded LRU of already-parsed cache contents. Each entry
+  lives until the earlier of the memory TTL and the file cache's own
+  expiry, so repeated reads in the daemon skip the filesystem without
+  ever outliving the cache they came from.
+- SingleFlight: de-duplicates concurrent async loads per key. Callers that
+  miss at the same time share one load (one Notion fetch) instead of each
+  fetching independently; background refreshes for stale-while-revalidate
+  go through the same table, so a refresh and a blocking load never run
+  side by side.
+
+Usage:
+    >>> memory = MemoryTier(max_entries=128, ttl_seconds=300)
+    >>> memory.set(("data", "Companies", None), records, expires_at)
+    >>> flights = SingleFlight()
+    >>> records = await flights.do(("data", "Companies"), load)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_TTL_SECONDS = 300.0
+
+
+class MemoryTier:
+    """
+    Bounded LRU + TTL store of parsed cache contents.
+
+    Values are returned as stored (not copied); callers must treat them as
+    read-only.
+
+    Attributes:
+        max_entries: Maximum number of entries (0 disables the tier)
+        ttl_seconds: Longest time an entry is served without re-reading disk
+        hits: Lookups served from memory
+        misses: Lookups that found no valid entry
+        evictions: Entries dropped because the tier was full
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize MemoryTier.
+
+        Args:
+            max_entries: Maximum number of entries (default: 128, 0 disables)
+            ttl_seconds: Entry lifetime in seconds (default: 300)
+            clock: Monotonic time source (injectable for tests)
+
+        Raises:
+            ValueError: If max_entries is negative or ttl_seconds not positive
+        """
+        if max_entries < 0:
+            raise ValueError(f"max_entries must not be negative, got {max_entries}")
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up an entry.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Stored value, or None if absent or expired
+        """
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() >= entry[0]:
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Store an entry, evicting the least recently used one if full.
+
+        Args:
+            key: Entry key
+            value: Value to store (None values are not stored)
+            expires_at: Expiry of the cache the value was read from (naive
+                local time, like DataCache.expires_at); the entry never
+                outlives it
+        """
+        if self.max_entries == 0 or value is None:
+            return
+
+        lifetime = self.ttl_seconds
+        if expires_at is not None:
+            lifetime = min(lifetime, (expires_at - datetime.now()).total_seconds())
+        if lifetime <= 0:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = (self._clock() + lifetime, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, prefix: Tuple[Any, ...]) -> int:
+        """
+        Drop every entry whose (tuple) key starts with prefix.
+
+        Args:
+            prefix: Key prefix, e.g. ("data", "Companies")
+
+        Returns:
+            Number of entries dropped
+        """
+        stale = [
+            key
+            for key in self._entries
+            if isinstance(key, tuple) and key[: len(prefix)] == prefix
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get tier statistics.
+
+        Returns:
+            Dictionary with size, max_entries, hits, misses, hit_rate, evictions
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+class SingleFlight:
+    """
+    De-duplicates concurrent async loads per key.
+
+    A load is an asyncio task; callers arriving while it runs await the
+    same task. Waiters are shielded, so a cancelled caller does not cancel
+    the load the others are waiting for.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a load for key is running on the current event loop."""
+        return self._running(key) is not None
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run load, or join the load already running for key.
+
+        Args:
+            key: Load key
+            load: Zero-argument coroutine function producing the value
+
+        Returns:
+            The load's result
+
+        Raises:
+            Exception: Whatever the load raised (to every waiter)
+        """
+        return await asyncio.shield(self._start(key, load))
+
+    def start(
+        self, key: Hashable, load: Callable[[], Awaitable[Any]]
+    ) -> "asyncio.Task[Any]":
+        """
+        Start load in the background unless one is already running for key.
+
+        Failures are logged, not raised.
+
+        Args:
+            key: Load key
+            load: Zero-argument coroutine function
+
+        Returns:
+            The running task
+        """
+        task = self._running(key)
+        if task is not None:
+            return task
+
+        task = self._start(key, load)
+        task.add_done_callback(_log_background_failure)
+        return task
+
+    async def wait(self) -> None:
+        """Wait for all loads running on the current event loop to finish."""
+        loop = asyncio.get_running_loop()
+        tasks = [t for t in self._tasks.values() if t.get_loop() is loop]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _running(self, key: Hashable) -> Optional["asyncio.Task[Any]"]:
+        """Task running for key on the current loop, if any."""
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            return None
+        # Tasks of a finished event loop (e.g. an earlier asyncio.run) can't
+        # be awaited here
+        if task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    def _start(
+        self, key: Hashable, load: Callable[[], Awaitable[T]]
+    ) -> "asyncio.Task[T]":
+        task = self._running(key)
+        if task is not None:
+            return task
+
+        task = asyncio.ensure_future(load())
+        self._tasks[key] = task
+
+        def _forget(done: "asyncio.Task[Any]") -> None:
+            if self._tasks.get(key) is done:
+                del self._tasks[key]
+
+        task.add_done_callback(_forget)
+        return task
+
+
+def _log_background_failure(task: "asyncio.Task[Any]") -> None:
+    """Done callback: log (and so retrieve) a background load's exception."""
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.warning(
+            "Background cache refresh failed",
+            extra={"error": str(error), "error_type": type(error).__name__},
+        )
@@ -2,7 +2,8 @@
 Notion Client Wrapper
 
 Wraps the official Notion Python SDK with:
-- Rate limiting (3 req/sec via token bucket)
+- Adaptive rate limiting (3 req/sec ceiling, shared per API token) that
+  honours Retry-After on 429 responses and ramps back up on success
 - Error handling and translation to custom exceptions
 - Logging for all API calls
 - Retry logic with exponential backoff via @retry_with_backoff decorator
@@ -18,16 +19,20 @@ MIGRATION NOTES:
   for consistency with Gmail/Gemini retry logic and circuit breaker integration.
 """
 
+import asyncio
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
 
 from notion_client import AsyncClient
+from notion_client.client import ClientOptions
 from notion_client.errors import APIResponseError
 
 try:
     from ..error_handling import retry_with_backoff, NOTION_RETRY_CONFIG
+    from ..error_handling.error_classifier import ErrorClassifier
 except ImportError:
     from error_handling import retry_with_backoff, NOTION_RETRY_CONFIG
+    from error_handling.error_classifier import ErrorClassifier
 
 from .exceptions import (
     NotionAPIError,
@@ -37,11 +42,92 @@ from .exceptions import (
     NotionRateLimitError,
 )
 from .logging_config import get_logger, log_api_call
-from .rate_limiter import RateLimiter
+from .rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimiter,
+    RequestPriority,
+    get_shared_rate_limiter,
+)
 
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# 429 responses re-sent through the limiter before falling back to the
+# generic @retry_with_backoff policy
+MAX_RATE_LIMIT_RETRIES = 5
+
+
+def is_rate_limited_error(error: Exception) -> bool:
+    """Check whether an SDK error is a 429 rate limit response."""
+    return isinstance(error, APIResponseError) and (
+        getattr(error, "code", None) == "rate_limited"
+        or getattr(error, "status", None) == 429
+    )
+
+
+async def send_rate_limited(
+    client: Any,
+    request: Callable[[], Awaitable[T]],
+    priority: RequestPriority = RequestPriority.READ,
+    max_rate_limit_retries: int = MAX_RATE_LIMIT_RETRIES,
+) -> T:
+    """
+    Issue one Notion SDK request under the client's shared rate limiter.
+
+    Each attempt acquires a token at the given priority. Outcomes are fed
+    back to an AdaptiveRateLimiter: a 429 halves the rate and pauses the
+    shared bucket for Retry-After before the request is re-sent here;
+    successes let the rate ramp back up. Rate limiting therefore never
+    consumes the generic exponential-backoff retry budget unless the API
+    keeps refusing after max_rate_limit_retries attempts.
+
+    Objects without a RateLimiter (e.g. test doubles standing in for
+    NotionClient) just await the request.
+
+    Args:
+        client: NotionClient (or any object with a ``rate_limiter`` attribute)
+        request: Zero-argument callable returning the SDK coroutine
+        priority: Rate limiter priority class
+        max_rate_limit_retries: Attempts before a 429 is raised to the caller
+
+    Returns:
+        SDK response
+
+    Raises:
+        APIResponseError: Non-429 errors, or 429 after all attempts
+    """
+    limiter = getattr(client, "rate_limiter", None)
+    if not isinstance(limiter, RateLimiter):
+        return await request()
+
+    adaptive = isinstance(limiter, AdaptiveRateLimiter)
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            async with limiter.limit(priority):
+                response = await request()
+        except APIResponseError as e:
+            if not is_rate_limited_error(e) or attempt >= max_rate_limit_retries:
+                raise
+            retry_after = ErrorClassifier.extract_retry_after(e)
+            logger.warning(
+                "Notion rate limit hit, slowing down",
+                extra={"attempt": attempt, "retry_after": retry_after},
+            )
+            if adaptive:
+                await limiter.handle_rate_limit_error(retry_after)
+            else:
+                # A fixed-rate limiter cannot pause the bucket; back off locally
+                await asyncio.sleep(retry_after or 1.0)
+            continue
+
+        if adaptive:
+            await limiter.handle_success()
+        return response
+
 
 class NotionClient:
     """
@@ -49,13 +135,15 @@ class NotionClient:
 
     Attributes:
         client: Notion AsyncClient instance
-        rate_limiter: Rate limiter for API calls
+        rate_limiter: Rate limiter for API calls (shared by all clients
+            using the same API key)
     """
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         rate_per_second: float = 3.0,
+        base_url: Optional[str] = None,
     ):
         """
         Initialize Notion client wrapper.
@@ -63,6 +151,7 @@ class NotionClient:
         Args:
             api_key: Notion API key (defaults to NOTION_API_KEY env var)
             rate_per_second: Maximum API calls per second (default: 3.0)
+            base_url: Override the API root (e.g. a local stub server in tests)
 
         Raises:
             NotionAuthenticationError: If API key is missing
@@ -77,22 +166,35 @@ class NotionClient:
             )
 
         # Initialize Notion client
-        self.client = AsyncClient(auth=self.api_key)
-
-        # Initialize rate limiter
-        self.rate_limiter = RateLimiter(rate_per_second=rate_per_second)
+        client_options: Dict[str, Any] = {"auth": self.api_key}
+        if base_url:
+            client_options["base_url"] = base_url
+        # notion-client >= 3 retries 429s internally; leave them to our limiter
+        if "retry" in getattr(ClientOptions, "__dataclass_fields__", {}):
+            client_options["retry"] = False
+        self.client = AsyncClient(**client_options)
+
+        # Share one rate limiter per API key across the process
+        self.rate_limiter: RateLimiter = get_shared_rate_limiter(
+            self.api_key, rate_per_second=rate_per_second
+        )
 
         logger.info(
             "Notion client initialized",
             extra={"rate_limit_per_sec": rate_per_second},
         )
 
-    async def retrieve_database(self, database_id: str) -> Dict[str, Any]:
+    async def retrieve_database(
+        self,
+        database_id: str,
+        priority: RequestPriority = RequestPriority.READ,
+    ) -> Dict[str, Any]:
         """
         Retrieve database metadata and schema.
 
         Args:
             database_id: Notion database ID
+            priority: Rate limiter priority class (default: READ)
 
         Returns:
             Database object from Notion API
@@ -106,15 +208,18 @@ class NotionClient:
         """
         log_api_call(logger, "databases.retrieve", database_id=database_id)
 
-        async with self.rate_limiter:
-            try:
-                response = await self._retrieve_database_with_retry(database_id)
-                return response
-            except APIResponseError as e:
-                raise self._translate_api_error(e, database_id=database_id)
+        try:
+            response = await self._retrieve_database_with_retry(database_id, priority)
+            return response
+        except APIResponseError as e:
+            raise self._translate_api_error(e, database_id=database_id)
 
     @retry_with_backoff(NOTION_RETRY_CONFIG)
-    async def _retrieve_database_with_retry(self, database_id: str) -> Dict[str, Any]:
+    async def _retrieve_database_with_retry(
+        self,
+        database_id: str,
+        priority: RequestPriority = RequestPriority.READ,
+    ) -> Dict[str, Any]:
         """
         Retrieve database with retry logic for transient failures.
 
@@ -124,8 +229,11 @@ class NotionClient:
         - Structured error logging
         - Automatic classification of transient vs permanent errors
 
+        429s are absorbed by send_rate_limited() before reaching it.
+
         Args:
             database_id: Notion database ID
+            priority: Rate limiter priority class
 
         Returns:
             Database object from Notion API
@@ -133,7 +241,11 @@ class NotionClient:
         Raises:
             APIResponseError: If all retries exhausted
         """
-        return await self.client.databases.retrieve(database_id=database_id)
+        return await send_rate_limited(
+            self,
+            lambda: self.client.databases.retrieve(database_id=database_id),
+            priority,
+        )
 
     async def query_database(
         self,
@@ -142,6 +254,7 @@ class NotionClient:
         sorts: Optional[list] = None,
         start_cursor: Optional[str] = None,
         page_size: int = 100,
+        priority: RequestPriority = RequestPriority.READ,
     ) -> Dict[str, Any]:
         """
         Query database for records.
@@ -155,6 +268,7 @@ class NotionClient:
             sorts: Sort configuration (optional)
             start_cursor: Pagination cursor (optional)
             page_size: Number of records per page (default: 100, max: 100)
+            priority: Rate limiter priority class (default: READ)
 
         Returns:
             Query response with records and pagination info
@@ -174,34 +288,34 @@ class NotionClient:
             has_cursor=start_cursor is not None,
         )
 
-        async with self.rate_limiter:
-            try:
-                # First, get the database to retrieve data source IDs
-                db = await self._retrieve_database_with_retry(database_id)
-                data_sources = db.get("data_sources", [])
-
-                if not data_sources:
-                    raise NotionAPIError(
-                        message=f"Database has no data sources (database_id={database_id})",
-                        status_code=None,
-                        response_body="No data sources found in database",
-                        details={"database_id": database_id},
-                    )
-
-                # Query the first data source
-                # TODO: In the future, we might need to query all data sources for multi-source databases
-                data_source_id = data_sources[0]["id"]
-
-                response = await self._query_data_source_with_retry(
-                    data_source_id=data_source_id,
-                    filter_conditions=filter_conditions,
-                    sorts=sorts,
-                    start_cursor=start_cursor,
-                    page_size=page_size,
+        try:
+            # First, get the database to retrieve data source IDs
+            db = await self._retrieve_database_with_retry(database_id, priority)
+            data_sources = db.get("data_sources", [])
+
+            if not data_sources:
+                raise NotionAPIError(
+                    message=f"Database has no data sources (database_id={database_id})",
+                    status_code=None,
+                    response_body="No data sources found in database",
+                    details={"database_id": database_id},
                 )
-                return response
-            except APIResponseError as e:
-                raise self._translate_api_error(e, database_id=database_id)
+
+            # Query the first data source
+            # TODO: In the future, we might need to query all data sources for multi-source databases
+            data_source_id = data_sources[0]["id"]
+
+            response = await self._query_data_source_with_retry(
+                data_source_id=data_source_id,
+                filter_conditions=filter_conditions,
+                sorts=sorts,
+                start_cursor=start_cursor,
+                page_size=page_size,
+                priority=priority,
+            )
+            return response
+        except APIResponseError as e:
+            raise self._translate_api_error(e, database_id=database_id)
 
     @retry_with_backoff(NOTION_RETRY_CONFIG)
     async def _query_data_source_with_retry(
@@ -211,6 +325,7 @@ class NotionClient:
         sorts: Optional[list],
         start_cursor: Optional[str],
         page_size: int,
+        priority: RequestPriority = RequestPriority.READ,
     ) -> Dict[str, Any]:
         """Query data source with retry logic (Notion API 2025-09-03).
 
@@ -229,14 +344,21 @@ class NotionClient:
         if start_cursor:
             query_params["start_cursor"] = start_cursor
 
-        return await self.client.data_sources.query(**query_params)
+        return await send_rate_limited(
+            self, lambda: self.client.data_sources.query(**query_params), priority
+        )
 
-    async def retrieve_data_source(self, data_source_id: str) -> Dict[str, Any]:
+    async def retrieve_data_source(
+        self,
+        data_source_id: str,
+        priority: RequestPriority = RequestPriority.READ,
+    ) -> Dict[str, Any]:
         """
         Retrieve data source metadata and schema (Notion API 2025-09-03).
 
         Args:
             data_source_id: Notion data source ID
+            priority: Rate limiter priority class (default: READ)
 
         Returns:
             Data source object from Notion API
@@ -250,16 +372,19 @@ class NotionClient:
         """
         log_api_call(logger, "data_sources.retrieve", data_source_id=data_source_id)
 
-        async with self.rate_limiter:
-            try:
-                response = await self._retrieve_data_source_with_retry(data_source_id)
-                return response
-            except APIResponseError as e:
-                raise self._translate_api_error(e)
+        try:
+            response = await self._retrieve_data_source_with_retry(
+                data_source_id, priority
+            )
+            return response
+        except APIResponseError as e:
+            raise self._translate_api_error(e)
 
     @retry_with_backoff(NOTION_RETRY_CONFIG)
     async def _retrieve_data_source_with_retry(
-        self, data_source_id: str
+        self,
+        data_source_id: str,
+        priority: RequestPriority = RequestPriority.READ,
     ) -> Dict[str, Any]:
         """
         Retrieve data source with retry logic for transient failures.
@@ -269,6 +394,7 @@ class NotionClient:
 
         Args:
             data_source_id: Notion data source ID
+            priority: Rate limiter priority class
 
         Returns:
             Data source object from Notion API
@@ -276,14 +402,23 @@ class NotionClient:
         Raises:
             APIResponseError: If all retries exhausted
         """
-        return await self.client.data_sources.retrieve(data_source_id=data_source_id)
+        return await send_rate_limited(
+            self,
+            lambda: self.client.data_sources.retrieve(data_source_id=data_source_id),
+            priority,
+        )
 
-    async def retrieve_page(self, page_id: str) -> Dict[str, Any]:
+    async def retrieve_page(
+        self,
+        page_id: str,
+        priority: RequestPriority = RequestPriority.READ,
+    ) -> Dict[str, Any]:
         """
         Retrieve page/record by ID.
 
         Args:
             page_id: Notion page ID
+            priority: Rate limiter priority class (default: READ)
 
         Returns:
             Page object from Notion API
@@ -297,21 +432,26 @@ class NotionClient:
         """
         log_api_call(logger, "pages.retrieve", page_id=page_id)
 
-        async with self.rate_limiter:
-            try:
-                response = await self._retrieve_page_with_retry(page_id)
-                return response
-            except APIResponseError as e:
-                raise self._translate_api_error(e, page_id=page_id)
+        try:
+            response = await self._retrieve_page_with_retry(page_id, priority)
+            return response
+        except APIResponseError as e:
+            raise self._translate_api_error(e, page_id=page_id)
 
     @retry_with_backoff(NOTION_RETRY_CONFIG)
-    async def _retrieve_page_with_retry(self, page_id: str) -> Dict[str, Any]:
+    async def _retrieve_page_with_retry(
+        self,
+        page_id: str,
+        priority: RequestPriority = RequestPriority.READ,
+    ) -> Dict[str, Any]:
         """Retrieve page with retry logic.
 
         The @retry_with_backoff decorator handles retry logic with
         exponential backoff, circuit breaker integration, and error logging.
         """
-        return await self.client.pages.retrieve(page_id=page_id)
+        return await send_rate_limited(
+            self, lambda: self.client.pages.retrieve(page_id=page_id), priority
+        )
 
     def _translate_api_error(
         self,
@@ -374,14 +514,7 @@ class NotionClient:
 
         if status_code == "rate_limited" or response_status == 429:
             # Extract retry_after from headers if available
-            retry_after = None
-            if hasattr(error, "response") and hasattr(error.response, "headers"):
-                retry_after = error.response.headers.get("Retry-After")
-                if retry_after:
-                    try:
-                        retry_after = float(retry_after)
-                    except (ValueError, TypeError):
-                        retry_after = None
+            retry_after = ErrorClassifier.extract_retry_after(error)
 
             return NotionRateLimitError(
                 message="Notion API rate limit exceeded.",
@@ -406,7 +539,8 @@ class NotionClient:
         Get current rate limiter statistics.
 
         Returns:
-            Dictionary with rate limit stats
+            Dictionary with rate limit stats, including cumulative and
+            percentile wait times (see RateLimiter.get_stats)
         """
         return self.rate_limiter.get_stats()
 
@@ -6,29 +6,51 @@ Maintains a list of (page_id, company_name) tuples with TTL-based refresh.
 
 Key Features:
 - Fetch all companies from Notion Companies database
-- Store in data/notion_cache/companies_list.json
+- Store in data/notion_cache/data_Companies.sqlite3 (read back with a
+  page_id + name projection)
 - 6-hour TTL (same as data cache)
-- Delta refresh support (invalidate when needed)
+- Delta refresh: an expired cache is brought up to date by fetching only
+  pages edited since the last sync (last_edited_time filter)
+- Full refetch only on a schedule (default: every 24 hours), which also
+  drops deleted companies that a delta cannot see
+- In-place upserts: companies created by CollabIQ are added to the cache
+  directly instead of invalidating it
+- Concurrent misses share one refresh; optionally an expired snapshot is
+  served while it refreshes in the background (stale-while-revalidate)
 - Thread-safe for concurrent access
 
 Usage:
     >>> cache = CompaniesCache(notion_integrator, companies_db_id)
     >>> candidates = await cache.get_companies()
     >>> # [(page_id, name), (page_id, name), ...]
-    >>> await cache.refresh()  # Force refresh
+    >>> index = await cache.get_index()  # CompanyIndex for the same snapshot
+    >>> cache.upsert_company(new_page_id, "새회사")  # After creating a company
+    >>> await cache.refresh()  # Force full refresh
 """
 
-from typing import List, Optional, Tuple
+from datetime import datetime, timedelta, UTC
+from typing import Any, Dict, List, Optional, Tuple
 
 from .cache import CacheManager
+from .cache_tiers import SingleFlight
 from .client import NotionClient
 from .exceptions import NotionAPIError
 from .fetcher import fetch_all_records
+from .fuzzy_matcher import CompanyIndex
 from .logging_config import get_logger, PerformanceLogger
+from .models import DataCache
+from .rate_limiter import RequestPriority
 
 
 logger = get_logger(__name__)
 
+CACHE_NAME = "Companies"
+CACHE_FIELDS = ("page_id", "name")
+
+# Notion reports last_edited_time truncated to the minute, so a delta starts
+# one full minute before the previous sync began.
+WATERMARK_OVERLAP = timedelta(minutes=1)
+
 
 class CompaniesCache:
     """
@@ -42,7 +64,10 @@ class CompaniesCache:
         client: NotionClient instance for API access
         companies_db_id: Companies database ID
         cache_manager: CacheManager for file-based caching
-        ttl_hours: Cache TTL in hours (default: 6)
+        ttl_hours: Cache TTL in hours; an expired cache gets a delta refresh (default: 6)
+        full_refresh_hours: Interval between full refetches (default: 24)
+        stale_while_revalidate: Serve an expired snapshot while refreshing
+            it in the background (default: False)
     """
 
     def __init__(
@@ -51,6 +76,8 @@ class CompaniesCache:
         companies_db_id: str,
         cache_manager: Optional[CacheManager] = None,
         ttl_hours: int = 6,
+        full_refresh_hours: int = 24,
+        stale_while_revalidate: bool = False,
     ):
         """
         Initialize CompaniesCache.
@@ -60,11 +87,26 @@ class CompaniesCache:
             companies_db_id: Companies database ID
             cache_manager: Optional CacheManager (creates new if not provided)
             ttl_hours: Cache TTL in hours (default: 6)
+            full_refresh_hours: Hours between full refetches; in between, an
+                expired cache is delta-refreshed (default: 24)
+            stale_while_revalidate: Return an expired snapshot immediately
+                and refresh it in the background; only useful in
+                long-running processes where the refresh can finish
+                (default: False)
         """
         self.client = client
         self.companies_db_id = companies_db_id
         self.cache_manager = cache_manager or CacheManager(data_ttl_hours=ttl_hours)
         self.ttl_hours = ttl_hours
+        self.full_refresh_hours = full_refresh_hours
+        self.stale_while_revalidate = stale_while_revalidate
+
+        # De-duplicates concurrent and background refreshes
+        self._flights = SingleFlight()
+
+        # Matching index and the snapshot it was built from
+        self._index: Optional[CompanyIndex] = None
+        self._index_source: Optional[List[Tuple[str, str]]] = None
 
         logger.info(
             "CompaniesCache initialized",
@@ -81,8 +123,13 @@ class CompaniesCache:
         """
         Get list of companies as (page_id, company_name) tuples.
 
-        Checks cache first. If cache is invalid or use_cache=False,
-        fetches from Notion API and updates cache.
+        Checks cache first. An expired cache is delta-refreshed (only pages
+        edited since the last sync are fetched) unless a full refetch is
+        due; with stale_while_revalidate the expired snapshot is returned
+        and the refresh runs in the background. If there is no usable cache
+        or use_cache=False, fetches all companies from Notion API (and
+        updates cache when use_cache=True). Concurrent callers share one
+        refresh.
 
         Args:
             use_cache: Whether to use cached data (default: True)
@@ -115,33 +162,67 @@ class CompaniesCache:
                     )
                     return cached_companies
 
-            # Cache miss - fetch from API
+                if self.stale_while_revalidate:
+                    stale = self._get_stale_companies()
+                    if stale:
+                        self._flights.start(self._flight_key, self._refresh_cache)
+                        return stale
+
+                # Missing or expired - one refresh shared by concurrent callers
+                return await self._flights.do(self._flight_key, self._refresh_cache)
+
+            # Cache bypassed - fetch from API without touching the cache
             logger.info(
                 "Fetching companies from Notion API",
                 extra={"companies_db_id": self.companies_db_id},
             )
+            return await self._fetch_from_api()
 
-            companies = await self._fetch_from_api()
+    async def get_index(self, use_cache: bool = True) -> CompanyIndex:
+        """
+        Get a CompanyIndex over the current companies snapshot.
 
-            # Update cache
-            if use_cache:
-                self._save_to_cache(companies)
+        The index is rebuilt only when the snapshot returned by
+        get_companies() changes, so candidate names are normalized once per
+        snapshot rather than on every match.
 
-            logger.info(
-                "Companies fetched and cached",
+        Treat the returned index as read-only; use CompanyIndex.copy() before
+        appending to it.
+
+        Args:
+            use_cache: Whether to use cached data (default: True)
+
+        Returns:
+            CompanyIndex over (page_id, company_name) tuples
+
+        Raises:
+            NotionAPIError: If API fetch fails
+        """
+        companies = await self.get_companies(use_cache=use_cache)
+
+        if self._index is None or companies != self._index_source:
+            self._index = CompanyIndex(companies)
+            self._index_source = list(companies)
+            logger.debug(
+                "Company index built",
                 extra={
                     "companies_db_id": self.companies_db_id,
                     "company_count": len(companies),
                 },
             )
 
-            return companies
+        return self._index
+
+    async def wait_for_refresh(self) -> None:
+        """Wait for a running (e.g. background) refresh to finish."""
+        await self._flights.wait()
 
     async def refresh(self) -> List[Tuple[str, str]]:
         """
         Force refresh of companies cache from Notion API.
 
-        Invalidates existing cache and fetches fresh data.
+        Invalidates existing cache and refetches all companies (a full
+        refresh, which restarts the full-refresh schedule).
 
         Returns:
             List of (page_id, company_name) tuples
@@ -159,10 +240,68 @@ class CompaniesCache:
         )
 
         # Invalidate cache
-        self.cache_manager.invalidate_data_cache("Companies")
+        self.cache_manager.invalidate_data_cache(CACHE_NAME)
 
         # Fetch fresh data
-        return await self.get_companies(use_cache=False)
+        return await self._full_refresh()
+
+    def upsert_company(self, page_id: str, company_name: str) -> None:
+        """
+        Add (or rename) one company in the cache without refetching.
+
+        Call this after creating a company in Notion so the next lookup
+        sees it, instead of invalidating the cache. The cache's TTL and
+        sync watermark are left unchanged; a later delta refresh simply
+        re-reads the page.
+
+        Args:
+            page_id: Notion page ID of the company
+            company_name: Company name
+
+        Example:
+            >>> page_id = await writer.create_company("새회사", companies_db_id)
+            >>> cache.upsert_company(page_id, "새회사")
+        """
+        entry = self._get_cache_entry()
+        if entry is not None:
+            companies = self._parse_cache_records(entry.content)
+            companies = self._apply_changes(companies, {page_id: company_name})
+            try:
+                self.cache_manager.update_data_cache_entry(
+                    entry.model_copy(
+                        update={
+                            "content": self._to_cache_records(companies),
+                            "metadata": {
+                                **entry.metadata,
+                                "record_count": len(companies),
+                            },
+                        }
+                    )
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to upsert company into cache",
+                    extra={
+                        "companies_db_id": self.companies_db_id,
+                        "page_id": page_id,
+                        "error": str(e),
+                    },
+                )
+
+        # Keep the in-memory index current without a rebuild
+        if self._index is not None and self._index_source is not None:
+            if all(pid != page_id for pid, _ in self._index_source):
+                self._index.append((page_id, company_name))
+                self._index_source.append((page_id, company_name))
+
+        logger.info(
+            "Company upserted into cache",
+            extra={
+                "companies_db_id": self.companies_db_id,
+                "page_id": page_id,
+                "cached": entry is not None,
+            },
+        )
 
     def invalidate_cache(self) -> None:
         """
@@ -180,55 +319,245 @@ class CompaniesCache:
             "Invalidating companies cache",
             extra={"companies_db_id": self.companies_db_id},
         )
-        self.cache_manager.invalidate_data_cache("Companies")
+        self.cache_manager.invalidate_data_cache(CACHE_NAME)
 
-    async def _fetch_from_api(self) -> List[Tuple[str, str]]:
+    @property
+    def _flight_key(self) -> Tuple[str, str]:
+        """Single-flight key of this cache's refreshes."""
+        return ("companies", self.companies_db_id)
+
+    async def _refresh_cache(self) -> List[Tuple[str, str]]:
+        """Bring the cache up to date: a delta if possible, else a full refresh."""
+        companies = await self._delta_refresh()
+        if companies is not None:
+            return companies
+
+        return await self._full_refresh()
+
+    def _get_stale_companies(self) -> Optional[List[Tuple[str, str]]]:
+        """Companies of an expired cache entry, or None if there is none."""
+        entry = self._get_cache_entry()
+        if entry is None:
+            return None
+
+        companies = self._parse_cache_records(entry.content)
+        if companies:
+            logger.info(
+                "Serving expired companies cache while refreshing",
+                extra={
+                    "companies_db_id": self.companies_db_id,
+                    "company_count": len(companies),
+                },
+            )
+        return companies or None
+
+    async def _full_refresh(self) -> List[Tuple[str, str]]:
+        """Fetch all companies and replace the cache, starting a new schedule."""
+        logger.info(
+            "Fetching companies from Notion API",
+            extra={"companies_db_id": self.companies_db_id},
+        )
+
+        synced_at = datetime.now(UTC)
+        companies = await self._fetch_from_api()
+        self._save_to_cache(
+            companies,
+            last_edited_time=self._watermark(synced_at),
+            full_refreshed_at=synced_at.isoformat(),
+        )
+
+        logger.info(
+            "Companies fetched and cached",
+            extra={
+                "companies_db_id": self.companies_db_id,
+                "company_count": len(companies),
+            },
+        )
+
+        return companies
+
+    async def _delta_refresh(self) -> Optional[List[Tuple[str, str]]]:
         """
-        Fetch all companies from Notion API.
+        Update an expired cache with pages edited since the last sync.
 
         Returns:
-            List of (page_id, company_name) tuples
+            Updated companies, or None when a full refresh is needed instead
+            (no cache or watermark, or the full-refresh schedule is due)
 
         Raises:
             NotionAPIError: If API fetch fails
         """
-        try:
-            # Fetch all records from Companies database
-            records = await fetch_all_records(
-                client=self.client,
-                database_id=self.companies_db_id,
-            )
-
-            # Extract (page_id, name) tuples
-            companies = []
-            for record in records:
-                page_id = record.get("id")
-                if not page_id:
-                    continue
-
-                # Extract company name from title property
-                # Companies database uses "Name" as title property
-                properties = record.get("properties", {})
-                name_prop = properties.get("Name", {})
+        entry = self._get_cache_entry()
+        if entry is None:
+            return None
 
-                # Handle title property format
-                if name_prop.get("type") == "title":
-                    title_array = name_prop.get("title", [])
-                    if title_array and len(title_array) > 0:
-                        company_name = title_array[0].get("text", {}).get("content", "")
-                        if company_name:
-                            companies.append((page_id, company_name))
+        watermark = entry.metadata.get("last_edited_time")
+        full_refreshed_at = entry.metadata.get("full_refreshed_at")
+        if not watermark or not full_refreshed_at:
+            return None
 
+        synced_at = datetime.now(UTC)
+        try:
+            due = datetime.fromisoformat(full_refreshed_at) + timedelta(
+                hours=self.full_refresh_hours
+            )
+        except (TypeError, ValueError):
+            return None
+        if due.tzinfo is None:
+            due = due.replace(tzinfo=UTC)
+        if synced_at >= due:
             logger.info(
-                "Companies fetched from API",
+                "Scheduled full refresh of companies cache",
                 extra={
                     "companies_db_id": self.companies_db_id,
-                    "total_records": len(records),
-                    "valid_companies": len(companies),
+                    "full_refreshed_at": full_refreshed_at,
                 },
             )
+            return None
 
-            return companies
+        records = await self._fetch_records(
+            filter_conditions={
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": watermark},
+            }
+        )
+
+        # page_id -> new name, or None if the page no longer is a company
+        changes: Dict[str, Optional[str]] = {}
+        for record in records:
+            page_id = record.get("id")
+            if page_id:
+                company = self._parse_company(record)
+                changes[page_id] = company[1] if company else None
+
+        companies = self._apply_changes(
+            self._parse_cache_records(entry.content), changes
+        )
+        self._save_to_cache(
+            companies,
+            last_edited_time=self._watermark(synced_at),
+            full_refreshed_at=full_refreshed_at,
+        )
+
+        logger.info(
+            "Companies cache delta-refreshed",
+            extra={
+                "companies_db_id": self.companies_db_id,
+                "changed_records": len(changes),
+                "company_count": len(companies),
+            },
+        )
+
+        return companies
+
+    @staticmethod
+    def _watermark(synced_at: datetime) -> str:
+        """last_edited_time filter value for the next delta after a sync."""
+        return (synced_at - WATERMARK_OVERLAP).replace(
+            second=0, microsecond=0
+        ).isoformat()
+
+    @staticmethod
+    def _apply_changes(
+        companies: List[Tuple[str, str]],
+        changes: Dict[str, Optional[str]],
+    ) -> List[Tuple[str, str]]:
+        """
+        Apply upserts/removals to a companies list, keeping its order.
+
+        Args:
+            companies: Current (page_id, company_name) tuples
+            changes: page_id -> new name (None removes the company)
+
+        Returns:
+            Updated list; new companies are appended at the end
+        """
+        pending = dict(changes)
+        updated = []
+        for page_id, name in companies:
+            if page_id in pending:
+                name = pending.pop(page_id)
+                if name is None:
+                    continue
+            updated.append((page_id, name))
+        updated.extend(
+            (page_id, name) for page_id, name in pending.items() if name is not None
+        )
+        return updated
+
+    @staticmethod
+    def _parse_company(record: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """
+        Extract (page_id, company_name) from a Companies page.
+
+        Returns:
+            Tuple, or None for archived/trashed pages and pages without a name
+        """
+        page_id = record.get("id")
+        if not page_id or record.get("archived") or record.get("in_trash"):
+            return None
+
+        # Extract company name from title property
+        # Companies database uses "Name" as title property
+        properties = record.get("properties", {})
+        name_prop = properties.get("Name", {})
+
+        # Handle title property format
+        if name_prop.get("type") == "title":
+            title_array = name_prop.get("title", [])
+            if title_array and len(title_array) > 0:
+                company_name = title_array[0].get("text", {}).get("content", "")
+                if company_name:
+                    return (page_id, company_name)
+        return None
+
+    async def _fetch_from_api(self) -> List[Tuple[str, str]]:
+        """
+        Fetch all companies from Notion API.
+
+        Returns:
+            List of (page_id, company_name) tuples
+
+        Raises:
+            NotionAPIError: If API fetch fails
+        """
+        records = await self._fetch_records()
+
+        # Extract (page_id, name) tuples
+        companies = [
+            company
+            for company in map(self._parse_company, records)
+            if company is not None
+        ]
+
+        logger.info(
+            "Companies fetched from API",
+            extra={
+                "companies_db_id": self.companies_db_id,
+                "total_records": len(records),
+                "valid_companies": len(companies),
+            },
+        )
+
+        return companies
+
+    async def _fetch_records(
+        self, filter_conditions: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch Companies pages (all, or those matching filter_conditions).
+
+        Raises:
+            NotionAPIError: If API fetch fails
+        """
+        try:
+            # Background priority so entry writes are not starved
+            return await fetch_all_records(
+                client=self.client,
+                database_id=self.companies_db_id,
+                filter_conditions=filter_conditions,
+                priority=RequestPriority.BACKGROUND,
+            )
 
         except Exception as e:
             logger.error(
@@ -253,10 +582,11 @@ class CompaniesCache:
             List of (page_id, company_name) tuples or None if cache invalid
         """
         try:
-            # Use existing CacheManager infrastructure
+            # Projection read: only the fields the (page_id, name) list needs
             cached_data = self.cache_manager.get_data_cache(
                 database_id=self.companies_db_id,
-                database_name="Companies",
+                database_name=CACHE_NAME,
+                fields=CACHE_FIELDS,
             )
 
             if not cached_data:
@@ -271,13 +601,7 @@ class CompaniesCache:
                 return None
 
             # Convert from cache format to tuple format
-            companies = []
-            for item in cached_data:
-                if isinstance(item, dict):
-                    page_id = item.get("page_id")
-                    name = item.get("name")
-                    if page_id and name:
-                        companies.append((page_id, name))
+            companies = self._parse_cache_records(cached_data)
 
             if not companies:
                 logger.warning(
@@ -298,24 +622,64 @@ class CompaniesCache:
             )
             return None
 
-    def _save_to_cache(self, companies: List[Tuple[str, str]]) -> None:
+    def _get_cache_entry(self) -> Optional[DataCache]:
+        """Get the cache entry with sync metadata, even if expired."""
+        try:
+            entry = self.cache_manager.get_data_cache_entry(CACHE_NAME)
+        except Exception as e:
+            logger.warning(
+                "Error reading companies cache entry",
+                extra={"companies_db_id": self.companies_db_id, "error": str(e)},
+            )
+            return None
+
+        if not isinstance(entry, DataCache) or not isinstance(entry.content, list):
+            return None
+        if entry.database_id != self.companies_db_id:
+            return None
+        return entry
+
+    @staticmethod
+    def _parse_cache_records(records: List[Any]) -> List[Tuple[str, str]]:
+        """Convert cached {page_id, name} dicts to (page_id, name) tuples."""
+        companies = []
+        for item in records:
+            if isinstance(item, dict):
+                page_id = item.get("page_id")
+                name = item.get("name")
+                if page_id and name:
+                    companies.append((page_id, name))
+        return companies
+
+    @staticmethod
+    def _to_cache_records(companies: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+        """Convert (page_id, name) tuples to cached {page_id, name} dicts."""
+        return [{"page_id": page_id, "name": name} for page_id, name in companies]
+
+    def _save_to_cache(
+        self,
+        companies: List[Tuple[str, str]],
+        last_edited_time: str,
+        full_refreshed_at: str,
+    ) -> None:
         """
         Save companies to cache.
 
         Args:
             companies: List of (page_id, company_name) tuples
+            last_edited_time: Watermark for the next delta refresh
+            full_refreshed_at: When all companies were last fetched (ISO 8601)
         """
         try:
-            # Convert to cache format: list of {page_id, name} dicts
-            cache_data = [
-                {"page_id": page_id, "name": name} for page_id, name in companies
-            ]
-
             # Use existing CacheManager infrastructure
             self.cache_manager.set_data_cache(
                 database_id=self.companies_db_id,
-                database_name="Companies",
-                records=cache_data,
+                database_name=CACHE_NAME,
+                records=self._to_cache_records(companies),
+                metadata={
+                    "last_edited_time": last_edited_time,
+                    "full_refreshed_at": full_refreshed_at,
+                },
             )
 
             logger.info(
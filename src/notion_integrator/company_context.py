@@ -0,0 +1,264 @@
+"""
+Incrementally Maintained Company Context
+
+format_for_llm() formats every record and rebuilds the Markdown summary
+from scratch: each property is re-extracted, four groups re-sorted and the
+summary re-joined. The daemon asks for the same company context every
+cycle while the Companies data rarely changes, so CompanyContext keeps
+the formatted result as an artifact:
+
+- Each record is formatted once (CompanyRecord + summary group) and kept
+  by page ID
+- Summary names are kept sorted per group (bisect), so a change is an
+  insert/delete instead of a re-sort
+- sync() diffs a new record list against the kept one and re-formats only
+  added or changed records; upsert()/remove() patch a single record
+- The LLMFormattedData is rebuilt only after a change
+
+The version attribute records which data cache version the context
+reflects (see CacheManager.get_data_cache_version), so callers can skip
+even the diff when the cache has not been rewritten.
+
+Output is the same as formatter.format_for_llm() for the same records
+(except metadata.formatted_at, which is when the context last changed).
+
+Usage:
+    >>> context = CompanyContext(schema, records, version=version)
+    >>> context.to_llm_data().summary_markdown
+    >>> context.upsert(created_page)
+    >>> context.sync(new_records, version=new_version)
+"""
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .formatter import (
+    SUMMARY_GROUPS,
+    classify_summary_group,
+    extract_title,
+    format_company_record,
+    render_markdown_summary,
+)
+from .logging_config import get_logger
+from .models import CompanyRecord, DatabaseSchema, FormatMetadata, LLMFormattedData
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Entry:
+    """One formatted record."""
+
+    record: Dict[str, Any]
+    company: CompanyRecord
+    group: str
+    name: str
+
+
+def schema_key(schema: DatabaseSchema) -> Tuple[str, str]:
+    """Identity of the schema version a context was formatted with."""
+    return (schema.database.id, schema.database.last_edited_time.isoformat())
+
+
+class CompanyContext:
+    """
+    Formatted LLM context for one database, patchable per record.
+
+    Attributes:
+        schema: DatabaseSchema the records are formatted with
+        version: Data cache version the context reflects (None if unknown)
+    """
+
+    def __init__(
+        self,
+        schema: DatabaseSchema,
+        records: List[Dict[str, Any]],
+        version: Optional[str] = None,
+    ):
+        """
+        Format records into a new context.
+
+        Args:
+            schema: DatabaseSchema for field identification
+            records: Notion page records, in output order
+            version: Data cache version the records came from
+        """
+        self.schema = schema
+        self.version = version
+        self._entries: Dict[str, _Entry] = {}
+        self._names: Dict[str, List[str]] = {group: [] for group in SUMMARY_GROUPS}
+        self._ssg_count = 0
+        self._portfolio_count = 0
+        self._formatted: Optional[LLMFormattedData] = None
+
+        for position, record in enumerate(records):
+            self._add(_record_key(record, position), record)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def schema_key(self) -> Tuple[str, str]:
+        """Identity of the schema this context was formatted with."""
+        return schema_key(self.schema)
+
+    def upsert(self, record: Dict[str, Any]) -> bool:
+        """
+        Add or replace one record.
+
+        New records are appended at the end, as a refetch would list a
+        newly created page.
+
+        Args:
+            record: Notion page record (must have an "id")
+
+        Returns:
+            True if the context changed
+        """
+        key = record.get("id")
+        if not key:
+            raise ValueError("Record to upsert has no id")
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.record == record:
+                return False
+            self._discard(entry)
+            self._entries[key] = self._format(record)
+        else:
+            self._add(key, record)
+        self._formatted = None
+        return True
+
+    def remove(self, page_id: str) -> bool:
+        """
+        Remove one record.
+
+        Args:
+            page_id: Notion page ID
+
+        Returns:
+            True if the record was present
+        """
+        entry = self._entries.pop(page_id, None)
+        if entry is None:
+            return False
+        self._discard(entry)
+        self._formatted = None
+        return True
+
+    def sync(
+        self,
+        records: List[Dict[str, Any]],
+        version: Optional[str] = None,
+    ) -> int:
+        """
+        Bring the context up to date with a full record list.
+
+        Only added or changed records are re-formatted; removed records
+        are dropped, and the order follows records.
+
+        Args:
+            records: Current Notion page records
+            version: Data cache version the records came from
+
+        Returns:
+            Number of records added, changed or removed
+        """
+        keys = [_record_key(record, position) for position, record in enumerate(records)]
+        changes = 0
+
+        for key in set(self._entries).difference(keys):
+            self.remove(key)
+            changes += 1
+
+        for key, record in zip(keys, records):
+            entry = self._entries.get(key)
+            if entry is None:
+                self._add(key, record)
+                changes += 1
+            elif entry.record is not record and entry.record != record:
+                self._discard(entry)
+                self._entries[key] = self._format(record)
+                changes += 1
+
+        if list(self._entries) != keys:
+            self._entries = {key: self._entries[key] for key in keys}
+            self._formatted = None
+
+        if changes:
+            self._formatted = None
+        self.version = version
+
+        logger.debug(
+            "Company context synced",
+            extra={
+                "database_name": self.schema.database.title,
+                "changed_records": changes,
+                "record_count": len(self._entries),
+            },
+        )
+        return changes
+
+    def to_llm_data(self) -> LLMFormattedData:
+        """
+        Get the formatted data, rebuilding it only after a change.
+
+        Treat the returned object as read-only; it is shared by callers
+        until the context changes.
+        """
+        if self._formatted is None:
+            self._formatted = LLMFormattedData(
+                companies=[entry.company for entry in self._entries.values()],
+                summary_markdown=render_markdown_summary(
+                    self._names, len(self._entries)
+                ),
+                metadata=FormatMetadata(
+                    total_companies=len(self._entries),
+                    shinsegae_affiliate_count=self._ssg_count,
+                    portfolio_company_count=self._portfolio_count,
+                    formatted_at=datetime.now(),
+                    data_freshness="fresh",
+                    databases_included=[self.schema.database.title],
+                ),
+            )
+        return self._formatted
+
+    def _format(self, record: Dict[str, Any]) -> _Entry:
+        """Format one record and add it to the summary groups and counts."""
+        entry = _Entry(
+            record=record,
+            company=format_company_record(record, self.schema),
+            group=classify_summary_group(record),
+            name=extract_title(record),
+        )
+        insort(self._names[entry.group], entry.name)
+        if entry.company.classification.is_shinsegae_affiliate:
+            self._ssg_count += 1
+        if entry.company.classification.is_portfolio_company:
+            self._portfolio_count += 1
+        return entry
+
+    def _add(self, key: str, record: Dict[str, Any]) -> None:
+        """Format a record and append it (replacing a duplicate key)."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._discard(previous)
+        self._entries[key] = self._format(record)
+
+    def _discard(self, entry: _Entry) -> None:
+        """Take an entry out of the summary groups and counts."""
+        names = self._names[entry.group]
+        del names[bisect_left(names, entry.name)]
+        if entry.company.classification.is_shinsegae_affiliate:
+            self._ssg_count -= 1
+        if entry.company.classification.is_portfolio_company:
+            self._portfolio_count -= 1
+
+
+def _record_key(record: Dict[str, Any], position: int) -> str:
+    """Page ID of a record (records without one are keyed by position)."""
+    return record.get("id") or f"#{position}"
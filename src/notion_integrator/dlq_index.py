@@ -0,0 +1,358 @@
+"""DLQIndex - SQLite index over dead letter queue entries.
+
+DLQ entries are stored one JSON file per failed write (the full
+ExtractedEntitiesWithClassification payload). This index keeps the
+fields used for listing and filtering - email_id, error_type, severity,
+failed_at, retry_count - in a SQLite database next to the files, so
+listing, filtering, pagination and lookup by error ID never parse entry
+files.
+
+The index is reconciled with the directory when opened: files that are
+new (including every file on first start, i.e. migration) or changed on
+disk are parsed and indexed once, and rows whose file was removed are
+dropped.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".dlq_index.sqlite3"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    error_id      TEXT PRIMARY KEY,
+    email_id      TEXT NOT NULL,
+    error_type    TEXT NOT NULL,
+    error_message TEXT NOT NULL,
+    status_code   INTEGER,
+    severity      TEXT NOT NULL,
+    failed_at     TEXT NOT NULL,
+    retry_count   INTEGER NOT NULL,
+    mtime_ns      INTEGER NOT NULL,
+    size          INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_email_id ON entries (email_id);
+CREATE INDEX IF NOT EXISTS idx_entries_error_type ON entries (error_type);
+CREATE INDEX IF NOT EXISTS idx_entries_severity ON entries (severity);
+CREATE INDEX IF NOT EXISTS idx_entries_failed_at ON entries (failed_at);
+CREATE INDEX IF NOT EXISTS idx_entries_retry_count ON entries (retry_count);
+"""
+
+
+def classify_severity(error_type: Optional[str], status_code: Optional[int]) -> str:
+    """Determine severity level from error type and HTTP status.
+
+    Args:
+        error_type: Exception class name
+        status_code: HTTP status code, if any
+
+    Returns:
+        "warning" for retryable (network, 5xx) errors, otherwise "error"
+    """
+    error_type = error_type or ""
+
+    # Network/connection errors are warnings (retryable)
+    if "Connection" in error_type or "Timeout" in error_type:
+        return "warning"
+
+    # 4xx errors are errors (client-side issues)
+    if status_code and 400 <= status_code < 500:
+        return "error"
+
+    # 5xx errors are warnings (server-side, retryable)
+    if status_code and status_code >= 500:
+        return "warning"
+
+    # Default to error
+    return "error"
+
+
+def _timestamp(value: datetime) -> str:
+    """Fixed-width UTC ISO timestamp so text order equals time order."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat(timespec="microseconds")
+
+
+@dataclass(frozen=True)
+class DLQRecord:
+    """Indexed summary of one DLQ entry.
+
+    Attributes:
+        error_id: Entry identifier (DLQ file name without .json)
+        email_id: Email identifier of the failed write
+        error_type: Exception class name
+        error_message: Error message
+        status_code: HTTP status code, if any
+        severity: "error" or "warning" (see classify_severity)
+        failed_at: Time of the last failure (UTC)
+        retry_count: Retries attempted so far
+        file_path: Path of the entry's JSON file
+    """
+
+    error_id: str
+    email_id: str
+    error_type: str
+    error_message: str
+    status_code: Optional[int]
+    severity: str
+    failed_at: datetime
+    retry_count: int
+    file_path: str
+
+
+class DLQIndex:
+    """SQLite index of the DLQ entry files in one directory."""
+
+    def __init__(self, dlq_dir: Path):
+        """Open (creating or migrating as needed) the index for dlq_dir.
+
+        Args:
+            dlq_dir: DLQ directory holding the entry files
+        """
+        self.dlq_dir = Path(dlq_dir)
+        self.db_path = self.dlq_dir / INDEX_FILENAME
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.sync()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection committing on success."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def sync(self) -> int:
+        """Reconcile the index with the entry files on disk.
+
+        Only files that are new or whose size/mtime changed are parsed.
+
+        Returns:
+            Number of files (re)indexed
+        """
+        on_disk: Dict[str, Tuple[int, int]] = {}
+        with os.scandir(self.dlq_dir) as it:
+            for entry in it:
+                if (
+                    entry.name.endswith(".json")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ):
+                    stat = entry.stat()
+                    on_disk[entry.name[: -len(".json")]] = (stat.st_mtime_ns, stat.st_size)
+
+        with self._connect() as conn:
+            indexed = {
+                row[0]: (row[1], row[2])
+                for row in conn.execute("SELECT error_id, mtime_ns, size FROM entries")
+            }
+
+            removed = [error_id for error_id in indexed if error_id not in on_disk]
+            conn.executemany(
+                "DELETE FROM entries WHERE error_id = ?",
+                [(error_id,) for error_id in removed],
+            )
+
+            reindexed = 0
+            for error_id, stamp in on_disk.items():
+                if indexed.get(error_id) == stamp:
+                    continue
+                file_path = self.dlq_dir / f"{error_id}.json"
+                try:
+                    with open(file_path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    self._upsert(conn, error_id, data, stamp)
+                    reindexed += 1
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable DLQ file {file_path}: {e}")
+
+        if reindexed or removed:
+            logger.info(
+                f"DLQ index synced: {reindexed} indexed, {len(removed)} removed"
+            )
+        return reindexed
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, file_path: str, data: Dict[str, Any]) -> None:
+        """Index (or re-index) an entry file just written.
+
+        Args:
+            file_path: Path of the entry's JSON file
+            data: The serialized DLQEntry written to it
+        """
+        path = Path(file_path)
+        stat = path.stat()
+        with self._connect() as conn:
+            self._upsert(conn, path.stem, data, (stat.st_mtime_ns, stat.st_size))
+
+    def remove(self, error_id: str) -> None:
+        """Drop an entry from the index."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE error_id = ?", (error_id,))
+
+    @staticmethod
+    def _upsert(
+        conn: sqlite3.Connection,
+        error_id: str,
+        data: Dict[str, Any],
+        stamp: Tuple[int, int],
+    ) -> None:
+        error = data.get("error") or {}
+        error_type = error.get("error_type") or "Unknown"
+        status_code = error.get("status_code")
+        failed_at = data["failed_at"]
+        if not isinstance(failed_at, datetime):
+            failed_at = datetime.fromisoformat(str(failed_at))
+
+        conn.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                error_id,
+                data["email_id"],
+                error_type,
+                error.get("error_message") or "",
+                status_code,
+                classify_severity(error_type, status_code),
+                _timestamp(failed_at),
+                int(data.get("retry_count") or 0),
+                stamp[0],
+                stamp[1],
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get(self, error_id: str) -> Optional[DLQRecord]:
+        """Look up one entry by error ID (primary key)."""
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {self._COLUMNS} FROM entries WHERE error_id = ?", (error_id,)
+            ).fetchone()
+        return self._record(row) if row else None
+
+    def query(
+        self,
+        *,
+        email_id: Optional[str] = None,
+        error_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        since: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        min_retry_count: Optional[int] = None,
+        max_retry_count: Optional[int] = None,
+        newest_first: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[DLQRecord]:
+        """List indexed entries matching all given filters.
+
+        Args:
+            email_id: Exact email ID
+            error_type: Exact error type
+            severity: "error" or "warning"
+            since: Failed at or after this time (naive = UTC)
+            before: Failed strictly before this time (naive = UTC)
+            min_retry_count: Minimum retry count
+            max_retry_count: Maximum retry count
+            newest_first: Order by failure time descending (default ascending)
+            limit: Page size (None for all)
+            offset: Rows to skip (pagination)
+
+        Returns:
+            Matching records in failure-time order
+        """
+        where, params = self._where(
+            email_id, error_type, severity, since, before, min_retry_count, max_retry_count
+        )
+        order = "DESC" if newest_first else "ASC"
+        sql = (
+            f"SELECT {self._COLUMNS} FROM entries{where} "
+            f"ORDER BY failed_at {order}, error_id {order} LIMIT ? OFFSET ?"
+        )
+        params += [limit if limit is not None else -1, offset]
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [self._record(row) for row in rows]
+
+    def count(
+        self,
+        *,
+        email_id: Optional[str] = None,
+        error_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        since: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        min_retry_count: Optional[int] = None,
+        max_retry_count: Optional[int] = None,
+    ) -> int:
+        """Count indexed entries matching all given filters (see query())."""
+        where, params = self._where(
+            email_id, error_type, severity, since, before, min_retry_count, max_retry_count
+        )
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM entries{where}", params).fetchone()[0]
+
+    _COLUMNS = (
+        "error_id, email_id, error_type, error_message, status_code, "
+        "severity, failed_at, retry_count"
+    )
+
+    @staticmethod
+    def _where(
+        email_id, error_type, severity, since, before, min_retry_count, max_retry_count
+    ) -> Tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, op, value in (
+            ("email_id", "=", email_id),
+            ("error_type", "=", error_type),
+            ("severity", "=", severity),
+            ("failed_at", ">=", _timestamp(since) if since else None),
+            ("failed_at", "<", _timestamp(before) if before else None),
+            ("retry_count", ">=", min_retry_count),
+            ("retry_count", "<=", max_retry_count),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def _record(self, row: Tuple[Any, ...]) -> DLQRecord:
+        return DLQRecord(
+            error_id=row[0],
+            email_id=row[1],
+            error_type=row[2],
+            error_message=row[3],
+            status_code=row[4],
+            severity=row[5],
+            failed_at=datetime.fromisoformat(row[6]),
+            retry_count=row[7],
+            file_path=str(self.dlq_dir / f"{row[0]}.json"),
+        )
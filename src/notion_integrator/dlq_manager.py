@@ -1,19 +1,28 @@
 """DLQManager - Manages dead letter queue for failed Notion writes.
 
 This module provides functionality to capture, store, and retry failed write operations.
+Entries are stored one JSON file per failed write; a SQLite index (see
+dlq_index.py) serves listing, filtering and lookup without parsing them.
 """
 
+import asyncio
 import json
 import logging
+import time
 from pathlib import Path
 from datetime import datetime, UTC
-from typing import Dict, Any, List
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from llm_provider.types import DLQEntry, ExtractedEntitiesWithClassification
+from .dlq_index import DLQIndex, DLQRecord
 
 
 logger = logging.getLogger(__name__)
 
+# Entries replayed concurrently by replay_batch(); Notion calls are still
+# paced by the client's shared rate limiter
+DEFAULT_REPLAY_WORKERS = 4
+
 
 class DLQManager:
     """Manages dead letter queue for failed Notion writes."""
@@ -26,6 +35,8 @@ class DLQManager:
         """
         self.dlq_dir = Path(dlq_dir)
         self.dlq_dir.mkdir(parents=True, exist_ok=True)
+        # Opening the index indexes any files not yet in it (migration)
+        self.index = DLQIndex(self.dlq_dir)
 
     def save_failed_write(
         self,
@@ -55,16 +66,55 @@ class DLQManager:
         filename = f"{extracted_data.email_id}_{timestamp_str}.json"
         file_path = self.dlq_dir / filename
 
-        # Serialize to JSON
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(
-                dlq_entry.model_dump(), f, indent=2, ensure_ascii=False, default=str
-            )
+        self._write_entry(str(file_path), dlq_entry)
 
         logger.info(f"DLQ entry created: {file_path}")
 
         return str(file_path)
 
+    def save_quarantined_email(
+        self,
+        email_id: str,
+        error_details: Dict[str, Any],
+        original_email_content: Optional[str] = None,
+    ) -> str:
+        """Save an email the daemon gave up on (a poison message) to DLQ.
+
+        Such entries have no extracted data, so they cannot be replayed;
+        they are kept for inspection with `collabiq errors`.
+
+        Args:
+            email_id: Email message ID
+            error_details: Error information (error_type, error_message, retry_count)
+            original_email_content: Email text, if available
+
+        Returns:
+            File path to created DLQ entry
+        """
+        dlq_entry = DLQEntry(
+            email_id=email_id,
+            failed_at=datetime.now(UTC),
+            retry_count=error_details.get("retry_count", 0),
+            error=error_details,
+            original_email_content=original_email_content,
+        )
+
+        timestamp_str = dlq_entry.failed_at.strftime("%Y%m%d_%H%M%S")
+        file_path = self.dlq_dir / f"{email_id}_{timestamp_str}.json"
+
+        self._write_entry(str(file_path), dlq_entry)
+
+        logger.warning(f"Email quarantined to DLQ: {file_path}")
+
+        return str(file_path)
+
+    def _write_entry(self, file_path: str, dlq_entry: DLQEntry) -> None:
+        """Serialize an entry to its JSON file and update the index."""
+        data = dlq_entry.model_dump()
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        self.index.upsert(file_path, data)
+
     def load_dlq_entry(self, file_path: str) -> DLQEntry:
         """Load and deserialize DLQ entry from JSON file.
 
@@ -84,16 +134,39 @@ class DLQManager:
         """List all DLQ entries in the directory.
 
         Returns:
-            Sorted list of DLQ file paths (oldest first)
+            List of DLQ file paths sorted by failure time (oldest first)
+        """
+        return [record.file_path for record in self.index.query()]
+
+    def query_entries(self, **filters) -> List[DLQRecord]:
+        """List indexed entry summaries with filtering and pagination.
+
+        Accepts the keyword filters of DLQIndex.query() (email_id,
+        error_type, severity, since, before, min/max_retry_count,
+        newest_first, limit, offset). No entry files are read.
+
+        Returns:
+            Matching DLQRecords
         """
-        # Find all .json files in dlq_dir
-        dlq_files = list(self.dlq_dir.glob("*.json"))
+        return self.index.query(**filters)
 
-        # Sort by creation time (oldest first)
-        dlq_files.sort(key=lambda p: p.stat().st_ctime)
+    def count_entries(self, **filters) -> int:
+        """Count indexed entries matching DLQIndex.count() filters."""
+        return self.index.count(**filters)
 
-        # Return as string paths
-        return [str(f) for f in dlq_files]
+    def get_entry(self, error_id: str) -> Optional[DLQRecord]:
+        """Look up an entry summary by error ID (DLQ file name without .json).
+
+        Returns:
+            DLQRecord, or None if no such entry exists
+        """
+        return self.index.get(error_id)
+
+    def remove_entry(self, file_path: str) -> None:
+        """Delete an entry's file and its index row."""
+        path = Path(file_path)
+        path.unlink(missing_ok=True)
+        self.index.remove(path.stem)
 
     async def retry_failed_write(self, file_path: str, notion_writer) -> bool:
         """Retry a failed write operation from DLQ.
@@ -108,15 +181,42 @@ class DLQManager:
         # Load DLQ entry
         dlq_entry = self.load_dlq_entry(file_path)
 
+        processed_ids = self._load_processed_ids()
+        already_processed = dlq_entry.email_id in processed_ids
+        succeeded = await self._retry_entry(
+            dlq_entry, file_path, notion_writer, processed_ids
+        )
+        if succeeded and not already_processed:
+            self._save_processed_ids(processed_ids)
+        return succeeded
+
+    async def _retry_entry(
+        self,
+        dlq_entry: DLQEntry,
+        file_path: str,
+        notion_writer,
+        processed_ids: Set[str],
+    ) -> bool:
+        """Retry one loaded DLQ entry, recording success in processed_ids.
+
+        processed_ids is updated in memory only; callers persist it.
+        """
         # Check if already processed (idempotency)
-        if self.is_processed(dlq_entry.email_id):
+        if dlq_entry.email_id in processed_ids:
             logger.info(
                 f"DLQ entry {dlq_entry.email_id} already processed, skipping (idempotency check)"
             )
             # Delete the DLQ file since it's already processed
-            Path(file_path).unlink()
+            self.remove_entry(file_path)
             return True
 
+        if dlq_entry.extracted_data is None:
+            logger.warning(
+                f"DLQ entry {dlq_entry.email_id} is a quarantined email without "
+                "extracted data, nothing to replay"
+            )
+            return False
+
         logger.info(
             f"Retrying DLQ entry: {dlq_entry.email_id} (retry #{dlq_entry.retry_count + 1})"
         )
@@ -126,8 +226,8 @@ class DLQManager:
 
         if result.success:
             # Success - mark as processed and delete DLQ file
-            self._mark_processed(dlq_entry.email_id)
-            Path(file_path).unlink()
+            processed_ids.add(dlq_entry.email_id)
+            self.remove_entry(file_path)
             logger.info(f"DLQ retry succeeded: {dlq_entry.email_id} - file deleted")
             return True
         else:
@@ -144,10 +244,7 @@ class DLQManager:
             }
 
             # Overwrite file with updated entry
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    dlq_entry.model_dump(), f, indent=2, ensure_ascii=False, default=str
-                )
+            self._write_entry(file_path, dlq_entry)
 
             logger.warning(
                 f"DLQ retry failed: {dlq_entry.email_id} (retry #{dlq_entry.retry_count}) - {result.error_message}"
@@ -155,45 +252,126 @@ class DLQManager:
             return False
 
     async def replay_batch(
-        self, notion_writer, max_count: int = 10, operation_type: str = "all"
-    ) -> Dict[str, int]:
-        """Replay multiple DLQ entries in batch.
+        self,
+        notion_writer,
+        max_count: Optional[int] = 10,
+        operation_type: str = "all",
+        workers: int = DEFAULT_REPLAY_WORKERS,
+        file_paths: Optional[List[str]] = None,
+        failed_since: Optional[datetime] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Replay multiple DLQ entries concurrently.
+
+        Entries are loaded once, replayed oldest failure first by a pool of
+        workers (their Notion calls share the client's rate limiter), and
+        the processed-IDs file is written once at the end rather than per
+        entry.
 
         Args:
             notion_writer: NotionWriter instance to use for retry
-            max_count: Maximum number of entries to replay (default: 10)
+            max_count: Maximum number of entries to replay (None for all)
             operation_type: Filter by operation type (default: "all")
+            workers: Number of entries replayed concurrently
+            file_paths: Specific DLQ files to replay (default: all entries)
+            failed_since: Only replay entries that failed at or after this time
+                (naive datetimes are treated as UTC)
+            progress_callback: Called with the running stats after each entry
 
         Returns:
-            Dictionary with success/failure counts: {"succeeded": N, "failed": M}
+            Dictionary with "succeeded", "failed" and "total" counts plus
+            "elapsed_seconds" and "throughput_per_second"
         """
-        results = {"succeeded": 0, "failed": 0}
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
 
-        # Get all DLQ entries
-        dlq_files = self.list_dlq_entries()[:max_count]
+        if failed_since is not None and failed_since.tzinfo is None:
+            failed_since = failed_since.replace(tzinfo=UTC)
 
-        if not dlq_files:
-            logger.info("No DLQ entries found for replay")
-            return results
+        stats: Dict[str, Any] = {"succeeded": 0, "failed": 0}
 
-        logger.info(f"Replaying {len(dlq_files)} DLQ entries (max: {max_count})")
+        if file_paths is None:
+            # Select from the index (oldest failures first) without reading files
+            file_paths = [
+                record.file_path
+                for record in self.index.query(since=failed_since, limit=max_count)
+            ]
 
-        # Replay each entry
-        for file_path in dlq_files:
+        # Load each entry once; unreadable files count as failures
+        entries: List[Tuple[DLQEntry, str]] = []
+        for file_path in file_paths:
             try:
-                success = await self.retry_failed_write(file_path, notion_writer)
-                if success:
-                    results["succeeded"] += 1
-                else:
-                    results["failed"] += 1
+                entry = self.load_dlq_entry(file_path)
             except Exception as e:
-                logger.error(f"Error replaying DLQ entry {file_path}: {e}")
-                results["failed"] += 1
+                logger.error(f"Error loading DLQ entry {file_path}: {e}")
+                stats["failed"] += 1
+                continue
+            if failed_since is None or entry.failed_at >= failed_since:
+                entries.append((entry, file_path))
+
+        # Oldest failures first
+        entries.sort(key=lambda item: item[0].failed_at)
+        if max_count is not None:
+            entries = entries[:max_count]
+
+        stats["total"] = len(entries) + stats["failed"]
+        stats["elapsed_seconds"] = 0.0
+        stats["throughput_per_second"] = 0.0
+
+        if not entries:
+            logger.info("No DLQ entries found for replay")
+            return stats
 
         logger.info(
-            f"DLQ replay complete: {results['succeeded']} succeeded, {results['failed']} failed"
+            f"Replaying {len(entries)} DLQ entries "
+            f"(max: {max_count}, workers: {workers})"
         )
-        return results
+
+        processed_ids = self._load_processed_ids()
+        processed_before = len(processed_ids)
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in entries:
+            queue.put_nowait(item)
+        start = time.monotonic()
+
+        def record(success: bool) -> None:
+            stats["succeeded" if success else "failed"] += 1
+            elapsed = time.monotonic() - start
+            completed = stats["succeeded"] + stats["failed"]
+            stats["elapsed_seconds"] = elapsed
+            stats["throughput_per_second"] = completed / elapsed if elapsed > 0 else 0.0
+            if progress_callback:
+                progress_callback(dict(stats, completed=completed))
+
+        async def worker() -> None:
+            while True:
+                try:
+                    dlq_entry, file_path = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    success = await self._retry_entry(
+                        dlq_entry, file_path, notion_writer, processed_ids
+                    )
+                except Exception as e:
+                    logger.error(f"Error replaying DLQ entry {file_path}: {e}")
+                    success = False
+                record(success)
+
+        try:
+            await asyncio.gather(
+                *(worker() for _ in range(min(workers, len(entries))))
+            )
+        finally:
+            # Flush idempotency state once, even if replay was interrupted
+            if len(processed_ids) != processed_before:
+                self._save_processed_ids(processed_ids)
+
+        logger.info(
+            f"DLQ replay complete: {stats['succeeded']} succeeded, {stats['failed']} failed "
+            f"in {stats['elapsed_seconds']:.1f}s ({stats['throughput_per_second']:.2f}/s)"
+        )
+        return stats
 
     def is_processed(self, email_id: str) -> bool:
         """Check if an email has already been processed (idempotency check).
@@ -207,6 +385,14 @@ class DLQManager:
         processed_ids = self._load_processed_ids()
         return email_id in processed_ids
 
+    def get_processed_ids(self) -> Set[str]:
+        """Get all processed email IDs (one read for bulk idempotency checks).
+
+        Returns:
+            Set of processed email IDs
+        """
+        return self._load_processed_ids()
+
     def _mark_processed(self, email_id: str) -> None:
         """Mark an email as processed (for idempotency).
 
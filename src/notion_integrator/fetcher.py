@@ -24,6 +24,7 @@ from .exceptions import (
     NotionObjectNotFoundError,
 )
 from .logging_config import get_logger, PerformanceLogger
+from .rate_limiter import RequestPriority
 from .models import (
     DatabaseSchema,
     RelationshipGraph,
@@ -44,6 +45,7 @@ async def fetch_all_records(
     filter_conditions: Optional[Dict[str, Any]] = None,
     sorts: Optional[List[Dict[str, Any]]] = None,
     page_size: int = 100,
+    priority: RequestPriority = RequestPriority.READ,
 ) -> List[Dict[str, Any]]:
     """
     Fetch all records from a database with pagination.
@@ -54,6 +56,7 @@ async def fetch_all_records(
         filter_conditions: Optional filter conditions
         sorts: Optional sort configuration
         page_size: Records per page (default: 100, max: 100)
+        priority: Rate limiter priority class for each page request
 
     Returns:
         List of all records from database
@@ -87,6 +90,7 @@ async def fetch_all_records(
                 sorts=sorts,
                 start_cursor=start_cursor,
                 page_size=page_size,
+                priority=priority,
             )
 
             # Extract results
@@ -361,75 +365,61 @@ async def fetch_database_with_relationships(
         if cache_manager is None and use_cache:
             cache_manager = CacheManager()
 
-        # Try to get from cache first
-        cached_records = None
-        if use_cache and cache_manager:
-            cached_records = cache_manager.get_data_cache(
+        async def load() -> List[Dict[str, Any]]:
+            logger.info(
+                "Fetching data from Notion API",
+                extra={
+                    "database_id": database_id,
+                    "database_name": schema.database.title,
+                },
+            )
+
+            # Fetch all records
+            records = await fetch_all_records(
+                client=client,
                 database_id=database_id,
-                database_name=schema.database.title,
+                filter_conditions=filter_conditions,
+                sorts=sorts,
             )
 
-            if cached_records:
+            # Resolve relationships if schema has relations
+            if schema.has_relations and max_relationship_depth > 0:
                 logger.info(
-                    "Data loaded from cache",
+                    "Resolving relationships",
                     extra={
                         "database_id": database_id,
-                        "database_name": schema.database.title,
-                        "record_count": len(cached_records),
+                        "record_count": len(records),
+                        "relation_count": len(schema.relation_properties),
+                        "max_depth": max_relationship_depth,
                     },
                 )
-                return cached_records
-
-        # Cache miss - fetch from API
-        logger.info(
-            "Fetching data from Notion API",
-            extra={
-                "database_id": database_id,
-                "database_name": schema.database.title,
-            },
-        )
 
-        # Fetch all records
-        records = await fetch_all_records(
-            client=client,
-            database_id=database_id,
-            filter_conditions=filter_conditions,
-            sorts=sorts,
-        )
+                # Resolve relationships for each record
+                resolved_records = []
+                for record in records:
+                    resolved_record = await resolve_relationships(
+                        client=client,
+                        record=record,
+                        schema=schema,
+                        max_depth=max_relationship_depth,
+                        visited_pages=set(),  # Fresh set for each record
+                    )
+                    resolved_records.append(resolved_record)
 
-        # Resolve relationships if schema has relations
-        if schema.has_relations and max_relationship_depth > 0:
-            logger.info(
-                "Resolving relationships",
-                extra={
-                    "database_id": database_id,
-                    "record_count": len(records),
-                    "relation_count": len(schema.relation_properties),
-                    "max_depth": max_relationship_depth,
-                },
-            )
-
-            # Resolve relationships for each record
-            resolved_records = []
-            for record in records:
-                resolved_record = await resolve_relationships(
-                    client=client,
-                    record=record,
-                    schema=schema,
-                    max_depth=max_relationship_depth,
-                    visited_pages=set(),  # Fresh set for each record
-                )
-                resolved_records.append(resolved_record)
+                records = resolved_records
 
-            records = resolved_records
+            return records
 
-        # Cache the results
         if use_cache and cache_manager:
-            cache_manager.set_data_cache(
+            # Cached data, else one shared load (concurrent misses are
+            # de-duplicated; an expired cache may be served while it refreshes)
+            records = await cache_manager.get_or_load_data(
                 database_id=database_id,
                 database_name=schema.database.title,
-                records=records,
+                load=load,
             )
+        else:
+            records = await load()
 
         logger.info(
             "Database fetch with relationships completed",
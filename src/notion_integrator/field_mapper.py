@@ -5,7 +5,7 @@ Pydantic models to Notion API property format.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
 
@@ -55,7 +55,13 @@ class FieldMapper:
             for name, prop in properties_dict.items()
         }
 
-    async def map_to_notion_properties_async(self, extracted_data) -> Dict[str, Any]:
+    async def map_to_notion_properties_async(
+        self,
+        extracted_data,
+        company_candidates: Optional[List[Tuple[str, str]]] = None,
+        users: Optional[List[Any]] = None,
+        company_matches: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """Map ExtractedEntitiesWithClassification to Notion properties format with async fuzzy matching.
 
         This async version performs fuzzy matching for company names and person names before mapping.
@@ -63,41 +69,109 @@ class FieldMapper:
 
         Args:
             extracted_data: ExtractedEntitiesWithClassification instance
+            company_candidates: Optional shared (page_id, name) snapshot to match
+                against instead of loading from companies_cache. Companies
+                auto-created during matching are appended to it.
+            users: Optional shared workspace user snapshot for person matching
+            company_matches: Optional CompanyMatch per normalized company name,
+                pre-matched for a whole batch (see NotionWriter), used before
+                matching again
 
         Returns:
             Dict of Notion properties ready for API submission
         """
         # Perform fuzzy matching for companies if matcher is available
         if self.company_matcher and self.companies_cache:
-            await self._match_and_populate_companies(extracted_data)
+            await self._match_and_populate_companies(
+                extracted_data, company_candidates, company_matches
+            )
 
         # Perform person matching if matcher is available
         if self.person_matcher:
-            await self._match_and_populate_person(extracted_data)
+            await self._match_and_populate_person(extracted_data, users)
 
         # Use sync version for the actual mapping
         return self.map_to_notion_properties(extracted_data)
 
-    async def _match_and_populate_companies(self, extracted_data) -> None:
+    async def _load_company_candidates(self):
+        """Load company candidates, as a prebuilt CompanyIndex when available.
+
+        Returns a private copy, so auto-created companies can be appended
+        without touching the cache's snapshot. The copy shares the cached
+        index until an append (CompanyIndex.copy() is copy-on-write), so
+        this costs nothing per email.
+        """
+        from .companies_cache import CompaniesCache
+
+        if isinstance(self.companies_cache, CompaniesCache):
+            return (await self.companies_cache.get_index()).copy()
+        return list(await self.companies_cache.get_companies())
+
+    async def _match_company(
+        self,
+        company_name: str,
+        candidates,
+        company_matches: Optional[Dict[str, Any]] = None,
+    ):
+        """Match one company name, through match_async() when the matcher has it.
+
+        Matchers that may call an LLM (HybridMatcher, LLMMatcher) only work
+        asynchronously inside the event loop.
+
+        A pre-matched result is used as is, except a "none" result for a
+        name a company was since created under (e.g. by an earlier item of
+        the batch), which then resolves to that company.
+        """
+        from .fuzzy_matcher import CompanyIndex, normalize_company_name
+
+        prematched = (company_matches or {}).get(normalize_company_name(company_name))
+        if prematched is not None:
+            if prematched.match_type != "none":
+                return prematched
+            if not CompanyIndex.from_candidates(candidates).exact(
+                normalize_company_name(company_name)
+            ):
+                return prematched
+
+        if hasattr(self.company_matcher, "match_async"):
+            return await self.company_matcher.match_async(
+                company_name,
+                candidates,
+                auto_create=True,
+                similarity_threshold=0.85,
+            )
+        return self.company_matcher.match(
+            company_name=company_name,
+            candidates=candidates,
+            auto_create=True,
+            similarity_threshold=0.85,
+        )
+
+    async def _match_and_populate_companies(
+        self,
+        extracted_data,
+        candidates: Optional[List[Tuple[str, str]]] = None,
+        company_matches: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """Match extracted company names to Companies database and populate IDs.
 
         Args:
             extracted_data: ExtractedEntitiesWithClassification instance (modified in place)
+            candidates: Optional shared candidate snapshot (see map_to_notion_properties_async)
+            company_matches: Optional pre-matched results (see map_to_notion_properties_async)
         """
         # Get company candidates from cache
-        candidates = await self.companies_cache.get_companies()
+        if candidates is None:
+            candidates = await self._load_company_candidates()
 
         # Match startup_name to 스타트업명
         if extracted_data.startup_name and not extracted_data.matched_company_id:
-            match_result = self.company_matcher.match(
-                company_name=extracted_data.startup_name,
-                candidates=candidates,
-                auto_create=True,
-                similarity_threshold=0.85,
+            match_result = await self._match_company(
+                extracted_data.startup_name, candidates, company_matches
             )
 
             # Handle match result
-            if match_result.match_type in ["exact", "fuzzy"]:
+            if match_result.match_type in ["exact", "fuzzy", "semantic"]:
                 # Match found
                 extracted_data.matched_company_id = match_result.page_id
                 logger.info(
@@ -131,8 +205,12 @@ class FieldMapper:
                             f"New company created: '{match_result.company_name}' (page_id: {new_page_id})"
                         )
 
-                        # Invalidate cache so next fetch includes new company
-                        self.companies_cache.invalidate_cache()
+                        # Add to cache so next fetch includes new company
+                        self.companies_cache.upsert_company(
+                            new_page_id, match_result.company_name
+                        )
+                        # Make it matchable for the rest of this email/batch
+                        candidates.append((new_page_id, match_result.company_name))
                     else:
                         logger.error(
                             f"Failed to create company: '{match_result.company_name}'"
@@ -145,14 +223,11 @@ class FieldMapper:
 
         # Match partner_org to 협업기관 (same logic)
         if extracted_data.partner_org and not extracted_data.matched_partner_id:
-            match_result = self.company_matcher.match(
-                company_name=extracted_data.partner_org,
-                candidates=candidates,
-                auto_create=True,
-                similarity_threshold=0.85,
+            match_result = await self._match_company(
+                extracted_data.partner_org, candidates, company_matches
             )
 
-            if match_result.match_type in ["exact", "fuzzy"]:
+            if match_result.match_type in ["exact", "fuzzy", "semantic"]:
                 extracted_data.matched_partner_id = match_result.page_id
                 logger.info(
                     f"Partner matched: '{extracted_data.partner_org}' → '{match_result.company_name}' "
@@ -183,25 +258,34 @@ class FieldMapper:
                         logger.info(
                             f"New partner created: '{match_result.company_name}' (page_id: {new_page_id})"
                         )
-                        self.companies_cache.invalidate_cache()
+                        self.companies_cache.upsert_company(
+                            new_page_id, match_result.company_name
+                        )
+                        # Make it matchable for the rest of this email/batch
+                        candidates.append((new_page_id, match_result.company_name))
                     else:
                         logger.error(
                             f"Failed to create partner: '{match_result.company_name}'"
                         )
 
-    async def _match_and_populate_person(self, extracted_data) -> None:
+    async def _match_and_populate_person(
+        self, extracted_data, users: Optional[List[Any]] = None
+    ) -> None:
         """Match extracted person name to Notion workspace users and populate ID.
 
         Args:
             extracted_data: ExtractedEntitiesWithClassification instance (modified in place)
+            users: Optional shared workspace user snapshot
         """
         # Match person_in_charge to 담당자
         if extracted_data.person_in_charge and not extracted_data.matched_person_id:
             # Use async matching if available, otherwise sync fallback (though unlikely in this context)
             if hasattr(self.person_matcher, "match_async"):
+                snapshot = {"users": users} if users is not None else {}
                 match_result = await self.person_matcher.match_async(
                     person_name=extracted_data.person_in_charge,
                     similarity_threshold=0.70,
+                    **snapshot,
                 )
             else:
                 match_result = self.person_matcher.match(
@@ -30,6 +30,16 @@ from .models import (
 
 logger = get_logger(__name__)
 
+# Markdown summary groups, in rendering order
+SUMMARY_GROUPS = ("both", "ssg", "portfolio", "other")
+
+_SUMMARY_HEADINGS = {
+    "both": "## Both SSG & Portfolio Companies\n",
+    "ssg": "## Shinsegae Affiliates\n",
+    "portfolio": "## Portfolio Companies\n",
+    "other": "## Other Companies\n",
+}
+
 
 # ==============================================================================
 # Classification Field Extraction
@@ -290,75 +300,88 @@ def generate_markdown_summary(
         return "# Companies\n\nNo companies found.\n"
 
     # Group by classification
-    ssg_only = []
-    portfolio_only = []
-    both = []
-    neither = []
-
+    names_by_group: Dict[str, List[str]] = {group: [] for group in SUMMARY_GROUPS}
     for record in records:
-        name = extract_title(record)
-        properties = record.get("properties", {})
-
-        # Check classification flags
-        is_ssg = False
-        is_portfolio = False
-
-        for prop_name, prop_data in properties.items():
-            if (
-                prop_name.lower() == "shinsegae affiliates?"
-                and prop_data.get("type") == "checkbox"
-            ):
-                is_ssg = prop_data.get("checkbox", False)
-            if (
-                prop_name.lower() == "is portfolio?"
-                and prop_data.get("type") == "checkbox"
-            ):
-                is_portfolio = prop_data.get("checkbox", False)
-
-        # Categorize
-        if is_ssg and is_portfolio:
-            both.append((name, record))
-        elif is_ssg:
-            ssg_only.append((name, record))
-        elif is_portfolio:
-            portfolio_only.append((name, record))
-        else:
-            neither.append((name, record))
-
-    # Generate Markdown
+        names_by_group[classify_summary_group(record)].append(extract_title(record))
+
+    for names in names_by_group.values():
+        names.sort()
+
+    return render_markdown_summary(names_by_group, len(records))
+
+
+def classify_summary_group(record: Dict[str, Any]) -> str:
+    """
+    Determine which Markdown summary group a Notion page belongs to.
+
+    Args:
+        record: Notion page record
+
+    Returns:
+        One of SUMMARY_GROUPS: "both", "ssg", "portfolio" or "other"
+    """
+    properties = record.get("properties", {})
+
+    # Check classification flags
+    is_ssg = False
+    is_portfolio = False
+
+    for prop_name, prop_data in properties.items():
+        if (
+            prop_name.lower() == "shinsegae affiliates?"
+            and prop_data.get("type") == "checkbox"
+        ):
+            is_ssg = prop_data.get("checkbox", False)
+        if (
+            prop_name.lower() == "is portfolio?"
+            and prop_data.get("type") == "checkbox"
+        ):
+            is_portfolio = prop_data.get("checkbox", False)
+
+    # Categorize
+    if is_ssg and is_portfolio:
+        return "both"
+    if is_ssg:
+        return "ssg"
+    if is_portfolio:
+        return "portfolio"
+    return "other"
+
+
+def render_markdown_summary(names_by_group: Dict[str, List[str]], total: int) -> str:
+    """
+    Render the Markdown summary from already sorted company names per group.
+
+    Args:
+        names_by_group: Sorted company names keyed by SUMMARY_GROUPS
+        total: Total number of companies
+
+    Returns:
+        Markdown-formatted summary string
+    """
+    if not total:
+        return "# Companies\n\nNo companies found.\n"
+
     lines = ["# Companies Summary\n"]
 
-    if both:
-        lines.append("## Both SSG & Portfolio Companies\n")
-        for name, _ in sorted(both, key=lambda x: x[0]):
-            lines.append(f"- {name}")
-        lines.append("")
-
-    if ssg_only:
-        lines.append("## Shinsegae Affiliates\n")
-        for name, _ in sorted(ssg_only, key=lambda x: x[0]):
-            lines.append(f"- {name}")
-        lines.append("")
-
-    if portfolio_only:
-        lines.append("## Portfolio Companies\n")
-        for name, _ in sorted(portfolio_only, key=lambda x: x[0]):
-            lines.append(f"- {name}")
-        lines.append("")
-
-    if neither:
-        lines.append("## Other Companies\n")
-        for name, _ in sorted(neither, key=lambda x: x[0]):
-            lines.append(f"- {name}")
-        lines.append("")
+    for group in SUMMARY_GROUPS:
+        names = names_by_group.get(group)
+        if names:
+            lines.append(_SUMMARY_HEADINGS[group])
+            lines.extend(f"- {name}" for name in names)
+            lines.append("")
+
+    both = len(names_by_group.get("both", ()))
+    ssg_only = len(names_by_group.get("ssg", ()))
+    portfolio_only = len(names_by_group.get("portfolio", ()))
 
     # Add counts
     lines.append("---\n")
-    lines.append(f"**Total**: {len(records)} companies")
+    lines.append(f"**Total**: {total} companies")
     if both or ssg_only:
-        lines.append(f"- **SSG Affiliates**: {len(both) + len(ssg_only)}")
+        lines.append(f"- **SSG Affiliates**: {both + ssg_only}")
     if both or portfolio_only:
-        lines.append(f"- **Portfolio**: {len(both) + len(portfolio_only)}")
+        lines.append(f"- **Portfolio**: {both + portfolio_only}")
 
     return "\n".join(lines)
 
@@ -5,13 +5,35 @@ This module provides interfaces and implementations for matching extracted
 company names to the Notion Companies database using fuzzy string matching.
 """
 
+import asyncio
+import json
+import logging
+import re
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import Counter
+from collections.abc import Sequence
+from itertools import chain, count
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from models.matching import CompanyMatch
 
+if TYPE_CHECKING:
+    from notion_integrator.match_memo import MatchMemo
+
+logger = logging.getLogger(__name__)
+
+# Candidates shortlisted per name for LLM disambiguation
+LLM_SHORTLIST_SIZE = 10
+
+# Best fuzzy score from which HybridMatcher asks the LLM
+LLM_FALLBACK_THRESHOLD = 0.70
+
+# Score range of semantic (LLM) matches, see CompanyMatch
+SEMANTIC_MIN_SCORE = 0.70
+SEMANTIC_MAX_SCORE = 0.99
+
 
 def normalize_company_name(name: str) -> str:
     """
@@ -46,6 +68,11 @@ def normalize_for_matching(name: str) -> str:
     1. Removes parentheticals: "웨이크(산스)" → "웨이크"
     2. Normalizes Korean character variants: "네트워크" ↔ "네트웍"
 
+    This form is used for scoring (normalized-exact lookup and fuzz.ratio).
+    The jamo grams of company_name_grams() only decide which candidates are
+    scored, so they do not replace step 2: scores are still compared
+    syllable by syllable, and 네트워크/네트웍스 must stay an exact match.
+
     Args:
         name: Normalized company name
 
@@ -63,13 +90,438 @@ def normalize_for_matching(name: str) -> str:
     normalized = without_parens
 
     # 워크 (work) ↔ 웍 (same pronunciation, different spelling)
-    # Common in "네트워크" (network) variations
+    # Common in "네트워크" (network) variations. Blocking grams need no such
+    # rule (jamo already overlap); this lets the variants score as exact.
     normalized = normalized.replace("워크", "웍")
     normalized = normalized.replace("웍스", "웍")  # 웍스 → 웍 for matching
 
     return normalized
 
 
+def _has_parens(name: str) -> bool:
+    return "(" in name or ")" in name
+
+
+_HANGUL_FIRST = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+# Characters ignored when building blocking grams (spacing, punctuation)
+_GRAM_IGNORED = re.compile(r"[\s()\[\]{}.,&/\-_'\"·]+")
+
+
+def decompose_hangul(text: str) -> str:
+    """
+    Decompose precomposed Hangul syllables into conjoining jamo.
+
+    "웍" becomes "ᄋ ᅯ ᆨ" (without spaces), so "네트웍" and "네트워크"
+    share their leading jamo instead of differing in the last syllable.
+    Other characters are returned unchanged.
+
+    Args:
+        text: Any text
+
+    Returns:
+        Text with every Hangul syllable replaced by its 2-3 jamo
+    """
+    parts = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_FIRST <= code <= _HANGUL_LAST:
+            index = code - _HANGUL_FIRST
+            parts.append(chr(0x1100 + index // 588))
+            parts.append(chr(0x1161 + (index % 588) // 28))
+            if index % 28:
+                parts.append(chr(0x11A7 + index % 28))
+        else:
+            parts.append(char)
+    return "".join(parts)
+
+
+def company_name_grams(name: str) -> frozenset[str]:
+    """
+    Blocking grams for a company name: jamo trigrams of the padded name.
+
+    Case, spacing and punctuation are ignored, and Hangul is decomposed
+    into jamo first, so spelling variants like 네트워크/네트웍 and
+    "웨이크(산스)"/"웨이크" still share most grams. Grams only select
+    candidates for scoring; scores use normalize_for_matching() forms.
+
+    Args:
+        name: Company name
+
+    Returns:
+        Set of 3-character grams (empty for names with no usable characters)
+    """
+    text = decompose_hangul(_GRAM_IGNORED.sub("", name).lower())
+    if not text:
+        return frozenset()
+    padded = f"\x02{text}\x03"
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+# Indexes smaller than this are scored in full (one batch pass is cheap)
+BLOCKING_MIN_CANDIDATES = 200
+
+# Fraction of the smaller gram set a candidate must share with the query
+MIN_GRAM_OVERLAP = 0.3
+
+# Source of CompanyIndex.version values (unique per process)
+_index_versions = count(1)
+
+
+class CompanyIndex(Sequence):
+    """
+    Precomputed matching index over Companies database candidates.
+
+    Candidate names are normalized once when added, instead of on every
+    match call. Exact and normalized-exact matches are hash lookups, and
+    fuzzy scoring runs as one rapidfuzz batch pass per scorer with
+    score_cutoff, rather than a Python loop over all candidates.
+
+    Large indexes add a blocking stage: an inverted index from jamo
+    trigrams (see company_name_grams) to candidates selects those sharing
+    enough grams with the query, and only these are scored.
+
+    The index is a sequence of (page_id, company_name) tuples, so it can be
+    passed anywhere a candidates list is expected. append() adds a company
+    (e.g. one just auto-created) without rebuilding the index.
+
+    version identifies the candidate snapshot: it is unique per process,
+    changes on every append(), and is kept by copy(), so match results can
+    be memoized per (name, version) (see MatchMemo).
+
+    Candidates with blank names are kept for position but never match.
+    """
+
+    def __init__(
+        self,
+        candidates: Iterable[tuple[str, str]] = (),
+        *,
+        blocking_min_candidates: Optional[int] = BLOCKING_MIN_CANDIDATES,
+        min_gram_overlap: float = MIN_GRAM_OVERLAP,
+    ):
+        """
+        Build index from candidates.
+
+        Args:
+            candidates: (page_id, company_name) tuples from Companies database
+            blocking_min_candidates: Index size from which queries are
+                pre-filtered by shared grams (None disables blocking)
+            min_gram_overlap: Fraction (0.0-1.0) of the smaller of the query's
+                and candidate's gram sets that must be shared to be scored
+        """
+        self.blocking_min_candidates = blocking_min_candidates
+        self.min_gram_overlap = min_gram_overlap
+
+        self._candidates: List[tuple[str, str]] = []
+        # Aligned with _candidates; None for blank names (skipped by rapidfuzz)
+        self._names: List[Optional[str]] = []
+        self._matching_names: List[Optional[str]] = []
+        self._has_parens: List[bool] = []
+        self._gram_counts: List[int] = []
+        # Candidates containing parentheses (partial_ratio applies to these)
+        self._paren_positions: List[int] = []
+        # name -> first position (first occurrence wins, as in a linear scan)
+        self._exact: Dict[str, int] = {}
+        self._normalized_exact: Dict[str, int] = {}
+        # gram -> positions of candidates containing it
+        self._postings: Dict[str, List[int]] = {}
+        # True while the structures above are shared with a copy()
+        self._shared = False
+        self.version = next(_index_versions)
+
+        for candidate in candidates:
+            self.append(candidate)
+
+    @classmethod
+    def from_candidates(cls, candidates: Iterable[tuple[str, str]]) -> "CompanyIndex":
+        """Return candidates as an index, building one only if needed."""
+        if isinstance(candidates, cls):
+            return candidates
+        return cls(candidates)
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def __getitem__(self, item):
+        return self._candidates[item]
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return iter(self._candidates)
+
+    def append(self, candidate: tuple[str, str]) -> None:
+        """
+        Add a candidate to the index.
+
+        Args:
+            candidate: (page_id, company_name) tuple
+        """
+        if self._shared:
+            self._unshare()
+        page_id, candidate_name = candidate
+        position = len(self._candidates)
+        self._candidates.append((page_id, candidate_name))
+        self.version = next(_index_versions)
+
+        name = (candidate_name or "").strip()
+        if not name:
+            self._names.append(None)
+            self._matching_names.append(None)
+            self._has_parens.append(False)
+            self._gram_counts.append(0)
+            return
+
+        matching_name = normalize_for_matching(name)
+        self._names.append(name)
+        self._matching_names.append(matching_name)
+        self._has_parens.append(_has_parens(name))
+        self._exact.setdefault(name, position)
+        self._normalized_exact.setdefault(matching_name, position)
+        if self._has_parens[position]:
+            self._paren_positions.append(position)
+
+        grams = company_name_grams(name)
+        self._gram_counts.append(len(grams))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(position)
+
+    def copy(self) -> "CompanyIndex":
+        """
+        Return an independent copy (appends do not affect this index).
+
+        Copying is O(1): both indexes share their structures until either
+        one is appended to, which then copies them (copy-on-write). Callers
+        can take a private copy of a shared index per email for free.
+        """
+        clone = CompanyIndex(
+            blocking_min_candidates=self.blocking_min_candidates,
+            min_gram_overlap=self.min_gram_overlap,
+        )
+        clone._candidates = self._candidates
+        clone._names = self._names
+        clone._matching_names = self._matching_names
+        clone._has_parens = self._has_parens
+        clone._gram_counts = self._gram_counts
+        clone._paren_positions = self._paren_positions
+        clone._exact = self._exact
+        clone._normalized_exact = self._normalized_exact
+        clone._postings = self._postings
+        clone._shared = self._shared = True
+        clone.version = self.version
+        return clone
+
+    def _unshare(self) -> None:
+        """Take private copies of structures shared with a copy()."""
+        self._candidates = list(self._candidates)
+        self._names = list(self._names)
+        self._matching_names = list(self._matching_names)
+        self._has_parens = list(self._has_parens)
+        self._gram_counts = list(self._gram_counts)
+        self._paren_positions = list(self._paren_positions)
+        self._exact = dict(self._exact)
+        self._normalized_exact = dict(self._normalized_exact)
+        self._postings = {gram: list(p) for gram, p in self._postings.items()}
+        self._shared = False
+
+    def exact(self, normalized_name: str) -> Optional[tuple[str, str]]:
+        """
+        Look up exact match (case-sensitive).
+
+        Args:
+            normalized_name: Normalized extracted company name
+
+        Returns:
+            (page_id, company_name) if exact match found, None otherwise
+        """
+        position = self._exact.get(normalized_name)
+        return self._candidates[position] if position is not None else None
+
+    def block(self, normalized_name: str) -> Optional[List[int]]:
+        """
+        Select candidates sharing enough grams with the query.
+
+        Args:
+            normalized_name: Normalized extracted company name
+
+        Returns:
+            Sorted candidate positions, or None when blocking does not apply
+            (index below blocking_min_candidates, or a query without grams)
+        """
+        if (
+            self.blocking_min_candidates is None
+            or len(self._candidates) < self.blocking_min_candidates
+        ):
+            return None
+
+        query_grams = company_name_grams(normalized_name)
+        if not query_grams:
+            return None
+
+        shared = Counter(
+            chain.from_iterable(self._postings.get(gram, ()) for gram in query_grams)
+        )
+        query_count = len(query_grams)
+        overlap = self.min_gram_overlap
+        gram_counts = self._gram_counts
+        return sorted(
+            position
+            for position, count in shared.items()
+            if count >= overlap * min(query_count, gram_counts[position])
+        )
+
+    def best_match(
+        self, normalized_name: str, threshold: float
+    ) -> Optional[tuple[str, str, float]]:
+        """
+        Find the best fuzzy match at or above threshold.
+
+        Scores each candidate as the maximum of:
+        1. fuzz.ratio() on the names
+        2. fuzz.partial_ratio() when either name has parentheses
+        3. 1.0 when the names are equal after normalize_for_matching()
+        4. fuzz.ratio() on the normalize_for_matching() forms
+
+        The highest score wins; ties go to the earliest candidate. On large
+        indexes only candidates selected by block() are scored.
+
+        Args:
+            normalized_name: Normalized extracted company name
+            threshold: Minimum similarity score (0.0-1.0)
+
+        Returns:
+            (page_id, company_name, similarity_score) if match found, None otherwise
+        """
+        matching_name = normalize_for_matching(normalized_name)
+        positions = self.block(normalized_name)
+
+        # Strategy 3 as a hash lookup. Only a partial_ratio of 100 on an
+        # earlier candidate can tie with it.
+        position = self._normalized_exact.get(matching_name)
+        if position is not None:
+            tied = self._partial_scores(normalized_name, positions, 100.0)
+            position = min([position, *tied])
+            return (*self._candidates[position], 1.0)
+
+        # Scores are compared on the 0-100 scale; the small margin keeps
+        # candidates whose score/100 equals threshold despite float rounding.
+        cutoff = max(threshold * 100.0 - 1e-6, 0.0)
+        scores = self._scores(normalized_name, matching_name, positions, cutoff)
+
+        if not scores:
+            return None
+        position = min(scores, key=lambda p: (-scores[p], p))
+        similarity = scores[position] / 100.0
+        if similarity > 0.0 and similarity >= threshold:
+            return (*self._candidates[position], similarity)
+        return None
+
+    def rank(
+        self, normalized_name: str, limit: int = 10
+    ) -> List[tuple[str, str, float]]:
+        """
+        Rank candidates by best_match() score, e.g. to shortlist for an LLM.
+
+        Args:
+            normalized_name: Normalized extracted company name
+            limit: Maximum number of candidates returned
+
+        Returns:
+            Up to limit (page_id, company_name, similarity_score) tuples with
+            a score above 0, best first (ties in index order)
+        """
+        matching_name = normalize_for_matching(normalized_name)
+        positions = self.block(normalized_name)
+        scores = self._scores(normalized_name, matching_name, positions, 0.0)
+
+        position = self._normalized_exact.get(matching_name)
+        if position is not None:
+            scores[position] = 100.0
+
+        ranked = sorted(
+            (p for p, score in scores.items() if score > 0.0),
+            key=lambda p: (-scores[p], p),
+        )
+        return [(*self._candidates[p], scores[p] / 100.0) for p in ranked[:limit]]
+
+    def _scores(
+        self,
+        normalized_name: str,
+        matching_name: str,
+        positions: Optional[List[int]],
+        cutoff: float,
+    ) -> Dict[int, float]:
+        """Best ratio/partial_ratio score (0-100) per candidate at or above cutoff."""
+        if positions is None:
+            names, matching_names = self._names, self._matching_names
+        else:
+            names = [self._names[p] for p in positions]
+            matching_names = [self._matching_names[p] for p in positions]
+
+        scores: Dict[int, float] = {}
+        for query, choices in (
+            (normalized_name, names),
+            (matching_name, matching_names),
+        ):
+            for position, score in _extract(
+                query, choices, positions, fuzz.ratio, cutoff
+            ):
+                if score > scores.get(position, 0.0):
+                    scores[position] = score
+        for position, score in self._partial_scores(
+            normalized_name, positions, cutoff
+        ).items():
+            if score > scores.get(position, 0.0):
+                scores[position] = score
+        return scores
+
+    def _partial_scores(
+        self,
+        normalized_name: str,
+        positions: Optional[List[int]],
+        cutoff: float,
+    ) -> Dict[int, float]:
+        """partial_ratio scores (0-100) for candidates where it applies.
+
+        Only used when one side has parentheses, so "스타트업" does not
+        match "스타트업A" at 1.0. positions restricts scoring to a block.
+        """
+        if _has_parens(normalized_name):
+            if positions is None:
+                positions = range(len(self._candidates))
+        elif positions is None:
+            positions = self._paren_positions
+        else:
+            positions = [p for p in positions if self._has_parens[p]]
+
+        choices = [self._names[p] for p in positions]
+        return dict(
+            _extract(normalized_name, choices, positions, fuzz.partial_ratio, cutoff)
+        )
+
+
+def _extract(
+    query: str,
+    choices: List[Optional[str]],
+    positions: Optional[Sequence],
+    scorer,
+    cutoff: float,
+) -> Iterator[tuple[int, float]]:
+    """Yield (candidate position, score) for choices scoring at least cutoff.
+
+    positions maps choice indexes back to candidate positions (None when
+    choices are all candidates).
+    """
+    for _, score, i in process.extract(
+        query,
+        choices,
+        scorer=scorer,
+        processor=None,
+        limit=None,
+        score_cutoff=cutoff,
+    ):
+        yield (positions[i] if positions is not None else i), score
+
+
 class CompanyMatcher(ABC):
     """
     Abstract interface for company name matching algorithms.
@@ -118,8 +570,20 @@ class RapidfuzzMatcher(CompanyMatcher):
     Note: This matcher signals when company creation is needed (returns match_type="none"
     with company_name set). The actual creation is handled by NotionWriter.create_company()
     which should be called by the integration layer (FieldMapper) when it detects this signal.
+
+    With a MatchMemo, results (including "no match") are memoized per
+    normalized name and candidate index version.
     """
 
+    def __init__(self, memo: Optional["MatchMemo"] = None):
+        """
+        Initialize RapidfuzzMatcher.
+
+        Args:
+            memo: Optional MatchMemo shared with other matchers
+        """
+        self.memo = memo
+
     def _find_exact_match(
         self, normalized_name: str, candidates: List[tuple[str, str]]
     ) -> Optional[tuple[str, str]]:
@@ -128,16 +592,12 @@ class RapidfuzzMatcher(CompanyMatcher):
 
         Args:
             normalized_name: Normalized extracted company name
-            candidates: List of (page_id, company_name) tuples
+            candidates: List of (page_id, company_name) tuples or a CompanyIndex
 
         Returns:
             (page_id, company_name) if exact match found, None otherwise
         """
-        for page_id, candidate_name in candidates:
-            normalized_candidate = normalize_company_name(candidate_name)
-            if normalized_name == normalized_candidate:
-                return (page_id, candidate_name)
-        return None
+        return CompanyIndex.from_candidates(candidates).exact(normalized_name)
 
     def _find_fuzzy_match(
         self,
@@ -153,66 +613,19 @@ class RapidfuzzMatcher(CompanyMatcher):
         2. partial_ratio() for parenthetical cases like "웨이크(산스)" → "웨이크"
         3. Parenthetical normalization for exact matching after removal
 
-        Takes the maximum score across all strategies.
+        Takes the maximum score across all strategies (see CompanyIndex.best_match).
 
         Args:
             normalized_name: Normalized extracted company name
-            candidates: List of (page_id, company_name) tuples
+            candidates: List of (page_id, company_name) tuples or a CompanyIndex
             threshold: Minimum similarity score (0.0-1.0)
 
         Returns:
             (page_id, company_name, similarity_score) if match found, None otherwise
         """
-        best_match = None
-        best_score = 0.0
-
-        # Normalize for matching (remove parentheticals)
-        matching_name = normalize_for_matching(normalized_name)
-
-        for page_id, candidate_name in candidates:
-            normalized_candidate = normalize_company_name(candidate_name)
-            matching_candidate = normalize_for_matching(normalized_candidate)
-
-            # Strategy 1: Standard ratio (handles spacing, minor variations)
-            score_ratio = fuzz.ratio(normalized_name, normalized_candidate) / 100.0
-
-            # Strategy 2: Partial ratio (ONLY for parentheticals)
-            # Only use if one string has parentheses (indicates likely parenthetical case)
-            # This prevents "스타트업" matching "스타트업A" at 1.0
-            use_partial = (
-                "(" in normalized_name
-                or ")" in normalized_name
-                or "(" in normalized_candidate
-                or ")" in normalized_candidate
-            )
-            score_partial = (
-                fuzz.partial_ratio(normalized_name, normalized_candidate) / 100.0
-                if use_partial
-                else 0.0
-            )
-
-            # Strategy 3: Exact match after parenthetical removal
-            score_normalized = 1.0 if matching_name == matching_candidate else 0.0
-
-            # Strategy 4: Ratio on normalized forms (for Korean variants)
-            score_normalized_fuzzy = (
-                fuzz.ratio(matching_name, matching_candidate) / 100.0
-            )
-
-            # Take the maximum score across all strategies
-            similarity = max(
-                score_ratio, score_partial, score_normalized, score_normalized_fuzzy
-            )
-
-            if similarity > best_score:
-                best_score = similarity
-                best_match = (page_id, candidate_name, similarity)
-
-        # Return best match if it meets threshold
-        if best_match and best_score >= threshold:
-            return best_match
-
-        return None
+        return CompanyIndex.from_candidates(candidates).best_match(
+            normalized_name, threshold
+        )
 
     def _compute_confidence_level(self, similarity_score: float) -> str:
         """
@@ -261,7 +674,8 @@ class RapidfuzzMatcher(CompanyMatcher):
 
         Args:
             company_name: Extracted company name (will be normalized: trim whitespace)
-            candidates: List of (page_id, company_name) from Companies database
+            candidates: List of (page_id, company_name) from Companies database,
+                or a prebuilt CompanyIndex (avoids re-normalizing candidates per call)
             auto_create: Create new company if no match found (default: True)
             similarity_threshold: Minimum similarity for match (default: 0.85)
 
@@ -285,6 +699,36 @@ class RapidfuzzMatcher(CompanyMatcher):
         # Normalize company name (raises ValueError if empty)
         normalized_name = normalize_company_name(company_name)
 
+        # Index plain candidate lists once for both lookups
+        candidates = CompanyIndex.from_candidates(candidates)
+
+        if self.memo is None:
+            return self._match_normalized(
+                normalized_name, candidates, auto_create, similarity_threshold
+            )
+
+        key = (
+            "rapidfuzz",
+            normalized_name,
+            candidates.version,
+            similarity_threshold,
+            auto_create,
+        )
+        return self.memo.get_or_compute(
+            key,
+            lambda: self._match_normalized(
+                normalized_name, candidates, auto_create, similarity_threshold
+            ),
+        )
+
+    def _match_normalized(
+        self,
+        normalized_name: str,
+        candidates: CompanyIndex,
+        auto_create: bool,
+        similarity_threshold: float,
+    ) -> CompanyMatch:
+        """Run exact, then fuzzy matching for an already normalized name."""
         # Step 1: Search for exact match
         exact_match = self._find_exact_match(normalized_name, candidates)
         if exact_match:
@@ -367,27 +811,48 @@ class LLMMatcher(CompanyMatcher):
     - Different naming conventions
     - Complex name transformations
 
+    Names are disambiguated in batches: match_many() resolves all names of
+    an email (or a whole processing cycle) with a single
+    LLMOrchestrator.generate_text() call returning JSON. Each name is sent
+    with a shortlist of the candidates ranked highest by CompanyIndex.rank(),
+    not an arbitrary slice of the database.
+
     Trade-offs:
     - Higher accuracy on ambiguous cases
     - Slower than character-based matching
     - Higher cost per match (LLM API calls)
     - Requires LLM orchestrator
 
+    With a MatchMemo, results against a CompanyIndex are memoized per
+    normalized name and index version, so repeated names skip the LLM call.
+    Results of failed LLM calls are not memoized.
+
     Example:
         >>> from llm_orchestrator.orchestrator import LLMOrchestrator
-        >>> orchestrator = LLMOrchestrator()
+        >>> orchestrator = LLMOrchestrator.from_config(config)
         >>> matcher = LLMMatcher(orchestrator)
-        >>> result = matcher.match("SANS Group", candidates, similarity_threshold=0.70)
+        >>> results = await matcher.match_many(["SANS Group", "SSG"], candidates)
+        >>> results["SSG"].page_id
     """
 
-    def __init__(self, llm_orchestrator):
+    def __init__(
+        self,
+        llm_orchestrator,
+        memo: Optional["MatchMemo"] = None,
+        *,
+        shortlist_size: int = LLM_SHORTLIST_SIZE,
+    ):
         """
         Initialize LLMMatcher with LLM orchestrator.
 
         Args:
             llm_orchestrator: LLMOrchestrator instance for semantic matching
+            memo: Optional MatchMemo shared with other matchers
+            shortlist_size: Candidates sent to the LLM per name (default: 10)
         """
         self.llm_orchestrator = llm_orchestrator
+        self.memo = memo
+        self.shortlist_size = shortlist_size
 
     def match(
         self,
@@ -400,12 +865,8 @@ class LLMMatcher(CompanyMatcher):
         """
         Match company name using LLM semantic understanding.
 
-        Algorithm:
-        1. Validate inputs and normalize
-        2. Check exact match first (fast path)
-        3. Use LLM to rank candidates by semantic similarity
-        4. Return best match if ≥ threshold
-        5. Signal creation if auto_create and no match
+        Synchronous wrapper around match_async(); from async code (where an
+        event loop is already running) use match_async() or match_many().
 
         Args:
             company_name: Extracted company name
@@ -414,130 +875,261 @@ class LLMMatcher(CompanyMatcher):
             similarity_threshold: Minimum similarity (default: 0.70, more lenient than rapidfuzz)
 
         Returns:
-            CompanyMatch with match_method="semantic"
+            CompanyMatch with match_method="llm"
+
+        Raises:
+            ValueError: If company_name is empty or threshold is invalid
+            RuntimeError: If called while an event loop is running
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(
+                self.match_async(
+                    company_name,
+                    candidates,
+                    auto_create=auto_create,
+                    similarity_threshold=similarity_threshold,
+                )
+            )
+        raise RuntimeError(
+            "LLMMatcher.match() cannot run inside an event loop; use match_async()"
+        )
+
+    async def match_async(
+        self,
+        company_name: str,
+        candidates: List[tuple[str, str]],
+        *,
+        auto_create: bool = True,
+        similarity_threshold: float = 0.70,
+    ) -> CompanyMatch:
+        """
+        Match one company name (a batch of one, see match_many).
+
+        Returns:
+            CompanyMatch with match_method="llm"
 
         Raises:
             ValueError: If company_name is empty or threshold is invalid
         """
-        import logging
+        results = await self.match_many(
+            [company_name],
+            candidates,
+            auto_create=auto_create,
+            similarity_threshold=similarity_threshold,
+        )
+        return results[normalize_company_name(company_name)]
+
+    async def match_many(
+        self,
+        company_names: Iterable[str],
+        candidates: List[tuple[str, str]],
+        *,
+        auto_create: bool = True,
+        similarity_threshold: float = 0.70,
+    ) -> Dict[str, CompanyMatch]:
+        """
+        Match several company names with at most one LLM call.
+
+        Algorithm:
+        1. Validate inputs and normalize (duplicates are matched once)
+        2. Exact matches and memoized results need no LLM
+        3. Shortlist the best-ranked candidates for each remaining name
+        4. Ask the LLM to pick a candidate (or none) for all names at once
+        5. Accept picks scoring ≥ threshold; otherwise signal creation or none
+
+        Args:
+            company_names: Extracted company names
+            candidates: List of (page_id, company_name) from database, or a
+                CompanyIndex (required for memoization)
+            auto_create: Create new company if no match (default: True)
+            similarity_threshold: Minimum LLM score (default: 0.70; semantic
+                matches below 0.70 are never accepted)
 
+        Returns:
+            Dict mapping each normalized name to its CompanyMatch
+
+        Raises:
+            ValueError: If a company name is empty or threshold is invalid
+        """
         # Validate threshold
         if not (0.0 <= similarity_threshold <= 1.0):
             raise ValueError(
                 f"similarity_threshold must be between 0.0 and 1.0, got {similarity_threshold}"
             )
 
-        # Normalize company name
-        normalized_name = normalize_company_name(company_name)
+        names = list(dict.fromkeys(normalize_company_name(n) for n in company_names))
 
-        # Fast path: Check exact match
-        for page_id, candidate_name in candidates:
-            if normalized_name == candidate_name:
-                return CompanyMatch(
+        # Only index snapshots have a version to key memoized results on
+        version = getattr(candidates, "version", None)
+        use_memo = self.memo is not None and version is not None
+        index = CompanyIndex.from_candidates(candidates)
+
+        def memo_key(name: str) -> tuple:
+            return ("semantic", name, version, similarity_threshold, auto_create)
+
+        results: Dict[str, CompanyMatch] = {}
+        shortlists: Dict[str, List[tuple[str, str, float]]] = {}
+        for name in names:
+            # Fast path: exact match
+            exact_match = index.exact(name)
+            if exact_match:
+                page_id, matched_name = exact_match
+                results[name] = CompanyMatch(
                     page_id=page_id,
-                    company_name=candidate_name,
+                    company_name=matched_name,
                     similarity_score=1.0,
                     match_type="exact",
                     confidence_level="high",
                     was_created=False,
-                    match_method="semantic",
+                    match_method="llm",
                 )
+                continue
+
+            if use_memo:
+                cached = self.memo.get(memo_key(name))
+                if cached is not None:
+                    results[name] = cached
+                    continue
+
+            shortlists[name] = index.rank(name, self.shortlist_size)
+
+        asked = [name for name, shortlist in shortlists.items() if shortlist]
+        picks: Dict[str, Optional[tuple[str, str, float]]] = {}
+        failed = False
+        if asked:
+            prompt = self._build_disambiguation_prompt(asked, shortlists)
+            try:
+                response_text = await self.llm_orchestrator.generate_text(prompt)
+                picks = self._parse_disambiguation(response_text, asked, shortlists)
+            except Exception as e:
+                # LLM call failed - fall back to no match (not memoized, so it is retried)
+                logger.warning(f"LLM matching failed for {asked}: {str(e)}")
+                failed = True
+
+        for name in shortlists:
+            results[name] = self._to_match(
+                name, picks.get(name), auto_create, similarity_threshold
+            )
+            if use_memo and not (failed and name in asked):
+                self.memo.set(memo_key(name), results[name])
 
-        # Use LLM for semantic ranking
-        prompt = self._build_ranking_prompt(normalized_name, candidates)
+        return results
 
-        # Call LLM to rank candidates
-        try:
-            # Simple text response parsing (no structured response needed for evaluation)
-            response_text = self.llm_orchestrator.generate_text(prompt)
-
-            # Parse response to extract best match
-            # Format: "Best match: <company_name> (score: 0.XX)"
-            import re
-
-            match = re.search(r"Best match: (.+?) \(score: (0\.\d+)\)", response_text)
-
-            if match:
-                best_name = match.group(1).strip()
-                score = float(match.group(2))
-
-                if score >= similarity_threshold:
-                    # Find matching page_id
-                    page_id = next(
-                        (pid for pid, name in candidates if name == best_name), None
-                    )
-
-                    if page_id:
-                        confidence = self._compute_confidence_level(score)
-                        return CompanyMatch(
-                            page_id=page_id,
-                            company_name=best_name,
-                            similarity_score=score,
-                            match_type="fuzzy",
-                            confidence_level=confidence,
-                            was_created=False,
-                            match_method="semantic",
-                        )
-
-        except Exception as e:
-            # LLM call failed - fallback to no match
-            logging.warning(f"LLM matching failed for '{normalized_name}': {str(e)}")
+    def _to_match(
+        self,
+        normalized_name: str,
+        pick: Optional[tuple[str, str, float]],
+        auto_create: bool,
+        similarity_threshold: float,
+    ) -> CompanyMatch:
+        """Build the CompanyMatch for an LLM pick (or the lack of one)."""
+        if pick is not None:
+            page_id, matched_name, score = pick
+            score = min(score, SEMANTIC_MAX_SCORE)
+            if score >= max(similarity_threshold, SEMANTIC_MIN_SCORE):
+                return CompanyMatch(
+                    page_id=page_id,
+                    company_name=matched_name,
+                    similarity_score=score,
+                    match_type="semantic",
+                    confidence_level=self._compute_confidence_level(score),
+                    was_created=False,
+                    match_method="llm",
+                )
 
         # No match found
-        if auto_create:
-            return CompanyMatch(
-                page_id=None,
-                company_name=normalized_name,
-                similarity_score=0.0,
-                match_type="none",
-                confidence_level="none",
-                was_created=False,
-                match_method="semantic",
-            )
-        else:
-            return CompanyMatch(
-                page_id=None,
-                company_name="",
-                similarity_score=0.0,
-                match_type="none",
-                confidence_level="none",
-                was_created=False,
-                match_method="semantic",
-            )
+        return CompanyMatch(
+            page_id=None,
+            company_name=normalized_name if auto_create else "",
+            similarity_score=0.0,
+            match_type="none",
+            confidence_level="none",
+            was_created=False,
+            match_method="llm",
+        )
 
-    def _build_ranking_prompt(
-        self, company_name: str, candidates: List[tuple[str, str]]
+    def _build_disambiguation_prompt(
+        self,
+        names: List[str],
+        shortlists: Dict[str, List[tuple[str, str, float]]],
     ) -> str:
         """
-        Build prompt for LLM to rank candidates by semantic similarity.
+        Build prompt asking the LLM to resolve all names in one response.
 
         Args:
-            company_name: Extracted company name to match
-            candidates: List of (page_id, company_name) tuples
+            names: Normalized company names to resolve
+            shortlists: Ranked (page_id, company_name, score) candidates per name
 
         Returns:
             Prompt string for LLM
         """
-        candidates_list = "\n".join(
-            [
-                f"{i + 1}. {name}" for i, (page_id, name) in enumerate(candidates[:10])
-            ]  # Limit to top 10
-        )
+        sections = []
+        for i, name in enumerate(names, start=1):
+            options = "\n".join(
+                f"   {j}. {candidate_name}"
+                for j, (_, candidate_name, _) in enumerate(shortlists[name], start=1)
+            )
+            sections.append(f'{i}. "{name}"\n{options}')
+        names_list = "\n".join(sections)
 
-        return f"""You are a company name matching expert. Match the extracted company name to the most similar candidate.
+        return f"""You are a company name matching expert. For each extracted company name, pick the candidate that refers to the same company.
 
-Extracted Company Name: "{company_name}"
+Extracted names, each with its candidate companies:
+{names_list}
 
-Candidate Companies:
-{candidates_list}
+Respond with ONLY a JSON array containing one object per extracted name:
+[{{"name": <name number>, "candidate": <candidate number or null>, "score": <0.00-1.00>}}]
 
-Respond with ONLY:
-Best match: <company_name> (score: 0.XX)
+Use "candidate": null and "score": 0.00 when no candidate is the same company.
+Consider name variations, abbreviations, and Korean/English equivalents."""
 
-Or if no good match:
-No match (score: 0.00)
+    @staticmethod
+    def _parse_disambiguation(
+        response_text: str,
+        names: List[str],
+        shortlists: Dict[str, List[tuple[str, str, float]]],
+    ) -> Dict[str, Optional[tuple[str, str, float]]]:
+        """
+        Parse the JSON response of a disambiguation prompt.
 
-Consider name variations, abbreviations, and Korean/English equivalents. Score from 0.00 to 1.00."""
+        Args:
+            response_text: Raw LLM response
+            names: Names in prompt order
+            shortlists: Candidates per name, in prompt order
+
+        Returns:
+            (page_id, company_name, score) per name the LLM matched
+
+        Raises:
+            ValueError: If the response holds no valid JSON array
+        """
+        start, end = response_text.find("["), response_text.rfind("]")
+        if start == -1 or end < start:
+            raise ValueError(f"No JSON array in LLM response: {response_text[:200]!r}")
+        entries = json.loads(response_text[start : end + 1])
+        if not isinstance(entries, list):
+            raise ValueError("LLM response is not a JSON array")
+
+        picks: Dict[str, Optional[tuple[str, str, float]]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                name = names[int(entry["name"]) - 1]
+                candidate = entry.get("candidate")
+                if candidate is None:
+                    continue
+                shortlist = shortlists[name]
+                position = int(candidate) - 1
+                score = float(entry.get("score", 0.0))
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+            if 0 <= position < len(shortlist) and 0.0 <= score <= 1.0:
+                page_id, company_name, _ = shortlist[position]
+                picks[name] = (page_id, company_name, score)
+        return picks
 
     def _compute_confidence_level(self, similarity_score: float) -> str:
         """Compute confidence level from similarity score."""
@@ -557,9 +1149,13 @@ class HybridMatcher(CompanyMatcher):
 
     Strategy:
     1. Try rapidfuzz first with high threshold (≥0.85) - fast, high precision
-    2. If no match, try LLM with lower threshold (≥0.70) - slower, handles edge cases
+    2. If no match but the best fuzzy score is ≥0.70 (ambiguous), try LLM
+       with lower threshold (≥0.70) - slower, handles edge cases
     3. If still no match, signal auto-creation
 
+    match_many() sends all ambiguous names to the LLM in one call, so a
+    whole email or processing cycle costs at most one LLM call.
+
     Benefits:
     - Fast path for most cases (exact and high-confidence fuzzy matches)
     - LLM fallback handles complex variations
@@ -571,15 +1167,16 @@ class HybridMatcher(CompanyMatcher):
     - Best of both approaches
     """
 
-    def __init__(self, llm_orchestrator):
+    def __init__(self, llm_orchestrator, memo: Optional["MatchMemo"] = None):
         """
         Initialize HybridMatcher with both rapidfuzz and LLM.
 
         Args:
             llm_orchestrator: LLMOrchestrator instance for semantic fallback
+            memo: Optional MatchMemo shared by both matchers
         """
-        self.rapidfuzz_matcher = RapidfuzzMatcher()
-        self.llm_matcher = LLMMatcher(llm_orchestrator)
+        self.rapidfuzz_matcher = RapidfuzzMatcher(memo=memo)
+        self.llm_matcher = LLMMatcher(llm_orchestrator, memo=memo)
 
     def match(
         self,
@@ -592,12 +1189,7 @@ class HybridMatcher(CompanyMatcher):
         """
         Match using hybrid approach: rapidfuzz first, LLM fallback.
 
-        Algorithm:
-        1. Try rapidfuzz with threshold 0.85 (fast path)
-        2. If match found → return immediately
-        3. If no match and score ≥ 0.70 → try LLM for semantic understanding
-        4. If LLM finds match ≥ 0.70 → return LLM result
-        5. Otherwise → signal auto-creation or none
+        Synchronous; from async code use match_async() or match_many().
 
         Args:
             company_name: Extracted company name
@@ -611,57 +1203,145 @@ class HybridMatcher(CompanyMatcher):
         Raises:
             ValueError: If company_name is empty or threshold is invalid
         """
-        # Step 1: Try rapidfuzz (fast path)
-        rapidfuzz_result = self.rapidfuzz_matcher.match(
+        candidates = CompanyIndex.from_candidates(candidates)
+        rapidfuzz_result = self._match_character(
+            company_name, candidates, similarity_threshold
+        )
+        llm_result = None
+        if self._is_ambiguous(company_name, rapidfuzz_result, candidates):
+            llm_result = self.llm_matcher.match(
+                company_name,
+                candidates,
+                auto_create=False,  # Don't auto-create yet
+                similarity_threshold=LLM_FALLBACK_THRESHOLD,
+            )
+        return self._combine(company_name, rapidfuzz_result, llm_result, auto_create)
+
+    async def match_async(
+        self,
+        company_name: str,
+        candidates: List[tuple[str, str]],
+        *,
+        auto_create: bool = True,
+        similarity_threshold: float = 0.85,
+    ) -> CompanyMatch:
+        """
+        Match one company name (a batch of one, see match_many).
+
+        Raises:
+            ValueError: If company_name is empty or threshold is invalid
+        """
+        results = await self.match_many(
+            [company_name],
+            candidates,
+            auto_create=auto_create,
+            similarity_threshold=similarity_threshold,
+        )
+        return results[normalize_company_name(company_name)]
+
+    async def match_many(
+        self,
+        company_names: Iterable[str],
+        candidates: List[tuple[str, str]],
+        *,
+        auto_create: bool = True,
+        similarity_threshold: float = 0.85,
+    ) -> Dict[str, CompanyMatch]:
+        """
+        Match several names: rapidfuzz for each, one LLM call for the ambiguous.
+
+        Args:
+            company_names: Extracted company names (e.g. all of one cycle)
+            candidates: List of (page_id, company_name) from database, or a
+                CompanyIndex
+            auto_create: Create new company if no match (default: True)
+            similarity_threshold: Minimum similarity for rapidfuzz (default: 0.85)
+
+        Returns:
+            Dict mapping each normalized name to its CompanyMatch
+
+        Raises:
+            ValueError: If a company name is empty or threshold is invalid
+        """
+        candidates = CompanyIndex.from_candidates(candidates)
+        names = list(dict.fromkeys(normalize_company_name(n) for n in company_names))
+
+        rapidfuzz_results = {
+            name: self._match_character(name, candidates, similarity_threshold)
+            for name in names
+        }
+        ambiguous = [
+            name
+            for name, result in rapidfuzz_results.items()
+            if self._is_ambiguous(name, result, candidates)
+        ]
+        llm_results = {}
+        if ambiguous:
+            llm_results = await self.llm_matcher.match_many(
+                ambiguous,
+                candidates,
+                auto_create=False,  # Don't auto-create yet
+                similarity_threshold=LLM_FALLBACK_THRESHOLD,
+            )
+
+        return {
+            name: self._combine(
+                name, rapidfuzz_results[name], llm_results.get(name), auto_create
+            )
+            for name in names
+        }
+
+    def _match_character(
+        self,
+        company_name: str,
+        candidates: CompanyIndex,
+        similarity_threshold: float,
+    ) -> CompanyMatch:
+        """Step 1: rapidfuzz (fast path), without auto-creation."""
+        return self.rapidfuzz_matcher.match(
             company_name,
             candidates,
             auto_create=False,  # Don't auto-create yet
             similarity_threshold=similarity_threshold,
         )
 
+    @staticmethod
+    def _is_ambiguous(
+        company_name: str, rapidfuzz_result: CompanyMatch, candidates: CompanyIndex
+    ) -> bool:
+        """Whether rapidfuzz failed but got close (best score ≥0.70 but <threshold)."""
+        if rapidfuzz_result.match_type in ("exact", "fuzzy"):
+            return False
+        # A failed match reports similarity 0.0, so score the best candidate again
+        normalized_name = normalize_company_name(company_name)
+        return candidates.best_match(normalized_name, LLM_FALLBACK_THRESHOLD) is not None
+
+    @staticmethod
+    def _combine(
+        company_name: str,
+        rapidfuzz_result: CompanyMatch,
+        llm_result: Optional[CompanyMatch],
+        auto_create: bool,
+    ) -> CompanyMatch:
+        """Pick the rapidfuzz match, else the LLM match, else signal creation."""
         # If rapidfuzz found a match, return it
         if rapidfuzz_result.match_type in ["exact", "fuzzy"]:
             # Update match_method to indicate hybrid approach
             rapidfuzz_result.match_method = "hybrid-character"
             return rapidfuzz_result
 
-        # Step 2: Rapidfuzz failed - try LLM fallback with lower threshold
-        # Only use LLM if rapidfuzz got close but not quite (≥0.70 but <0.85)
-        use_llm_fallback = rapidfuzz_result.similarity_score >= 0.70
-
-        if use_llm_fallback:
-            llm_result = self.llm_matcher.match(
-                company_name,
-                candidates,
-                auto_create=False,  # Don't auto-create yet
-                similarity_threshold=0.70,  # Lower threshold for LLM
-            )
-
-            # If LLM found a match, return it
-            if llm_result.match_type in ["exact", "fuzzy"]:
-                # Update match_method to indicate hybrid approach
-                llm_result.match_method = "hybrid-semantic"
-                return llm_result
-
-        # Step 3: Both approaches failed - signal auto-creation
-        if auto_create:
-            normalized_name = normalize_company_name(company_name)
-            return CompanyMatch(
-                page_id=None,
-                company_name=normalized_name,
-                similarity_score=0.0,
-                match_type="none",
-                confidence_level="none",
-                was_created=False,
-                match_method="hybrid",
-            )
-        else:
-            return CompanyMatch(
-                page_id=None,
-                company_name="",
-                similarity_score=0.0,
-                match_type="none",
-                confidence_level="none",
-                was_created=False,
-                match_method="hybrid",
-            )
+        # If LLM found a match, return it
+        if llm_result is not None and llm_result.match_type in ["exact", "semantic"]:
+            llm_result.match_method = "hybrid-semantic"
+            return llm_result
+
+        # Both approaches failed - signal auto-creation
+        return CompanyMatch(
+            page_id=None,
+            company_name=normalize_company_name(company_name) if auto_create else "",
+            similarity_score=0.0,
+            match_type="none",
+            confidence_level="none",
+            was_created=False,
+            match_method="hybrid",
+        )
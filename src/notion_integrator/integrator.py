@@ -4,7 +4,8 @@ NotionIntegrator - High-Level API
 Orchestrates all Notion operations with a clean, simple interface:
 - Schema discovery with caching
 - Data fetching with pagination and relationships
-- LLM-ready formatting
+- LLM-ready formatting (company context kept per data cache version and
+  patched incrementally)
 - Error handling and retry logic
 - Cache management
 
@@ -26,6 +27,7 @@ from typing import Any, Dict, List, Optional
 
 from .cache import CacheManager
 from .client import NotionClient
+from .company_context import CompanyContext, schema_key
 from .fetcher import (
     fetch_database_with_relationships,
     fetch_multiple_databases,
@@ -71,6 +73,8 @@ class NotionIntegrator:
         data_ttl_hours: int = 6,
         use_cache: bool = True,
         default_max_depth: int = 1,
+        stale_while_revalidate: bool = False,
+        base_url: Optional[str] = None,
     ):
         """
         Initialize NotionIntegrator.
@@ -83,24 +87,34 @@ class NotionIntegrator:
             data_ttl_hours: Data cache TTL in hours (default: 6)
             use_cache: Whether to use caching (default: True)
             default_max_depth: Default relationship depth (default: 1)
+            stale_while_revalidate: Serve an expired data cache while it is
+                refreshed in the background (default: False; for
+                long-running processes such as the daemon)
+            base_url: Override the API root (e.g. a local stub server)
 
         Raises:
             NotionAuthenticationError: If API key is missing/invalid
         """
         # Initialize client
-        self.client = NotionClient(api_key=api_key, rate_per_second=rate_per_second)
+        self.client = NotionClient(
+            api_key=api_key, rate_per_second=rate_per_second, base_url=base_url
+        )
 
         # Initialize cache manager
         self.cache_manager = CacheManager(
             cache_dir=cache_dir,
             schema_ttl_hours=schema_ttl_hours,
             data_ttl_hours=data_ttl_hours,
+            stale_while_revalidate=stale_while_revalidate,
         )
 
         # Configuration
         self.use_cache = use_cache
         self.default_max_depth = default_max_depth
 
+        # Formatted context per database ID (see format_for_llm)
+        self._contexts: Dict[str, CompanyContext] = {}
+
         logger.info(
             "NotionIntegrator initialized",
             extra={
@@ -201,6 +215,11 @@ class NotionIntegrator:
         """
         Format database records for LLM consumption.
 
+        When records are not given, the result is kept as a CompanyContext
+        keyed by the data cache version: an unchanged cache returns the
+        kept result without formatting anything, and a changed one only
+        re-formats added or changed records.
+
         Args:
             database_id: Database ID
             records: Records to format (will fetch if not provided)
@@ -224,17 +243,96 @@ class NotionIntegrator:
                 use_cache=use_cache,
             )
 
-        # Fetch records if not provided
-        if records is None:
-            records = await self.fetch_all_records(
-                database_id=database_id,
-                schema=schema,
-                max_relationship_depth=max_relationship_depth,
-                use_cache=use_cache,
+        # Explicit records are formatted as given
+        if records is not None:
+            return format_for_llm(records, schema)
+
+        # Version read before fetching: if the cache is rewritten meanwhile,
+        # the next call sees a newer version and re-syncs
+        use_cache_flag = use_cache if use_cache is not None else self.use_cache
+        version = (
+            self.cache_manager.get_data_cache_version(schema.database.title)
+            if use_cache_flag
+            else None
+        )
+
+        context = self._contexts.get(database_id)
+        if (
+            context is not None
+            and version is not None
+            and context.version == version
+            and context.schema_key == schema_key(schema)
+        ):
+            return context.to_llm_data()
+
+        records = await self.fetch_all_records(
+            database_id=database_id,
+            schema=schema,
+            max_relationship_depth=max_relationship_depth,
+            use_cache=use_cache,
+        )
+
+        if context is None or context.schema_key != schema_key(schema):
+            context = CompanyContext(schema, records, version=version)
+            self._contexts[database_id] = context
+        else:
+            context.sync(records, version=version)
+
+        return context.to_llm_data()
+
+    def upsert_record(self, database_id: str, record: Dict[str, Any]) -> None:
+        """
+        Patch one page into the cached data and formatted context.
+
+        Call this after creating or updating a page (e.g. a new company) so
+        the next format_for_llm() includes it without refetching or
+        re-formatting the database. Does nothing for databases not yet
+        formatted by this integrator.
+
+        Args:
+            database_id: Database ID the page belongs to
+            record: Notion page record (as returned by pages.create)
+        """
+        context = self._contexts.get(database_id)
+        if context is None or not record.get("id"):
+            return
+
+        context.upsert(record)
+
+        if not self.use_cache:
+            return
+
+        database_name = context.schema.database.title
+        entry = self.cache_manager.get_data_cache_entry(database_name)
+        if entry is None or entry.database_id != database_id:
+            return
+
+        records = list(entry.content)
+        for position, cached in enumerate(records):
+            if isinstance(cached, dict) and cached.get("id") == record["id"]:
+                records[position] = record
+                break
+        else:
+            records.append(record)
+
+        try:
+            self.cache_manager.update_data_cache_entry(
+                entry.model_copy(
+                    update={
+                        "content": records,
+                        "metadata": {**entry.metadata, "record_count": len(records)},
+                    }
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to upsert record into data cache",
+                extra={"database_name": database_name, "error": str(e)},
             )
+            return
 
-        # Format for LLM
-        return format_for_llm(records, schema)
+        # The context already reflects the rewritten cache
+        context.version = self.cache_manager.get_data_cache_version(database_name)
 
     async def get_data(
         self,
@@ -0,0 +1,169 @@
+"""
+Match Result Memoization
+
+Bounded LRU + TTL memo of name-matching results, shared by the company and
+person matchers. The same startup, partner and person names recur in most
+emails; with the memo, repeats skip exact/fuzzy scoring and, for
+LLMMatcher, the LLM call.
+
+Keys include the version of the candidate snapshot the match ran against
+(CompanyIndex.version, or a digest of the workspace user list), so a
+changed Companies cache or user list never serves stale results: old
+entries simply stop being looked up and age out. "No match" outcomes are
+cached too (negative caching) under the same rule.
+
+Usage:
+    >>> memo = MatchMemo(max_size=1024, ttl_seconds=3600)
+    >>> matcher = RapidfuzzMatcher(memo=memo)
+    >>> person_matcher = NotionPersonMatcher(notion_client, memo=memo)
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+class MatchMemo:
+    """
+    Bounded LRU + TTL memo for match results.
+
+    Values are deep-copied on the way in and out (pydantic model_copy), so
+    a caller mutating a returned match (as HybridMatcher does with
+    match_method) cannot alter the memoized result.
+
+    Attributes:
+        max_size: Maximum number of entries (least recently used evicted first)
+        ttl_seconds: Seconds an entry stays valid
+        hits: Lookups served from the memo
+        misses: Lookups that found no valid entry
+        evictions: Entries dropped because the memo was full
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize MatchMemo.
+
+        Args:
+            max_size: Maximum number of entries (default: 1024)
+            ttl_seconds: Entry lifetime in seconds (default: 3600)
+            clock: Monotonic time source (injectable for tests)
+
+        Raises:
+            ValueError: If max_size or ttl_seconds is not positive
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a memoized result.
+
+        Args:
+            key: Memo key
+
+        Returns:
+            Copy of the stored result, or None if absent or expired
+        """
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() >= entry[0]:
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return _copy(entry[1])
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a result, evicting the least recently used entry if full.
+
+        Args:
+            key: Memo key
+            value: Result to store (a copy is kept)
+        """
+        self._entries[key] = (self._clock() + self.ttl_seconds, _copy(value))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Return the memoized result for key, computing and storing it on a miss.
+
+        Exceptions from compute are not memoized.
+
+        Args:
+            key: Memo key
+            compute: Zero-argument callable producing the result
+
+        Returns:
+            Memoized or freshly computed result
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        value = compute()
+        self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get memo statistics.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses, hit_rate, evictions
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+def _copy(value: Any) -> Any:
+    """Deep-copy pydantic models; other values are stored as-is."""
+    model_copy = getattr(value, "model_copy", None)
+    return model_copy(deep=True) if callable(model_copy) else value
@@ -8,14 +8,20 @@ person names to Notion workspace users.
 import asyncio
 import json
 import logging
+import re
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from models.matching import PersonMatch
+from .client import send_rate_limited
+from .rate_limiter import RequestPriority
+
+if TYPE_CHECKING:
+    from .match_memo import MatchMemo
 
 
 logger = logging.getLogger(__name__)
@@ -45,6 +51,175 @@ class NotionUser:
         self.type = type
 
 
+def users_version(users: List[NotionUser]) -> int:
+    """
+    Digest of the user fields matching depends on (changes with the list).
+
+    Args:
+        users: Workspace users
+
+    Returns:
+        Hash of the (id, name, email) triples in order
+    """
+    return hash(tuple((user.id, user.name, user.email) for user in users))
+
+
+# Separators between name variants, e.g. "김철수 (Chulsoo Kim)", "김철수/Chulsoo"
+_NAME_VARIANT_SEPARATORS = re.compile(r"[()\[\]/,]")
+# Separators inside email local-parts, e.g. "chulsoo.kim", "chulsoo_kim"
+_LOCAL_PART_SEPARATORS = re.compile(r"[._\-+]+")
+_HANGUL = re.compile(r"[\uac00-\ud7a3]")
+
+
+def alias_key(text: str) -> str:
+    """Case- and spacing-insensitive form under which aliases are compared."""
+    return " ".join(text.casefold().split())
+
+
+def person_aliases(user: NotionUser) -> List[str]:
+    """
+    Alias keys a user can be referred to by in emails.
+
+    Covers the name and its parenthesized or slash-separated variants
+    (Korean/English names), the email local-part ("chulsoo.kim" ->
+    "chulsoo kim"), English names in either order ("kim chulsoo"), and
+    Korean names without spaces ("김 철수" -> "김철수").
+
+    Args:
+        user: Workspace user
+
+    Returns:
+        Distinct alias keys (see alias_key), name first
+    """
+    name = (user.name or "").strip()
+    forms = [name]
+    variants = [v for v in _NAME_VARIANT_SEPARATORS.split(name) if v.strip()]
+    if len(variants) > 1:
+        forms.extend(variants)
+    if user.email and "@" in user.email:
+        local_part = user.email.split("@", 1)[0]
+        forms.append(" ".join(_LOCAL_PART_SEPARATORS.split(local_part)))
+
+    aliases: List[str] = []
+    for form in forms:
+        key = alias_key(form)
+        tokens = key.split()
+        keys = [key]
+        if len(tokens) > 1:
+            if _HANGUL.search(key):
+                keys.append("".join(tokens))
+            else:
+                keys.append(" ".join(reversed(tokens)))
+        for key in keys:
+            if key and key not in aliases:
+                aliases.append(key)
+    return aliases
+
+
+class PersonIndex:
+    """
+    Precomputed matching index over workspace users.
+
+    Built once per user list (see version): exact names and alias keys are
+    hash lookups, and fuzzy scoring runs as rapidfuzz batch passes returning
+    only the top candidates, instead of scoring and sorting every user in
+    a Python loop.
+
+    A user's score is the best of fuzz.ratio() on the name as given and on
+    each alias key (see person_aliases).
+    """
+
+    def __init__(self, users: Iterable[NotionUser]):
+        """
+        Build index from users.
+
+        Args:
+            users: Workspace users (earlier users win ties)
+        """
+        self.users: List[NotionUser] = list(users)
+        self.version = users_version(self.users)
+
+        self._names: List[str] = [user.name for user in self.users]
+        # name -> first position (first occurrence wins, as in a linear scan)
+        self._exact: Dict[str, int] = {}
+        self._aliases: List[str] = []
+        self._alias_owners: List[int] = []
+        # alias key -> positions of users having it
+        self._alias_exact: Dict[str, List[int]] = {}
+        self._max_aliases = 1
+
+        for position, user in enumerate(self.users):
+            self._exact.setdefault(user.name, position)
+            aliases = person_aliases(user)
+            self._max_aliases = max(self._max_aliases, len(aliases))
+            for alias in aliases:
+                self._aliases.append(alias)
+                self._alias_owners.append(position)
+                owners = self._alias_exact.setdefault(alias, [])
+                if position not in owners:
+                    owners.append(position)
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def exact(self, normalized_name: str) -> Optional[NotionUser]:
+        """
+        Look up a user by exact name, else by an alias only one user has.
+
+        Args:
+            normalized_name: Normalized extracted person name
+
+        Returns:
+            Matching NotionUser, or None
+        """
+        position = self._exact.get(normalized_name)
+        if position is None:
+            owners = self._alias_exact.get(alias_key(normalized_name), [])
+            if len(owners) != 1:
+                return None
+            position = owners[0]
+        return self.users[position]
+
+    def top_matches(
+        self, normalized_name: str, limit: int = 3
+    ) -> List[tuple[NotionUser, float]]:
+        """
+        Best-scoring users, best first (ties in user order).
+
+        Args:
+            normalized_name: Normalized extracted person name
+            limit: Maximum number of users returned
+
+        Returns:
+            Up to limit (NotionUser, similarity 0.0-1.0) pairs
+        """
+        scores: Dict[int, float] = {}
+        for _, score, position in process.extract(
+            normalized_name,
+            self._names,
+            scorer=fuzz.ratio,
+            processor=None,
+            limit=limit,
+        ):
+            scores[position] = score
+
+        # The best alias of each of the top users is among the first
+        # limit * max_aliases alias scores
+        for _, score, i in process.extract(
+            alias_key(normalized_name),
+            self._aliases,
+            scorer=fuzz.ratio,
+            processor=None,
+            limit=limit * self._max_aliases,
+        ):
+            position = self._alias_owners[i]
+            if score > scores.get(position, -1.0):
+                scores[position] = score
+
+        ranked = sorted(scores, key=lambda p: (-scores[p], p))[:limit]
+        return [(self.users[p], scores[p] / 100.0) for p in ranked]
+
+
 class PersonMatcher(ABC):
     """
     Abstract interface for person name matching algorithms.
@@ -108,6 +283,10 @@ class NotionPersonMatcher(PersonMatcher):
     - Handles Korean names (family name + given name variations)
     - Detects ambiguity (top 2 scores differ by <0.10)
     - More lenient threshold (0.70) than company matching
+    - Matches against a PersonIndex (names, email local-parts and
+      Korean/English aliases), rebuilt only when the user list changes
+    - Optional MatchMemo: results (including "no match") are memoized per
+      normalized name and user list version
     """
 
     def __init__(
@@ -115,6 +294,7 @@ class NotionPersonMatcher(PersonMatcher):
         notion_client,
         cache_dir: Optional[str] = None,
         cache_ttl_hours: int = 24,
+        memo: Optional["MatchMemo"] = None,
     ):
         """
         Initialize NotionPersonMatcher.
@@ -123,8 +303,11 @@ class NotionPersonMatcher(PersonMatcher):
             notion_client: NotionClient instance for API access
             cache_dir: Cache directory (defaults to data/notion_cache)
             cache_ttl_hours: Cache TTL in hours (default: 24)
+            memo: Optional MatchMemo shared with the company matchers
         """
         self.notion_client = notion_client
+        self.memo = memo
+        self._index: Optional[PersonIndex] = None
         self.cache_dir = Path(cache_dir or "data/notion_cache")
         self.cache_ttl_hours = cache_ttl_hours
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -240,13 +423,14 @@ class NotionPersonMatcher(PersonMatcher):
         # Load users from cache (sync)
         users = self.list_users()
 
-        return self._perform_matching_logic(normalized_name, users, similarity_threshold)
+        return self._match_users(normalized_name, users, similarity_threshold)
 
     async def match_async(
         self,
         person_name: str,
         *,
         similarity_threshold: float = 0.70,
+        users: Optional[List[NotionUser]] = None,
     ) -> PersonMatch:
         """
         Match person name using fuzzy matching with ambiguity detection (asynchronous).
@@ -254,6 +438,8 @@ class NotionPersonMatcher(PersonMatcher):
         Args:
             person_name: Extracted person name (will be normalized)
             similarity_threshold: Minimum similarity for match (default: 0.70)
+            users: Optional pre-loaded user list (e.g. a batch-wide snapshot);
+                loaded from cache when omitted
 
         Returns:
             PersonMatch object
@@ -269,27 +455,112 @@ class NotionPersonMatcher(PersonMatcher):
             raise ValueError("Person name cannot be empty or whitespace-only")
 
         # Load users from cache (async)
-        users = await self.list_users_async()
+        if users is None:
+            users = await self.list_users_async()
 
-        return self._perform_matching_logic(normalized_name, users, similarity_threshold)
+        return self._match_users(normalized_name, users, similarity_threshold)
 
-    def _perform_matching_logic(
+    async def match_many(
+        self,
+        person_names: Iterable[str],
+        *,
+        similarity_threshold: float = 0.70,
+        users: Optional[List[NotionUser]] = None,
+    ) -> Dict[str, PersonMatch]:
+        """
+        Match several person names against one user list and index.
+
+        Args:
+            person_names: Extracted person names (will be normalized)
+            similarity_threshold: Minimum similarity for match (default: 0.70)
+            users: Optional pre-loaded user list; loaded from cache when omitted
+
+        Returns:
+            Dict mapping each normalized name to its PersonMatch
+
+        Raises:
+            ValueError: If a name is empty or the threshold is invalid
+        """
+        if not (0.0 <= similarity_threshold <= 1.0):
+            raise ValueError(
+                f"similarity_threshold must be between 0.0 and 1.0, got {similarity_threshold}"
+            )
+
+        names = []
+        for person_name in person_names:
+            normalized_name = person_name.strip()
+            if not normalized_name:
+                raise ValueError("Person name cannot be empty or whitespace-only")
+            names.append(normalized_name)
+
+        if users is None:
+            users = await self.list_users_async()
+
+        index = self.get_index(users)
+        return {
+            name: self._match_indexed(name, index, similarity_threshold)
+            for name in names
+        }
+
+    def get_index(self, users: List[NotionUser]) -> PersonIndex:
+        """
+        Get the PersonIndex for a user list, rebuilding it only if it changed.
+
+        Args:
+            users: Workspace users
+
+        Returns:
+            PersonIndex over users
+        """
+        if self._index is None or self._index.version != users_version(users):
+            self._index = PersonIndex(users)
+            logger.debug("Person index built", extra={"user_count": len(users)})
+        return self._index
+
+    def _match_users(
         self,
         normalized_name: str,
         users: List[NotionUser],
+        similarity_threshold: float,
+    ) -> PersonMatch:
+        """Match against the index for users (see _match_indexed)."""
+        return self._match_indexed(
+            normalized_name, self.get_index(users), similarity_threshold
+        )
+
+    def _match_indexed(
+        self,
+        normalized_name: str,
+        index: PersonIndex,
+        similarity_threshold: float,
+    ) -> PersonMatch:
+        """Run the matching logic, through the memo if one is configured."""
+        if self.memo is None:
+            return self._perform_matching_logic(
+                normalized_name, index, similarity_threshold
+            )
+
+        key = ("person", normalized_name, index.version, similarity_threshold)
+        return self.memo.get_or_compute(
+            key,
+            lambda: self._perform_matching_logic(
+                normalized_name, index, similarity_threshold
+            ),
+        )
+
+    def _perform_matching_logic(
+        self,
+        normalized_name: str,
+        index: PersonIndex,
         similarity_threshold: float
     ) -> PersonMatch:
         """Internal matching logic shared by sync and async match methods."""
-        # Convert to candidates format
-        candidates = [(user.id, user.name) for user in users]
-
-        # Step 1: Search for exact match
-        exact_match = self._find_exact_match(normalized_name, candidates)
+        # Step 1: Search for exact match (name, or an alias unique to one user)
+        exact_match = index.exact(normalized_name)
         if exact_match:
-            user_id, matched_name = exact_match
             return PersonMatch(
-                user_id=user_id,
-                user_name=matched_name,
+                user_id=exact_match.id,
+                user_name=exact_match.name,
                 similarity_score=1.0,
                 match_type="exact",
                 confidence_level="high",
@@ -298,14 +569,11 @@ class NotionPersonMatcher(PersonMatcher):
                 match_method="character",
             )
 
-        # Step 2: Compute fuzzy similarity for all candidates
-        scored_matches = []
-        for user_id, user_name in candidates:
-            similarity = fuzz.ratio(normalized_name, user_name) / 100.0
-            scored_matches.append((user_id, user_name, similarity))
-
-        # Sort by similarity (descending)
-        scored_matches.sort(key=lambda x: x[2], reverse=True)
+        # Step 2: Score users, keeping the top 3 (best first)
+        scored_matches = [
+            (user.id, user.name, similarity)
+            for user, similarity in index.top_matches(normalized_name, limit=3)
+        ]
 
         # Step 3: Check if best match meets threshold
         if not scored_matches or scored_matches[0][2] < similarity_threshold:
@@ -360,15 +628,6 @@ class NotionPersonMatcher(PersonMatcher):
             match_method="character",
         )
 
-    def _find_exact_match(
-        self, normalized_name: str, candidates: List[Tuple[str, str]]
-    ) -> Optional[Tuple[str, str]]:
-        """Search for exact match (case-sensitive)."""
-        for user_id, user_name in candidates:
-            if normalized_name == user_name:
-                return (user_id, user_name)
-        return None
-
     def _compute_confidence_level(
         self, similarity_score: float, is_ambiguous: bool
     ) -> str:
@@ -407,9 +666,14 @@ class NotionPersonMatcher(PersonMatcher):
             # NotionClient wraps the official notion-client SDK
             sdk_client = self.notion_client.client
 
-            # Call Notion SDK users.list() API (async)
+            # Call Notion SDK users.list() API (async), drawing from the
+            # client's shared rate limit budget at background priority
             # Returns: {"results": [{"id": "...", "name": "...", "person": {"email": "..."}, "type": "person"}]}
-            response = await sdk_client.users.list()
+            response = await send_rate_limited(
+                self.notion_client,
+                lambda: sdk_client.users.list(),
+                RequestPriority.BACKGROUND,
+            )
 
             # Extract users from response
             users = []
@@ -7,20 +7,53 @@ Provides async-safe rate limiting with request queuing.
 Key Features:
 - Token bucket algorithm for smooth rate limiting
 - Async/await support with asyncio primitives
-- Request queuing when rate limit reached
+- Priority-ordered request queuing when rate limit reached
+- Wait-time accounting (cumulative + percentiles) via get_stats()
+- Process-wide limiter registry keyed by API token
+- Adaptive (AIMD) rate that honours Retry-After on 429 responses
 - Configurable rate and burst capacity
-- Thread-safe operation
+
+The Notion budget (3 req/s) is per integration token, not per client object.
+Every NotionClient built for the same token therefore shares one limiter from
+get_shared_rate_limiter(), so the integrator, writer, CompaniesCache and
+NotionPersonMatcher draw from a single bucket.
 
 Usage:
-    >>> limiter = RateLimiter(rate_per_second=3)
+    >>> limiter = get_shared_rate_limiter(api_key, rate_per_second=3)
     >>> async with limiter:
     ...     # Make API call
     ...     response = await notion_client.databases.retrieve(db_id)
+    >>> async with limiter.limit(RequestPriority.WRITE):
+    ...     await notion_client.pages.create(...)
 """
 
 import asyncio
+import hashlib
+import heapq
+import itertools
 import time
-from typing import Optional
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+
+class RequestPriority(IntEnum):
+    """
+    Priority classes for queued requests (lower value is served first).
+
+    - WRITE: Page creation/update for the email being processed
+    - READ: Interactive reads (duplicate checks, schema discovery)
+    - BACKGROUND: Cache refreshes (Companies list, users list)
+    """
+
+    WRITE = 0
+    READ = 1
+    BACKGROUND = 2
+
+
+# Number of recent wait samples kept for percentile calculation
+WAIT_SAMPLE_SIZE = 1000
 
 
 class RateLimiter:
@@ -29,6 +62,8 @@ class RateLimiter:
 
     Enforces a maximum rate of requests per second using the token bucket
     algorithm. Supports burst capacity and smooth request distribution.
+    Waiting requests are served in (priority, arrival) order, and the lock
+    is never held while a request sleeps for tokens.
 
     Attributes:
         rate_per_second: Maximum requests per second
@@ -54,18 +89,62 @@ class RateLimiter:
         self.capacity = capacity if capacity is not None else int(rate_per_second)
         self.tokens = float(self.capacity)
         self.last_update = time.monotonic()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._lock = asyncio.Lock()
-        self._waiting_count = 0
+        self._condition = asyncio.Condition(self._lock)
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._paused_until = 0.0  # monotonic time before which no tokens are issued
+
+        # Wait-time accounting
+        self._total_acquired = 0
+        self._total_wait_seconds = 0.0
+        self._throttled_count = 0
+        self._wait_samples: Deque[float] = deque(maxlen=WAIT_SAMPLE_SIZE)
+        self._wait_by_priority: Dict[str, float] = {p.name.lower(): 0.0 for p in RequestPriority}
+
+    @property
+    def _waiting_count(self) -> int:
+        """Number of requests currently queued for tokens."""
+        return len(self._waiters)
+
+    def _bind_to_running_loop(self) -> None:
+        """
+        Recreate asyncio primitives when used from a new event loop.
 
-    async def acquire(self, tokens: int = 1) -> None:
+        Shared limiters outlive individual asyncio.run() calls (CLI commands,
+        tests), and asyncio locks cannot be awaited across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._condition = asyncio.Condition(self._lock)
+            self._waiters = []
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.tokens = min(
+            self.capacity,
+            self.tokens + elapsed * self.rate_per_second,
+        )
+        self.last_update = now
+
+    async def acquire(
+        self, tokens: int = 1, priority: RequestPriority = RequestPriority.READ
+    ) -> None:
         """
         Acquire tokens from the bucket.
 
         Blocks until sufficient tokens are available. Tokens are refilled
-        continuously at the configured rate.
+        continuously at the configured rate. When several requests are
+        waiting, the one with the highest priority (then oldest) goes first.
 
         Args:
             tokens: Number of tokens to acquire (default: 1)
+            priority: Request priority class (default: READ)
 
         Raises:
             ValueError: If tokens requested exceeds capacity
@@ -75,36 +154,72 @@ class RateLimiter:
                 f"Cannot acquire {tokens} tokens (capacity: {self.capacity})"
             )
 
-        async with self._lock:
-            self._waiting_count += 1
+        self._bind_to_running_loop()
+        started = time.monotonic()
+        ticket = (int(priority), next(self._sequence))
+
+        async with self._condition:
+            heapq.heappush(self._waiters, ticket)
             try:
                 while True:
-                    # Refill tokens based on elapsed time
-                    now = time.monotonic()
-                    elapsed = now - self.last_update
-                    self.tokens = min(
-                        self.capacity,
-                        self.tokens + elapsed * self.rate_per_second,
-                    )
-                    self.last_update = now
+                    self._refill()
+                    is_next = self._waiters[0] == ticket
+                    paused_for = self._paused_until - time.monotonic()
 
-                    # Check if enough tokens available
-                    if self.tokens >= tokens:
+                    if is_next and paused_for <= 0 and self.tokens >= tokens:
+                        heapq.heappop(self._waiters)
                         self.tokens -= tokens
-                        return
+                        break
+
+                    # Only the head of the queue sleeps on a timer; everyone
+                    # else waits to be notified when the head is served.
+                    timeout = (
+                        max(paused_for, (tokens - self.tokens) / self.rate_per_second)
+                        if is_next
+                        else None
+                    )
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                # Cancelled while queued - drop our ticket so others proceed
+                if ticket in self._waiters:
+                    self._waiters.remove(ticket)
+                    heapq.heapify(self._waiters)
+                self._condition.notify_all()
+                raise
+
+            # Wake the new head of the queue so it can start its own timer
+            self._condition.notify_all()
+
+        self._record_wait(time.monotonic() - started, priority)
+
+    def _record_wait(self, wait_seconds: float, priority: RequestPriority) -> None:
+        """Record time spent waiting for tokens."""
+        self._total_acquired += 1
+        self._total_wait_seconds += wait_seconds
+        self._wait_samples.append(wait_seconds)
+        self._wait_by_priority[priority.name.lower()] += wait_seconds
+        if wait_seconds > 0.001:
+            self._throttled_count += 1
+
+    @asynccontextmanager
+    async def limit(
+        self, priority: RequestPriority = RequestPriority.READ
+    ) -> AsyncIterator["RateLimiter"]:
+        """
+        Context manager that acquires one token at the given priority.
 
-                    # Calculate wait time for next token
-                    tokens_needed = tokens - self.tokens
-                    wait_time = tokens_needed / self.rate_per_second
+        Args:
+            priority: Request priority class
 
-                    # Release lock while waiting to allow other operations
-                    self._lock.release()
-                    try:
-                        await asyncio.sleep(wait_time)
-                    finally:
-                        await self._lock.acquire()
-            finally:
-                self._waiting_count -= 1
+        Example:
+            >>> async with limiter.limit(RequestPriority.WRITE):
+            ...     await client.pages.create(...)
+        """
+        await self.acquire(1, priority=priority)
+        yield self
 
     async def __aenter__(self):
         """Context manager entry - acquire one token."""
@@ -125,42 +240,84 @@ class RateLimiter:
             - capacity: Maximum tokens
             - rate_per_second: Configured rate
             - waiting_requests: Number of requests waiting for tokens
+            - total_requests: Requests that acquired a token
+            - throttled_requests: Requests that had to wait
+            - total_wait_seconds: Cumulative time spent waiting
+            - wait_seconds_by_priority: Cumulative wait per priority class
+            - wait_p50_seconds / wait_p95_seconds / wait_p99_seconds /
+              wait_max_seconds: Percentiles over recent requests
         """
+        samples = sorted(self._wait_samples)
         return {
             "available_tokens": self.tokens,
             "capacity": self.capacity,
             "rate_per_second": self.rate_per_second,
             "waiting_requests": self._waiting_count,
+            "total_requests": self._total_acquired,
+            "throttled_requests": self._throttled_count,
+            "total_wait_seconds": self._total_wait_seconds,
+            "wait_seconds_by_priority": dict(self._wait_by_priority),
+            "wait_p50_seconds": _percentile(samples, 50),
+            "wait_p95_seconds": _percentile(samples, 95),
+            "wait_p99_seconds": _percentile(samples, 99),
+            "wait_max_seconds": samples[-1] if samples else 0.0,
         }
 
     async def reset(self) -> None:
         """
         Reset rate limiter to initial state.
 
-        Refills token bucket to capacity. Useful for testing or manual reset.
+        Refills token bucket to capacity and clears wait statistics.
+        Useful for testing or manual reset.
         """
+        self._bind_to_running_loop()
         async with self._lock:
             self.tokens = float(self.capacity)
             self.last_update = time.monotonic()
+            self._total_acquired = 0
+            self._total_wait_seconds = 0.0
+            self._throttled_count = 0
+            self._wait_samples.clear()
+            self._wait_by_priority = {p.name.lower(): 0.0 for p in RequestPriority}
+
+
+def _percentile(sorted_samples: List[float], percentile: float) -> float:
+    """
+    Nearest-rank percentile of pre-sorted samples.
+
+    Args:
+        sorted_samples: Samples in ascending order
+        percentile: Percentile to compute (0-100)
+
+    Returns:
+        Percentile value (0.0 if no samples)
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, int(round(percentile / 100 * len(sorted_samples))) - 1)
+    return sorted_samples[min(rank, len(sorted_samples) - 1)]
 
 
 class AdaptiveRateLimiter(RateLimiter):
     """
-    Rate limiter with adaptive rate adjustment.
+    Rate limiter with adaptive (AIMD) rate adjustment.
 
-    Automatically reduces rate when rate limit errors are detected,
-    and gradually increases rate when operations are successful.
+    Multiplicatively reduces the rate when the API answers 429, pausing all
+    requests for the server's Retry-After, and additively increases it again
+    after a run of successful requests (up to max_rate).
 
-    Useful for APIs with unpredictable rate limits or retry-after headers.
+    This is the default limiter for NotionClient, which feeds it the
+    outcome of every request.
     """
 
     def __init__(
         self,
         initial_rate: float = 3.0,
-        min_rate: float = 1.0,
+        min_rate: float = 0.5,
         max_rate: float = 3.0,
         backoff_factor: float = 0.5,
-        recovery_factor: float = 1.1,
+        increase_step: float = 0.5,
+        success_threshold: int = 10,
     ):
         """
         Initialize adaptive rate limiter.
@@ -170,14 +327,22 @@ class AdaptiveRateLimiter(RateLimiter):
             min_rate: Minimum allowed rate (safety floor)
             max_rate: Maximum allowed rate (ceiling)
             backoff_factor: Multiplier when rate limit hit (0.5 = halve rate)
-            recovery_factor: Multiplier for gradual recovery (1.1 = 10% increase)
+            increase_step: Requests/second added after each run of successes
+            success_threshold: Consecutive successes required before increasing
         """
-        super().__init__(rate_per_second=initial_rate)
+        super().__init__(
+            rate_per_second=initial_rate,
+            capacity=max(1, int(max_rate)),
+        )
         self.min_rate = min_rate
         self.max_rate = max_rate
         self.backoff_factor = backoff_factor
-        self.recovery_factor = recovery_factor
+        self.increase_step = increase_step
+        self.success_threshold = success_threshold
         self._consecutive_successes = 0
+        self._rate_limit_hits = 0
+        # Monotonic time before which further 429s belong to the same event
+        self._backoff_until = 0.0
 
     async def handle_rate_limit_error(
         self, retry_after: Optional[float] = None
@@ -185,40 +350,126 @@ class AdaptiveRateLimiter(RateLimiter):
         """
         Handle rate limit error by reducing rate.
 
+        The rate is multiplied by backoff_factor once per throttling event:
+        429s answering requests that were already in flight (arriving before
+        the Retry-After, or one refill interval at the reduced rate, has
+        passed since the last decrease) only extend the pause. If the API
+        supplied a Retry-After, no tokens are issued to anyone until it has
+        elapsed. The bucket is drained so requests resume at the reduced
+        rate rather than in a burst.
+
         Args:
             retry_after: Suggested wait time from API (seconds)
         """
+        self._bind_to_running_loop()
         async with self._lock:
-            if retry_after:
-                # Use suggested wait time to calculate new rate
-                new_rate = 1.0 / retry_after
-                self.rate_per_second = max(
-                    self.min_rate, min(new_rate, self.rate_per_second)
-                )
-            else:
-                # Reduce rate by backoff factor
+            now = time.monotonic()
+            if now >= self._backoff_until:
                 self.rate_per_second = max(
                     self.min_rate, self.rate_per_second * self.backoff_factor
                 )
+                self._backoff_until = now + max(
+                    retry_after or 0.0, 1.0 / self.rate_per_second
+                )
 
-            # Reset tokens to prevent burst after rate reduction
-            self.tokens = float(self.capacity)
-            self.last_update = time.monotonic()
+            if retry_after and retry_after > 0:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+            self.tokens = 0.0
+            self.last_update = now
             self._consecutive_successes = 0
+            self._rate_limit_hits += 1
 
     async def handle_success(self) -> None:
         """
         Handle successful operation - gradually increase rate.
 
-        Rate increases after multiple consecutive successes to avoid
-        oscillation between rate limit errors and recovery.
+        Rate increases additively after success_threshold consecutive
+        successes to avoid oscillation between rate limit errors and recovery.
         """
+        self._bind_to_running_loop()
         async with self._lock:
             self._consecutive_successes += 1
 
-            # Only increase rate after sustained success (e.g., 10 requests)
-            if self._consecutive_successes >= 10:
+            if self._consecutive_successes >= self.success_threshold:
                 self.rate_per_second = min(
-                    self.max_rate, self.rate_per_second * self.recovery_factor
+                    self.max_rate, self.rate_per_second + self.increase_step
                 )
                 self._consecutive_successes = 0
+
+    def get_stats(self) -> dict:
+        """
+        Get current rate limiter statistics.
+
+        Returns:
+            RateLimiter.get_stats() plus:
+            - min_rate / max_rate: Adaptive bounds
+            - rate_limit_hits: 429 responses reported to the limiter
+            - paused_seconds_remaining: Time left on a Retry-After pause
+        """
+        stats = super().get_stats()
+        stats.update(
+            {
+                "min_rate": self.min_rate,
+                "max_rate": self.max_rate,
+                "rate_limit_hits": self._rate_limit_hits,
+                "paused_seconds_remaining": max(
+                    0.0, self._paused_until - time.monotonic()
+                ),
+            }
+        )
+        return stats
+
+
+# ==============================================================================
+# Process-wide limiter registry
+# ==============================================================================
+
+_shared_limiters: Dict[str, RateLimiter] = {}
+
+
+def _token_key(api_key: str) -> str:
+    """Registry key for an API token (hashed so the token isn't kept as a key)."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def get_shared_rate_limiter(
+    api_key: str,
+    rate_per_second: float = 3.0,
+    adaptive: bool = True,
+) -> RateLimiter:
+    """
+    Get the process-wide rate limiter for a Notion API token.
+
+    The first call for a token creates the limiter; later calls return the
+    same instance so all clients using that token share one request budget.
+
+    Args:
+        api_key: Notion API token the budget belongs to
+        rate_per_second: Rate used when the limiter is first created
+            (the ceiling for an adaptive limiter)
+        adaptive: Create an AdaptiveRateLimiter (default) rather than a
+            fixed-rate RateLimiter
+
+    Returns:
+        Shared RateLimiter instance for the token
+    """
+    key = _token_key(api_key)
+    limiter = _shared_limiters.get(key)
+    if limiter is None:
+        if adaptive:
+            limiter = AdaptiveRateLimiter(
+                initial_rate=rate_per_second,
+                min_rate=min(0.5, rate_per_second),
+                max_rate=rate_per_second,
+            )
+        else:
+            limiter = RateLimiter(rate_per_second=rate_per_second)
+        _shared_limiters[key] = limiter
+    return limiter
+
+
+def reset_shared_rate_limiters() -> None:
+    """Drop all shared limiters (used by tests to isolate state)."""
+    _shared_limiters.clear()
+
@@ -0,0 +1,158 @@
+"""RecordStore - compact SQLite file holding one Notion data cache.
+
+Data caches used to be a single indented JSON document per database,
+parsed in full (and validated into a DataCache) on every read even when
+the caller only needed page IDs and names. A RecordStore keeps the cache
+metadata (the DataCache fields other than content) in a one-row header
+table and each record as compact JSON in its own row, so that:
+
+- expiry can be checked from the header without touching the records
+- a full read parses one JSON array, not a pretty-printed document
+- projection reads ("page_id + name only") are evaluated by SQLite's JSON
+  functions and never materialize the other fields in Python
+
+Files are written to a temporary path and renamed into place, so readers
+see either the old or the new cache, never a partial one.
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE header (
+    id   INTEGER PRIMARY KEY CHECK (id = 1),
+    body TEXT NOT NULL
+);
+CREATE TABLE records (
+    pos  INTEGER PRIMARY KEY,
+    body TEXT NOT NULL
+);
+"""
+
+# The -> operator (JSON value of a key, nested objects included) needs 3.38
+_HAS_JSON_ARROW = sqlite3.sqlite_version_info >= (3, 38, 0)
+
+
+def _dumps(value: Any) -> str:
+    """Compact JSON, keeping non-ASCII text as-is."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class RecordStore:
+    """One data cache stored as a SQLite file."""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Store file path (need not exist yet)
+        """
+        self.path = Path(path)
+
+    def exists(self) -> bool:
+        """Whether the store file exists."""
+        return self.path.exists()
+
+    def write(self, header: Dict[str, Any], records: List[Any]) -> None:
+        """
+        Replace the store's contents atomically.
+
+        Args:
+            header: Cache metadata (JSON-serializable)
+            records: Records to store, in order
+
+        Raises:
+            sqlite3.Error, OSError: If the file cannot be written
+        """
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        if temp_path.exists():
+            temp_path.unlink()
+
+        try:
+            with closing(sqlite3.connect(temp_path)) as conn:
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                conn.execute(
+                    "INSERT INTO header (id, body) VALUES (1, ?)", (_dumps(header),)
+                )
+                conn.executemany(
+                    "INSERT INTO records (pos, body) VALUES (?, ?)",
+                    ((pos, _dumps(record)) for pos, record in enumerate(records)),
+                )
+                conn.commit()
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
+    def read_header(self) -> Dict[str, Any]:
+        """
+        Read the cache metadata without loading any records.
+
+        Raises:
+            sqlite3.Error: If the file is not a valid store
+            ValueError: If the header is missing or not a JSON object
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT body FROM header WHERE id = 1").fetchone()
+        if row is None:
+            raise ValueError("Record store has no header")
+        header = json.loads(row[0])
+        if not isinstance(header, dict):
+            raise ValueError("Record store header is not a JSON object")
+        return header
+
+    def read_records(self, fields: Optional[Sequence[str]] = None) -> List[Any]:
+        """
+        Read all records, or only some top-level fields of each.
+
+        Args:
+            fields: Keys to keep in each record (None reads whole records).
+                A key missing from a record is returned as None.
+
+        Returns:
+            Records in stored order
+
+        Raises:
+            sqlite3.Error: If the file is not a valid store
+            ValueError: If stored JSON is invalid
+        """
+        with closing(self._connect()) as conn:
+            if fields is None:
+                rows = conn.execute("SELECT body FROM records ORDER BY pos")
+                return json.loads("[" + ",".join(body for (body,) in rows) + "]")
+
+            if not _HAS_JSON_ARROW:
+                rows = conn.execute("SELECT body FROM records ORDER BY pos")
+                projected = []
+                for (body,) in rows:
+                    record = json.loads(body)
+                    if not isinstance(record, dict):
+                        record = {}
+                    projected.append({field: record.get(field) for field in fields})
+                return projected
+
+            columns = ", ".join("?, body -> ?" for _ in fields)
+            params: List[str] = []
+            for field in fields:
+                params += [field, _json_path(field)]
+            rows = conn.execute(
+                f"SELECT json_object({columns}) FROM records ORDER BY pos", params
+            )
+            return json.loads("[" + ",".join(body for (body,) in rows) + "]")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Read-only connection (never creates an empty file)."""
+        return sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def _json_path(field: str) -> str:
+    """JSON path selecting one top-level key, quoted so any key name works."""
+    return "$." + json.dumps(field, ensure_ascii=False)
@@ -4,12 +4,16 @@ This module provides functionality to create entries in the CollabIQ Notion data
 with all extracted and classified data fields.
 """
 
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from notion_client.errors import APIResponseError
 from llm_provider.types import ExtractedEntitiesWithClassification, WriteResult
 from .field_mapper import FieldMapper
+from .client import send_rate_limited
+from .rate_limiter import RequestPriority
 
 try:
     from ..error_handling import retry_with_backoff, NOTION_RETRY_CONFIG
@@ -19,6 +23,26 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Page writes in flight at once for create_collabiq_entries()
+DEFAULT_WRITE_CONCURRENCY = 5
+
+# Notion accepts at most 100 conditions in a compound filter
+MAX_FILTER_CONDITIONS = 100
+
+# Page-create attempts for the write in progress. A ContextVar rather than
+# an attribute so concurrent batch writes each count their own retries.
+_create_attempts: ContextVar[int] = ContextVar("notion_create_attempts", default=0)
+
+
+def _page_email_id(page: Dict[str, Any]) -> Optional[str]:
+    """Read the "Email ID" rich text value from a CollabIQ page."""
+    prop = page.get("properties", {}).get("Email ID", {})
+    text = "".join(
+        part.get("plain_text") or part.get("text", {}).get("content", "")
+        for part in prop.get("rich_text", [])
+    )
+    return text or None
+
 
 class NotionWriter:
     """Handles writing extracted email data to Notion databases."""
@@ -30,6 +54,9 @@ class NotionWriter:
         duplicate_behavior: str = "skip",
         dlq_manager=None,
         companies_db_id: Optional[str] = None,
+        llm_orchestrator=None,
+        stale_while_revalidate: bool = False,
+        cache_dir: Optional[str] = None,
     ):
         """Initialize NotionWriter with Notion integrator and database ID.
 
@@ -39,14 +66,24 @@ class NotionWriter:
             duplicate_behavior: Behavior for duplicates - "skip" or "update" (default: "skip")
             dlq_manager: Optional DLQManager for failed write handling
             companies_db_id: Optional Companies database ID for fuzzy matching
+            llm_orchestrator: Optional LLMOrchestrator; when given, company names
+                rapidfuzz cannot resolve but scores close are disambiguated
+                by the LLM (HybridMatcher)
+            stale_while_revalidate: Let the companies cache serve an expired
+                snapshot while refreshing it in the background (for the
+                long-running daemon)
+            cache_dir: Directory for the companies and users caches
+                (defaults to data/notion_cache)
         """
         self.notion_integrator = notion_integrator
         self.collabiq_db_id = collabiq_db_id
         self.companies_db_id = companies_db_id
         self.duplicate_behavior = duplicate_behavior
         self.dlq_manager = dlq_manager
+        self.llm_orchestrator = llm_orchestrator
+        self.stale_while_revalidate = stale_while_revalidate
+        self.cache_dir = cache_dir
         self.field_mapper: Optional[FieldMapper] = None
-        self._retry_count = 0  # Track retry attempts for current operation
 
     async def check_duplicate(self, email_id: str) -> Optional[str]:
         """Check if an entry with the given email_id already exists.
@@ -118,6 +155,12 @@ class NotionWriter:
                 f"Successfully created company: {company_name}, page_id={page_id}"
             )
 
+            # Patch the new page into the cached company context
+            try:
+                self.notion_integrator.upsert_record(companies_db_id, response)
+            except Exception as e:
+                logger.warning(f"Failed to add company to cached context: {e}")
+
             return page_id
 
         except Exception as e:
@@ -143,11 +186,113 @@ class NotionWriter:
         Raises:
             APIResponseError: If page creation fails after retries
         """
-        response = await self.notion_integrator.client.client.pages.create(
-            parent={"database_id": companies_db_id},
-            properties=properties,
+        client = self.notion_integrator.client
+        return await send_rate_limited(
+            client,
+            lambda: client.client.pages.create(
+                parent={"database_id": companies_db_id},
+                properties=properties,
+            ),
+            RequestPriority.WRITE,
+        )
+
+    async def _ensure_field_mapper(self) -> FieldMapper:
+        """Initialize FieldMapper with schema discovery (lazy load).
+
+        Returns:
+            The writer's FieldMapper
+        """
+        if self.field_mapper is None:
+            schema = await self.notion_integrator.discover_database_schema(
+                self.collabiq_db_id
+            )
+
+            # Initialize matchers and cache for field mapping
+            company_matcher = None
+            person_matcher = None
+            companies_cache = None
+
+            if self.companies_db_id:
+                # Import here to avoid circular dependencies
+                from .fuzzy_matcher import HybridMatcher, RapidfuzzMatcher
+                from .person_matcher import NotionPersonMatcher
+                from .cache import CacheManager
+                from .companies_cache import CompaniesCache
+                from .match_memo import MatchMemo
+
+                # Match results are memoized per name and snapshot version,
+                # shared by company and person matching
+                memo = MatchMemo()
+
+                # Initialize company matcher
+                if self.llm_orchestrator is not None:
+                    company_matcher = HybridMatcher(self.llm_orchestrator, memo=memo)
+                else:
+                    company_matcher = RapidfuzzMatcher(memo=memo)
+
+                # Initialize person matcher
+                person_matcher = NotionPersonMatcher(
+                    notion_client=self.notion_integrator.client,
+                    cache_dir=self.cache_dir,
+                    memo=memo,
+                )
+
+                # Initialize companies cache
+                companies_cache = CompaniesCache(
+                    client=self.notion_integrator.client,
+                    companies_db_id=self.companies_db_id,
+                    cache_manager=(
+                        CacheManager(cache_dir=self.cache_dir)
+                        if self.cache_dir
+                        else None
+                    ),
+                    stale_while_revalidate=self.stale_while_revalidate,
+                )
+
+            # Create FieldMapper with all components
+            self.field_mapper = FieldMapper(
+                schema=schema,
+                company_matcher=company_matcher,
+                person_matcher=person_matcher,
+                companies_cache=companies_cache,
+                notion_writer=self,
+                companies_db_id=self.companies_db_id,
+            )
+        return self.field_mapper
+
+    async def _map_properties(
+        self,
+        extracted_data: ExtractedEntitiesWithClassification,
+        company_candidates: Optional[List[Tuple[str, str]]] = None,
+        users: Optional[List[Any]] = None,
+        company_matches: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Map extracted data to Notion properties format.
+
+        Uses the async (matching) version if available, otherwise falls
+        back to sync. Snapshot arguments are only passed when given.
+        """
+        if hasattr(self.field_mapper, "map_to_notion_properties_async"):
+            snapshot = {}
+            if company_candidates is not None:
+                snapshot["company_candidates"] = company_candidates
+            if users is not None:
+                snapshot["users"] = users
+            if company_matches:
+                snapshot["company_matches"] = company_matches
+            return await self.field_mapper.map_to_notion_properties_async(
+                extracted_data, **snapshot
+            )
+        return self.field_mapper.map_to_notion_properties(extracted_data)
+
+    async def _update_page(self, page_id: str, properties: Dict[str, Any]) -> None:
+        """Update an existing page at write priority."""
+        client = self.notion_integrator.client
+        await send_rate_limited(
+            client,
+            lambda: client.client.pages.update(page_id=page_id, properties=properties),
+            RequestPriority.WRITE,
         )
-        return response
 
     async def create_collabiq_entry(
         self, extracted_data: ExtractedEntitiesWithClassification
@@ -160,117 +305,305 @@ class NotionWriter:
         Returns:
             WriteResult with success status, page_id, or error details
         """
-        # Reset retry counter for this operation
-        self._retry_count = 0
-
         try:
-            # Initialize FieldMapper with schema discovery (lazy load)
-            if self.field_mapper is None:
-                schema = await self.notion_integrator.discover_database_schema(
-                    self.collabiq_db_id
+            await self._ensure_field_mapper()
+
+            # Check for duplicate entry
+            existing_page_id = await self.check_duplicate(extracted_data.email_id)
+
+            if existing_page_id and self.duplicate_behavior == "skip":
+                return self._skipped_duplicate_result(
+                    extracted_data.email_id, existing_page_id
                 )
 
-                # Initialize matchers and cache for field mapping
-                company_matcher = None
-                person_matcher = None
-                companies_cache = None
+            # Startup and partner are disambiguated together (one LLM call)
+            company_candidates = await self._load_prematch_candidates()
+            company_matches = await self._prematch_companies(
+                [extracted_data], company_candidates
+            )
 
-                if self.companies_db_id:
-                    # Import here to avoid circular dependencies
-                    from .fuzzy_matcher import RapidfuzzMatcher
-                    from .person_matcher import NotionPersonMatcher
-                    from .companies_cache import CompaniesCache
+            properties = await self._map_properties(
+                extracted_data, company_candidates, company_matches=company_matches
+            )
+            return await self._write_mapped_entry(
+                extracted_data, properties, existing_page_id
+            )
 
-                    # Initialize company matcher
-                    company_matcher = RapidfuzzMatcher()
+        except Exception as e:
+            return self._failed_write_result(extracted_data, e)
 
-                    # Initialize person matcher
-                    person_matcher = NotionPersonMatcher(
-                        notion_client=self.notion_integrator.client
-                    )
+    async def create_collabiq_entries(
+        self,
+        batch: Sequence[ExtractedEntitiesWithClassification],
+        max_concurrency: int = DEFAULT_WRITE_CONCURRENCY,
+    ) -> List[WriteResult]:
+        """Create CollabIQ entries for a batch of emails.
+
+        Bulk counterpart of create_collabiq_entry() for backfills and DLQ
+        replays:
+        - Duplicates for the whole batch are looked up with OR-filtered
+          queries (up to 100 email IDs per request) instead of one query
+          per email
+        - Company candidates and workspace users are loaded once and shared
+          by every item; companies auto-created for one item are added to
+          the snapshot so later items match them instead of creating them
+          again
+        - With an LLM-backed company matcher, the company names of the whole
+          batch are pre-matched together: one LLM call disambiguates all of
+          them, and per-item matching is served from the match memo
+        - Field mapping runs in order while page writes for already-mapped
+          items proceed concurrently (bounded by max_concurrency) under the
+          client's shared rate limiter
+
+        Emails repeated within the batch are written once; the repeats get
+        a duplicate result pointing at the first one's page.
 
-                    # Initialize companies cache
-                    companies_cache = CompaniesCache(
-                        client=self.notion_integrator.client,
-                        companies_db_id=self.companies_db_id,
-                    )
+        Args:
+            batch: Extracted and classified email data
+            max_concurrency: Maximum page writes in flight at once
 
-                # Create FieldMapper with all components
-                self.field_mapper = FieldMapper(
-                    schema=schema,
-                    company_matcher=company_matcher,
-                    person_matcher=person_matcher,
-                    companies_cache=companies_cache,
-                    notion_writer=self,
-                    companies_db_id=self.companies_db_id,
-                )
+        Returns:
+            One WriteResult per input item, in input order. Failed items are
+            saved to the DLQ (if configured) exactly as in create_collabiq_entry()
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if not batch:
+            return []
 
-            # Check for duplicate entry
-            existing_page_id = await self.check_duplicate(extracted_data.email_id)
+        results: List[Optional[WriteResult]] = [None] * len(batch)
 
-            if existing_page_id:
-                # Duplicate detected
-                if self.duplicate_behavior == "skip":
-                    logger.info(
-                        f"Duplicate detected for email_id={extracted_data.email_id}, "
-                        f"existing_page_id={existing_page_id}. Skipping write (duplicate_behavior=skip)."
-                    )
-                    return WriteResult(
-                        success=True,
-                        page_id=None,
-                        email_id=extracted_data.email_id,
-                        retry_count=0,
-                        is_duplicate=True,
-                        existing_page_id=existing_page_id,
-                    )
-                elif self.duplicate_behavior == "update":
-                    logger.info(
-                        f"Duplicate detected for email_id={extracted_data.email_id}, "
-                        f"existing_page_id={existing_page_id}. Updating entry (duplicate_behavior=update)."
+        try:
+            await self._ensure_field_mapper()
+            existing = await self.check_duplicates(
+                [item.email_id for item in batch]
+            )
+            company_candidates, users = await self._load_match_snapshot()
+            company_matches = await self._prematch_companies(
+                batch, company_candidates
+            )
+        except Exception as e:
+            # Shared setup failed - every item fails the same way
+            return [self._failed_write_result(item, e) for item in batch]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        first_index: Dict[str, int] = {}
+        writes: Dict[int, asyncio.Task] = {}
+
+        async def write(extracted_data, properties, existing_page_id):
+            async with semaphore:
+                return await self._write_mapped_entry(
+                    extracted_data, properties, existing_page_id
+                )
+
+        try:
+            for index, extracted_data in enumerate(batch):
+                email_id = extracted_data.email_id
+                if email_id in first_index:
+                    continue  # Filled in from the first occurrence below
+                first_index[email_id] = index
+
+                existing_page_id = existing.get(email_id)
+                if existing_page_id and self.duplicate_behavior == "skip":
+                    results[index] = self._skipped_duplicate_result(
+                        email_id, existing_page_id
                     )
-                    # Map extracted data to Notion properties format
-                    # Use async version if available, otherwise fall back to sync
-                    if hasattr(self.field_mapper, "map_to_notion_properties_async"):
-                        properties = (
-                            await self.field_mapper.map_to_notion_properties_async(
-                                extracted_data
-                            )
-                        )
-                    else:
-                        properties = self.field_mapper.map_to_notion_properties(
-                            extracted_data
-                        )
-
-                    # Update existing page
-                    await self.notion_integrator.client.client.pages.update(
-                        page_id=existing_page_id, properties=properties
+                    continue
+
+                try:
+                    properties = await self._map_properties(
+                        extracted_data, company_candidates, users, company_matches
                     )
+                except Exception as e:
+                    results[index] = self._failed_write_result(extracted_data, e)
+                    continue
+
+                writes[index] = asyncio.create_task(
+                    write(extracted_data, properties, existing_page_id)
+                )
 
-                    return WriteResult(
-                        success=True,
-                        page_id=existing_page_id,
-                        email_id=extracted_data.email_id,
-                        retry_count=0,
-                        is_duplicate=True,
-                        existing_page_id=existing_page_id,
+            outcomes = await asyncio.gather(*writes.values(), return_exceptions=True)
+        except BaseException:
+            for task in writes.values():
+                task.cancel()
+            raise
+
+        for index, outcome in zip(writes, outcomes):
+            if isinstance(outcome, BaseException):
+                outcome = self._failed_write_result(batch[index], outcome)
+            results[index] = outcome
+
+        for index, extracted_data in enumerate(batch):
+            if results[index] is None:
+                first = results[first_index[extracted_data.email_id]]
+                if first.success:
+                    results[index] = self._skipped_duplicate_result(
+                        extracted_data.email_id,
+                        first.page_id or first.existing_page_id,
                     )
+                else:
+                    results[index] = first.model_copy()
 
-            # No duplicate - proceed with creation
-            # Map extracted data to Notion properties format
-            # Use async version if available, otherwise fall back to sync
-            if hasattr(self.field_mapper, "map_to_notion_properties_async"):
-                properties = await self.field_mapper.map_to_notion_properties_async(
-                    extracted_data
+        succeeded = sum(1 for result in results if result.success)
+        logger.info(
+            f"Batch write complete: {succeeded}/{len(batch)} succeeded "
+            f"(max_concurrency={max_concurrency})"
+        )
+        return results
+
+    async def check_duplicates(self, email_ids: Sequence[str]) -> Dict[str, str]:
+        """Look up existing entries for many email IDs at once.
+
+        Args:
+            email_ids: Email identifiers to check
+
+        Returns:
+            Mapping of email_id to existing page_id for those that exist
+        """
+        unique_ids = list(dict.fromkeys(email_ids))
+        existing: Dict[str, str] = {}
+
+        for start in range(0, len(unique_ids), MAX_FILTER_CONDITIONS):
+            chunk = unique_ids[start : start + MAX_FILTER_CONDITIONS]
+            filter_conditions = {
+                "or": [
+                    {"property": "Email ID", "rich_text": {"equals": email_id}}
+                    for email_id in chunk
+                ]
+            }
+            cursor = None
+            while True:
+                response = await self.notion_integrator.client.query_database(
+                    database_id=self.collabiq_db_id,
+                    filter_conditions=filter_conditions,
+                    start_cursor=cursor,
+                    page_size=100,
+                )
+                for page in response.get("results", []):
+                    email_id = _page_email_id(page)
+                    if email_id and email_id not in existing:
+                        existing[email_id] = page["id"]
+                if not response.get("has_more"):
+                    break
+                cursor = response.get("next_cursor")
+
+        if existing:
+            logger.info(f"Found {len(existing)} existing entries in batch")
+        return existing
+
+    async def _load_match_snapshot(
+        self,
+    ) -> Tuple[Optional[List[Tuple[str, str]]], Optional[List[Any]]]:
+        """Load company candidates and workspace users once for a batch."""
+        company_candidates = None
+        users = None
+        field_mapper = self.field_mapper
+
+        companies_cache = getattr(field_mapper, "companies_cache", None)
+        if getattr(field_mapper, "company_matcher", None) and companies_cache:
+            company_candidates = await field_mapper._load_company_candidates()
+
+        person_matcher = getattr(field_mapper, "person_matcher", None)
+        if person_matcher is not None and hasattr(person_matcher, "list_users_async"):
+            users = await person_matcher.list_users_async()
+
+        return company_candidates, users
+
+    async def _load_prematch_candidates(self) -> Optional[List[Tuple[str, str]]]:
+        """Load company candidates if the company matcher can pre-match.
+
+        Returns None (candidates are then loaded during mapping as usual)
+        for matchers without match_many().
+        """
+        field_mapper = self.field_mapper
+        matcher = getattr(field_mapper, "company_matcher", None)
+        if not hasattr(matcher, "match_many") or not getattr(
+            field_mapper, "companies_cache", None
+        ):
+            return None
+        return await field_mapper._load_company_candidates()
+
+    async def _prematch_companies(
+        self,
+        batch: Sequence[ExtractedEntitiesWithClassification],
+        company_candidates: Optional[List[Tuple[str, str]]],
+    ) -> Dict[str, Any]:
+        """Match the batch's unmatched company names in one match_many() call.
+
+        Only for matchers with match_many() (HybridMatcher). The results are
+        returned for field mapping to use first: memoized results are keyed
+        on the candidate snapshot version, which changes when an item
+        auto-creates a company, so the memo alone would send later items'
+        names to the LLM again. Failures are logged; items then match one
+        by one.
+
+        Returns:
+            CompanyMatch per normalized name (empty if nothing was pre-matched)
+        """
+        matcher = getattr(self.field_mapper, "company_matcher", None)
+        if company_candidates is None or not hasattr(matcher, "match_many"):
+            return {}
+
+        names = []
+        for item in batch:
+            if item.startup_name and not item.matched_company_id:
+                names.append(item.startup_name)
+            if item.partner_org and not item.matched_partner_id:
+                names.append(item.partner_org)
+        names = [name for name in names if name.strip()]
+        if not names:
+            return {}
+
+        try:
+            return await matcher.match_many(
+                names,
+                company_candidates,
+                auto_create=True,
+                similarity_threshold=0.85,
+            )
+        except Exception as e:
+            logger.warning(f"Batch company pre-matching failed: {e}")
+            return {}
+
+    async def _write_mapped_entry(
+        self,
+        extracted_data: ExtractedEntitiesWithClassification,
+        properties: Dict[str, Any],
+        existing_page_id: Optional[str],
+    ) -> WriteResult:
+        """Create (or, for duplicates in update mode, update) one entry.
+
+        Args:
+            extracted_data: Extracted and classified email data
+            properties: Mapped Notion properties
+            existing_page_id: Existing duplicate page, if any
+
+        Returns:
+            WriteResult for the item (failures are saved to the DLQ)
+        """
+        try:
+            if existing_page_id:
+                logger.info(
+                    f"Duplicate detected for email_id={extracted_data.email_id}, "
+                    f"existing_page_id={existing_page_id}. Updating entry (duplicate_behavior=update)."
+                )
+                await self._update_page(existing_page_id, properties)
+                return WriteResult(
+                    success=True,
+                    page_id=existing_page_id,
+                    email_id=extracted_data.email_id,
+                    retry_count=0,
+                    is_duplicate=True,
+                    existing_page_id=existing_page_id,
                 )
-            else:
-                properties = self.field_mapper.map_to_notion_properties(extracted_data)
 
             # Create page (retry logic handled by decorator)
+            _create_attempts.set(0)
             page_response = await self._create_page(properties)
 
             # Return success result
             # retry_count: subtract 1 because first attempt is not a retry
-            actual_retries = max(0, self._retry_count - 1)
+            actual_retries = max(0, _create_attempts.get() - 1)
             return WriteResult(
                 success=True,
                 page_id=page_response["id"],
@@ -278,53 +611,75 @@ class NotionWriter:
                 retry_count=actual_retries,
                 is_duplicate=False,
             )
-
         except Exception as e:
-            logger.error(
-                f"Failed to create Notion entry for email_id={extracted_data.email_id}: {e}",
-                exc_info=True,
-            )
+            return self._failed_write_result(extracted_data, e)
 
-            # Extract error details
-            error_type = type(e).__name__
-            error_message = str(e)
-            status_code = None
-
-            if isinstance(e, APIResponseError):
-                # Safely extract status code
-                if hasattr(e, "response") and hasattr(e.response, "status_code"):
-                    status_code = e.response.status_code
-                # Format error message
-                if hasattr(e, "message") and hasattr(e, "code"):
-                    error_message = f"{e.message} (code: {e.code})"
-
-            # Save to DLQ if manager is available
-            if self.dlq_manager:
-                error_details = {
-                    "error_type": error_type,
-                    "error_message": error_message,
-                    "status_code": status_code,
-                    "retry_count": 3,  # Assume max retries attempted
-                }
-                try:
-                    dlq_file = self.dlq_manager.save_failed_write(
-                        extracted_data=extracted_data, error_details=error_details
-                    )
-                    logger.info(f"Failed write saved to DLQ: {dlq_file}")
-                except Exception as dlq_error:
-                    logger.error(f"Failed to save to DLQ: {dlq_error}", exc_info=True)
+    def _skipped_duplicate_result(
+        self, email_id: str, existing_page_id: Optional[str]
+    ) -> WriteResult:
+        """Build the result for a duplicate skipped under duplicate_behavior=skip."""
+        logger.info(
+            f"Duplicate detected for email_id={email_id}, "
+            f"existing_page_id={existing_page_id}. Skipping write (duplicate_behavior=skip)."
+        )
+        return WriteResult(
+            success=True,
+            page_id=None,
+            email_id=email_id,
+            retry_count=0,
+            is_duplicate=True,
+            existing_page_id=existing_page_id,
+        )
 
-            # Return error result
-            return WriteResult(
-                success=False,
-                page_id=None,
-                email_id=extracted_data.email_id,
-                error_type=error_type,
-                error_message=error_message,
-                status_code=status_code,
-                retry_count=3,  # Assume max retries attempted
-                is_duplicate=False,
-            )
+    def _failed_write_result(
+        self, extracted_data: ExtractedEntitiesWithClassification, e: BaseException
+    ) -> WriteResult:
+        """Log a failed write, save it to the DLQ and build its WriteResult."""
+        logger.error(
+            f"Failed to create Notion entry for email_id={extracted_data.email_id}: {e}",
+            exc_info=e,
+        )
+
+        # Extract error details
+        error_type = type(e).__name__
+        error_message = str(e)
+        status_code = None
+
+        if isinstance(e, APIResponseError):
+            # Safely extract status code
+            if hasattr(e, "response") and hasattr(e.response, "status_code"):
+                status_code = e.response.status_code
+            # Format error message
+            if hasattr(e, "message") and hasattr(e, "code"):
+                error_message = f"{e.message} (code: {e.code})"
+
+        # Save to DLQ if manager is available
+        if self.dlq_manager:
+            error_details = {
+                "error_type": error_type,
+                "error_message": error_message,
+                "status_code": status_code,
+                "retry_count": 3,  # Assume max retries attempted
+            }
+            try:
+                dlq_file = self.dlq_manager.save_failed_write(
+                    extracted_data=extracted_data, error_details=error_details
+                )
+                logger.info(f"Failed write saved to DLQ: {dlq_file}")
+            except Exception as dlq_error:
+                logger.error(f"Failed to save to DLQ: {dlq_error}", exc_info=True)
+
+        # Return error result
+        return WriteResult(
+            success=False,
+            page_id=None,
+            email_id=extracted_data.email_id,
+            error_type=error_type,
+            error_message=error_message,
+            status_code=status_code,
+            retry_count=3,  # Assume max retries attempted
+            is_duplicate=False,
+        )
 
     @retry_with_backoff(NOTION_RETRY_CONFIG)
     async def _create_page(self, properties: Dict[str, Any]) -> Dict[str, Any]:
@@ -346,14 +701,19 @@ class NotionWriter:
             APIResponseError: If page creation fails after retries
         """
         # Track retry attempts (incremented on each call by decorator)
-        if self._retry_count > 0:
-            logger.debug(f"Retry attempt {self._retry_count} for page creation")
-        self._retry_count += 1
+        attempts = _create_attempts.get()
+        if attempts > 0:
+            logger.debug(f"Retry attempt {attempts} for page creation")
+        _create_attempts.set(attempts + 1)
 
-        # Call Notion API to create page
+        # Call Notion API to create page at write priority
         # Retry logic is handled by the decorator
-        response = await self.notion_integrator.client.client.pages.create(
-            parent={"database_id": self.collabiq_db_id},
-            properties=properties,
+        client = self.notion_integrator.client
+        return await send_rate_limited(
+            client,
+            lambda: client.client.pages.create(
+                parent={"database_id": self.collabiq_db_id},
+                properties=properties,
+            ),
+            RequestPriority.WRITE,
         )
-        return response
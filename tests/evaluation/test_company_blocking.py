@@ -0,0 +1,223 @@
+"""
+Recall and Latency Evaluation: CompanyIndex n-gram blocking
+
+Blocking scores only the candidates sharing enough jamo trigrams with the
+query. This module measures what that costs in recall and gains in latency
+against a full scan of the same index, using the ground truth dataset of
+test_matching_comparison.py with the candidate list padded by synthetic
+company names (the real Companies cache is usually much larger than the
+evaluation candidates).
+
+Metrics:
+- Recall: % of full-scan matches that blocking also finds (same candidate)
+- Block size: Average number of candidates scored per query
+- Latency: Average / p95 time per best_match() call (ms)
+
+Usage:
+    pytest tests/evaluation/test_company_blocking.py -v
+    python scripts/analysis/benchmark_company_blocking.py
+"""
+
+import random
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Tuple
+
+import pytest
+
+from notion_integrator.fuzzy_matcher import CompanyIndex, normalize_company_name
+from tests.evaluation.test_matching_comparison import (
+    load_candidates,
+    load_ground_truth,
+)
+
+
+_SYLLABLES = (
+    "가나다라마바사아자차카타파하강남동림명민빛산상서선성세솔수신"
+    "아연영오온우원유은이인재정제주준지진창청태한현형혜화희"
+)
+_SUFFIXES = ["", "", "", "테크", "랩스", "컴퍼니", "파트너스", "바이오", "(주)", "솔루션", "에너지"]
+_LATIN = "ABCDEFGHIJKLMNOPRSTUVWXYZ"
+
+
+@dataclass
+class BlockingMetrics:
+    """Blocking evaluation results for one candidate set size."""
+
+    candidates: int
+    queries: int
+    recall: float
+    missed: int
+    avg_block_size: float
+    full_avg_latency_ms: float
+    full_p95_latency_ms: float
+    blocked_avg_latency_ms: float
+    blocked_p95_latency_ms: float
+
+    @property
+    def speedup(self) -> float:
+        if not self.blocked_avg_latency_ms:
+            return 0.0
+        return self.full_avg_latency_ms / self.blocked_avg_latency_ms
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return {**asdict(self), "speedup": self.speedup}
+
+
+def synthetic_candidates(count: int, seed: int = 42) -> List[Tuple[str, str]]:
+    """
+    Generate deterministic company-like distractor names.
+
+    Args:
+        count: Number of candidates
+        seed: Random seed
+
+    Returns:
+        List of (page_id, company_name) tuples
+    """
+    rng = random.Random(seed)
+    names = []
+    for i in range(count):
+        if rng.random() < 0.15:
+            base = "".join(rng.choice(_LATIN) for _ in range(rng.randint(2, 5)))
+        else:
+            base = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 5)))
+        names.append((f"synthetic-{i:06d}", base + rng.choice(_SUFFIXES)))
+    return names
+
+
+def perturbed_queries(names: List[str], count: int, seed: int = 7) -> List[str]:
+    """
+    Derive query variants (spacing, dropped/added characters) from names.
+
+    Args:
+        names: Source company names
+        count: Number of queries
+        seed: Random seed
+
+    Returns:
+        Non-empty query strings
+    """
+    rng = random.Random(seed)
+    queries = []
+    while len(queries) < count:
+        chars = list(rng.choice(names))
+        edit = rng.random()
+        if edit < 0.3 and len(chars) > 2:
+            chars.pop(rng.randrange(len(chars)))
+        elif edit < 0.6:
+            chars.insert(rng.randrange(len(chars) + 1), rng.choice(" 웍워크(주)"))
+        elif edit < 0.8 and len(chars) > 1:
+            chars.insert(rng.randrange(1, len(chars)), " ")
+        query = "".join(chars).strip()
+        if query:
+            queries.append(query)
+    return queries
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def evaluate_blocking(
+    candidates: List[Tuple[str, str]],
+    queries: List[str],
+    *,
+    similarity_threshold: float = 0.85,
+) -> BlockingMetrics:
+    """
+    Compare blocked against full-scan best_match() on the same candidates.
+
+    Args:
+        candidates: List of (page_id, company_name) tuples
+        queries: Extracted company names to match
+        similarity_threshold: Threshold for matching
+
+    Returns:
+        BlockingMetrics
+    """
+    full = CompanyIndex(candidates, blocking_min_candidates=None)
+    blocked = CompanyIndex(candidates, blocking_min_candidates=0)
+
+    full_latencies, blocked_latencies, block_sizes = [], [], []
+    expected_matches = 0
+    missed = 0
+
+    for query in queries:
+        name = normalize_company_name(query)
+
+        start = time.perf_counter()
+        expected = full.best_match(name, similarity_threshold)
+        full_latencies.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        found = blocked.best_match(name, similarity_threshold)
+        blocked_latencies.append((time.perf_counter() - start) * 1000)
+
+        block_sizes.append(len(blocked.block(name) or ()))
+        if expected is not None:
+            expected_matches += 1
+            if found != expected:
+                missed += 1
+
+    return BlockingMetrics(
+        candidates=len(candidates),
+        queries=len(queries),
+        recall=(
+            (expected_matches - missed) / expected_matches if expected_matches else 1.0
+        ),
+        missed=missed,
+        avg_block_size=sum(block_sizes) / len(block_sizes),
+        full_avg_latency_ms=sum(full_latencies) / len(full_latencies),
+        full_p95_latency_ms=_percentile(full_latencies, 0.95),
+        blocked_avg_latency_ms=sum(blocked_latencies) / len(blocked_latencies),
+        blocked_p95_latency_ms=_percentile(blocked_latencies, 0.95),
+    )
+
+
+def load_blocking_dataset(
+    total_candidates: int,
+) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """
+    Evaluation candidates padded with synthetic names, and the queries.
+
+    Queries are the ground truth extracted names plus perturbed variants of
+    the evaluation candidate names.
+
+    Args:
+        total_candidates: Candidate list size after padding
+
+    Returns:
+        Tuple of (candidates, queries)
+    """
+    candidates = load_candidates()
+    padding = max(0, total_candidates - len(candidates))
+    candidates = candidates + synthetic_candidates(padding)
+
+    queries = [case["extracted_name"] for case in load_ground_truth()]
+    queries += perturbed_queries([name for _, name in load_candidates()], 200)
+    return candidates, [q for q in queries if q.strip()]
+
+
+def test_blocking_recall_on_ground_truth():
+    """Blocking finds the same match as a full scan on evaluation data."""
+    candidates, queries = load_blocking_dataset(2_000)
+
+    metrics = evaluate_blocking(candidates, queries)
+
+    assert metrics.recall >= 0.99, f"Blocking recall {metrics.recall:.1%} below 99%"
+    assert metrics.avg_block_size < len(candidates) / 4
+
+
+@pytest.mark.skip(reason="Latency benchmark - run manually")
+@pytest.mark.parametrize("total_candidates", [1_000, 5_000, 20_000])
+def test_blocking_latency(total_candidates):
+    """Blocked matching is faster than a full scan on large candidate sets."""
+    candidates, queries = load_blocking_dataset(total_candidates)
+
+    metrics = evaluate_blocking(candidates, queries)
+
+    print(f"\n{metrics.to_dict()}")
+    assert metrics.blocked_avg_latency_ms < metrics.full_avg_latency_ms
@@ -0,0 +1,86 @@
+"""Integration tests for Notion rate limiting against a local API stub.
+
+Runs the real NotionClient/SDK/httpx stack against NotionStubServer, which
+answers 429 with Retry-After once its token bucket is exhausted, to verify
+the adaptive limiter absorbs rate limiting without surfacing errors.
+"""
+
+import asyncio
+
+import pytest
+
+from collabiq.test_utils.notion_stub import NotionStubServer
+from notion_integrator.client import NotionClient, send_rate_limited
+from notion_integrator.rate_limiter import RequestPriority, reset_shared_rate_limiters
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    """Each test gets a fresh shared limiter for its token."""
+    reset_shared_rate_limiters()
+    yield
+    reset_shared_rate_limiters()
+
+
+class TestNotionRateLimitStub:
+    """Adaptive rate limiting end to end over HTTP."""
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honoured_and_requests_succeed(self):
+        """
+        Test: Forced 429s are absorbed via Retry-After.
+
+        Given: Stub rejects the first 2 requests with Retry-After: 0.2
+        When: Client retrieves a database
+        Then: Call succeeds, limiter recorded both 429s and slowed down
+        """
+        with NotionStubServer(rate_per_second=50.0, fail_first=2, retry_after=0.2) as stub:
+            client = NotionClient(api_key="secret_stub_retry", base_url=stub.base_url)
+
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            response = await client.retrieve_database(stub.database_id)
+            elapsed = loop.time() - start
+
+        assert response["id"] == stub.database_id
+        assert stub.rate_limited_count == 2
+        assert elapsed >= 0.4
+        stats = client.rate_limiter.get_stats()
+        assert stats["rate_limit_hits"] == 2
+        assert stats["rate_per_second"] < stats["max_rate"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_stay_within_server_budget(self):
+        """
+        Test: Concurrent clients sharing a token all succeed.
+
+        Given: Stub enforcing 3 req/s and two clients with the same token
+        When: 8 page creations are issued concurrently
+        Then: All succeed and accepted traffic never exceeds the budget
+        """
+        with NotionStubServer(rate_per_second=3.0, retry_after=0.5) as stub:
+            clients = [
+                NotionClient(api_key="secret_stub_shared", base_url=stub.base_url)
+                for _ in range(2)
+            ]
+
+            async def create(i):
+                client = clients[i % 2]
+                return await send_rate_limited(
+                    client,
+                    lambda: client.client.pages.create(
+                        parent={"database_id": stub.database_id},
+                        properties={"Name": {"title": [{"text": {"content": f"{i}"}}]}},
+                    ),
+                    RequestPriority.WRITE,
+                )
+
+            results = await asyncio.gather(*(create(i) for i in range(8)))
+
+            assert len(results) == 8
+            assert len(stub.pages) == 8
+            stats = stub.get_stats()
+
+        # Clock skew between the two buckets may cost the odd 429, never more
+        assert stats["rate_limited"] <= 2
+        assert stats["peak_requests_per_second"] <= 4  # burst of 3 + 1 refill
@@ -0,0 +1,49 @@
+"""
+Microbenchmark for ContentNormalizer over tests/fixtures/sample_emails.
+
+Compares cleaning with the anchor prefilter (patterns.scan_anchors) to
+trying every pattern, and checks both give the same results.
+
+Usage:
+    pytest tests/performance/test_normalizer_benchmark.py -s
+"""
+
+import logging
+import time
+from pathlib import Path
+
+from content_normalizer import patterns
+from content_normalizer.normalizer import ContentNormalizer
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "sample_emails"
+ROUNDS = 50
+
+
+def _clean_corpus(normalizer, bodies):
+    start = time.perf_counter()
+    results = [normalizer.clean(body).cleaned_body for _ in range(ROUNDS) for body in bodies]
+    return time.perf_counter() - start, results
+
+
+def test_prefilter_benchmark(monkeypatch):
+    bodies = [path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("*.txt"))]
+    normalizer = ContentNormalizer()
+    # Measure pattern work, not log formatting
+    logging.disable(logging.INFO)
+    try:
+        prefiltered_time, prefiltered = _clean_corpus(normalizer, bodies)
+        with monkeypatch.context() as m:
+            m.setattr(patterns, "scan_anchors", lambda text: None)
+            all_patterns_time, all_patterns = _clean_corpus(normalizer, bodies)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    emails = ROUNDS * len(bodies)
+    print(
+        f"\nContentNormalizer.clean over {emails} emails: "
+        f"all patterns {emails / all_patterns_time:,.0f}/s, "
+        f"prefiltered {emails / prefiltered_time:,.0f}/s "
+        f"({all_patterns_time / prefiltered_time:.1f}x)"
+    )
+    assert prefiltered == all_patterns
+    assert prefiltered_time < all_patterns_time
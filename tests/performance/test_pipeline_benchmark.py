@@ -0,0 +1,157 @@
+"""Tests for the offline daemon pipeline benchmark.
+
+Covers the latency distributions, stage timing and threshold checks, and
+one small end-to-end run of DaemonController.process_cycle() against the
+fake Gmail service, stub LLM providers and Notion stub server.
+"""
+
+import random
+
+import pytest
+
+from collabiq.test_utils.performance_monitor import PerformanceThresholds
+from collabiq.test_utils.pipeline_benchmark import (
+    BenchmarkConfig,
+    FakeGmailService,
+    LatencyDistribution,
+    PipelineBenchmark,
+    StageRecorder,
+    StageStats,
+    check_stage,
+    generate_benchmark_emails,
+    percentile,
+)
+
+
+class TestLatencyDistribution:
+    """Test latency distribution parsing and sampling."""
+
+    @pytest.mark.parametrize(
+        "spec,expected",
+        [
+            ("0.25", LatencyDistribution("fixed", (0.25,))),
+            ("uniform:0.1,0.5", LatencyDistribution("uniform", (0.1, 0.5))),
+            ("lognormal:1.0,0.4", LatencyDistribution("lognormal", (1.0, 0.4))),
+        ],
+    )
+    def test_parse(self, spec, expected):
+        assert LatencyDistribution.parse(spec) == expected
+
+    @pytest.mark.parametrize("spec", ["gamma:1,2", "uniform:0.1", "fixed:-1"])
+    def test_invalid_spec_rejected(self, spec):
+        with pytest.raises(ValueError):
+            LatencyDistribution.parse(spec)
+
+    def test_samples_stay_in_range(self):
+        rng = random.Random(0)
+        uniform = LatencyDistribution("uniform", (0.1, 0.2))
+        normal = LatencyDistribution("normal", (0.0, 1.0))
+
+        assert all(0.1 <= uniform.sample(rng) <= 0.2 for _ in range(100))
+        assert all(normal.sample(rng) >= 0 for _ in range(100))
+
+
+class TestStageTiming:
+    """Test percentiles, stage recording and threshold checks."""
+
+    def test_percentile_interpolates(self):
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+        assert percentile(values, 50) == 3.0
+        assert percentile(values, 90) == pytest.approx(4.6)
+        assert percentile([], 95) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_recorder_times_calls_and_emails(self):
+        class Component:
+            async def start(self, email_id):
+                return True
+
+            async def finish(self, email_id):
+                return None
+
+        ticks = iter(range(100))
+        recorder = StageRecorder(clock=lambda: float(next(ticks)))
+        component = Component()
+        recorder.wrap(component, "start", "first", email_key=lambda email_id: email_id)
+        recorder.wrap(
+            component,
+            "finish",
+            "last",
+            email_key=lambda email_id: email_id,
+            completes_email=True,
+            succeeded=lambda result: result is not None,
+        )
+
+        await component.start("m1")
+        await component.finish("m1")
+        stats = recorder.stats()
+
+        assert stats["first"].count == 1 and stats["first"].errors == 0
+        assert stats["last"].errors == 1
+        assert stats["email"].p50 == 3.0  # start at tick 0, finish ends at tick 3
+
+    def test_check_stage_uses_p95_and_error_rate(self):
+        stats = StageStats.from_samples("llm", [0.5] * 18 + [6.0, 7.0], errors=2)
+
+        result = check_stage(
+            stats, PerformanceThresholds(max_response_time=5.0, max_error_rate=0.05)
+        )
+
+        assert not result.passed
+        assert len(result.failures) == 2
+
+
+class TestFakeGmailService:
+    """Test the Gmail API stand-in."""
+
+    def test_list_honours_after_and_max_results(self):
+        service = FakeGmailService()
+        service.deliver(generate_benchmark_emails(3))
+
+        listed = service.users().messages().list(userId="me", maxResults=2).execute()
+        future = service.users().messages().list(
+            userId="me", q="after:9999999999"
+        ).execute()
+
+        assert len(listed["messages"]) == 2
+        assert future["messages"] == []
+
+
+class TestPipelineBenchmark:
+    """End-to-end benchmark run."""
+
+    @pytest.mark.asyncio
+    async def test_small_run_processes_every_email(self, tmp_path):
+        """
+        Test: The daemon cycle runs against the offline stand-ins.
+
+        Given: 3 emails arriving 2 per cycle, instant LLM stubs
+        When: The benchmark runs
+        Then: Every email is written to the Notion stub and every stage
+              is timed and checked against its thresholds
+        """
+        config = BenchmarkConfig(
+            email_count=3,
+            batch_size=2,
+            llm_latency=LatencyDistribution("fixed", (0.0,)),
+            notion_rate_per_second=50.0,
+            notion_latency=LatencyDistribution("fixed", (0.0,)),
+            work_dir=tmp_path,
+        )
+
+        report = await PipelineBenchmark(config).run()
+
+        assert report.cycles == 2
+        assert report.emails_processed == 3
+        assert report.errors == 0
+        assert report.throughput > 0
+        assert report.stages["email"].count == 3
+        assert report.stages["llm_extraction"].count == 3
+        assert {result.name for result in report.thresholds} >= {
+            "pipeline",
+            "notion_write",
+            "llm_extraction",
+        }
+        assert report.notion["requests"] > 0
+        assert "Result:" in report.format_text()
@@ -0,0 +1,112 @@
+"""
+Unit tests for parallel bulk re-cleaning (content_normalizer.bulk).
+"""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from collabiq import app
+from content_normalizer import bulk
+from content_normalizer.bulk import MANIFEST_NAME, bulk_clean
+from content_normalizer.normalizer import ContentNormalizer
+from models.raw_email import EmailMetadata, RawEmail
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "sample_emails"
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    """data/raw-style archive built from the sample email fixtures."""
+    raw_dir = tmp_path / "raw"
+    for n, fixture in enumerate(sorted(FIXTURES.glob("*.txt"))[:12]):
+        email = RawEmail(
+            metadata=EmailMetadata(
+                message_id=f"<msg{n}@example.com>",
+                sender="sender@example.com",
+                subject=fixture.stem,
+                received_at=datetime(2025, 10 + n % 2, 1 + n, tzinfo=UTC),
+            ),
+            body=fixture.read_text(encoding="utf-8"),
+        )
+        month_dir = raw_dir / "2025" / f"{10 + n % 2:02d}"
+        month_dir.mkdir(parents=True, exist_ok=True)
+        (month_dir / f"{fixture.stem}.json").write_text(email.model_dump_json())
+    return raw_dir
+
+
+def read_outputs(out_dir):
+    return {
+        path.relative_to(out_dir).as_posix(): json.loads(path.read_text())
+        for path in out_dir.rglob("*.json")
+        if path.name != MANIFEST_NAME
+    }
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_bulk_clean_matches_single_email_cleaning(raw_dir, tmp_path, workers):
+    out_dir = tmp_path / "cleaned"
+
+    stats = bulk_clean(raw_dir, out_dir, workers=workers, batch_size=5)
+
+    assert (stats.scanned, stats.cleaned, stats.failed) == (12, 12, 0)
+    assert stats.emails_per_second > 0
+    normalizer = ContentNormalizer()
+    outputs = read_outputs(out_dir)
+    assert set(outputs) == {p.relative_to(raw_dir).as_posix() for p in raw_dir.rglob("*.json")}
+    for rel_path, cleaned in outputs.items():
+        raw_email = RawEmail.model_validate_json((raw_dir / rel_path).read_text())
+        assert cleaned["cleaned_body"] == normalizer.clean(raw_email.body).cleaned_body
+        assert cleaned["original_message_id"] == raw_email.metadata.message_id
+
+
+def test_unchanged_inputs_are_skipped(raw_dir, tmp_path):
+    out_dir = tmp_path / "cleaned"
+    bulk_clean(raw_dir, out_dir, workers=1)
+    changed = next(raw_dir.rglob("*.json"))
+    data = json.loads(changed.read_text())
+    data["body"] += "\n\nOne more paragraph about the pilot."
+    changed.write_text(json.dumps(data))
+
+    stats = bulk_clean(raw_dir, out_dir, workers=1)
+
+    assert (stats.cleaned, stats.skipped) == (1, 11)
+    assert bulk_clean(raw_dir, out_dir, workers=1, force=True).cleaned == 12
+
+
+def test_pattern_change_recleans_everything(raw_dir, tmp_path, monkeypatch):
+    out_dir = tmp_path / "cleaned"
+    bulk_clean(raw_dir, out_dir, workers=1)
+
+    monkeypatch.setattr(bulk.patterns, "pattern_set_version", lambda: "edited-patterns")
+    stats = bulk_clean(raw_dir, out_dir, workers=1)
+
+    assert (stats.cleaned, stats.skipped) == (12, 0)
+
+
+def test_invalid_files_are_reported_and_retried(raw_dir, tmp_path):
+    out_dir = tmp_path / "cleaned"
+    (raw_dir / "broken.json").write_text("{not json")
+
+    stats = bulk_clean(raw_dir, out_dir, workers=1)
+    rerun = bulk_clean(raw_dir, out_dir, workers=1)
+
+    assert stats.failed == 1 and "broken.json" in stats.errors
+    assert (rerun.failed, rerun.skipped) == (1, 12)
+
+
+def test_bulk_clean_command_reports_throughput(raw_dir, tmp_path):
+    out_dir = tmp_path / "cleaned"
+
+    result = CliRunner().invoke(
+        app,
+        ["email", "bulk-clean", "-i", str(raw_dir), "-o", str(out_dir), "-w", "1", "--json"],
+    )
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)["data"]
+    assert data["cleaned"] == 12
+    assert data["emails_per_second"] > 0
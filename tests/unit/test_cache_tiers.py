@@ -0,0 +1,299 @@
+"""
+Unit tests for the memory tier, single-flight loading and
+stale-while-revalidate in CacheManager and CompaniesCache.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from notion_integrator.cache import CacheManager
+from notion_integrator.cache_tiers import MemoryTier, SingleFlight
+from notion_integrator.companies_cache import CompaniesCache
+from notion_integrator.record_store import RecordStore
+
+
+RECORDS = [{"page_id": "page-1", "name": "웨이크"}]
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _expire(cache_manager, database_name):
+    """Rewrite a data cache entry as expired."""
+    entry = cache_manager.get_data_cache_entry(database_name)
+    cache_manager.update_data_cache_entry(
+        entry.model_copy(update={"expires_at": datetime.now() - timedelta(1)})
+    )
+
+
+class TestMemoryTier:
+    """Test MemoryTier storage."""
+
+    def test_least_recently_used_entry_evicted(self):
+        memory = MemoryTier(max_entries=2)
+        memory.set("a", 1)
+        memory.set("b", 2)
+        memory.get("a")
+
+        memory.set("c", 3)
+
+        assert memory.get("b") is None
+        assert memory.get("a") == 1
+        assert memory.get_stats()["evictions"] == 1
+
+    def test_entry_never_outlives_file_cache(self):
+        """The earlier of the memory TTL and the cache's expiry applies."""
+        clock = FakeClock()
+        memory = MemoryTier(ttl_seconds=300, clock=clock)
+        memory.set("long", 1)
+        memory.set("short", 2, expires_at=datetime.now() + timedelta(seconds=10))
+        memory.set("expired", 3, expires_at=datetime.now() - timedelta(seconds=1))
+
+        clock.now = 11
+        assert memory.get("long") == 1
+        assert memory.get("short") is None
+        assert memory.get("expired") is None
+
+        clock.now = 300
+        assert memory.get("long") is None
+
+    def test_discard_by_prefix(self):
+        memory = MemoryTier()
+        memory.set(("data", "Companies", None), 1)
+        memory.set(("data", "Companies", ("name",)), 2)
+        memory.set(("data", "CollabIQ", None), 3)
+
+        assert memory.discard(("data", "Companies")) == 2
+        assert memory.get(("data", "CollabIQ", None)) == 3
+
+    def test_zero_entries_disables_tier(self):
+        memory = MemoryTier(max_entries=0)
+        memory.set("a", 1)
+
+        assert memory.get("a") is None
+
+
+class TestSingleFlight:
+    """Test SingleFlight de-duplication."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_load(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return calls
+
+        waiters = [asyncio.create_task(flights.do("k", load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [1] * 5
+        assert calls == 1
+        assert not flights.in_flight("k")
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_waiter_and_is_not_kept(self):
+        flights = SingleFlight()
+        load = AsyncMock(side_effect=[RuntimeError("notion down"), "ok"])
+
+        results = await asyncio.gather(
+            flights.do("k", load), flights.do("k", load), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await flights.do("k", load) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_load(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flights.do("k", load))
+        second = asyncio.create_task(flights.do("k", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+
+
+class TestCacheManagerTiers:
+    """Test CacheManager memory tier and get_or_load_data()."""
+
+    def test_repeat_reads_skip_disk(self, tmp_path):
+        cache_manager = CacheManager(cache_dir=str(tmp_path))
+        cache_manager.set_data_cache("db-1", "Companies", RECORDS)
+
+        with patch.object(RecordStore, "read_header") as read_header:
+            assert cache_manager.get_data_cache("db-1", "Companies") == RECORDS
+        read_header.assert_not_called()
+
+        # Projections are read from disk once, then from memory
+        cache_manager.get_data_cache("db-1", "Companies", fields=["name"])
+        with patch.object(RecordStore, "read_records") as read_records:
+            assert cache_manager.get_data_cache(
+                "db-1", "Companies", fields=["name"]
+            ) == [{"name": "웨이크"}]
+        read_records.assert_not_called()
+
+    def test_invalidate_clears_memory(self, tmp_path):
+        cache_manager = CacheManager(cache_dir=str(tmp_path))
+        cache_manager.set_data_cache("db-1", "Companies", RECORDS)
+
+        cache_manager.invalidate_data_cache("Companies")
+
+        assert cache_manager.get_data_cache("db-1", "Companies") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self, tmp_path):
+        cache_manager = CacheManager(cache_dir=str(tmp_path))
+        load = AsyncMock(return_value=RECORDS)
+
+        results = await asyncio.gather(
+            *(
+                cache_manager.get_or_load_data("db-1", "Companies", load)
+                for _ in range(3)
+            )
+        )
+
+        assert results == [RECORDS] * 3
+        load.assert_awaited_once()
+        assert cache_manager.get_data_cache("db-1", "Companies") == RECORDS
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_blocks_without_stale_serving(self, tmp_path):
+        cache_manager = CacheManager(cache_dir=str(tmp_path))
+        cache_manager.set_data_cache("db-1", "Companies", RECORDS)
+        _expire(cache_manager, "Companies")
+        fresh = [{"page_id": "page-2", "name": "네트워크"}]
+
+        records = await cache_manager.get_or_load_data(
+            "db-1", "Companies", AsyncMock(return_value=fresh)
+        )
+
+        assert records == fresh
+
+    @pytest.mark.asyncio
+    async def test_stale_served_while_refreshing(self, tmp_path):
+        """
+        Test: An expired cache is served at once and refreshed in the background.
+
+        Given: An expired cache and stale_while_revalidate
+        When: get_or_load_data() is called twice before the refresh finishes
+        Then: Both calls get the stale records, one refresh runs, and later
+              reads see the refreshed records
+        """
+        cache_manager = CacheManager(
+            cache_dir=str(tmp_path), stale_while_revalidate=True
+        )
+        cache_manager.set_data_cache("db-1", "Companies", RECORDS)
+        _expire(cache_manager, "Companies")
+        fresh = [{"page_id": "page-2", "name": "네트워크"}]
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return fresh
+
+        load_mock = AsyncMock(side_effect=load)
+
+        first = await cache_manager.get_or_load_data("db-1", "Companies", load_mock)
+        second = await cache_manager.get_or_load_data(
+            "db-1", "Companies", load_mock, fields=["name"]
+        )
+        release.set()
+        await cache_manager.wait_for_refreshes()
+
+        assert first == RECORDS
+        assert second == [{"name": "웨이크"}]
+        load_mock.assert_awaited_once()
+        assert cache_manager.get_data_cache("db-1", "Companies") == fresh
+
+    @pytest.mark.asyncio
+    async def test_failed_background_refresh_keeps_stale_cache(self, tmp_path):
+        cache_manager = CacheManager(
+            cache_dir=str(tmp_path), stale_while_revalidate=True
+        )
+        cache_manager.set_data_cache("db-1", "Companies", RECORDS)
+        _expire(cache_manager, "Companies")
+        load = AsyncMock(side_effect=RuntimeError("notion down"))
+
+        assert await cache_manager.get_or_load_data("db-1", "Companies", load) == RECORDS
+        await cache_manager.wait_for_refreshes()
+
+        assert await cache_manager.get_or_load_data("db-1", "Companies", load) == RECORDS
+        await cache_manager.wait_for_refreshes()
+        assert load.await_count == 2
+
+
+class TestCompaniesCacheStaleWhileRevalidate:
+    """Test CompaniesCache refreshes with SingleFlight."""
+
+    def _record(self, page_id, name):
+        return {
+            "id": page_id,
+            "properties": {
+                "Name": {"type": "title", "title": [{"text": {"content": name}}]}
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_expired_snapshot_served_then_refreshed(self, tmp_path):
+        cache_manager = CacheManager(cache_dir=str(tmp_path))
+        cache = CompaniesCache(
+            MagicMock(), "db-1", cache_manager, stale_while_revalidate=True
+        )
+        with patch(
+            "notion_integrator.companies_cache.fetch_all_records",
+            new_callable=AsyncMock,
+            return_value=[self._record("page-1", "웨이크")],
+        ):
+            await cache.get_companies()
+        _expire(cache_manager, "Companies")
+
+        with patch(
+            "notion_integrator.companies_cache.fetch_all_records",
+            new_callable=AsyncMock,
+            return_value=[self._record("page-2", "네트워크")],
+        ) as mock_fetch:
+            assert await cache.get_companies() == [("page-1", "웨이크")]
+            await cache.wait_for_refresh()
+
+            assert await cache.get_companies() == [
+                ("page-1", "웨이크"),
+                ("page-2", "네트워크"),
+            ]
+        mock_fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_misses_fetch_once(self, tmp_path):
+        cache = CompaniesCache(MagicMock(), "db-1", CacheManager(cache_dir=str(tmp_path)))
+
+        with patch(
+            "notion_integrator.companies_cache.fetch_all_records",
+            new_callable=AsyncMock,
+            return_value=[self._record("page-1", "웨이크")],
+        ) as mock_fetch:
+            results = await asyncio.gather(*(cache.get_companies() for _ in range(4)))
+
+        assert results == [[("page-1", "웨이크")]] * 4
+        mock_fetch.assert_awaited_once()
@@ -1,12 +1,16 @@
 """
 Unit tests for CompaniesCache service.
 
-Tests caching logic, API fetching, and cache invalidation.
+Tests caching logic, API fetching, cache invalidation, in-place upserts
+and delta refreshes.
 """
 
+from datetime import datetime, timedelta, UTC
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
+from notion_integrator.cache import CacheManager
 from notion_integrator.companies_cache import CompaniesCache
 from notion_integrator.exceptions import NotionAPIError
 
@@ -261,11 +265,15 @@ class TestCompaniesCacheCaching:
         ):
             await cache.get_companies(use_cache=True)
 
-            # Verify cache write format
+            # Verify cache write format (with delta-refresh metadata)
             mock_cache_manager.set_data_cache.assert_called_once_with(
                 database_id=companies_db_id,
                 database_name="Companies",
                 records=[{"page_id": "page1" + "0" * 26, "name": "웨이크"}],
+                metadata={
+                    "last_edited_time": ANY,
+                    "full_refreshed_at": ANY,
+                },
             )
 
 
@@ -442,3 +450,167 @@ class TestCompaniesCacheEdgeCases:
 
             assert len(companies) == 1
             assert companies[0] == ("page1" + "0" * 26, "웨이크")
+
+
+def _company_record(page_id: str, name: str, **extra) -> dict:
+    """Companies page as returned by a data source query."""
+    return {
+        "id": page_id,
+        "properties": {
+            "Name": {"type": "title", "title": [{"text": {"content": name}}]},
+        },
+        **extra,
+    }
+
+
+class TestCompaniesCacheIncremental:
+    """Test in-place upserts, delta refreshes and scheduled full refreshes."""
+
+    @pytest.fixture
+    def cache_manager(self, tmp_path):
+        return CacheManager(cache_dir=str(tmp_path))
+
+    async def _populated_cache(self, cache_manager):
+        """CompaniesCache populated by one full fetch of two companies."""
+        cache = CompaniesCache(MagicMock(), "abc123", cache_manager)
+        with patch(
+            "notion_integrator.companies_cache.fetch_all_records",
+            new_callable=AsyncMock,
+            return_value=[
+                _company_record("page-1", "웨이크"),
+                _company_record("page-2", "네트워크"),
+            ],
+        ):
+            await cache.get_companies()
+        return cache
+
+    def _age_cache(self, cache_manager, *, expired=True, full_refresh_hours_ago=1):
+        """Rewrite the cache entry as expired and/or fully refreshed long ago."""
+        entry = cache_manager.get_data_cache_entry("Companies")
+        now = datetime.now()
+        cache_manager.update_data_cache_entry(
+            entry.model_copy(
+                update={
+                    "expires_at": now - timedelta(minutes=1) if expired else entry.expires_at,
+                    "metadata": {
+                        **entry.metadata,
+                        "full_refreshed_at": (
+                            datetime.now(UTC) - timedelta(hours=full_refresh_hours_ago)
+                        ).isoformat(),
+                    },
+                }
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_upsert_adds_company_without_api_call(self, cache_manager):
+        """
+        Test: A created company is added to the cache in place.
+
+        Given: A valid cache
+        When: upsert_company() is called for a new page
+        Then: The next get_companies() includes it without an API call,
+              and the cache's expiry is unchanged
+        """
+        cache = await self._populated_cache(cache_manager)
+        expires_at = cache_manager.get_data_cache_entry("Companies").expires_at
+
+        cache.upsert_company("page-3", "새회사")
+
+        with patch(
+            "notion_integrator.companies_cache.fetch_all_records",
+            new_callable=AsyncMock,
+        ) as mock_fetch:
+            companies = await cache.get_companies()
+
+        mock_fetch.assert_not_called()
+        assert companies[-1] == ("page-3", "새회사")
+        assert len(companies) == 3
+        assert cache_manager.get_data_cache_entry("Companies").expires_at == expires_at
+
+    @pytest.mark.asyncio
+    async def test_upsert_updates_index_without_rebuild(self, cache_manager):
+        """The in-memory CompanyIndex gets the upserted company appended."""
+        cache = await self._populated_cache(cache_manager)
+        index = await cache.get_index()
+
+        cache.upsert_company("page-3", "새회사")
+
+        assert await cache.get_index() is index
+        assert index.exact("새회사") == ("page-3", "새회사")
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_gets_delta_refresh(self, cache_manager):
+        """
+        Test: An expired cache fetches only pages edited since the last sync.
+
+        Given: An expired cache whose full refresh is not yet due
+        When: get_companies() is called
+        Then: One filtered query applies renames, additions and removals
+        """
+        cache = await self._populated_cache(cache_manager)
+        self._age_cache(cache_manager)
+        watermark = cache_manager.get_data_cache_entry("Companies").metadata[
+            "last_edited_time"
+        ]
+
+        with patch(
+            "notion_integrator.companies_cache.fetch_all_records",
+            new_callable=AsyncMock,
+            return_value=[
+                _company_record("page-1", "웨이크(산스)"),
+                _company_record("page-2", "네트워크", in_trash=True),
+                _company_record("page-4", "신규회사"),
+            ],
+        ) as mock_fetch:
+            companies = await cache.get_companies()
+
+        assert mock_fetch.await_args.kwargs["filter_conditions"] == {
+            "timestamp": "last_edited_time",
+            "last_edited_time": {"on_or_after": watermark},
+        }
+        assert companies == [("page-1", "웨이크(산스)"), ("page-4", "신규회사")]
+
+        entry = cache_manager.get_data_cache_entry("Companies")
+        assert not entry.is_expired
+        assert entry.metadata["last_edited_time"] >= watermark
+
+    @pytest.mark.asyncio
+    async def test_full_refresh_when_scheduled(self, cache_manager):
+        """After full_refresh_hours the whole database is refetched."""
+        cache = await self._populated_cache(cache_manager)
+        self._age_cache(cache_manager, full_refresh_hours_ago=25)
+
+        with patch(
+            "notion_integrator.companies_cache.fetch_all_records",
+            new_callable=AsyncMock,
+            return_value=[_company_record("page-1", "웨이크")],
+        ) as mock_fetch:
+            companies = await cache.get_companies()
+
+        assert mock_fetch.await_args.kwargs["filter_conditions"] is None
+        assert companies == [("page-1", "웨이크")]
+
+    @pytest.mark.asyncio
+    async def test_cache_without_sync_metadata_gets_full_refresh(self, cache_manager):
+        """Caches written before delta support are refetched in full."""
+        cache_manager.set_data_cache(
+            database_id="abc123",
+            database_name="Companies",
+            records=[{"page_id": "page-1", "name": "웨이크"}],
+        )
+        entry = cache_manager.get_data_cache_entry("Companies")
+        cache_manager.update_data_cache_entry(
+            entry.model_copy(update={"expires_at": datetime.now() - timedelta(1)})
+        )
+        cache = CompaniesCache(MagicMock(), "abc123", cache_manager)
+
+        with patch(
+            "notion_integrator.companies_cache.fetch_all_records",
+            new_callable=AsyncMock,
+            return_value=[_company_record("page-9", "카카오")],
+        ) as mock_fetch:
+            companies = await cache.get_companies()
+
+        assert mock_fetch.await_args.kwargs["filter_conditions"] is None
+        assert companies == [("page-9", "카카오")]
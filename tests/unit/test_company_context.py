@@ -0,0 +1,207 @@
+"""
+Unit tests for CompanyContext and NotionIntegrator's cached company context.
+
+Tests that the incrementally maintained context matches a full
+format_for_llm(), that only changed records are re-formatted, and that
+the integrator reuses the context while the data cache version is
+unchanged.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from notion_integrator import company_context
+from notion_integrator.company_context import CompanyContext
+from notion_integrator.formatter import format_for_llm
+from notion_integrator.integrator import NotionIntegrator
+from notion_integrator.schema import create_database_schema, parse_database_response
+
+
+def _schema(last_edited_time="2025-11-01T00:00:00.000Z"):
+    db_response = {
+        "object": "database",
+        "id": "companies-db",
+        "created_time": "2025-01-01T00:00:00.000Z",
+        "last_edited_time": last_edited_time,
+        "title": [{"type": "text", "text": {"content": "Companies"}}],
+        "url": "https://www.notion.so/workspace/companies",
+        "data_sources": [{"id": "ds-1", "type": "database_source"}],
+    }
+    data_source_response = {
+        "object": "data_source",
+        "id": "ds-1",
+        "properties": {
+            "Name": {"id": "title", "name": "Name", "type": "title", "title": {}},
+            "Shinsegae affiliates?": {
+                "id": "ssg",
+                "name": "Shinsegae affiliates?",
+                "type": "checkbox",
+                "checkbox": {},
+            },
+            "Is Portfolio?": {
+                "id": "pf",
+                "name": "Is Portfolio?",
+                "type": "checkbox",
+                "checkbox": {},
+            },
+        },
+    }
+    return create_database_schema(
+        parse_database_response(db_response, data_source_response), "ds-1"
+    )
+
+
+def _page(page_id, name, ssg=False, portfolio=False):
+    return {
+        "id": page_id,
+        "properties": {
+            "Name": {"type": "title", "title": [{"text": {"content": name}}]},
+            "Shinsegae affiliates?": {"type": "checkbox", "checkbox": ssg},
+            "Is Portfolio?": {"type": "checkbox", "checkbox": portfolio},
+        },
+    }
+
+
+RECORDS = [
+    _page("p1", "웨이크", portfolio=True),
+    _page("p2", "신세계푸드", ssg=True),
+    _page("p3", "네트워크"),
+    _page("p4", "SSG닷컴", ssg=True, portfolio=True),
+    _page("p5", "브레이크앤컴퍼니", portfolio=True),
+]
+
+
+def assert_same_as_full_format(context, records, schema):
+    expected = format_for_llm(records, schema)
+    actual = context.to_llm_data()
+
+    assert actual.summary_markdown == expected.summary_markdown
+    assert actual.companies == expected.companies
+    assert actual.metadata.model_dump(exclude={"formatted_at"}) == (
+        expected.metadata.model_dump(exclude={"formatted_at"})
+    )
+
+
+class TestCompanyContext:
+    """Test CompanyContext maintenance."""
+
+    def test_initial_build_matches_full_format(self):
+        schema = _schema()
+
+        assert_same_as_full_format(CompanyContext(schema, RECORDS), RECORDS, schema)
+
+    def test_upsert_and_remove_match_full_format(self):
+        schema = _schema()
+        context = CompanyContext(schema, RECORDS)
+
+        renamed = _page("p3", "네트워크랩", ssg=True)
+        created = _page("p6", "가나다")
+        assert context.upsert(renamed)
+        assert context.upsert(created)
+        assert not context.upsert(created)
+        assert context.remove("p1")
+
+        expected = [RECORDS[1], renamed, RECORDS[3], RECORDS[4], created]
+        assert_same_as_full_format(context, expected, schema)
+
+    def test_sync_reformats_only_changed_records(self):
+        schema = _schema()
+        context = CompanyContext(schema, [dict(r) for r in RECORDS])
+        updated = [dict(r) for r in RECORDS]
+        updated[2] = _page("p3", "네트워크", portfolio=True)
+        del updated[0]
+        updated.insert(0, _page("p7", "새회사"))
+
+        with patch.object(
+            company_context,
+            "format_company_record",
+            wraps=company_context.format_company_record,
+        ) as format_record:
+            changes = context.sync(updated, version="v2")
+
+        assert changes == 3
+        assert format_record.call_count == 2
+        assert context.version == "v2"
+        assert_same_as_full_format(context, updated, schema)
+
+    def test_formatted_data_reused_until_changed(self):
+        context = CompanyContext(_schema(), RECORDS)
+        first = context.to_llm_data()
+
+        assert context.sync(list(RECORDS)) == 0
+        assert context.to_llm_data() is first
+
+        context.remove("p2")
+        assert context.to_llm_data() is not first
+
+
+class TestIntegratorCompanyContext:
+    """Test NotionIntegrator.format_for_llm() with the kept context."""
+
+    def _integrator(self, tmp_path, schema, records):
+        with patch("notion_integrator.integrator.NotionClient"):
+            integrator = NotionIntegrator(api_key="test-key", cache_dir=str(tmp_path))
+        integrator.discover_database_schema = AsyncMock(return_value=schema)
+
+        async def fetch_all_records(**kwargs):
+            return integrator.cache_manager.get_data_cache(
+                "companies-db", "Companies"
+            )
+
+        integrator.fetch_all_records = AsyncMock(side_effect=fetch_all_records)
+        integrator.cache_manager.set_data_cache("companies-db", "Companies", records)
+        return integrator
+
+    @pytest.mark.asyncio
+    async def test_unchanged_cache_version_skips_fetch_and_format(self, tmp_path):
+        integrator = self._integrator(tmp_path, _schema(), RECORDS)
+
+        first = await integrator.format_for_llm(database_id="companies-db")
+        second = await integrator.format_for_llm(database_id="companies-db")
+
+        assert second is first
+        integrator.fetch_all_records.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rewritten_cache_is_synced(self, tmp_path):
+        schema = _schema()
+        integrator = self._integrator(tmp_path, schema, RECORDS)
+        await integrator.format_for_llm(database_id="companies-db")
+
+        updated = RECORDS[:-1] + [_page("p8", "카카오", portfolio=True)]
+        integrator.cache_manager.set_data_cache("companies-db", "Companies", updated)
+        formatted = await integrator.format_for_llm(database_id="companies-db")
+
+        assert formatted.summary_markdown == format_for_llm(
+            updated, schema
+        ).summary_markdown
+        assert integrator.fetch_all_records.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_schema_change_rebuilds(self, tmp_path):
+        integrator = self._integrator(tmp_path, _schema(), RECORDS)
+        first = await integrator.format_for_llm(database_id="companies-db")
+
+        integrator.discover_database_schema.return_value = _schema(
+            "2025-12-01T00:00:00.000Z"
+        )
+        second = await integrator.format_for_llm(database_id="companies-db")
+
+        assert second is not first
+        assert second.summary_markdown == first.summary_markdown
+
+    @pytest.mark.asyncio
+    async def test_upsert_record_patches_cache_and_context(self, tmp_path):
+        """A created company appears without refetching or re-formatting."""
+        integrator = self._integrator(tmp_path, _schema(), RECORDS)
+        await integrator.format_for_llm(database_id="companies-db")
+
+        integrator.upsert_record("companies-db", _page("p9", "새스타트업"))
+        formatted = await integrator.format_for_llm(database_id="companies-db")
+
+        assert "- 새스타트업" in formatted.summary_markdown
+        assert formatted.metadata.total_companies == 6
+        integrator.fetch_all_records.assert_awaited_once()
+        cached = integrator.cache_manager.get_data_cache("companies-db", "Companies")
+        assert cached[-1]["id"] == "p9"
@@ -0,0 +1,238 @@
+"""
+Unit tests for CompanyIndex and its use by RapidfuzzMatcher and CompaniesCache.
+
+Tests hash lookups, batch fuzzy scoring (same results as scoring each
+candidate individually), jamo n-gram blocking, incremental appends, and one
+index build per companies snapshot.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from rapidfuzz import fuzz
+
+from notion_integrator.companies_cache import CompaniesCache
+from notion_integrator.fuzzy_matcher import (
+    CompanyIndex,
+    RapidfuzzMatcher,
+    company_name_grams,
+    decompose_hangul,
+    normalize_for_matching,
+)
+
+
+CANDIDATES = [
+    ("page-wake", "웨이크"),
+    ("page-network", "네트워크"),
+    ("page-card", "현대카드"),
+    ("page-food", "신세계푸드"),
+    ("page-dept", "신세계백화점"),
+    ("page-sans", "웨이크(산스)"),
+    ("page-startup", "스타트업A"),
+    ("page-blank", "   "),
+]
+
+
+def _reference_best_match(name, candidates, threshold):
+    """Score every candidate one by one (the matcher's documented strategies)."""
+    best, best_score = None, 0.0
+    matching_name = normalize_for_matching(name)
+    for page_id, candidate in candidates:
+        candidate = candidate.strip()
+        if not candidate:
+            continue
+        matching_candidate = normalize_for_matching(candidate)
+        use_partial = "(" in name + candidate or ")" in name + candidate
+        score = max(
+            fuzz.ratio(name, candidate) / 100.0,
+            fuzz.partial_ratio(name, candidate) / 100.0 if use_partial else 0.0,
+            1.0 if matching_name == matching_candidate else 0.0,
+            fuzz.ratio(matching_name, matching_candidate) / 100.0,
+        )
+        if score > best_score:
+            best, best_score = (page_id, candidate, score), score
+    return best if best and best_score >= threshold else None
+
+
+class TestCompanyIndex:
+    """Test CompanyIndex lookups."""
+
+    def test_behaves_as_candidate_sequence(self):
+        """The index can stand in for the candidates list."""
+        index = CompanyIndex(CANDIDATES)
+
+        assert len(index) == len(CANDIDATES)
+        assert list(index) == CANDIDATES
+        assert index[0] == ("page-wake", "웨이크")
+        assert index[:2] == CANDIDATES[:2]
+
+    def test_exact_lookup_first_occurrence_wins(self):
+        """Exact lookup is case-sensitive and returns the earliest candidate."""
+        index = CompanyIndex(CANDIDATES + [("page-wake-2", "웨이크")])
+
+        assert index.exact("웨이크") == ("page-wake", "웨이크")
+        assert index.exact("웨이") is None
+
+    def test_normalized_exact_match(self):
+        """Names equal after normalize_for_matching score 1.0."""
+        index = CompanyIndex(CANDIDATES)
+
+        assert index.best_match("네트웍", 0.85) == ("page-network", "네트워크", 1.0)
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "웨이크(산스)",
+            "웨이크 (산스)",
+            "네트웍스",
+            "현대 카드",
+            "신세계",
+            "신세계백화",
+            "스타트업",
+            "(주)현대카드",
+            "완전히다른회사",
+        ],
+    )
+    @pytest.mark.parametrize("threshold", [0.85, 0.5, 0.0])
+    def test_best_match_equals_per_candidate_scoring(self, name, threshold):
+        """Batch scoring picks the same candidate and score as a linear scan."""
+        index = CompanyIndex(CANDIDATES)
+
+        assert index.best_match(name, threshold) == _reference_best_match(
+            name, CANDIDATES, threshold
+        )
+
+    def test_blank_candidates_never_match(self):
+        """Blank candidate names are skipped instead of raising."""
+        index = CompanyIndex([("page-blank", "  ")])
+
+        assert index.exact("") is None
+        assert index.best_match("웨이크", 0.0) is None
+
+    def test_append_is_incremental_and_copy_is_independent(self):
+        """Appended companies are matchable; copies do not share appends."""
+        index = CompanyIndex(CANDIDATES)
+        snapshot = index.copy()
+
+        snapshot.append(("page-new", "새로운스타트업"))
+
+        assert snapshot.exact("새로운스타트업") == ("page-new", "새로운스타트업")
+        assert index.exact("새로운스타트업") is None
+        assert len(index) == len(CANDIDATES)
+
+    def test_copy_shares_structures_until_append(self):
+        """copy() is copy-on-write: nothing is copied until an append."""
+        index = CompanyIndex(CANDIDATES)
+        snapshot = index.copy()
+
+        assert snapshot._candidates is index._candidates
+        assert snapshot._postings is index._postings
+
+        index.append(("page-new", "새로운스타트업"))  # either side may append first
+
+        assert snapshot._candidates is not index._candidates
+        assert snapshot.exact("새로운스타트업") is None
+        assert len(snapshot) == len(CANDIDATES)
+        assert snapshot.best_match("웨이크", 0.85)[0] == index.best_match("웨이크", 0.85)[0]
+
+
+class TestCompanyIndexBlocking:
+    """Test jamo n-gram blocking."""
+
+    def test_decompose_hangul(self):
+        """Syllables become conjoining jamo; other characters are kept."""
+        assert decompose_hangul("웍") == "\u110b\u116f\u11a8"
+        assert decompose_hangul("네") == "\u1102\u1166"
+        assert decompose_hangul("SK 웍") == "SK \u110b\u116f\u11a8"
+
+    def test_spelling_variants_share_grams(self):
+        """네트웍/네트워크 share most jamo grams; spacing and case are ignored."""
+        variant, original = company_name_grams("네트웍"), company_name_grams("네트워크")
+
+        assert len(variant & original) / len(variant) >= 0.7
+        assert company_name_grams("Naver Corp") == company_name_grams("navercorp")
+        assert company_name_grams(" () ") == frozenset()
+
+    def test_block_selects_similar_candidates(self):
+        """Only candidates sharing enough grams are scored."""
+        index = CompanyIndex(CANDIDATES, blocking_min_candidates=0)
+
+        block = [index[p][1] for p in index.block("웨이크(산스)")]
+
+        assert "웨이크" in block
+        assert "웨이크(산스)" in block
+        assert "현대카드" not in block
+        full = CompanyIndex(CANDIDATES, blocking_min_candidates=None)
+        for name in ("웨이크 (산스)", "네트웍스", "신세계 백화점"):
+            assert index.best_match(name, 0.85) == full.best_match(name, 0.85)
+
+    def test_small_index_is_not_blocked(self):
+        """Below blocking_min_candidates every candidate is scored."""
+        index = CompanyIndex(CANDIDATES, blocking_min_candidates=100)
+
+        assert index.block("웨이크") is None
+
+    def test_appended_candidates_are_blocked_in(self):
+        """append() updates the gram index, without touching copies' sources."""
+        index = CompanyIndex(CANDIDATES, blocking_min_candidates=0)
+        snapshot = index.copy()
+
+        snapshot.append(("page-new", "그린에너지솔루션"))
+
+        assert snapshot.best_match("그린 에너지솔루션", 0.85)[0] == "page-new"
+        assert index.block("그린에너지솔루션") == []
+
+
+class TestRapidfuzzMatcherWithIndex:
+    """Test RapidfuzzMatcher accepting a prebuilt index."""
+
+    @pytest.mark.parametrize("name", ["웨이크", "네트웍", "신세계 푸드", "새회사"])
+    def test_index_and_list_give_same_result(self, name):
+        """Matching against an index equals matching against the list."""
+        matcher = RapidfuzzMatcher()
+
+        assert matcher.match(name, CompanyIndex(CANDIDATES)) == matcher.match(
+            name, CANDIDATES
+        )
+
+    def test_prebuilt_index_is_not_renormalized(self):
+        """Candidate names are normalized at build time, not per match."""
+        index = CompanyIndex(CANDIDATES)
+        matcher = RapidfuzzMatcher()
+
+        with patch(
+            "notion_integrator.fuzzy_matcher.normalize_for_matching",
+            wraps=normalize_for_matching,
+        ) as normalize:
+            matcher.match("신세계 푸드", index)
+
+        # Only the query is normalized
+        assert normalize.call_count == 1
+
+
+class TestCompaniesCacheIndex:
+    """Test CompaniesCache.get_index()."""
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_only_when_snapshot_changes(self):
+        """
+        Test: The index is built once per companies snapshot.
+
+        Given: A cache whose snapshot is unchanged across two calls
+        When: get_index() is called twice, then after the snapshot changes
+        Then: The same index is reused, and rebuilt for the new snapshot
+        """
+        cache = CompaniesCache(MagicMock(), "companies-db")
+        cache.get_companies = AsyncMock(return_value=list(CANDIDATES))
+
+        first = await cache.get_index()
+        second = await cache.get_index()
+
+        assert first is second
+        assert list(first) == CANDIDATES
+
+        cache.get_companies.return_value = CANDIDATES + [("page-new", "새회사")]
+        third = await cache.get_index()
+
+        assert third is not first
+        assert third.exact("새회사") == ("page-new", "새회사")
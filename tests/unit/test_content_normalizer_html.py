@@ -0,0 +1,149 @@
+"""
+Unit tests for HTML-to-text conversion and token-budget trimming
+in ContentNormalizer.
+"""
+
+import pytest
+
+from content_normalizer.html_text import collapse_url, html_to_text, looks_like_html
+from content_normalizer.normalizer import ContentNormalizer
+from content_normalizer.token_budget import (
+    OMISSION_MARKER,
+    estimate_tokens,
+    trim_to_budget,
+)
+
+NEWSLETTER_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Weekly</title>
+<style>
+  body { margin: 0; padding: 0; font-family: Arial, sans-serif; }
+  .container { width: 600px; background-color: #ffffff; border: 1px solid #eeeeee; }
+  .button { display: inline-block; padding: 12px 24px; border-radius: 4px; }
+</style></head>
+<body>
+<table class="container" cellpadding="0" cellspacing="0" border="0" width="600">
+  <tr><td style="padding: 20px; font-size: 14px; color: #333333;">
+    <p style="margin: 0 0 12px 0;">안녕하세요, 브랜드엑스 김철수입니다.</p>
+    <p style="margin: 0 0 12px 0;">신세계인터내셔날과 <b>11월 5일</b> PoC 킥오프 미팅을 진행하기로 했습니다.</p>
+    <p style="margin: 0 0 12px 0;">
+      <a class="button" href="https://click.example-mailer.com/ls/click?upn=AbCdEf123456&amp;utm_source=newsletter&amp;utm_medium=email">미팅 자료 보기</a>
+    </p>
+  </td></tr>
+  <tr><td style="padding: 20px; font-size: 11px; color: #999999;">
+    <a href="https://click.example-mailer.com/unsub?u=123">Unsubscribe</a> |
+    <a href="https://view.example-mailer.com/web?id=987">View this email in your browser</a>
+  </td></tr>
+</table>
+<img src="https://open.example-mailer.com/o.gif?u=123" width="1" height="1" alt="">
+</body></html>
+"""
+
+
+class TestHtmlToText:
+    """Test HTML detection and conversion."""
+
+    def test_detects_html_but_not_plain_text(self):
+        assert looks_like_html(NEWSLETTER_HTML)
+        assert looks_like_html("<div>Hello</div><p>there</p>")
+        assert not looks_like_html("From: Kim <kim@example.com>\nHello a < b > c")
+
+    def test_keeps_content_and_drops_markup_and_footer(self):
+        text = html_to_text(NEWSLETTER_HTML)
+
+        assert "11월 5일 PoC 킥오프 미팅" in text
+        assert "미팅 자료 보기" in text
+        for noise in ("font-family", "Weekly", "Unsubscribe", "browser", "utm_source", "<"):
+            assert noise not in text
+
+    def test_blockquote_becomes_quoted_lines(self):
+        text = html_to_text(
+            "<div>See below.</div><blockquote>On Mon, Kim wrote:<br>Earlier</blockquote>"
+        )
+
+        assert text == "See below.\n> On Mon, Kim wrote:\n> Earlier"
+
+    def test_list_items_and_entities(self):
+        text = html_to_text("<ul><li>PoC&nbsp;범위</li><li>R&amp;D 일정</li></ul>")
+
+        assert text == "- PoC 범위\n- R&D 일정"
+
+    def test_collapse_url_strips_tracking(self):
+        assert collapse_url("https://signite.co/about?utm_source=x#top") == "signite.co/about"
+        assert collapse_url(
+            "https://t.example.com/c/eJyNkE1uwzAIhO_iNQtjg3_6lj5ArVDWkIq0qS3ZTqr"
+        ) == "t.example.com"
+
+
+class TestTrimToBudget:
+    """Test informative-paragraph trimming."""
+
+    def test_text_within_budget_is_unchanged(self):
+        text = "Short email.\n\nSecond paragraph."
+        assert trim_to_budget(text, max_tokens=100) is text
+
+    def test_keeps_opening_and_informative_paragraphs(self):
+        filler = "This paragraph is general filler without anything in particular to say. " * 4
+        text = "\n\n".join(
+            ["Hi team, a quick update."]
+            + [filler] * 3
+            + ["Kickoff meeting with Shinsegae Inc. on 2025-11-05 at 3pm, budget $20,000."]
+            + [filler + " (again)"] * 3
+        )
+
+        trimmed = trim_to_budget(text, max_tokens=120)
+
+        assert estimate_tokens(trimmed) <= 120
+        assert trimmed.startswith("Hi team, a quick update.")
+        assert "Kickoff meeting with Shinsegae Inc." in trimmed
+        assert OMISSION_MARKER in trimmed
+
+    def test_respects_character_limit(self):
+        text = "\n\n".join(f"Paragraph {i} about the partnership meeting." for i in range(200))
+
+        trimmed = trim_to_budget(text, max_tokens=10_000, max_chars=500)
+
+        assert len(trimmed) <= 500
+        assert trimmed.startswith("Paragraph 0")
+
+    def test_single_oversized_line_is_cut(self):
+        trimmed = trim_to_budget("x" * 10_000, max_tokens=100)
+
+        assert estimate_tokens(trimmed) <= 100 + estimate_tokens(OMISSION_MARKER) + 1
+        assert trimmed.endswith(OMISSION_MARKER)
+
+    def test_cut_keeps_best_segment_not_leading_link(self):
+        link = "https://tracker.example.com/click?id=" + "a" * 600
+        content = "2025년 11월 5일 PoC 킥오프 미팅, 예산 2천만원 " * 40
+        text = f"{link}\n\n{content}"
+
+        trimmed = trim_to_budget(text, max_tokens=100)
+
+        assert trimmed.startswith("2025년 11월 5일 PoC")
+        assert "https://" not in trimmed
+        assert estimate_tokens(trimmed) <= 100 + estimate_tokens(OMISSION_MARKER) + 1
+
+
+class TestNormalizerStages:
+    """Test the HTML and budget stages inside ContentNormalizer.clean()."""
+
+    def test_html_newsletter_cuts_tokens_substantially(self):
+        result = ContentNormalizer().clean(NEWSLETTER_HTML)
+
+        assert result.removed_content.html_converted
+        assert estimate_tokens(result.cleaned_body) < estimate_tokens(NEWSLETTER_HTML) / 4
+        assert "PoC 킥오프" in result.cleaned_body
+
+    def test_plain_text_is_not_converted(self):
+        result = ContentNormalizer().clean("Meeting on Friday.\n\nBest regards,\nJohn Smith")
+
+        assert not result.removed_content.html_converted
+        assert not result.removed_content.trimmed
+        assert result.cleaned_body == "Meeting on Friday."
+
+    @pytest.mark.parametrize("budget, trimmed", [(None, False), (50, True)])
+    def test_token_budget_is_configurable(self, budget, trimmed):
+        body = "\n\n".join(f"Update {i}: the pilot with Partner Corp. continues." for i in range(30))
+
+        result = ContentNormalizer(token_budget=budget).clean(body)
+
+        assert result.removed_content.trimmed is trimmed
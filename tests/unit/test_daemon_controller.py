@@ -38,6 +38,7 @@ def mock_components():
         # This ensures += operations work correctly
         real_state = DaemonProcessState()
         mock_state_manager.return_value.load_state.return_value = real_state
+        mock_state_manager.return_value.save_state_async = AsyncMock()
         
         yield {
             "gmail": mock_gmail,
@@ -62,7 +63,7 @@ def test_daemon_init(mock_settings, mock_components):
     
     mock_components["state"].assert_called_once()
     # Check scheduler interval (30 * 60 = 1800)
-    mock_components["scheduler"].assert_called_with(1800)
+    assert mock_components["scheduler"].call_args.args == (1800,)
 
 @pytest.mark.asyncio
 async def test_process_cycle_success(mock_settings, mock_components):
@@ -136,4 +137,226 @@ async def test_process_cycle_error_handling(mock_settings, mock_components):
     state = mock_components["real_state"]
     assert state.current_status == "error"
     # At least one error should be recorded (may have additional errors from mock setup)
-    assert state.error_count >= 1
\ No newline at end of file
+    assert state.error_count >= 1
+
+@pytest.mark.asyncio
+async def test_process_pushed_emails_keeps_polling_watermark(mock_settings, mock_components):
+    """Pushed emails run through the pipeline without moving the fetch timestamp"""
+    controller = DaemonController()
+
+    mock_raw_email = MagicMock()
+    mock_raw_email.metadata.message_id = "msg_push"
+    mock_components["gmail"].return_value.is_duplicate.return_value = False
+    mock_components["orch"].from_config.return_value.extract_entities.return_value = None
+
+    state = mock_components["real_state"]
+    state.mark_email_processed("msg_done")
+    already_done = MagicMock()
+    already_done.metadata.message_id = "msg_done"
+
+    await controller.process_pushed_emails([already_done, mock_raw_email])
+
+    assert state.emails_received_count == 2
+    assert state.emails_skipped_count == 1
+    assert state.last_successful_fetch_timestamp is None
+    mock_components["orch"].from_config.return_value.extract_entities.assert_awaited_once()
+    mock_components["gmail"].return_value.fetch_emails.assert_not_called()
+    mock_components["state"].return_value.save_state_async.assert_awaited_with(state)
+
+
+@pytest.mark.asyncio
+async def test_full_batch_moves_watermark_past_batch_and_reports_backlog(mock_settings, mock_components):
+    """A full oldest-first batch resumes after its newest email and asks for a rerun"""
+    from datetime import datetime, timedelta, UTC
+    from daemon.controller import FETCH_BATCH_SIZE
+
+    controller = DaemonController()
+    state = mock_components["real_state"]
+    since = datetime(2025, 11, 1, 9, 0)
+    state.last_successful_fetch_timestamp = since
+
+    emails = []
+    for i in range(FETCH_BATCH_SIZE):
+        email = MagicMock()
+        email.metadata.message_id = f"msg_{i}"
+        email.metadata.internal_date = since.astimezone(UTC) + timedelta(minutes=i + 1)
+        state.mark_email_processed(f"msg_{i}")
+        emails.append(email)
+    mock_components["gmail"].return_value.fetch_emails.return_value = emails
+
+    result = await controller.process_cycle()
+
+    fetch_kwargs = mock_components["gmail"].return_value.fetch_emails.call_args.kwargs
+    assert fetch_kwargs["oldest_first"] is True
+    assert result.backlog is True
+    newest = emails[-1].metadata.internal_date
+    assert state.last_successful_fetch_timestamp.timestamp() == newest.timestamp() - 1
+
+
+@pytest.mark.asyncio
+async def test_poison_email_is_quarantined_and_releases_watermark(mock_settings, mock_components, tmp_path):
+    """An email failing every attempt goes to the DLQ instead of stalling the watermark"""
+    from daemon.controller import MAX_EMAIL_ATTEMPTS
+    from notion_integrator.dlq_manager import DLQManager
+
+    dlq = DLQManager(dlq_dir=str(tmp_path / "dlq"))
+    controller = DaemonController(dlq_manager=dlq)
+    state = mock_components["real_state"]
+
+    poison = MagicMock()
+    poison.metadata.message_id = "msg_poison"
+    poison.body = "Undecodable body"
+    mock_components["gmail"].return_value.fetch_emails.return_value = [poison]
+    mock_components["gmail"].return_value.is_duplicate.return_value = False
+    mock_components["writer"].return_value.check_duplicate = AsyncMock(return_value=None)
+    extract = mock_components["orch"].from_config.return_value.extract_entities
+    extract.side_effect = ValueError("malformed MIME")
+
+    await controller.process_cycle()
+
+    assert state.work_ledger["msg_poison"].status == "failed"
+    assert state.work_ledger["msg_poison"].attempts == 1
+    assert "malformed MIME" in state.work_ledger["msg_poison"].last_error
+    assert state.last_successful_fetch_timestamp is None
+    assert state.current_status == "sleeping"
+
+    for _ in range(MAX_EMAIL_ATTEMPTS - 1):
+        await controller.process_cycle()
+
+    assert extract.await_count == MAX_EMAIL_ATTEMPTS
+    assert state.work_ledger["msg_poison"].status == "quarantined"
+    assert state.is_email_processed("msg_poison")
+    assert state.last_successful_fetch_timestamp is not None
+    [record] = dlq.query_entries(email_id="msg_poison")
+    entry = dlq.load_dlq_entry(record.file_path)
+    assert entry.extracted_data is None
+    assert entry.original_email_content == "Undecodable body"
+
+
+@pytest.mark.asyncio
+async def test_email_interrupted_mid_attempt_counts_toward_quarantine(mock_settings, mock_components, tmp_path):
+    """An email left "extracting" by crashes is quarantined without another attempt"""
+    from daemon.controller import MAX_EMAIL_ATTEMPTS
+    from notion_integrator.dlq_manager import DLQManager
+
+    controller = DaemonController(dlq_manager=DLQManager(dlq_dir=str(tmp_path / "dlq")))
+    state = mock_components["real_state"]
+    for _ in range(MAX_EMAIL_ATTEMPTS):
+        state.start_work("msg_crash")
+
+    crashing = MagicMock()
+    crashing.metadata.message_id = "msg_crash"
+    crashing.body = "Body"
+    mock_components["gmail"].return_value.fetch_emails.return_value = [crashing]
+    mock_components["gmail"].return_value.is_duplicate.return_value = False
+    mock_components["writer"].return_value.check_duplicate = AsyncMock(return_value=None)
+
+    await controller.process_cycle()
+
+    mock_components["orch"].from_config.return_value.extract_entities.assert_not_awaited()
+    assert state.work_ledger["msg_crash"].status == "quarantined"
+    assert state.emails_skipped_count == 1
+
+
+@pytest.mark.asyncio
+async def test_lease_store_leaves_emails_leased_by_another_daemon(mock_settings, mock_components, tmp_path):
+    """Emails another daemon holds are left alone and keep the watermark back"""
+    from daemon.work_queue import LEASE_DONE, SQLiteLeaseStore
+
+    store_path = tmp_path / "leases.sqlite3"
+    other_daemon = SQLiteLeaseStore(store_path, worker_id="other")
+    other_daemon.claim("msg_theirs")
+    controller = DaemonController(lease_store=SQLiteLeaseStore(store_path, worker_id="us"))
+    state = mock_components["real_state"]
+
+    emails = []
+    for message_id in ("msg_theirs", "msg_ours"):
+        email = MagicMock()
+        email.metadata.message_id = message_id
+        emails.append(email)
+    mock_components["gmail"].return_value.fetch_emails.return_value = emails
+    mock_components["gmail"].return_value.is_duplicate.return_value = False
+    mock_components["writer"].return_value.check_duplicate = AsyncMock(return_value="page_1")
+
+    await controller.process_cycle()
+
+    assert state.is_email_processed("msg_ours")
+    assert not state.is_email_processed("msg_theirs")
+    assert state.last_successful_fetch_timestamp is None
+    assert other_daemon.claim("msg_ours") == LEASE_DONE
+    assert "msg_theirs" not in state.work_ledger  # not left pending forever
+
+
+@pytest.mark.asyncio
+async def test_skipped_emails_do_not_stay_pending(mock_settings, mock_components):
+    """Emails skipped as already processed leave no pending ledger entry"""
+    controller = DaemonController()
+    state = mock_components["real_state"]
+    state.mark_email_processed("msg_done")
+    email = MagicMock()
+    email.metadata.message_id = "msg_done"
+    mock_components["gmail"].return_value.fetch_emails.return_value = [email]
+
+    await controller.process_cycle()
+
+    assert state.emails_skipped_count == 1
+    assert state.work_ledger == {}
+
+
+@pytest.mark.asyncio
+async def test_forwarded_copy_is_linked_to_written_original(mock_settings, mock_components):
+    """A near-identical copy under another message ID skips extraction and the Notion write"""
+    from content_normalizer.near_duplicates import NearDuplicateDetector
+
+    controller = DaemonController(near_duplicates=NearDuplicateDetector())
+    state = mock_components["real_state"]
+
+    original = (
+        "안녕하세요,\n\n브랜드엑스와 신세계인터내셔날의 PoC 킥오프 미팅을 11월 5일 오후 3시에 "
+        "진행합니다.\n예산은 2천만원이며 파일럿 범위는 강남점입니다."
+    )
+    bodies = {
+        "msg_orig": original,
+        "msg_fwd": (
+            "FYI 공유드립니다.\n\n---------- Forwarded message ---------\n"
+            "From: 김철수 <kim@brandx.com>\nDate: 2025년 10월 30일 (목) 오후 2:30\n"
+            "Subject: PoC 킥오프\nTo: <collab@signite.co>\n\n" + original
+        ),
+    }
+    emails = []
+    for message_id in bodies:
+        email = MagicMock()
+        email.metadata.message_id = message_id
+        emails.append(email)
+    mock_components["gmail"].return_value.fetch_emails.return_value = emails
+    mock_components["gmail"].return_value.is_duplicate.return_value = False
+    mock_components["normalizer"].return_value.process_raw_email.side_effect = (
+        lambda raw: MagicMock(cleaned_body=bodies[raw.metadata.message_id])
+    )
+    mock_components["writer"].return_value.check_duplicate = AsyncMock(return_value=None)
+    mock_components["writer"].return_value.create_collabiq_entry.return_value.success = True
+    extracted = MagicMock(spec=ExtractedEntities)
+    extracted.model_dump.return_value = {
+        "person_in_charge": "김철수",
+        "startup_name": "브랜드엑스",
+        "partner_org": "신세계인터내셔날",
+        "details": "PoC kickoff",
+        "date": "2025-11-05",
+        "email_id": "msg_orig",
+        "confidence": {"person": 0.9, "startup": 0.9, "partner": 0.9, "details": 0.9, "date": 0.9},
+    }
+    extracted.collaboration_type = "[A]PortCoXSSG"
+    extracted.collaboration_intensity = "협력"
+    extract = mock_components["orch"].from_config.return_value.extract_entities
+    extract.return_value = extracted
+    mock_components["summary"].return_value.generate_summary.return_value = "S" * 60
+
+    await controller.process_cycle()
+
+    assert extract.await_count == 1
+    mock_components["writer"].return_value.create_collabiq_entry.assert_awaited_once()
+    assert state.work_ledger["msg_fwd"].status == "duplicate"
+    assert state.work_ledger["msg_fwd"].duplicate_of == "msg_orig"
+    assert state.is_email_processed("msg_fwd")
+    assert (state.emails_processed_count, state.emails_skipped_count) == (1, 1)
+    assert state.last_successful_fetch_timestamp is not None
@@ -0,0 +1,167 @@
+"""
+Unit tests for the SQLite DLQ index.
+
+Tests migration of pre-existing entry files, filtering, pagination,
+lookup by error ID, and keeping the index in step with the files.
+"""
+
+import json
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+import pytest
+
+from llm_provider.types import DLQEntry
+from notion_integrator import DLQManager
+from notion_integrator.dlq_index import INDEX_FILENAME, classify_severity
+from tests.fixtures import create_valid_extracted_data
+
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _write_legacy_file(dlq_dir: Path, email_id: str, minutes: int, **error) -> Path:
+    """Write a DLQ file the way older versions did (no index)."""
+    entry = DLQEntry(
+        email_id=email_id,
+        failed_at=BASE_TIME + timedelta(minutes=minutes),
+        retry_count=error.pop("retry_count", 0),
+        error={"error_type": "APIResponseError", **error},
+        extracted_data=create_valid_extracted_data(email_id=email_id),
+    )
+    path = dlq_dir / f"{email_id}_20250101_000000.json"
+    path.write_text(
+        json.dumps(entry.model_dump(), default=str, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def dlq_dir(tmp_path):
+    """DLQ directory pre-populated with files from before the index existed."""
+    directory = tmp_path / "dlq"
+    directory.mkdir()
+    _write_legacy_file(directory, "email_a", 0, status_code=400, retry_count=3)
+    _write_legacy_file(directory, "email_b", 1, status_code=503)
+    _write_legacy_file(
+        directory, "email_c", 2, error_type="ConnectionError", retry_count=1
+    )
+    _write_legacy_file(directory, "email_d", 3, status_code=400)
+    return directory
+
+
+class TestDLQIndexMigration:
+    """Test indexing of files that predate the index."""
+
+    def test_existing_files_are_indexed_on_first_start(self, dlq_dir):
+        """
+        Test: Opening a DLQ without an index migrates its files.
+
+        Given: 4 DLQ files and no index database
+        When: DLQManager is created
+        Then: The index exists and lists all entries oldest first
+        """
+        manager = DLQManager(dlq_dir=str(dlq_dir))
+
+        assert (dlq_dir / INDEX_FILENAME).exists()
+        assert manager.count_entries() == 4
+        assert [Path(p).stem.split("_2025")[0] for p in manager.list_dlq_entries()] == [
+            "email_a",
+            "email_b",
+            "email_c",
+            "email_d",
+        ]
+
+    def test_files_added_or_removed_externally_are_reconciled(self, dlq_dir):
+        """A later start picks up new files and drops rows for deleted ones."""
+        DLQManager(dlq_dir=str(dlq_dir))
+        next(dlq_dir.glob("email_a_*.json")).unlink()
+        _write_legacy_file(dlq_dir, "email_e", 4)
+
+        manager = DLQManager(dlq_dir=str(dlq_dir))
+
+        emails = {r.email_id for r in manager.query_entries()}
+        assert emails == {"email_b", "email_c", "email_d", "email_e"}
+
+    def test_unreadable_file_is_skipped(self, dlq_dir):
+        """A corrupt file does not prevent the rest from being indexed."""
+        (dlq_dir / "broken_20250101_000000.json").write_text("{not json")
+
+        manager = DLQManager(dlq_dir=str(dlq_dir))
+
+        assert manager.count_entries() == 4
+
+
+class TestDLQIndexQueries:
+    """Test filtering, pagination and lookup."""
+
+    @pytest.fixture
+    def manager(self, dlq_dir):
+        return DLQManager(dlq_dir=str(dlq_dir))
+
+    def test_filters(self, manager):
+        """Filters on error type, severity, email, time and retry count."""
+        assert manager.count_entries(error_type="ConnectionError") == 1
+        assert manager.count_entries(severity="warning") == 2
+        assert manager.count_entries(severity="error") == 2
+        assert [r.email_id for r in manager.query_entries(email_id="email_b")] == [
+            "email_b"
+        ]
+        assert manager.count_entries(since=BASE_TIME + timedelta(minutes=2)) == 2
+        assert manager.count_entries(
+            before=(BASE_TIME + timedelta(minutes=1)).replace(tzinfo=None)
+        ) == 1
+        assert manager.count_entries(min_retry_count=1) == 2
+
+    def test_pagination_newest_first(self, manager):
+        """limit/offset page through entries in failure-time order."""
+        first = manager.query_entries(newest_first=True, limit=2)
+        second = manager.query_entries(newest_first=True, limit=2, offset=2)
+
+        assert [r.email_id for r in first] == ["email_d", "email_c"]
+        assert [r.email_id for r in second] == ["email_b", "email_a"]
+
+    def test_get_entry_by_error_id(self, manager):
+        """Lookup by error ID returns the record with its file path."""
+        record = manager.query_entries(email_id="email_a")[0]
+
+        found = manager.get_entry(record.error_id)
+
+        assert found == record
+        assert found.retry_count == 3
+        assert manager.load_dlq_entry(found.file_path).email_id == "email_a"
+        assert manager.get_entry("missing") is None
+
+    def test_save_and_remove_keep_index_current(self, manager):
+        """Entries saved or removed through the manager update the index."""
+        path = manager.save_failed_write(
+            extracted_data=create_valid_extracted_data(email_id="email_new"),
+            error_details={"error_type": "APIResponseError", "status_code": 429},
+        )
+
+        record = manager.get_entry(Path(path).stem)
+        assert record is not None
+        assert record.status_code == 429
+
+        manager.remove_entry(path)
+
+        assert manager.get_entry(Path(path).stem) is None
+        assert not Path(path).exists()
+
+
+class TestClassifySeverity:
+    """Test the shared severity classification."""
+
+    @pytest.mark.parametrize(
+        "error_type,status_code,expected",
+        [
+            ("ConnectionError", None, "warning"),
+            ("ReadTimeout", None, "warning"),
+            ("APIResponseError", 400, "error"),
+            ("APIResponseError", 502, "warning"),
+            ("ValueError", None, "error"),
+        ],
+    )
+    def test_classify_severity(self, error_type, status_code, expected):
+        assert classify_severity(error_type, status_code) == expected
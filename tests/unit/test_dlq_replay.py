@@ -0,0 +1,210 @@
+"""
+Unit tests for concurrent DLQ replay (DLQManager.replay_batch).
+
+Tests worker concurrency, failure-time ordering, single flush of the
+processed-IDs file, and progress reporting.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from llm_provider.types import WriteResult
+from notion_integrator import DLQManager
+from tests.fixtures import create_valid_extracted_data
+
+
+class FakeWriter:
+    """NotionWriter stand-in recording call order and peak concurrency."""
+
+    def __init__(self, fail_ids=(), delay=0.01):
+        self.fail_ids = set(fail_ids)
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create_collabiq_entry(self, extracted_data):
+        self.calls.append(extracted_data.email_id)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        if extracted_data.email_id in self.fail_ids:
+            return WriteResult(
+                success=False,
+                email_id=extracted_data.email_id,
+                error_type="APIResponseError",
+                error_message="still failing",
+            )
+        return WriteResult(
+            success=True, page_id="page-id", email_id=extracted_data.email_id
+        )
+
+
+@pytest.fixture
+def dlq_manager(tmp_path):
+    """DLQManager in a temporary directory."""
+    return DLQManager(dlq_dir=str(tmp_path / "dlq"))
+
+
+def _save_entries(dlq_manager, email_ids, base_time):
+    """Save one DLQ entry per email ID, failing one minute apart (in order given).
+
+    Files are edited in place, so the manager's index is re-synced afterwards.
+    """
+    paths = []
+    for minutes, email_id in enumerate(email_ids):
+        path = dlq_manager.save_failed_write(
+            extracted_data=create_valid_extracted_data(email_id=email_id),
+            error_details={"error_type": "APIResponseError", "retry_count": 3},
+        )
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        data["failed_at"] = (base_time + timedelta(minutes=minutes)).isoformat()
+        Path(path).write_text(json.dumps(data), encoding="utf-8")
+        paths.append(path)
+    dlq_manager.index.sync()
+    return paths
+
+
+class TestReplayBatch:
+    """Test DLQManager.replay_batch()."""
+
+    @pytest.mark.asyncio
+    async def test_replays_concurrently_oldest_first(self, dlq_manager):
+        """
+        Test: Entries are replayed by several workers, oldest failure first.
+
+        Given: 6 DLQ entries whose files sort differently from their failure times
+        When: replay_batch() runs with 3 workers
+        Then: All succeed, up to 3 run at once, and dispatch follows failed_at
+        """
+        base = datetime(2025, 1, 1, tzinfo=UTC)
+        _save_entries(dlq_manager, ["e5", "e4", "e3", "e2", "e1", "e0"], base)
+        writer = FakeWriter()
+
+        stats = await dlq_manager.replay_batch(writer, max_count=None, workers=3)
+
+        assert stats["succeeded"] == 6
+        assert stats["failed"] == 0
+        assert stats["total"] == 6
+        assert stats["throughput_per_second"] > 0
+        assert writer.peak == 3
+        assert writer.calls == ["e5", "e4", "e3", "e2", "e1", "e0"]
+        assert dlq_manager.list_dlq_entries() == []
+
+    @pytest.mark.asyncio
+    async def test_processed_ids_flushed_once(self, dlq_manager):
+        """The processed-IDs file is loaded and written once per batch."""
+        _save_entries(dlq_manager, ["a", "b", "c"], datetime(2025, 1, 1, tzinfo=UTC))
+        writer = FakeWriter()
+
+        with patch.object(
+            dlq_manager, "_save_processed_ids", wraps=dlq_manager._save_processed_ids
+        ) as save:
+            await dlq_manager.replay_batch(writer, max_count=None, workers=2)
+
+        save.assert_called_once()
+        assert {"a", "b", "c"} <= dlq_manager._load_processed_ids()
+
+    @pytest.mark.asyncio
+    async def test_failed_entries_stay_in_dlq(self, dlq_manager):
+        """Failures increment retry_count and keep their file."""
+        paths = _save_entries(
+            dlq_manager, ["ok", "bad"], datetime(2025, 1, 1, tzinfo=UTC)
+        )
+        writer = FakeWriter(fail_ids={"bad"})
+
+        stats = await dlq_manager.replay_batch(writer, max_count=None)
+
+        assert stats["succeeded"] == 1
+        assert stats["failed"] == 1
+        assert not Path(paths[0]).exists()
+        assert dlq_manager.load_dlq_entry(paths[1]).retry_count == 4
+
+    @pytest.mark.asyncio
+    async def test_already_processed_entries_are_not_rewritten(self, dlq_manager):
+        """Entries whose email was already written are cleared without an API call."""
+        _save_entries(dlq_manager, ["done"], datetime(2025, 1, 1, tzinfo=UTC))
+        dlq_manager._save_processed_ids({"done"})
+        writer = FakeWriter()
+
+        stats = await dlq_manager.replay_batch(writer)
+
+        assert stats["succeeded"] == 1
+        assert writer.calls == []
+
+    @pytest.mark.asyncio
+    async def test_failed_since_and_max_count(self, dlq_manager):
+        """failed_since filters by failure time; max_count keeps the oldest."""
+        base = datetime(2025, 1, 1, tzinfo=UTC)
+        _save_entries(dlq_manager, ["old", "mid", "new", "newest"], base)
+        writer = FakeWriter()
+
+        stats = await dlq_manager.replay_batch(
+            writer,
+            max_count=2,
+            failed_since=(base + timedelta(minutes=1)).replace(tzinfo=None),
+        )
+
+        assert stats["total"] == 2
+        assert writer.calls == ["mid", "new"]
+
+    @pytest.mark.asyncio
+    async def test_progress_callback_reports_each_entry(self, dlq_manager):
+        """progress_callback receives running counts after every entry."""
+        _save_entries(dlq_manager, ["p1", "p2"], datetime(2025, 1, 1, tzinfo=UTC))
+        updates = []
+
+        await dlq_manager.replay_batch(
+            FakeWriter(), progress_callback=updates.append
+        )
+
+        assert [u["completed"] for u in updates] == [1, 2]
+        assert updates[-1]["total"] == 2
+
+
+class TestRetryCommand:
+    """Test `collabiq errors retry` against a stubbed writer."""
+
+    def test_retry_all_replays_through_writer(self, tmp_path, monkeypatch):
+        """
+        Test: The CLI builds a writer and replays every entry with it.
+
+        Given: 3 DLQ entries, one still failing
+        When: `collabiq errors retry --all --json` runs
+        Then: All 3 are replayed, 2 succeed, and the writer's client is closed
+        """
+        from typer.testing import CliRunner
+
+        from collabiq import app
+        from collabiq.commands import errors
+
+        dlq_dir = tmp_path / "dlq"
+        _save_entries(
+            DLQManager(dlq_dir=str(dlq_dir)),
+            ["e0", "e1", "e2"],
+            datetime(2025, 1, 1, tzinfo=UTC),
+        )
+        writer = FakeWriter(fail_ids={"e1"})
+        closed = []
+
+        class FakeIntegrator:
+            async def close(self):
+                closed.append(True)
+
+        writer.notion_integrator = FakeIntegrator()
+        monkeypatch.setattr(errors, "DLQ_DIR", dlq_dir)
+        monkeypatch.setattr(errors, "_create_notion_writer", lambda: writer)
+
+        result = CliRunner().invoke(app, ["errors", "retry", "--all", "--json"])
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.stdout)["data"]
+        assert (data["succeeded"], data["failed"], data["total"]) == (2, 1, 3)
+        assert sorted(writer.calls) == ["e0", "e1", "e2"]
+        assert closed == [True]
@@ -0,0 +1,173 @@
+"""
+Unit tests for GCSStateManager against the in-memory GCS stand-in.
+
+Tests compact serialization, generation-checked uploads, conflict
+merging between two overlapping instances and off-loop saves.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from collabiq.test_utils.gcs_stub import FakeGCSClient
+from daemon.gcs_state_manager import GCSStateManager
+from models.daemon_state import DaemonProcessState
+
+BUCKET = "state-bucket"
+BLOB = "daemon/state.json"
+
+
+@pytest.fixture
+def client():
+    return FakeGCSClient()
+
+
+def make_manager(client, tmp_path, name="a"):
+    return GCSStateManager(
+        BUCKET, BLOB, local_fallback_path=tmp_path / name / "state.json", client=client
+    )
+
+
+def stored_state(client):
+    return DaemonProcessState.model_validate_json(client.object_data(BUCKET, BLOB))
+
+
+class TestGCSStateManager:
+    """Test persistence through the fake client."""
+
+    def test_save_and_load_compact_json(self, client, tmp_path):
+        manager = make_manager(client, tmp_path)
+        state = manager.load_state()
+        state.mark_email_processed("<m1@example.com>")
+        state.emails_processed_count = 3
+
+        manager.save_state(state)
+        loaded = make_manager(client, tmp_path, "b").load_state()
+
+        assert b"\n" not in client.object_data(BUCKET, BLOB)
+        assert loaded.emails_processed_count == 3
+        assert loaded.is_email_processed("<m1@example.com>")
+        assert json.loads((tmp_path / "a" / "state.json").read_text())[
+            "emails_processed_count"
+        ] == 3
+
+    def test_unchanged_object_is_not_downloaded_again(self, client, tmp_path):
+        manager = make_manager(client, tmp_path)
+        manager.save_state(DaemonProcessState(total_processing_cycles=1))
+
+        manager.load_state()
+        manager.load_state()
+
+        assert client.downloads == 0
+
+    def test_overlapping_instances_merge_instead_of_clobbering(self, client, tmp_path):
+        first = make_manager(client, tmp_path, "a")
+        second = make_manager(client, tmp_path, "b")
+        first.save_state(DaemonProcessState())
+        state_a = first.load_state()
+        state_b = second.load_state()
+
+        state_b.mark_email_processed("<b@example.com>")
+        state_b.emails_processed_count = 1
+        second.save_state(state_b)
+        state_a.mark_email_processed("<a@example.com>")
+        state_a.last_successful_fetch_timestamp = datetime(2025, 11, 2)
+        first.save_state(state_a)
+
+        merged = stored_state(client)
+        assert merged.processed_message_ids == {"<a@example.com>", "<b@example.com>"}
+        assert merged.emails_processed_count == 1
+        assert merged.last_successful_fetch_timestamp == datetime(2025, 11, 2)
+        assert first.conflicts == 1
+        assert client.precondition_failures == 1
+
+    def test_later_saves_keep_merged_progress(self, client, tmp_path):
+        first = make_manager(client, tmp_path, "a")
+        second = make_manager(client, tmp_path, "b")
+        first.save_state(DaemonProcessState())
+        state_a = first.load_state()
+        state_b = second.load_state()
+
+        state_b.mark_email_processed("B1")
+        second.save_state(state_b)
+        state_a.mark_email_processed("A1")
+        first.save_state(state_a)
+        # state_a itself never saw B1; the next save must not drop it
+        state_a.mark_email_processed("A2")
+        first.save_state(state_a)
+
+        assert stored_state(client).processed_message_ids == {"A1", "A2", "B1"}
+        assert first.conflicts == 1
+
+    def test_object_rewritten_mid_read_is_read_again(self, client, tmp_path):
+        first = make_manager(client, tmp_path, "a")
+        second = make_manager(client, tmp_path, "b")
+        first.save_state(DaemonProcessState())
+        bucket = client.bucket(BUCKET)
+        get_blob = bucket.get_blob
+        rewrites = []
+
+        def get_blob_then_rewrite(name):
+            blob = get_blob(name)
+            if not rewrites:
+                rewrites.append(name)
+                # Lands between second's metadata read and its download
+                first.save_state(DaemonProcessState(emails_processed_count=5))
+            return blob
+
+        bucket.get_blob = get_blob_then_rewrite
+        client.bucket = lambda name: bucket
+        second.save_state(DaemonProcessState(emails_processed_count=99))
+
+        assert client.precondition_failures == 1
+        assert stored_state(client).emails_processed_count == 99
+        assert second.load_state().emails_processed_count == 99
+
+    def test_first_write_does_not_overwrite_existing_object(self, client, tmp_path):
+        existing = make_manager(client, tmp_path, "a")
+        state = DaemonProcessState()
+        state.mark_email_processed("<old@example.com>")
+        existing.save_state(state)
+
+        # A new instance saving before it ever loaded
+        newcomer = make_manager(client, tmp_path, "b")
+        newcomer.save_state(DaemonProcessState())
+
+        assert stored_state(client).is_email_processed("<old@example.com>")
+
+    @pytest.mark.asyncio
+    async def test_async_saves_are_coalesced(self, client, tmp_path):
+        manager = make_manager(client, tmp_path)
+        state = DaemonProcessState()
+
+        for count in range(1, 6):
+            state.emails_processed_count = count
+            await manager.save_state_async(state, wait=False)
+        await manager.flush()
+
+        assert stored_state(client).emails_processed_count == 5
+        assert client.uploads < 5
+
+
+class TestMergeFrom:
+    """Test DaemonProcessState.merge_from()."""
+
+    def test_keeps_progress_from_both(self):
+        ours = DaemonProcessState(error_count=2, current_status="running")
+        ours.record_error("high", "llm", "ours")
+        theirs = DaemonProcessState(
+            error_count=5,
+            last_successful_fetch_timestamp=datetime(2025, 11, 1),
+            llm_calls_by_provider={"gemini": 4},
+        )
+        theirs.record_error("high", "notion", "theirs")
+        ours.last_successful_fetch_timestamp = datetime(2025, 11, 3)
+
+        ours.merge_from(theirs)
+
+        assert ours.error_count == 6
+        assert ours.current_status == "running"
+        assert ours.last_successful_fetch_timestamp == datetime(2025, 11, 1)
+        assert ours.llm_calls_by_provider == {"gemini": 4}
+        assert {e["message"] for e in ours.recent_errors} == {"ours", "theirs"}
@@ -195,6 +195,44 @@ def test_gmail_receiver_fetch_new_messages(
     assert all(isinstance(msg, RawEmail) for msg in messages)
 
 
+def test_gmail_receiver_fetch_oldest_first_pages_through_list(
+    gmail_api_message_detail, mock_credentials_path, mock_token_path
+):
+    """
+    Test oldest_first lists every page and fetches the oldest messages.
+
+    Verifies:
+    - messages.list() is followed through nextPageToken
+    - Only the oldest max_emails IDs (end of the newest-first list) are fetched
+    - internalDate is kept on the parsed metadata
+    """
+    mock_service = Mock()
+    pages = [
+        {"messages": [{"id": "m5"}, {"id": "m4"}, {"id": "m3"}], "nextPageToken": "p2"},
+        {"messages": [{"id": "m2"}, {"id": "m1"}]},
+    ]
+    mock_service.users().messages().list.return_value.execute.side_effect = pages
+    mock_service.users().messages().get.return_value.execute.return_value = (
+        gmail_api_message_detail
+    )
+
+    receiver = GmailReceiver(
+        credentials_path=mock_credentials_path, token_path=mock_token_path
+    )
+    receiver.service = mock_service
+
+    messages = receiver.fetch_emails(
+        since=datetime(2025, 10, 1), max_emails=2, oldest_first=True
+    )
+
+    list_calls = mock_service.users().messages().list.call_args_list
+    assert [c.kwargs.get("pageToken") for c in list_calls] == [None, "p2"]
+    get_ids = [c.kwargs["id"] for c in mock_service.users().messages().get.call_args_list]
+    assert get_ids == ["m1", "m2"]
+    assert len(messages) == 2
+    assert messages[0].metadata.internal_date.timestamp() == 1730267722
+
+
 # T026: Test Gmail receiver parse message
 def test_gmail_receiver_parse_message(
     gmail_api_message_detail, mock_credentials_path, mock_token_path, tmp_path
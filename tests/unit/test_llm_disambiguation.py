@@ -0,0 +1,289 @@
+"""
+Unit tests for batched LLM company name disambiguation.
+
+Tests candidate shortlisting by CompanyIndex.rank(), one LLM call per
+batch of names in LLMMatcher/HybridMatcher, parsing of the JSON response,
+NotionWriter pre-matching a whole batch, and LLMOrchestrator.generate_text()
+failover.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llm_orchestrator.exceptions import AllProvidersFailedError
+from llm_orchestrator.orchestrator import LLMOrchestrator
+from llm_orchestrator.types import OrchestrationConfig
+from llm_provider.exceptions import LLMRateLimitError
+from notion_integrator.fuzzy_matcher import CompanyIndex, HybridMatcher, LLMMatcher
+from notion_integrator.match_memo import MatchMemo
+from notion_integrator.writer import NotionWriter
+
+
+CANDIDATES = [
+    ("page-wake", "웨이크"),
+    ("page-network", "네트워크"),
+    ("page-card", "현대카드"),
+    ("page-capital", "현대캐피탈"),
+    ("page-ssg", "신세계"),
+]
+
+
+def _orchestrator(*responses):
+    """Orchestrator stub whose generate_text returns the given responses."""
+    orchestrator = MagicMock()
+    orchestrator.generate_text = AsyncMock(side_effect=list(responses))
+    return orchestrator
+
+
+def _response(*picks):
+    """JSON response picking (name number, candidate number, score)."""
+    return json.dumps(
+        [{"name": n, "candidate": c, "score": score} for n, c, score in picks]
+    )
+
+
+class TestCompanyIndexRank:
+    """Test candidate shortlisting."""
+
+    def test_rank_orders_by_score(self):
+        index = CompanyIndex(CANDIDATES)
+
+        ranked = index.rank("현대카드사", limit=2)
+
+        assert [page_id for page_id, _, _ in ranked] == ["page-card", "page-capital"]
+        assert ranked[0][2] > ranked[1][2] > 0.0
+
+    def test_rank_finds_candidates_beyond_the_first_ten(self):
+        """The shortlist is by score, not by database order."""
+        filler = [(f"page-{i}", f"회사{i:02d}") for i in range(30)]
+        index = CompanyIndex(filler + [("page-target", "그린에너지솔루션")])
+
+        ranked = index.rank("그린 에너지", limit=10)
+
+        assert ranked[0][0] == "page-target"
+
+    def test_normalized_exact_ranks_first(self):
+        index = CompanyIndex(CANDIDATES)
+
+        assert index.rank("네트웍", limit=1) == [("page-network", "네트워크", 1.0)]
+
+
+class TestLLMMatcherBatch:
+    """Test LLMMatcher.match_many()."""
+
+    @pytest.mark.asyncio
+    async def test_all_names_resolved_in_one_call(self):
+        """
+        Test: Several names are disambiguated with one LLM call.
+
+        Given: Two ambiguous names, an exact name and one without candidates
+        When: match_many() is called
+        Then: One prompt covers the ambiguous names; the others need no LLM
+        """
+        orchestrator = _orchestrator(_response((1, 1, 0.92), (2, None, 0.0)))
+        matcher = LLMMatcher(orchestrator)
+
+        results = await matcher.match_many(
+            ["현대카드사", "현대자동차", "웨이크", "ABC", "현대카드사"], CANDIDATES
+        )
+
+        assert orchestrator.generate_text.await_count == 1
+        prompt = orchestrator.generate_text.await_args.args[0]
+        assert '1. "현대카드사"\n   1. 현대카드\n   2. 현대캐피탈' in prompt
+        assert '2. "현대자동차"' in prompt
+        assert '"웨이크"' not in prompt and '"ABC"' not in prompt
+
+        assert set(results) == {"현대카드사", "현대자동차", "웨이크", "ABC"}
+        assert results["현대카드사"].page_id == "page-card"
+        assert results["현대카드사"].match_type == "semantic"
+        assert results["현대카드사"].match_method == "llm"
+        assert results["현대자동차"].match_type == "none"
+        assert results["현대자동차"].company_name == "현대자동차"
+        assert results["웨이크"].match_type == "exact"
+        assert results["ABC"].match_type == "none"
+
+    @pytest.mark.asyncio
+    async def test_low_scores_and_invalid_picks_are_not_matches(self):
+        orchestrator = _orchestrator(
+            "```json\n"
+            + _response((1, 1, 0.5), (2, 99, 0.9), (3, 1, 1.0))
+            + "\n```"
+        )
+        matcher = LLMMatcher(orchestrator)
+
+        results = await matcher.match_many(
+            ["현대카드사", "현대 캐피탈사", "네트웍스"], CANDIDATES, auto_create=False
+        )
+
+        assert results["현대카드사"].page_id is None
+        assert results["현대카드사"].company_name == ""
+        assert results["현대 캐피탈사"].page_id is None
+        # Scores are capped below an exact match
+        assert results["네트웍스"].similarity_score == 0.99
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_is_no_match(self):
+        matcher = LLMMatcher(_orchestrator("Best match: 현대카드"))
+
+        result = await matcher.match_async("현대카드사", CANDIDATES)
+
+        assert result.match_type == "none"
+
+    def test_sync_match_outside_event_loop(self):
+        matcher = LLMMatcher(_orchestrator(_response((1, 1, 0.9))))
+
+        assert matcher.match("현대카드사", CANDIDATES).page_id == "page-card"
+
+
+class TestHybridMatcherBatch:
+    """Test HybridMatcher LLM fallback."""
+
+    @pytest.mark.asyncio
+    async def test_only_close_misses_go_to_llm(self):
+        """
+        Test: rapidfuzz resolves what it can; near misses share one LLM call.
+
+        Given: A fuzzy match, two near misses (0.70-0.85) and an unrelated name
+        When: match_many() is called
+        Then: One LLM call for the two near misses only
+        """
+        orchestrator = _orchestrator(_response((1, 1, 0.9), (2, 1, 0.8)))
+        matcher = HybridMatcher(orchestrator)
+
+        results = await matcher.match_many(
+            ["신세계", "현대카드코리아", "현대캐피탈코리아", "ABC"], CANDIDATES
+        )
+
+        prompt = orchestrator.generate_text.await_args.args[0]
+        assert orchestrator.generate_text.await_count == 1
+        assert '"현대카드코리아"' in prompt and '"현대캐피탈코리아"' in prompt
+        assert '"ABC"' not in prompt
+        assert results["신세계"].match_method == "hybrid-character"
+        assert results["현대카드코리아"].page_id == "page-card"
+        assert results["현대카드코리아"].match_method == "hybrid-semantic"
+        assert results["현대캐피탈코리아"].page_id == "page-capital"
+        assert results["ABC"].match_type == "none"
+        assert results["ABC"].company_name == "ABC"
+
+    @pytest.mark.asyncio
+    async def test_batch_warms_memo_for_single_matches(self):
+        """Names pre-matched in a batch are served from the memo afterwards."""
+        orchestrator = _orchestrator(_response((1, 1, 0.9)))
+        matcher = HybridMatcher(orchestrator, memo=MatchMemo())
+        index = CompanyIndex(CANDIDATES)
+
+        await matcher.match_many(["현대카드코리아"], index)
+        result = await matcher.match_async("현대카드코리아", index)
+
+        assert result.page_id == "page-card"
+        assert orchestrator.generate_text.await_count == 1
+
+
+class TestWriterPrematch:
+    """Test NotionWriter pre-matching a batch's company names."""
+
+    @pytest.mark.asyncio
+    async def test_prematch_sends_unmatched_names_once(self):
+        writer = NotionWriter(MagicMock(), "collabiq-db")
+        matcher = MagicMock()
+        matcher.match_many = AsyncMock()
+        writer.field_mapper = SimpleNamespace(company_matcher=matcher)
+        batch = [
+            SimpleNamespace(
+                startup_name="현대카드사",
+                partner_org="신세계",
+                matched_company_id=None,
+                matched_partner_id="page-ssg",
+            ),
+            SimpleNamespace(
+                startup_name=" ",
+                partner_org="네트웍",
+                matched_company_id=None,
+                matched_partner_id=None,
+            ),
+        ]
+
+        await writer._prematch_companies(batch, CANDIDATES)
+
+        matcher.match_many.assert_awaited_once()
+        assert matcher.match_many.await_args.args[0] == ["현대카드사", "네트웍"]
+
+    @pytest.mark.asyncio
+    async def test_single_entry_prematches_startup_and_partner_together(self):
+        """
+        Test: create_collabiq_entry() disambiguates both names in one LLM call.
+
+        Given: An email whose startup and partner are both near misses
+        When: create_collabiq_entry() maps it
+        Then: One LLM call, and mapping is served from the pre-matched memo
+        """
+        orchestrator = _orchestrator(_response((1, 1, 0.9), (2, 1, 0.8)))
+        matcher = HybridMatcher(orchestrator, memo=MatchMemo())
+        index = CompanyIndex(CANDIDATES)
+        writer = NotionWriter(MagicMock(), "collabiq-db")
+        writer.field_mapper = SimpleNamespace(
+            company_matcher=matcher,
+            companies_cache=object(),
+            _load_company_candidates=AsyncMock(return_value=index),
+        )
+        writer.check_duplicate = AsyncMock(return_value=None)
+        writer._write_mapped_entry = AsyncMock()
+        mapped = {}
+
+        async def map_properties(
+            extracted_data, company_candidates=None, company_matches=None
+        ):
+            for name in (extracted_data.startup_name, extracted_data.partner_org):
+                mapped[name] = await matcher.match_async(name, company_candidates)
+            return {}
+
+        writer._map_properties = map_properties
+        extracted = SimpleNamespace(
+            email_id="email-1",
+            startup_name="현대카드코리아",
+            partner_org="현대캐피탈코리아",
+            matched_company_id=None,
+            matched_partner_id=None,
+        )
+
+        await writer.create_collabiq_entry(extracted)
+
+        assert orchestrator.generate_text.await_count == 1
+        assert mapped["현대카드코리아"].page_id == "page-card"
+        assert mapped["현대캐피탈코리아"].page_id == "page-capital"
+
+
+class TestOrchestratorGenerateText:
+    """Test LLMOrchestrator.generate_text() failover."""
+
+    def _orchestrator(self, providers, unhealthy=()):
+        health_tracker = MagicMock()
+        health_tracker.is_healthy.side_effect = lambda name: name not in unhealthy
+        config = OrchestrationConfig(provider_priority=list(providers))
+        return LLMOrchestrator(providers, config, health_tracker)
+
+    @pytest.mark.asyncio
+    async def test_fails_over_in_priority_order(self):
+        failing = MagicMock(generate_text=AsyncMock(side_effect=LLMRateLimitError("429")))
+        skipped = MagicMock(generate_text=AsyncMock(return_value="unused"))
+        working = MagicMock(generate_text=AsyncMock(return_value="[]"))
+        orchestrator = self._orchestrator(
+            {"gemini": failing, "claude": skipped, "openai": working},
+            unhealthy={"claude"},
+        )
+
+        assert await orchestrator.generate_text("prompt") == "[]"
+        skipped.generate_text.assert_not_awaited()
+        orchestrator.health_tracker.record_failure.assert_called_once()
+        orchestrator.health_tracker.record_success.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_raises_when_no_provider_succeeds(self):
+        unsupported = MagicMock(generate_text=AsyncMock(side_effect=NotImplementedError))
+        orchestrator = self._orchestrator({"gemini": unsupported})
+
+        with pytest.raises(AllProvidersFailedError):
+            await orchestrator.generate_text("prompt")
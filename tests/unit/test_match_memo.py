@@ -0,0 +1,214 @@
+"""
+Unit tests for MatchMemo and its use by the company and person matchers.
+
+Tests LRU eviction, TTL expiry, negative caching, copy isolation, and
+invalidation when the candidate snapshot (CompanyIndex version or user
+list) changes.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from notion_integrator.fuzzy_matcher import (
+    CompanyIndex,
+    HybridMatcher,
+    LLMMatcher,
+    RapidfuzzMatcher,
+)
+from notion_integrator.match_memo import MatchMemo
+from notion_integrator.person_matcher import NotionPersonMatcher, NotionUser
+
+
+CANDIDATES = [
+    ("page-wake", "웨이크"),
+    ("page-network", "네트워크"),
+    ("page-card", "현대카드"),
+]
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMatchMemo:
+    """Test MatchMemo storage."""
+
+    def test_invalid_limits_rejected(self):
+        with pytest.raises(ValueError):
+            MatchMemo(max_size=0)
+        with pytest.raises(ValueError):
+            MatchMemo(ttl_seconds=0)
+
+    def test_least_recently_used_entry_evicted(self):
+        """A full memo drops the entry used longest ago."""
+        memo = MatchMemo(max_size=2)
+        memo.set("a", 1)
+        memo.set("b", 2)
+        memo.get("a")
+
+        memo.set("c", 3)
+
+        assert memo.get("b") is None
+        assert memo.get("a") == 1
+        assert memo.get("c") == 3
+        assert memo.get_stats()["evictions"] == 1
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        memo = MatchMemo(ttl_seconds=10, clock=clock)
+        memo.set("a", 1)
+
+        clock.now = 9.9
+        assert memo.get("a") == 1
+
+        clock.now = 10.0
+        assert memo.get("a") is None
+        assert len(memo) == 0
+
+    def test_get_or_compute_counts_hits_and_skips_failures(self):
+        """Results are computed once; exceptions are not memoized."""
+        memo = MatchMemo()
+        compute = MagicMock(return_value="result")
+
+        assert memo.get_or_compute("k", compute) == "result"
+        assert memo.get_or_compute("k", compute) == "result"
+        assert compute.call_count == 1
+
+        with pytest.raises(RuntimeError):
+            memo.get_or_compute("bad", MagicMock(side_effect=RuntimeError))
+        assert memo.get("bad") is None
+
+        stats = memo.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+
+
+class TestCompanyMatcherMemo:
+    """Test memoized company matching."""
+
+    def test_repeat_match_served_from_memo(self):
+        """The same name against the same index version is scored once."""
+        memo = MatchMemo()
+        matcher = RapidfuzzMatcher(memo=memo)
+        index = CompanyIndex(CANDIDATES)
+
+        with patch.object(
+            CompanyIndex,
+            "best_match",
+            autospec=True,
+            side_effect=CompanyIndex.best_match,
+        ) as best_match:
+            first = matcher.match("네트웍", index)
+            second = matcher.match("  네트웍 ", index.copy())
+
+        assert first == second
+        assert first.page_id == "page-network"
+        assert best_match.call_count == 1
+        assert memo.hits == 1
+
+    def test_no_match_is_memoized(self):
+        """Negative results are cached like matches."""
+        memo = MatchMemo()
+        matcher = RapidfuzzMatcher(memo=memo)
+        index = CompanyIndex(CANDIDATES)
+
+        first = matcher.match("완전히다른회사", index)
+        second = matcher.match("완전히다른회사", index)
+
+        assert first.match_type == second.match_type == "none"
+        assert memo.hits == 1
+        assert len(memo) == 1
+
+    def test_new_snapshot_version_is_not_served_stale(self):
+        """After a company is added, earlier "no match" results are not reused."""
+        memo = MatchMemo()
+        matcher = RapidfuzzMatcher(memo=memo)
+        index = CompanyIndex(CANDIDATES)
+        assert matcher.match("새회사", index).page_id is None
+
+        index.append(("page-new", "새회사"))
+
+        assert matcher.match("새회사", index).page_id == "page-new"
+        assert matcher.match("새회사", CompanyIndex(CANDIDATES)).page_id is None
+
+    def test_returned_match_cannot_alter_memo(self):
+        """HybridMatcher rewrites match_method; the memoized result is unaffected."""
+        memo = MatchMemo()
+        index = CompanyIndex(CANDIDATES)
+        hybrid = HybridMatcher(MagicMock(), memo=memo)
+
+        assert hybrid.match("웨이크", index).match_method == "hybrid-character"
+        assert hybrid.rapidfuzz_matcher.match(
+            "웨이크", index, auto_create=False
+        ).match_method == "character"
+
+    @pytest.mark.asyncio
+    async def test_llm_result_memoized_but_not_failures(self):
+        """Repeated names skip the LLM; results of failed calls are not kept."""
+        orchestrator = MagicMock()
+        orchestrator.generate_text = AsyncMock(
+            return_value='[{"name": 1, "candidate": 1, "score": 0.9}]'
+        )
+        matcher = LLMMatcher(orchestrator, memo=MatchMemo())
+        index = CompanyIndex(CANDIDATES)
+
+        first = await matcher.match_async("현대 카드사", index)
+        second = await matcher.match_async("현대 카드사", index)
+
+        assert first == second
+        assert first.page_id == "page-card"
+        assert orchestrator.generate_text.await_count == 1
+
+        orchestrator.generate_text.side_effect = RuntimeError("quota")
+        await matcher.match_async("네트워크스", index)
+        await matcher.match_async("네트워크스", index)
+        assert orchestrator.generate_text.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_llm_plain_candidate_list_not_memoized(self):
+        """Without an index version there is no safe key."""
+        memo = MatchMemo()
+        orchestrator = MagicMock()
+        orchestrator.generate_text = AsyncMock(return_value="[]")
+        matcher = LLMMatcher(orchestrator, memo=memo)
+
+        await matcher.match_async("현대 카드사", list(CANDIDATES))
+
+        assert len(memo) == 0
+
+
+class TestPersonMatcherMemo:
+    """Test memoized person matching."""
+
+    @pytest.fixture
+    def matcher(self, tmp_path):
+        return NotionPersonMatcher(
+            notion_client=MagicMock(), cache_dir=str(tmp_path), memo=MatchMemo()
+        )
+
+    def test_same_user_list_served_from_memo(self, matcher):
+        users = [NotionUser("user-1", "김철수"), NotionUser("user-2", "이영희")]
+
+        with patch.object(
+            matcher, "_perform_matching_logic", wraps=matcher._perform_matching_logic
+        ) as logic:
+            matcher._match_users("김철수", users, 0.70)
+            matcher._match_users("김철수", list(users), 0.70)
+
+        assert logic.call_count == 1
+
+    def test_changed_user_list_invalidates(self, matcher):
+        """A user joining the workspace changes the key, so "no match" is redone."""
+        users = [NotionUser("user-1", "김철수")]
+        assert matcher._match_users("박지민", users, 0.70).user_id is None
+
+        users.append(NotionUser("user-3", "박지민"))
+
+        assert matcher._match_users("박지민", users, 0.70).user_id == "user-3"
@@ -0,0 +1,124 @@
+"""
+Unit tests for Gmail payload body selection and decoding (email_receiver.mime_body).
+"""
+
+import base64
+
+import pytest
+
+from email_receiver.gmail_receiver import GmailReceiver
+from email_receiver.mime_body import decode_body, part_charset, scan_payload
+
+# "똠" is outside EUC-KR proper; mail labelled EUC-KR carries it as CP949
+KOREAN = "안녕하세요, 똠방각하 프로젝트 미팅은 11월 5일입니다."
+
+
+def text_part(text_or_bytes, mime_type="text/plain", charset="utf-8", **extra):
+    raw = text_or_bytes if isinstance(text_or_bytes, bytes) else text_or_bytes.encode(charset)
+    headers = [{"name": "Content-Type", "value": f'{mime_type}; charset="{charset}"'}]
+    headers += extra.pop("headers", [])
+    return {
+        "mimeType": mime_type,
+        "headers": headers,
+        "body": {"size": len(raw), "data": base64.urlsafe_b64encode(raw).decode().rstrip("=")},
+        **extra,
+    }
+
+
+def multipart(mime_type, *parts):
+    return {"mimeType": mime_type, "headers": [], "body": {"size": 0}, "parts": list(parts)}
+
+
+class TestScanPayload:
+    """Test body part selection and attachment detection."""
+
+    def test_prefers_nested_plain_text_over_html(self):
+        plain = text_part("plain body")
+        payload = multipart(
+            "multipart/mixed",
+            multipart("multipart/alternative", plain, text_part("<p>html</p>", "text/html")),
+            {"mimeType": "application/pdf", "filename": "deck.pdf",
+             "body": {"size": 10_000_000, "attachmentId": "ANGjdJ8"}},
+        )
+
+        scan = scan_payload(payload)
+
+        assert scan.body_part is plain
+        assert scan.has_attachments
+
+    def test_html_only_message_and_inline_attachments(self):
+        html = text_part("<p>html</p>", "text/html")
+        attached_text = text_part(
+            "notes.txt content",
+            headers=[{"name": "Content-Disposition", "value": "attachment; filename=notes.txt"}],
+        )
+
+        scan = scan_payload(multipart("multipart/mixed", attached_text, html))
+
+        assert scan.body_part is html
+        assert scan.has_attachments
+
+    def test_single_part_message(self):
+        part = text_part("just text")
+
+        assert scan_payload(part).body_part is part
+        assert scan_payload({"mimeType": "text/plain", "body": {"size": 0}}).body_part is None
+
+
+class TestDecodeBody:
+    """Test charset and size handling."""
+
+    @pytest.mark.parametrize("label", ["euc-kr", "ks_c_5601-1987", "cp949"])
+    def test_declared_korean_charsets(self, label):
+        decoded = decode_body(text_part(KOREAN.encode("cp949"), charset=label))
+
+        assert decoded.text == KOREAN
+        assert decoded.charset == "cp949"
+
+    def test_undeclared_or_wrong_charset_falls_back(self):
+        part = text_part(KOREAN.encode("cp949"))
+        part["headers"] = []
+
+        assert decode_body(part).text == KOREAN
+        assert part_charset(text_part("x", charset="EUC-KR")) == "euc-kr"
+
+    def test_limit_applies_before_decoding_and_keeps_whole_characters(self):
+        body = "가나다라마바사" * 100_000  # 2.1 MB of UTF-8
+
+        decoded = decode_body(text_part(body), max_bytes=1000)
+
+        assert decoded.truncated
+        assert len(decoded.text.encode("utf-8")) <= 1000
+        assert body.startswith(decoded.text)
+        assert "�" not in decoded.text
+
+    def test_undecodable_bytes_are_replaced_and_flagged(self):
+        decoded = decode_body(text_part(b"ok \xff\xfe\xff end", charset="utf-8"))
+
+        assert decoded.lossy
+        assert decoded.text.startswith("ok ")
+
+    def test_invalid_base64_raises_value_error(self):
+        with pytest.raises(ValueError):
+            decode_body({"body": {"data": "a"}})
+
+
+def test_gmail_receiver_parses_euc_kr_message(tmp_path):
+    receiver = GmailReceiver(
+        tmp_path / "credentials.json", tmp_path / "token.json", max_body_bytes=10_000
+    )
+    payload = multipart(
+        "multipart/mixed",
+        text_part(KOREAN.encode("cp949"), charset="euc-kr"),
+        {"mimeType": "image/png", "filename": "logo.png", "body": {"attachmentId": "x"}},
+    )
+    payload["headers"] = [
+        {"name": "From", "value": "partner@example.com"},
+        {"name": "Subject", "value": "협업 업데이트"},
+        {"name": "Message-ID", "value": "<abc@example.com>"},
+    ]
+
+    email = receiver._parse_message({"id": "18c5f2e8", "payload": payload})
+
+    assert email.body == KOREAN
+    assert email.metadata.has_attachments
@@ -0,0 +1,71 @@
+"""
+Unit tests for SimHash near-duplicate detection (content_normalizer.near_duplicates).
+"""
+
+import itertools
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from content_normalizer.near_duplicates import (
+    DEFAULT_MAX_DISTANCE,
+    NearDuplicateDetector,
+    hamming_distance,
+    simhash,
+)
+from content_normalizer.normalizer import ContentNormalizer
+from models.daemon_state import ContentFingerprint
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "sample_emails"
+
+ORIGINAL = (
+    "안녕하세요,\n\n브랜드엑스와 신세계인터내셔날의 PoC 킥오프 미팅을 11월 5일 오후 3시에 "
+    "진행합니다.\n예산은 2천만원이며 파일럿 범위는 강남점입니다."
+)
+FORWARDED = (
+    "FYI 공유드립니다.\n\n---------- Forwarded message ---------\n"
+    "From: 김철수 <kim@brandx.com>\nDate: 2025년 10월 30일 (목) 오후 2:30\n"
+    "Subject: PoC 킥오프\nTo: <collab@signite.co>\n\n" + ORIGINAL
+)
+
+
+def test_forwarded_and_quoted_copies_are_near():
+    original = simhash(ORIGINAL)
+    quoted = "\n".join("> " + line for line in ORIGINAL.splitlines())
+
+    assert hamming_distance(original, simhash(FORWARDED)) <= DEFAULT_MAX_DISTANCE
+    assert simhash(quoted) == original
+
+
+def test_distinct_fixture_emails_are_far_apart():
+    normalizer = ContentNormalizer()
+    fingerprints = [
+        simhash(normalizer.clean(path.read_text(encoding="utf-8")).cleaned_body)
+        for path in sorted(FIXTURES.glob("*.txt"))
+    ]
+    fingerprints = [f for f in fingerprints if f is not None]
+
+    assert len(fingerprints) > 10
+    for a, b in itertools.combinations(fingerprints, 2):
+        assert hamming_distance(a, b) > 2 * DEFAULT_MAX_DISTANCE
+
+
+def test_short_bodies_are_not_fingerprinted():
+    assert simhash("See attached.") is None
+    assert simhash("") is None
+
+
+def test_detector_respects_window_and_picks_closest():
+    now = datetime(2025, 11, 1, 12, 0)
+    fingerprint = simhash(ORIGINAL)
+    detector = NearDuplicateDetector(window=timedelta(hours=24))
+    stored = {
+        "old": ContentFingerprint(simhash=fingerprint, seen_at=now - timedelta(hours=30)),
+        "near": ContentFingerprint(simhash=fingerprint ^ 0b111, seen_at=now - timedelta(hours=1)),
+        "exact": ContentFingerprint(simhash=fingerprint, seen_at=now - timedelta(hours=2)),
+        "other": ContentFingerprint(simhash=~fingerprint & (2**64 - 1), seen_at=now),
+    }
+
+    assert detector.find(fingerprint, stored, now=now) == "exact"
+    del stored["exact"]
+    assert detector.find(fingerprint, stored, now=now) == "near"
+    assert NearDuplicateDetector(max_distance=2).find(fingerprint, {"near": stored["near"]}, now=now) is None
@@ -0,0 +1,289 @@
+"""
+Unit tests for NotionWriter.create_collabiq_entries() batch writes.
+
+Tests batched duplicate lookup, shared company snapshot, per-item
+results and DLQ routing.
+"""
+
+import asyncio
+import json
+from itertools import count
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from notion_integrator import NotionWriter
+from notion_integrator.field_mapper import FieldMapper
+from notion_integrator.fuzzy_matcher import HybridMatcher, RapidfuzzMatcher
+from notion_integrator.match_memo import MatchMemo
+from tests.fixtures import create_valid_extracted_data
+
+
+SCHEMA_PROPERTIES = {
+    "제목": {"type": "title"},
+    "스타트업명": {"type": "relation"},
+    "협업기관": {"type": "relation"},
+    "협업내용": {"type": "rich_text"},
+    "Email ID": {"type": "rich_text"},
+}
+
+
+def _page(page_id: str, email_id: str) -> dict:
+    """CollabIQ page as returned by a data source query."""
+    return {
+        "id": page_id,
+        "properties": {
+            "Email ID": {"rich_text": [{"plain_text": email_id}]},
+        },
+    }
+
+
+@pytest.fixture
+def mock_notion_integrator():
+    """NotionIntegrator mock whose page creations return sequential IDs."""
+    mock = Mock()
+    mock.client = Mock()
+    mock.client.client = Mock()
+    mock.client.client.pages = Mock()
+
+    ids = count(1)
+
+    async def create_page(**kwargs):
+        await asyncio.sleep(0)
+        return {"id": f"page-{next(ids):03d}"}
+
+    mock.client.client.pages.create = AsyncMock(side_effect=create_page)
+    mock.client.client.pages.update = AsyncMock()
+    mock.client.query_database = AsyncMock(return_value={"results": []})
+
+    mock.schema = Mock()
+    mock.schema.database = Mock()
+    mock.schema.database.properties = SCHEMA_PROPERTIES
+    mock.discover_database_schema = AsyncMock(return_value=mock.schema)
+    return mock
+
+
+@pytest.fixture
+def dlq_manager():
+    """DLQ manager mock recording saved failures."""
+    manager = Mock()
+    manager.save_failed_write = Mock(return_value="data/dlq/failed.json")
+    return manager
+
+
+@pytest.fixture
+def writer(mock_notion_integrator, dlq_manager):
+    """NotionWriter with mock dependencies."""
+    return NotionWriter(
+        notion_integrator=mock_notion_integrator,
+        collabiq_db_id="collabiq-db",
+        dlq_manager=dlq_manager,
+    )
+
+
+def _batch(size: int) -> list:
+    return [create_valid_extracted_data(email_id=f"msg_{i:03d}") for i in range(size)]
+
+
+class TestCreateCollabiqEntries:
+    """Test batch entry creation."""
+
+    @pytest.mark.asyncio
+    async def test_batch_creates_all_entries_in_order(
+        self, writer, mock_notion_integrator
+    ):
+        """
+        Test: Every item is written and results keep input order.
+
+        Given: 5 new emails
+        When: create_collabiq_entries() is called
+        Then: 5 pages are created with one duplicate query for the batch
+        """
+        batch = _batch(5)
+
+        results = await writer.create_collabiq_entries(batch, max_concurrency=2)
+
+        assert [r.email_id for r in results] == [d.email_id for d in batch]
+        assert all(r.success and not r.is_duplicate for r in results)
+        assert len({r.page_id for r in results}) == 5
+        assert mock_notion_integrator.client.client.pages.create.await_count == 5
+        assert mock_notion_integrator.client.query_database.await_count == 1
+
+        query = mock_notion_integrator.client.query_database.await_args.kwargs
+        assert len(query["filter_conditions"]["or"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_existing_entries_are_skipped(self, writer, mock_notion_integrator):
+        """Emails already in Notion are reported as duplicates and not written."""
+        mock_notion_integrator.client.query_database.return_value = {
+            "results": [_page("existing-page", "msg_001")],
+        }
+
+        results = await writer.create_collabiq_entries(_batch(3))
+
+        assert results[1].is_duplicate
+        assert results[1].existing_page_id == "existing-page"
+        assert results[1].page_id is None
+        assert mock_notion_integrator.client.client.pages.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_item_goes_to_dlq_without_failing_batch(
+        self, writer, mock_notion_integrator, dlq_manager
+    ):
+        """
+        Test: One failing write does not affect the rest of the batch.
+
+        Given: Page creation fails for one email
+        When: The batch is written
+        Then: That item fails and is saved to the DLQ, the others succeed
+        """
+        original = mock_notion_integrator.client.client.pages.create.side_effect
+
+        async def create_page(**kwargs):
+            title = kwargs["properties"]["Email ID"]["rich_text"][0]["text"]["content"]
+            if title == "msg_002":
+                raise ValueError("invalid property")
+            return await original(**kwargs)
+
+        mock_notion_integrator.client.client.pages.create.side_effect = create_page
+
+        results = await writer.create_collabiq_entries(_batch(4))
+
+        assert [r.success for r in results] == [True, True, False, True]
+        assert results[2].error_type == "ValueError"
+        dlq_manager.save_failed_write.assert_called_once()
+        saved = dlq_manager.save_failed_write.call_args.kwargs["extracted_data"]
+        assert saved.email_id == "msg_002"
+
+    @pytest.mark.asyncio
+    async def test_repeated_email_in_batch_written_once(
+        self, writer, mock_notion_integrator
+    ):
+        """An email appearing twice in a batch creates a single page."""
+        first = create_valid_extracted_data(email_id="msg_dup")
+        second = create_valid_extracted_data(email_id="msg_dup")
+
+        results = await writer.create_collabiq_entries([first, second])
+
+        assert mock_notion_integrator.client.client.pages.create.await_count == 1
+        assert results[0].success and not results[0].is_duplicate
+        assert results[1].is_duplicate
+        assert results[1].existing_page_id == results[0].page_id
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, writer, mock_notion_integrator):
+        """An empty batch makes no API calls."""
+        assert await writer.create_collabiq_entries([]) == []
+        mock_notion_integrator.client.query_database.assert_not_awaited()
+
+
+class TestBatchCompanySnapshot:
+    """Test the shared company candidate snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_loaded_once_and_new_company_created_once(
+        self, writer, mock_notion_integrator
+    ):
+        """
+        Test: Company candidates are shared across the batch.
+
+        Given: Two emails naming the same unknown startup
+        When: The batch is written
+        Then: Candidates are loaded once and the startup is created once,
+              with both entries related to it
+        """
+        companies_cache = Mock()
+        companies_cache.get_companies = AsyncMock(
+            return_value=[("partner-page-id-0000000000000000", "신세계푸드")]
+        )
+        companies_cache.upsert_company = Mock()
+
+        writer.field_mapper = FieldMapper(
+            schema=mock_notion_integrator.schema,
+            company_matcher=RapidfuzzMatcher(),
+            companies_cache=companies_cache,
+            notion_writer=writer,
+            companies_db_id="companies-db",
+        )
+
+        batch = [
+            create_valid_extracted_data(
+                email_id=f"msg_{i}",
+                startup_name="새로운스타트업",
+                matched_company_id=None,
+                matched_partner_id=None,
+            )
+            for i in range(2)
+        ]
+
+        results = await writer.create_collabiq_entries(batch)
+
+        assert all(r.success for r in results)
+        companies_cache.get_companies.assert_awaited_once()
+
+        company_creates = [
+            call
+            for call in mock_notion_integrator.client.client.pages.create.await_args_list
+            if call.kwargs["parent"] == {"database_id": "companies-db"}
+        ]
+        assert len(company_creates) == 1
+        assert batch[0].matched_company_id == batch[1].matched_company_id
+        assert batch[0].matched_partner_id == "partner-page-id-0000000000000000"
+        companies_cache.upsert_company.assert_called_once_with(
+            batch[0].matched_company_id, "새로운스타트업"
+        )
+
+    @pytest.mark.asyncio
+    async def test_one_llm_call_even_after_a_company_is_created(
+        self, writer, mock_notion_integrator
+    ):
+        """
+        Test: Pre-matched names stay matched after an item auto-creates.
+
+        Given: A batch whose first email creates a company and whose second
+              names an ambiguous startup
+        When: The batch is written with an LLM-backed matcher
+        Then: The LLM is called once, for the whole batch
+        """
+        companies_cache = Mock()
+        companies_cache.get_companies = AsyncMock(
+            return_value=[
+                ("partner-page-id-0000000000000000", "신세계푸드"),
+                ("card-page-id-00000000000000000000", "현대카드"),
+            ]
+        )
+        companies_cache.upsert_company = Mock()
+        orchestrator = Mock()
+        orchestrator.generate_text = AsyncMock(
+            return_value=json.dumps([{"name": 1, "candidate": 1, "score": 0.9}])
+        )
+
+        writer.field_mapper = FieldMapper(
+            schema=mock_notion_integrator.schema,
+            company_matcher=HybridMatcher(orchestrator, memo=MatchMemo()),
+            companies_cache=companies_cache,
+            notion_writer=writer,
+            companies_db_id="companies-db",
+        )
+
+        batch = [
+            create_valid_extracted_data(
+                email_id="msg_new",
+                startup_name="새로운스타트업",
+                matched_company_id=None,
+                matched_partner_id=None,
+            ),
+            create_valid_extracted_data(
+                email_id="msg_ambiguous",
+                startup_name="현대카드코리아",
+                matched_company_id=None,
+                matched_partner_id=None,
+            ),
+        ]
+
+        results = await writer.create_collabiq_entries(batch)
+
+        assert all(r.success for r in results)
+        assert orchestrator.generate_text.await_count == 1
+        assert batch[0].matched_company_id not in (None, "card-page-id-00000000000000000000")
+        assert batch[1].matched_company_id == "card-page-id-00000000000000000000"
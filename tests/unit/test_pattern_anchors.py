@@ -0,0 +1,94 @@
+"""
+Unit tests for the anchor prefilter in content_normalizer.patterns.
+
+The prefilter may only skip patterns that cannot match, so cleaning with
+it must give exactly the results of trying every pattern.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from content_normalizer import patterns
+from content_normalizer.normalizer import ContentNormalizer
+
+FIXTURES = sorted((Path(__file__).parent.parent / "fixtures" / "sample_emails").glob("*.txt"))
+
+# One text per anchored pattern that the pattern matches
+POSITIVE_SAMPLES = {
+    "korean_thanks_name": "내용\n\n감사합니다.\n김철수 드림",
+    "korean_greeting_signature": "내용\n\n좋은 하루 보내세요.\n이영희 올림",
+    "korean_contact_block": "내용\n---\n박민수 팀장",
+    "korean_name_only": "내용\n\n박민수 드림",
+    "korean_closing_only": "내용\n\n수고하세요.",
+    "english_formal_closing": "Body\n\nKind Regards,\nJohn Smith",
+    "english_informal_closing": "Body\n\nCHEERS,\nMike",
+    "english_contact_block": "Body\n===\nJane Doe\nProduct Manager",
+    "english_phone_email_block": "Body\nTEL: 010-1234-5678",
+    "english_confidentiality_notice": "Body\nLegal Notice: read this",
+    "separator_line_signature": "Body\n-=-\nJane",
+    "gmail_reply_header": "Hi\nOn Mon, Oct 30, 2025 at 2:30 PM, John Smith WROTE:",
+    "outlook_reply_header": "Hi\nFrom: John\nSent: Monday, October 30, 2025",
+    "korean_reply_header": "답장\n2025년 10월 30일 목요일, 김철수님이 작성:",
+    "simple_on_date_wrote": "Hi\nOn Friday Kim wrote:",
+    "confidentiality_notice": "Body\nConfidentiality Notice: private",
+    "legal_disclaimer": "Body\nDisclaimer: none",
+    "intended_only_notice": "Body\nThis email is intended only for you",
+    "separator_disclaimer": "Body\n___\nLegal text",
+    "confidential_disclaimer": "Body\nThis message is confidential.",
+    "privileged_communication": "Body\nPrivileged communication",
+    "unauthorized_use": "Body\nUnauthorised disclosure is prohibited.",
+}
+
+PATTERNS_BY_NAME = {
+    name: getattr(patterns, name.upper()) for name in POSITIVE_SAMPLES
+}
+
+
+def clean_all_patterns(normalizer, body, monkeypatch):
+    """clean() without the prefilter (every pattern tried)."""
+    with monkeypatch.context() as m:
+        m.setattr(patterns, "scan_anchors", lambda text: None)
+        return normalizer.clean(body)
+
+
+@pytest.mark.parametrize("name", sorted(patterns.PATTERN_ANCHORS))
+def test_pattern_matches_imply_anchor(name):
+    text = POSITIVE_SAMPLES[name]
+
+    assert PATTERNS_BY_NAME[name].search(text), f"sample does not match {name}"
+    assert not patterns.scan_anchors(text).isdisjoint(patterns.PATTERN_ANCHORS[name])
+
+
+def test_anchor_classes_are_defined():
+    known = set(patterns.ANCHOR_CLASSES) | {"separator"}
+    for name, required in patterns.PATTERN_ANCHORS.items():
+        assert set(required) <= known, name
+
+
+def test_case_insensitive_matches_are_not_skipped():
+    # re.IGNORECASE matches these non-ASCII letters to ASCII ones
+    assert "sent" in patterns.scan_anchors("ſent:")
+    assert "notice" in patterns.scan_anchors("NOTİCE")
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.name)
+def test_prefiltered_cleaning_is_identical_on_fixtures(fixture, monkeypatch):
+    normalizer = ContentNormalizer()
+    body = fixture.read_text(encoding="utf-8")
+
+    expected = clean_all_patterns(normalizer, body, monkeypatch)
+    result = normalizer.clean(body)
+
+    assert result.cleaned_body == expected.cleaned_body
+    assert result.removed_content == expected.removed_content
+
+
+@pytest.mark.parametrize("name", sorted(POSITIVE_SAMPLES))
+def test_prefiltered_cleaning_is_identical_on_samples(name, monkeypatch):
+    normalizer = ContentNormalizer()
+    body = "Partnership update for Q4.\n\nMeeting on Friday.\n" + POSITIVE_SAMPLES[name]
+
+    expected = clean_all_patterns(normalizer, body, monkeypatch)
+
+    assert normalizer.clean(body).cleaned_body == expected.cleaned_body
@@ -0,0 +1,132 @@
+"""
+Unit tests for PersonIndex and its use by NotionPersonMatcher.
+
+Tests alias generation (email local-parts, Korean/English name variants),
+exact and alias lookups, top-candidate scoring, index reuse per user list,
+and batch matching with match_many().
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from notion_integrator.person_matcher import (
+    NotionPersonMatcher,
+    NotionUser,
+    PersonIndex,
+    person_aliases,
+)
+
+
+USERS = [
+    NotionUser("user-kim", "김철수 (Chulsoo Kim)", "chulsoo.kim@example.com"),
+    NotionUser("user-lee", "이영희", "younghee_lee@example.com"),
+    NotionUser("user-park", "Jimin Park", None),
+    NotionUser("user-lee-2", "이영호", None),
+]
+
+
+@pytest.fixture
+def matcher(tmp_path):
+    return NotionPersonMatcher(notion_client=MagicMock(), cache_dir=str(tmp_path))
+
+
+class TestPersonAliases:
+    """Test alias generation."""
+
+    def test_name_variants_and_email_local_part(self):
+        aliases = person_aliases(USERS[0])
+
+        assert aliases[0] == "김철수 (chulsoo kim)"
+        assert "김철수" in aliases
+        assert "chulsoo kim" in aliases
+        assert "kim chulsoo" in aliases
+
+    def test_korean_name_without_spaces(self):
+        assert "김철수" in person_aliases(NotionUser("u", "김 철수"))
+
+    def test_user_without_name_or_email(self):
+        assert person_aliases(NotionUser("u", "")) == []
+
+
+class TestPersonIndex:
+    """Test PersonIndex lookups."""
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("김철수 (Chulsoo Kim)", "user-kim"),
+            ("김철수", "user-kim"),
+            ("Chulsoo Kim", "user-kim"),
+            ("kim chulsoo", "user-kim"),
+            ("Younghee Lee", "user-lee"),
+            ("park jimin", "user-park"),
+        ],
+    )
+    def test_exact_name_and_alias_lookup(self, query, expected):
+        assert PersonIndex(USERS).exact(query).id == expected
+
+    def test_alias_shared_by_two_users_is_not_exact(self):
+        users = [NotionUser("a", "Kim (Sales)"), NotionUser("b", "Kim (Ops)")]
+
+        assert PersonIndex(users).exact("kim") is None
+
+    def test_top_matches_best_first(self):
+        top = PersonIndex(USERS).top_matches("이영", limit=2)
+
+        assert [user.id for user, _ in top] == ["user-lee", "user-lee-2"]
+        assert top[0][1] == top[1][1]
+
+    def test_alias_improves_fuzzy_score(self):
+        (user, score), = PersonIndex(USERS).top_matches("Chulsoo Kimm", limit=1)
+
+        assert user.id == "user-kim"
+        assert score > 0.9
+
+
+class TestNotionPersonMatcherIndex:
+    """Test NotionPersonMatcher with the index."""
+
+    def test_alias_match_returns_user_name(self, matcher):
+        result = matcher._match_users("chulsoo kim", USERS, 0.70)
+
+        assert result.match_type == "exact"
+        assert result.user_id == "user-kim"
+        assert result.user_name == "김철수 (Chulsoo Kim)"
+
+    def test_ambiguous_top_two_detected(self, matcher):
+        result = matcher._match_users("이영", USERS, 0.0)
+
+        assert result.is_ambiguous
+        assert [m["user_id"] for m in result.alternative_matches][:2] == [
+            "user-lee",
+            "user-lee-2",
+        ]
+
+    def test_index_rebuilt_only_when_users_change(self, matcher):
+        with patch(
+            "notion_integrator.person_matcher.PersonIndex", wraps=PersonIndex
+        ) as build:
+            matcher._match_users("김철수", USERS, 0.70)
+            matcher._match_users("이영희", list(USERS), 0.70)
+            assert build.call_count == 1
+
+            changed = USERS[:-1] + [NotionUser("user-lee-2", "이영호", "yh@x.com")]
+            matcher._match_users("이영희", changed, 0.70)
+            assert build.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_match_many_loads_users_once(self, matcher):
+        matcher.list_users_async = AsyncMock(return_value=USERS)
+
+        results = await matcher.match_many([" 김철수 ", "Jimin Park", "홍길동"])
+
+        matcher.list_users_async.assert_awaited_once()
+        assert results["김철수"].user_id == "user-kim"
+        assert results["Jimin Park"].user_id == "user-park"
+        assert results["홍길동"].match_type == "none"
+
+    @pytest.mark.asyncio
+    async def test_match_many_rejects_blank_names(self, matcher):
+        with pytest.raises(ValueError):
+            await matcher.match_many(["김철수", "  "], users=USERS)
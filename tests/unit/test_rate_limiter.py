@@ -0,0 +1,335 @@
+"""
+Unit tests for the Notion rate limiter.
+
+Tests priority ordering, wait-time accounting, adaptive (AIMD) rate
+control, and the shared per-token limiter registry.
+"""
+
+import asyncio
+
+import pytest
+
+from notion_client.errors import APIResponseError
+
+from notion_integrator.client import send_rate_limited
+from notion_integrator.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimiter,
+    RequestPriority,
+    get_shared_rate_limiter,
+    reset_shared_rate_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    """Isolate the process-wide limiter registry between tests."""
+    reset_shared_rate_limiters()
+    yield
+    reset_shared_rate_limiters()
+
+
+class TestRateLimiterAcquire:
+    """Test token acquisition and ordering."""
+
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity_does_not_wait(self):
+        """Requests within burst capacity are served immediately."""
+        limiter = RateLimiter(rate_per_second=10.0, capacity=3)
+
+        for _ in range(3):
+            await limiter.acquire()
+
+        stats = limiter.get_stats()
+        assert stats["total_requests"] == 3
+        assert stats["throttled_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_more_than_capacity_raises(self):
+        """Requesting more tokens than capacity is rejected."""
+        limiter = RateLimiter(rate_per_second=3.0)
+
+        with pytest.raises(ValueError):
+            await limiter.acquire(10)
+
+    @pytest.mark.asyncio
+    async def test_write_priority_served_before_background(self):
+        """
+        Test: Queued writes beat queued background refreshes.
+
+        Given: Bucket is empty, a background request is queued first
+        When: A write request is queued afterwards
+        Then: The write acquires its token before the background request
+        """
+        limiter = RateLimiter(rate_per_second=20.0, capacity=1)
+        await limiter.acquire()  # Drain the bucket
+
+        order = []
+
+        async def request(name, priority):
+            await limiter.acquire(priority=priority)
+            order.append(name)
+
+        background = [
+            asyncio.create_task(request(f"bg{i}", RequestPriority.BACKGROUND))
+            for i in range(2)
+        ]
+        await asyncio.sleep(0)  # Let background requests queue up
+        write = asyncio.create_task(request("write", RequestPriority.WRITE))
+
+        await asyncio.gather(*background, write)
+
+        assert order[0] == "write"
+        assert sorted(order[1:]) == ["bg0", "bg1"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_block_queue(self):
+        """A cancelled request leaves the queue so later requests proceed."""
+        limiter = RateLimiter(rate_per_second=20.0, capacity=1)
+        await limiter.acquire()
+
+        stuck = asyncio.create_task(limiter.acquire(priority=RequestPriority.WRITE))
+        await asyncio.sleep(0)
+        stuck.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await stuck
+
+        await asyncio.wait_for(limiter.acquire(), timeout=1.0)
+        assert limiter.get_stats()["waiting_requests"] == 0
+
+
+class TestRateLimiterStats:
+    """Test wait-time accounting exposed through get_stats()."""
+
+    @pytest.mark.asyncio
+    async def test_wait_time_is_accumulated(self):
+        """Throttled requests contribute cumulative and percentile wait times."""
+        limiter = RateLimiter(rate_per_second=50.0, capacity=1)
+
+        for _ in range(4):
+            await limiter.acquire(priority=RequestPriority.BACKGROUND)
+
+        stats = limiter.get_stats()
+        assert stats["total_requests"] == 4
+        assert stats["throttled_requests"] >= 3
+        assert stats["total_wait_seconds"] > 0.04
+        assert stats["wait_seconds_by_priority"]["background"] == pytest.approx(
+            stats["total_wait_seconds"]
+        )
+        assert 0 < stats["wait_p50_seconds"] <= stats["wait_p95_seconds"]
+        assert stats["wait_p99_seconds"] <= stats["wait_max_seconds"]
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_stats(self):
+        """reset() refills the bucket and clears wait statistics."""
+        limiter = RateLimiter(rate_per_second=50.0, capacity=1)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        await limiter.reset()
+
+        stats = limiter.get_stats()
+        assert stats["total_requests"] == 0
+        assert stats["total_wait_seconds"] == 0.0
+        assert stats["available_tokens"] == 1.0
+
+
+class TestSharedRateLimiter:
+    """Test the process-wide limiter registry."""
+
+    def test_same_token_returns_same_limiter(self):
+        """Clients using the same API token share one limiter."""
+        first = get_shared_rate_limiter("secret_abc")
+        second = get_shared_rate_limiter("secret_abc", rate_per_second=10.0)
+
+        assert first is second
+        assert first.rate_per_second == 3.0
+
+    def test_different_tokens_get_separate_limiters(self):
+        """Each API token has its own budget."""
+        assert get_shared_rate_limiter("secret_a") is not get_shared_rate_limiter(
+            "secret_b"
+        )
+
+    def test_shared_limiter_usable_across_event_loops(self):
+        """A shared limiter keeps working after the first event loop closes."""
+        limiter = get_shared_rate_limiter("secret_loop", rate_per_second=100.0)
+
+        asyncio.run(limiter.acquire())
+        asyncio.run(limiter.acquire())
+
+        assert limiter.get_stats()["total_requests"] == 2
+
+    def test_notion_clients_share_limiter(self):
+        """NotionClient instances for the same key draw from one bucket."""
+        from notion_integrator.client import NotionClient
+
+        first = NotionClient(api_key="secret_shared")
+        second = NotionClient(api_key="secret_shared")
+
+        assert first.rate_limiter is second.rate_limiter
+
+    def test_shared_limiter_is_adaptive_by_default(self):
+        """The registry hands out adaptive limiters capped at the requested rate."""
+        limiter = get_shared_rate_limiter("secret_adaptive")
+
+        assert isinstance(limiter, AdaptiveRateLimiter)
+        assert limiter.max_rate == 3.0
+
+
+class TestAdaptiveRateLimiter:
+    """Test AIMD rate adjustment and Retry-After pauses."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_halves_rate_and_success_recovers(self):
+        """
+        Test: 429s cut the rate multiplicatively, successes restore it additively.
+
+        Given: Adaptive limiter at 3 req/s
+        When: One rate limit error, then a run of successes
+        Then: Rate drops to 1.5 and climbs back by increase_step per run
+        """
+        limiter = AdaptiveRateLimiter(
+            initial_rate=3.0, max_rate=3.0, increase_step=0.5, success_threshold=2
+        )
+
+        await limiter.handle_rate_limit_error()
+        assert limiter.rate_per_second == 1.5
+
+        for _ in range(2):
+            await limiter.handle_success()
+        assert limiter.rate_per_second == 2.0
+
+        for _ in range(10):
+            await limiter.handle_success()
+        assert limiter.rate_per_second == 3.0
+
+    @pytest.mark.asyncio
+    async def test_rate_never_drops_below_min(self):
+        """Repeated 429s are floored at min_rate."""
+        limiter = AdaptiveRateLimiter(initial_rate=1.0, min_rate=0.5)
+
+        for _ in range(5):
+            await limiter.handle_rate_limit_error()
+
+        assert limiter.rate_per_second == 0.5
+        assert limiter.get_stats()["rate_limit_hits"] == 5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_429s_back_off_once(self):
+        """
+        Test: A burst of 429s from one throttling event halves the rate once.
+
+        Given: Adaptive limiter at 100 req/s
+        When: 5 in-flight requests are answered 429 together, then another
+            429 arrives after the Retry-After has passed
+        Then: The burst halves the rate once; the later 429 halves it again
+        """
+        limiter = AdaptiveRateLimiter(initial_rate=100.0, max_rate=100.0)
+
+        await asyncio.gather(
+            *(limiter.handle_rate_limit_error(retry_after=0.05) for _ in range(5))
+        )
+        assert limiter.rate_per_second == 50.0
+        assert limiter.get_stats()["rate_limit_hits"] == 5
+
+        await asyncio.sleep(0.06)
+        await limiter.handle_rate_limit_error(retry_after=0.05)
+        assert limiter.rate_per_second == 25.0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_all_requests(self):
+        """
+        Test: Retry-After blocks token issue for its whole duration.
+
+        Given: Adaptive limiter with a full bucket
+        When: The API answers 429 with Retry-After: 0.2
+        Then: The next acquire waits at least 0.2s even at high rate
+        """
+        limiter = AdaptiveRateLimiter(initial_rate=100.0, max_rate=100.0)
+
+        await limiter.handle_rate_limit_error(retry_after=0.2)
+        assert limiter.get_stats()["paused_seconds_remaining"] > 0
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire()
+
+        assert loop.time() - start >= 0.19
+
+
+def _rate_limited_error(retry_after: str = "0.05") -> APIResponseError:
+    """Build a 429 APIResponseError the way notion-client raises it."""
+    import httpx
+
+    response = httpx.Response(
+        429,
+        headers={"Retry-After": retry_after},
+        json={"code": "rate_limited", "message": "Rate limited"},
+    )
+    return APIResponseError(
+        code="rate_limited",
+        status=429,
+        message="Rate limited",
+        headers=response.headers,
+        raw_body_text=response.text,
+    )
+
+
+class TestSendRateLimited:
+    """Test the per-request wrapper used by NotionClient and NotionWriter."""
+
+    @pytest.mark.asyncio
+    async def test_without_limiter_just_awaits(self):
+        """Objects without a RateLimiter (e.g. mocks) are not throttled."""
+
+        class FakeClient:
+            rate_limiter = None
+
+        async def request():
+            return "ok"
+
+        assert await send_rate_limited(FakeClient(), request) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_is_resent_after_retry_after(self):
+        """
+        Test: A 429 is absorbed by the limiter and the request re-sent.
+
+        Given: First call raises 429 with Retry-After, second succeeds
+        When: send_rate_limited() issues the request
+        Then: The response is returned and the limiter slowed down
+        """
+        limiter = AdaptiveRateLimiter(initial_rate=3.0, max_rate=3.0)
+
+        class FakeClient:
+            rate_limiter = limiter
+
+        calls = []
+
+        async def request():
+            calls.append(1)
+            if len(calls) == 1:
+                raise _rate_limited_error("0.05")
+            return {"ok": True}
+
+        result = await send_rate_limited(FakeClient(), request, RequestPriority.WRITE)
+
+        assert result == {"ok": True}
+        assert len(calls) == 2
+        assert limiter.rate_per_second == 1.5
+        assert limiter.get_stats()["rate_limit_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_persistent_rate_limit_is_raised(self):
+        """A 429 is raised once max_rate_limit_retries is exhausted."""
+        limiter = AdaptiveRateLimiter(initial_rate=100.0, max_rate=100.0)
+
+        class FakeClient:
+            rate_limiter = limiter
+
+        async def request():
+            raise _rate_limited_error("0")
+
+        with pytest.raises(APIResponseError):
+            await send_rate_limited(FakeClient(), request, max_rate_limit_retries=2)
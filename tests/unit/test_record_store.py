@@ -0,0 +1,141 @@
+"""
+Unit tests for RecordStore and CacheManager's compact data caches.
+
+Tests record round trips, projection reads, expiry checks that skip the
+records, reading and replacing legacy JSON data caches, and corrupted
+store handling.
+"""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from notion_integrator.cache import CacheManager
+from notion_integrator.models import DataCache
+from notion_integrator.record_store import RecordStore
+
+
+RECORDS = [
+    {"page_id": "page-1", "name": "웨이크", "properties": {"Tags": ["a", "b"]}},
+    {"page_id": "page-2", "name": "네트워크", "properties": {}},
+    {"page_id": "page-3"},
+]
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    return CacheManager(cache_dir=str(tmp_path))
+
+
+class TestRecordStore:
+    """Test RecordStore reads and writes."""
+
+    def test_round_trip_keeps_order_and_header(self, tmp_path):
+        store = RecordStore(tmp_path / "data_x.sqlite3")
+
+        store.write({"database_id": "db-1"}, RECORDS)
+
+        assert store.read_header() == {"database_id": "db-1"}
+        assert store.read_records() == RECORDS
+        assert not (tmp_path / "data_x.sqlite3.tmp").exists()
+
+    def test_projection_returns_only_requested_fields(self, tmp_path):
+        store = RecordStore(tmp_path / "data_x.sqlite3")
+        store.write({}, RECORDS)
+
+        assert store.read_records(["page_id", "name"]) == [
+            {"page_id": "page-1", "name": "웨이크"},
+            {"page_id": "page-2", "name": "네트워크"},
+            {"page_id": "page-3", "name": None},
+        ]
+        assert store.read_records(["properties"])[0] == {
+            "properties": {"Tags": ["a", "b"]}
+        }
+
+    def test_rewrite_replaces_contents(self, tmp_path):
+        store = RecordStore(tmp_path / "data_x.sqlite3")
+        store.write({"v": 1}, RECORDS)
+
+        store.write({"v": 2}, RECORDS[:1])
+
+        assert store.read_header() == {"v": 2}
+        assert store.read_records(["name"]) == [{"name": "웨이크"}]
+
+
+class TestCacheManagerDataStore:
+    """Test CacheManager data caches backed by RecordStore."""
+
+    def test_set_and_get_with_projection(self, cache_manager, tmp_path):
+        cache_manager.set_data_cache("db-1", "Companies", RECORDS)
+
+        assert (tmp_path / "data_Companies.sqlite3").exists()
+        assert cache_manager.get_data_cache("db-1", "Companies") == RECORDS
+        assert cache_manager.get_data_cache(
+            "db-1", "Companies", fields=["page_id"]
+        ) == [{"page_id": "page-1"}, {"page_id": "page-2"}, {"page_id": "page-3"}]
+
+    def test_expired_cache_does_not_read_records(self, cache_manager):
+        """Expiry is decided from the header alone."""
+        cache_manager.set_data_cache("db-1", "Companies", RECORDS)
+        entry = cache_manager.get_data_cache_entry("Companies")
+        cache_manager.update_data_cache_entry(
+            entry.model_copy(update={"expires_at": datetime.now() - timedelta(1)})
+        )
+
+        with patch.object(RecordStore, "read_records") as read_records:
+            assert cache_manager.get_data_cache("db-1", "Companies") is None
+
+        read_records.assert_not_called()
+
+    def test_entry_round_trip_keeps_metadata(self, cache_manager):
+        cache_manager.set_data_cache(
+            "db-1", "Companies", RECORDS, metadata={"last_edited_time": "t"}
+        )
+
+        entry = cache_manager.get_data_cache_entry("Companies")
+
+        assert entry.database_id == "db-1"
+        assert entry.content == RECORDS
+        assert entry.metadata == {"last_edited_time": "t", "record_count": 3}
+        assert not entry.is_expired
+
+    def test_legacy_json_cache_read_then_replaced(self, cache_manager, tmp_path):
+        """Caches written before RecordStore keep working until rewritten."""
+        legacy_path = tmp_path / "data_Companies.json"
+        legacy = DataCache.create(
+            cache_type="data",
+            database_id="db-1",
+            database_name="Companies",
+            ttl_hours=6,
+            content=RECORDS,
+        )
+        legacy_path.write_text(
+            json.dumps(legacy.model_dump(), default=str), encoding="utf-8"
+        )
+
+        assert cache_manager.get_data_cache(
+            "db-1", "Companies", fields=["name"]
+        ) == [{"name": "웨이크"}, {"name": "네트워크"}, {"name": None}]
+        entry = cache_manager.get_data_cache_entry("Companies")
+
+        cache_manager.update_data_cache_entry(entry)
+
+        assert not legacy_path.exists()
+        assert cache_manager.get_data_cache("db-1", "Companies") == RECORDS
+
+    def test_corrupted_store_is_deleted(self, cache_manager, tmp_path):
+        store_path = tmp_path / "data_Companies.sqlite3"
+        store_path.write_bytes(b"not a database")
+
+        assert cache_manager.get_data_cache("db-1", "Companies") is None
+        assert not store_path.exists()
+
+    def test_invalidate_removes_store_and_legacy_file(self, cache_manager, tmp_path):
+        cache_manager.set_data_cache("db-1", "Companies", RECORDS)
+        (tmp_path / "data_Companies.json").write_text("{}", encoding="utf-8")
+
+        assert cache_manager.invalidate_data_cache("Companies") is True
+        assert list(tmp_path.iterdir()) == []
+        assert cache_manager.invalidate_data_cache("Companies") is False
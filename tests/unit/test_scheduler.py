@@ -0,0 +1,136 @@
+"""
+Unit tests for the daemon Scheduler's adaptive delays.
+
+Tests backlog reruns, idle backoff, wake-ups, daily-run wake-ups and the
+per-cycle budget.
+"""
+
+import asyncio
+import threading
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from daemon.scheduler import CycleResult, Scheduler
+
+
+def make_scheduler(**kwargs):
+    kwargs.setdefault("max_interval_seconds", 800)
+    return Scheduler(100, **kwargs)
+
+
+class TestNextDelay:
+    """Test the delay chosen from a cycle's result."""
+
+    def test_legacy_result_keeps_fixed_interval(self):
+        scheduler = make_scheduler()
+
+        assert scheduler.next_delay(None) == timedelta(seconds=100)
+
+    def test_backlog_reruns_immediately(self):
+        scheduler = make_scheduler()
+
+        assert scheduler.next_delay(CycleResult(processed=10, backlog=True)) == timedelta(0)
+
+    def test_idle_backs_off_exponentially_up_to_max(self):
+        scheduler = make_scheduler()
+
+        delays = [scheduler.next_delay(CycleResult()).total_seconds() for _ in range(5)]
+
+        assert delays == [200, 400, 800, 800, 800]
+
+    def test_work_resets_backoff(self):
+        scheduler = make_scheduler()
+        scheduler.next_delay(CycleResult())
+        scheduler.next_delay(CycleResult())
+
+        assert scheduler.next_delay(CycleResult(processed=1)) == timedelta(seconds=100)
+        assert scheduler.next_delay(CycleResult()) == timedelta(seconds=200)
+
+    def test_no_max_interval_means_no_backoff(self):
+        scheduler = Scheduler(100)
+
+        assert scheduler.next_delay(CycleResult()) == timedelta(seconds=100)
+
+
+class TestRunLoop:
+    """Test the loop with short-running tasks."""
+
+    @pytest.mark.asyncio
+    async def test_backlog_cycles_run_back_to_back_then_wait(self):
+        scheduler = make_scheduler()
+        results = [CycleResult(5, backlog=True), CycleResult(5, backlog=True), CycleResult(2)]
+        calls = []
+
+        async def task():
+            calls.append(len(calls))
+            if len(calls) > len(results):
+                scheduler._shutdown_requested = True
+                return None
+            return results[len(calls) - 1]
+
+        loop_task = asyncio.create_task(scheduler.run_loop_async(task))
+        await asyncio.sleep(0.2)
+
+        assert len(calls) == 3  # third cycle cleared the backlog: now waiting
+        scheduler._shutdown_requested = True
+        await asyncio.wait_for(loop_task, timeout=3)
+
+    @pytest.mark.asyncio
+    async def test_wake_from_another_thread_starts_next_cycle(self):
+        scheduler = make_scheduler()
+        calls = 0
+
+        async def task():
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                scheduler._shutdown_requested = True
+            return CycleResult()
+
+        loop_task = asyncio.create_task(scheduler.run_loop_async(task))
+        await asyncio.sleep(0.05)
+        threading.Thread(target=scheduler.wake).start()
+
+        await asyncio.wait_for(loop_task, timeout=3)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cycle_deadline_set_from_budget(self):
+        scheduler = make_scheduler(cycle_budget_seconds=30)
+        seen = []
+
+        async def task():
+            seen.append(scheduler.cycle_time_left())
+            scheduler._shutdown_requested = True
+
+        await asyncio.wait_for(scheduler.run_loop_async(task), timeout=3)
+
+        assert 29 < seen[0] <= 30
+        assert scheduler.cycle_time_left() is None
+
+    @pytest.mark.asyncio
+    async def test_idle_wait_ends_at_daily_run(self, monkeypatch):
+        scheduler = make_scheduler(daily_runs=[("07:00", "Asia/Seoul")])
+        next_run = datetime.now(UTC) + timedelta(seconds=0.2)
+        monkeypatch.setattr(scheduler, "get_next_daily_run", lambda target, tz: next_run)
+        calls = []
+
+        async def task():
+            calls.append(datetime.now(UTC))
+            if len(calls) == 2:
+                scheduler._shutdown_requested = True
+            return CycleResult()  # idle: backoff would wait 200s
+
+        await asyncio.wait_for(scheduler.run_loop_async(task), timeout=3)
+
+        assert len(calls) == 2
+        assert calls[1] >= next_run
+
+    def test_seconds_until_daily_run(self):
+        assert make_scheduler().seconds_until_daily_run() is None
+        scheduler = make_scheduler(
+            daily_runs=[("07:00", "Asia/Seoul"), ("19:00", "Asia/Seoul")]
+        )
+
+        assert 0 < scheduler.seconds_until_daily_run() <= 12 * 3600
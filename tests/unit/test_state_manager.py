@@ -1,7 +1,8 @@
 import pytest
 import json
+from datetime import datetime, timedelta
 from pathlib import Path
-from models.daemon_state import DaemonProcessState
+from models.daemon_state import MAX_PROCESSED_IDS, MAX_UNFINISHED_WORK_AGE, DaemonProcessState
 from daemon.state_manager import StateManager
 
 @pytest.fixture
@@ -55,3 +56,64 @@ def test_load_corrupt_state(state_manager, state_file):
     # Should return default state and log error (implied)
     assert state.total_processing_cycles == 0
     assert isinstance(state, DaemonProcessState)
+
+
+def test_work_ledger_round_trip_and_merge(state_manager):
+    """Ledger progress survives a save and merging keeps the furthest entry"""
+    state = DaemonProcessState()
+    state.track_pending(["a", "b", "c"])
+    state.start_work("a")
+    state.finish_work("a")
+    state.start_work("b")
+    state.fail_work("b", "LLM timeout")
+    state_manager.save_state(state)
+
+    loaded = state_manager.load_state()
+    assert {k: v.status for k, v in loaded.work_ledger.items()} == {
+        "a": "written", "b": "failed", "c": "pending"
+    }
+    assert loaded.work_ledger["b"].attempts == 1
+    assert loaded.is_email_processed("a")
+
+    other = DaemonProcessState()
+    other.start_work("b")
+    other.start_work("b")
+    other.quarantine_work("c", "poison")
+    loaded.merge_from(other)
+    assert loaded.work_ledger["b"].attempts == 2
+    assert loaded.work_ledger["c"].status == "quarantined"
+
+
+def test_unfinished_ledger_entries_are_capped():
+    """Stale pending/failed entries expire and the rest are capped by count"""
+    state = DaemonProcessState()
+    state.track_pending(["deleted", "failing"])
+    state.start_work("failing")
+    state.fail_work("failing", "LLM timeout")
+    stale = datetime.now() - MAX_UNFINISHED_WORK_AGE - timedelta(minutes=1)
+    for message_id in ("deleted", "failing"):
+        state.work_ledger[message_id].updated_at = stale
+
+    state.track_pending(f"msg_{n:04d}" for n in range(MAX_PROCESSED_IDS + 10))
+
+    assert "deleted" not in state.work_ledger
+    assert "failing" not in state.work_ledger
+    assert len(state.work_ledger) == MAX_PROCESSED_IDS
+
+
+def test_content_fingerprints_round_trip_and_merge(state_manager):
+    """Fingerprints and duplicate links survive a save; merging unites fingerprints"""
+    state = DaemonProcessState()
+    state.record_fingerprint("a", 2**64 - 1)
+    state.link_duplicate("b", "a")
+    state_manager.save_state(state)
+
+    loaded = state_manager.load_state()
+    assert loaded.content_fingerprints["a"].simhash == 2**64 - 1
+    assert loaded.work_ledger["b"].duplicate_of == "a"
+    assert loaded.is_email_processed("b")
+
+    other = DaemonProcessState()
+    other.record_fingerprint("c", 42)
+    loaded.merge_from(other)
+    assert set(loaded.content_fingerprints) == {"a", "c"}
@@ -0,0 +1,176 @@
+"""
+Unit tests for WebhookReceiver (Gmail push via Pub/Sub).
+
+Uses LocalPubSubQueue as the subscription and the benchmark's
+FakeGmailService as the Gmail API, so notifications flow end to end:
+deliver -> publish historyId -> pull -> history.list -> messages.get.
+"""
+
+import base64
+import threading
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from collabiq.test_utils.pipeline_benchmark import (
+    FakeGmailService,
+    OfflineGmailReceiver,
+    generate_benchmark_emails,
+)
+from email_receiver.webhook_receiver import (
+    LocalPubSubQueue,
+    PubSubMessage,
+    WebhookReceiver,
+    parse_notification,
+)
+
+MAILBOX = "collab@signite.co"
+
+
+@pytest.fixture
+def service():
+    return FakeGmailService()
+
+
+@pytest.fixture
+def queue():
+    return LocalPubSubQueue(ack_deadline=0.2)
+
+
+def make_receiver(tmp_path, service, queue):
+    return WebhookReceiver(
+        "test-project",
+        "gmail-notifications",
+        "gmail-notifications-sub",
+        tmp_path / "credentials.json",
+        metadata_dir=tmp_path / "metadata",
+        gmail_receiver=OfflineGmailReceiver(service, tmp_path),
+        subscriber=queue,
+    )
+
+
+class TestLocalPubSubQueue:
+    """Test the in-process Pub/Sub stand-in."""
+
+    def test_unacked_messages_are_redelivered(self, queue):
+        queue.publish({"historyId": 1})
+
+        first = queue.pull(max_messages=10)
+        assert queue.pull(max_messages=10) == []
+        redelivered = queue.pull(max_messages=10, timeout=1.0)
+
+        assert [m.delivery_attempt for m in first + redelivered] == [1, 2]
+        queue.acknowledge([redelivered[0].ack_id])
+        assert queue.pending_count() == 0
+
+    def test_pull_waits_for_publish(self, queue):
+        timer = threading.Timer(0.05, queue.publish, args=({"historyId": 2},))
+        timer.start()
+
+        messages = queue.pull(max_messages=10, timeout=2.0)
+
+        assert len(messages) == 1
+
+
+class TestParseNotification:
+    """Test Gmail notification decoding."""
+
+    def test_plain_and_base64_payloads(self):
+        plain = PubSubMessage("a", b'{"emailAddress": "x@y", "historyId": "42"}')
+        encoded = PubSubMessage(
+            "b", base64.b64encode(b'{"emailAddress": "x@y", "historyId": 43}')
+        )
+
+        assert parse_notification(plain).history_id == 42
+        assert parse_notification(encoded).history_id == 43
+
+    def test_malformed_payload_ignored(self):
+        assert parse_notification(PubSubMessage("c", b"not json")) is None
+
+
+class TestWebhookReceiver:
+    """Test watch setup and notification-driven fetching."""
+
+    def test_setup_watch_registers_topic_and_cursor(self, tmp_path, service, queue):
+        receiver = make_receiver(tmp_path, service, queue)
+
+        response = receiver.setup_watch()
+
+        assert service.watch_requests[0]["topicName"] == (
+            "projects/test-project/topics/gmail-notifications"
+        )
+        assert service.watch_requests[0]["labelIds"] == ["INBOX"]
+        assert receiver.history_id == int(response["historyId"])
+        assert not receiver.watch_needs_renewal()
+        assert receiver.watch_needs_renewal(datetime.now(UTC) + timedelta(days=6, hours=1))
+
+    def test_notification_yields_new_emails(self, tmp_path, service, queue):
+        receiver = make_receiver(tmp_path, service, queue)
+        receiver.setup_watch()
+
+        emails = generate_benchmark_emails(3)
+        history_id = service.deliver(emails)
+        queue.publish_gmail_notification(MAILBOX, history_id)
+
+        received = receiver.wait_for_emails(timeout=1.0)
+
+        assert [e.metadata.message_id for e in received] == [
+            e.message_id for e in emails
+        ]
+        assert receiver.history_id == history_id
+        assert queue.pending_count() == 0
+
+    def test_max_emails_keeps_rest_for_next_call(self, tmp_path, service, queue):
+        receiver = make_receiver(tmp_path, service, queue)
+        receiver.setup_watch()
+        queue.publish_gmail_notification(
+            MAILBOX, service.deliver(generate_benchmark_emails(3))
+        )
+
+        first = receiver.fetch_emails(max_emails=2)
+        rest = receiver.fetch_emails(max_emails=2)
+
+        assert len(first) == 2 and len(rest) == 1
+
+    def test_renew_watch_keeps_cursor(self, tmp_path, service, queue):
+        receiver = make_receiver(tmp_path, service, queue)
+        receiver.setup_watch()
+        cursor = receiver.history_id
+        service.deliver(generate_benchmark_emails(2))
+
+        receiver.renew_watch()
+
+        assert len(service.watch_requests) == 2
+        assert receiver.history_id == cursor
+
+    def test_cursor_survives_restart(self, tmp_path, service, queue):
+        receiver = make_receiver(tmp_path, service, queue)
+        receiver.setup_watch()
+        cursor = receiver.history_id
+
+        # Emails arrive while the daemon is down
+        emails = generate_benchmark_emails(2)
+        queue.publish_gmail_notification(MAILBOX, service.deliver(emails))
+        restarted = make_receiver(tmp_path, service, queue)
+
+        assert restarted.history_id == cursor
+        assert len(restarted.fetch_emails()) == 2
+
+    def test_expired_history_resets_cursor(self, tmp_path, service, queue):
+        receiver = make_receiver(tmp_path, service, queue)
+        receiver.setup_watch()
+        history = MagicMock()
+        history.list.return_value.execute.side_effect = HttpError(
+            MagicMock(status=404, reason="Not Found"), b"history too old"
+        )
+        service.history = MagicMock(return_value=history)
+        queue.publish_gmail_notification(MAILBOX, 5000)
+
+        assert receiver.fetch_emails() == []
+        assert receiver.history_id == 5000
+        assert queue.pending_count() == 0
+        assert receiver.take_history_gap()
+        assert not receiver.take_history_gap()
+
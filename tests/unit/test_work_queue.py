@@ -0,0 +1,152 @@
+"""
+Unit tests for lease-based work distribution (daemon.work_queue).
+
+Both stores run the same contract: SQLite on a temporary file, GCS on
+the in-memory FakeGCSClient. Two stores on the same backend with
+different worker IDs stand for two daemon instances.
+"""
+
+import threading
+
+import pytest
+
+from collabiq.test_utils.gcs_stub import FakeGCSClient
+from daemon.work_queue import (
+    LEASE_CLAIMED,
+    LEASE_DONE,
+    LEASE_HELD,
+    GCSLeaseStore,
+    SQLiteLeaseStore,
+    build_lease_store,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=["sqlite", "gcs"])
+def make_store(request, tmp_path):
+    """Factory for stores sharing one backend: make_store(worker_id, clock)."""
+    client = FakeGCSClient()
+
+    def make(worker_id, clock):
+        if request.param == "sqlite":
+            return SQLiteLeaseStore(
+                tmp_path / "leases.sqlite3",
+                worker_id=worker_id,
+                lease_seconds=60,
+                clock=clock,
+            )
+        return GCSLeaseStore(
+            "leases", worker_id=worker_id, lease_seconds=60, client=client, clock=clock
+        )
+
+    return make
+
+
+class TestLeaseStoreContract:
+    """Claims, expiry and completion across two workers."""
+
+    def test_one_worker_holds_a_lease(self, make_store):
+        clock = Clock()
+        a, b = make_store("a", clock), make_store("b", clock)
+
+        assert a.claim("msg_1") == LEASE_CLAIMED
+        assert b.claim("msg_1") == LEASE_HELD
+        assert a.claim("msg_1") == LEASE_CLAIMED  # re-claiming our own lease
+        assert b.claim("msg_2") == LEASE_CLAIMED
+
+    def test_expired_lease_is_taken_over(self, make_store):
+        clock = Clock()
+        a, b = make_store("a", clock), make_store("b", clock)
+        a.claim("msg_1")
+
+        clock.now += 61  # worker a crashed and never renewed
+
+        assert b.claim("msg_1") == LEASE_CLAIMED
+        assert not a.renew("msg_1")
+        assert b.renew("msg_1")
+
+    def test_completed_email_is_done_for_everyone(self, make_store):
+        clock = Clock()
+        a, b = make_store("a", clock), make_store("b", clock)
+        a.claim("msg_1")
+
+        a.complete("msg_1")
+        clock.now += 1000
+
+        assert b.claim("msg_1") == LEASE_DONE
+        assert a.claim("msg_1") == LEASE_DONE
+
+    def test_released_lease_is_free_at_once(self, make_store):
+        clock = Clock()
+        a, b = make_store("a", clock), make_store("b", clock)
+        a.claim("msg_1")
+
+        a.release("msg_1")
+
+        assert b.claim("msg_1") == LEASE_CLAIMED
+
+
+def test_concurrent_sqlite_claims_have_one_winner(tmp_path):
+    """Workers racing for the same emails never both get one."""
+    stores = [
+        SQLiteLeaseStore(tmp_path / "leases.sqlite3", worker_id=f"w{i}") for i in range(4)
+    ]
+    won = {store.worker_id: [] for store in stores}
+    barrier = threading.Barrier(len(stores))
+
+    def work(store):
+        barrier.wait()
+        for n in range(20):
+            if store.claim(f"msg_{n}") == LEASE_CLAIMED:
+                won[store.worker_id].append(n)
+
+    threads = [threading.Thread(target=work, args=(store,)) for store in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    claimed = sorted(n for ns in won.values() for n in ns)
+    assert claimed == list(range(20))
+
+
+def test_gcs_claim_rereads_lease_rewritten_mid_read():
+    """A lease rewritten between its metadata and download is read again."""
+    client = FakeGCSClient()
+    clock = Clock()
+    a = GCSLeaseStore("leases", worker_id="a", lease_seconds=60, client=client, clock=clock)
+    b = GCSLeaseStore("leases", worker_id="b", lease_seconds=60, client=client, clock=clock)
+    assert a.claim("msg_1") == LEASE_CLAIMED
+    get_blob = b._bucket.get_blob
+    rewrites = []
+
+    def get_blob_then_finish(name):
+        blob = get_blob(name)
+        if not rewrites:
+            rewrites.append(name)
+            a.complete("msg_1")  # lands before b downloads
+        return blob
+
+    b._bucket.get_blob = get_blob_then_finish
+
+    assert b.claim("msg_1") == LEASE_DONE
+    assert client.precondition_failures == 1
+
+
+def test_build_lease_store_from_url(tmp_path):
+    sqlite_store = build_lease_store(f"sqlite:///{tmp_path}/leases.sqlite3")
+    gcs_store = build_lease_store("gs://bucket/custom/prefix", client=FakeGCSClient())
+
+    assert isinstance(sqlite_store, SQLiteLeaseStore)
+    assert sqlite_store.db_path == tmp_path / "leases.sqlite3"
+    assert isinstance(gcs_store, GCSLeaseStore)
+    assert gcs_store.prefix == "custom/prefix"
+    with pytest.raises(ValueError):
+        build_lease_store("redis://localhost")